@@ -226,6 +226,7 @@ class AddonManager:
                 url=main_url,
                 filename=local_path,
                 timeout_s=int(2 + mb_size * MAX_S_PER_MB),
+                stream=True,
             )
             healthy, error = cls.get_addon_healthy(feature_name)
             if healthy:
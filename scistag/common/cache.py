@@ -146,6 +146,11 @@ class Cache:
         """
         Version counter for each key
         """
+        self._revision_listeners: list[Callable[[str], None]] = []
+        """
+        Functions to be called when ever the revision of a key changed, see
+        :meth:`add_revision_listener`
+        """
 
     @property
     def version(self) -> str:
@@ -295,6 +300,7 @@ class Cache:
                 self._key_revisions[key] += 1
             else:
                 self._key_revisions[key] = 1
+            self._notify_revision_listeners(key)
             if key.startswith(DISK_CACHE_HEADER):
                 self._disk_cache.set(org_key, value, version=version)
                 return value
@@ -427,6 +433,7 @@ class Cache:
                     del self._mem_cache[element]
                     del self._mem_cache_versions[element]
                     self._key_revisions[element] += 1
+                    self._notify_revision_listeners(element)
 
     def get_is_loading(self) -> bool:
         """
@@ -693,12 +700,47 @@ class Cache:
         """
         if _already_locked:
             self._key_revisions[key] += 1
+            self._notify_revision_listeners(key)
             return self._key_revisions[key]
         else:
             with self._access_lock:
                 self._key_revisions[key] += 1
+                self._notify_revision_listeners(key)
                 return self._key_revisions[key]
 
+    def add_revision_listener(self, listener: Callable[[str], None]):
+        """
+        Registers a function which is called when ever the revision of a key changed,
+        e.g. because it was set, extended or deleted.
+
+        The listener is called with the key's name while the cache is locked and
+        from the thread which modified the cache, so it should return quickly,
+        e.g. by just flagging the affected elements.
+
+        :param listener: The function to be called
+        """
+        with self._access_lock:
+            self._revision_listeners.append(listener)
+
+    def remove_revision_listener(self, listener: Callable[[str], None]):
+        """
+        Removes a listener added via :meth:`add_revision_listener`
+
+        :param listener: The function to remove
+        """
+        with self._access_lock:
+            if listener in self._revision_listeners:
+                self._revision_listeners.remove(listener)
+
+    def _notify_revision_listeners(self, key: str):
+        """
+        Informs all listeners about the modification of a key's revision
+
+        :param key: The modified key
+        """
+        for listener in self._revision_listeners:
+            listener(key)
+
     def remove(self, keys: str | list[str]) -> int:
         """
         Removes the key or keys matching the name or the name mask provided.
@@ -807,6 +849,7 @@ class Cache:
                 raise KeyError("Key not found")
             del self._mem_cache[key]
             self._key_revisions[key] += 1
+            self._notify_revision_listeners(key)
 
     def __contains__(self, key) -> bool:
         """
@@ -62,7 +62,7 @@ def verify_data(
         )
     if not os.path.exists(path):
         logging.info(f"Downloading {source_url}...")
-        web_fetch(source_url, filename=path)
+        web_fetch(source_url, filename=path, stream=True)
     if not quick:
         digest = hashlib.md5(open(path, "rb").read()).hexdigest()
         valid = digest == exp_md5
@@ -14,9 +14,11 @@ from .emoji_db import (
     find_emojis_by_name,
 )
 from .emoji_renderer import EmojiRenderer, render_emoji
+from .emoji_atlas import EmojiAtlas
 
 __all__ = [
     "EmojiRenderer",
+    "EmojiAtlas",
     "EmojiDb",
     "get_emoji_sequence",
     "render_emoji",
@@ -0,0 +1,176 @@
+"""
+Implements the class :class:`EmojiAtlas` which pre-renders a set of emojis
+into a single sprite image so that HTML documents can show them via CSS
+instead of embedding one image per emoji.
+"""
+
+from __future__ import annotations
+
+import base64
+import html
+
+from scistag.imagestag import Image, Canvas, ColorTypes, Colors
+from .emoji_db import EmojiDb
+from .emoji_definitions import EmojiIdentifierTypes
+from .emoji_index import sequence_key
+from .emoji_renderer import EmojiRenderer
+
+
+class EmojiAtlas:
+    """
+    A sprite atlas containing multiple emojis of the same size, arranged in a
+    grid.
+
+    Usage:
+
+    .. code-block: python
+
+        atlas = EmojiAtlas.from_search("*smiling*", size=14)
+        css = atlas.get_css()  # insert once, e.g. into the page's header
+        html = atlas.get_html(":smile:")  # <span class="emoji_atlas ...
+    """
+
+    def __init__(
+        self,
+        identifiers: list[EmojiIdentifierTypes],
+        size: int = 14,
+        columns: int = 32,
+        bg_color: ColorTypes | None = None,
+        quality: int = 90,
+        class_name: str = "emoji_atlas",
+    ):
+        """
+        :param identifiers: The emojis to add to the atlas, see
+            :func:`render_emoji`. Emojis which can not be found are skipped.
+        :param size: The width and height of each emoji in pixels
+        :param columns: The count of emojis per row in the atlas image
+        :param bg_color: The background color. Transparent by default.
+        :param quality: The rendering quality, see :func:`render_emoji`.
+        :param class_name: The CSS class name of the atlas. Each emoji's class
+            name is combined of this name and the emoji's unicode sequence.
+        """
+        self.class_name = class_name
+        "The atlas' CSS class name"
+        self.positions: dict[str, tuple[int, int]] = {}
+        "The position in pixels of each emoji within the atlas by sequence key"
+        self.cell_size: tuple[int, int] = (0, 0)
+        "The size of a single emoji in pixels"
+        self.image: Image | None = None
+        "The atlas image. None if no emoji could be rendered"
+        images: dict[str, Image] = {}
+        for identifier in identifiers:
+            sequence = EmojiDb.get_character_sequence(identifier)
+            if len(sequence) == 0:
+                continue
+            key = sequence_key(sequence)
+            if key in images:
+                continue
+            image = EmojiRenderer.render_emoji(
+                sequence, size=size, bg_color=bg_color, quality=quality
+            )
+            if image is not None:
+                images[key] = image
+        if len(images) == 0:
+            return
+        self.cell_size = next(iter(images.values())).get_size()
+        columns = max(1, min(columns, len(images)))
+        rows = (len(images) + columns - 1) // columns
+        canvas = Canvas(
+            size=(columns * self.cell_size[0], rows * self.cell_size[1]),
+            default_color=bg_color if bg_color is not None else Colors.TRANSPARENT,
+            pixel_format="RGBA",
+        )
+        for index, (key, image) in enumerate(images.items()):
+            position = (
+                (index % columns) * self.cell_size[0],
+                (index // columns) * self.cell_size[1],
+            )
+            canvas.draw_image(image, position, auto_blend=False)
+            self.positions[key] = position
+        self.image = canvas.to_image()
+
+    @classmethod
+    def from_search(cls, name_mask: str, md: bool = False, **params) -> EmojiAtlas:
+        """
+        Creates an atlas containing all emojis matching given name mask
+
+        :param name_mask: The name mask, e.g. "*smiling*", see
+            :meth:`EmojiDb.find_emojis_by_name`
+        :param md: Defines if the markdown names shall be searched
+        :param params: The atlas' parameters, see :class:`EmojiAtlas`
+        :return: The atlas
+        """
+        emojis = EmojiDb.find_emojis_by_name(name_mask, md=md)
+        return cls([emoji.sequence for emoji in emojis], **params)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __contains__(self, identifier: EmojiIdentifierTypes) -> bool:
+        return self.get_position(identifier) is not None
+
+    def get_position(self, identifier: EmojiIdentifierTypes) -> tuple[int, int] | None:
+        """
+        Returns the position of an emoji within the atlas image
+
+        :param identifier: The emoji's identifier, see :func:`render_emoji`
+        :return: The position in pixels if the emoji is part of the atlas
+        """
+        sequence = EmojiDb.get_character_sequence(identifier)
+        if len(sequence) == 0:
+            return None
+        return self.positions.get(sequence_key(sequence), None)
+
+    def get_emoji_class(self, identifier: EmojiIdentifierTypes) -> str | None:
+        """
+        Returns the CSS class name of a single emoji
+
+        :param identifier: The emoji's identifier, see :func:`render_emoji`
+        :return: The class name if the emoji is part of the atlas
+        """
+        if identifier not in self:
+            return None
+        key = sequence_key(EmojiDb.get_character_sequence(identifier))
+        return f"{self.class_name}_{key.lower()}"
+
+    def get_css(self) -> str:
+        """
+        Returns the style sheet defining the atlas' class and the class of each
+        emoji within the atlas.
+
+        :return: The CSS code
+        """
+        if self.image is None:
+            return ""
+        encoded = base64.b64encode(self.image.to_png()).decode("ascii")
+        width, height = self.cell_size
+        lines = [
+            f".{self.class_name}{{display:inline-block;width:{width}px;"
+            f"height:{height}px;vertical-align:middle;"
+            f"background-image:url(data:image/png;base64,{encoded});"
+            f"background-repeat:no-repeat}}"
+        ]
+        for key, (x, y) in self.positions.items():
+            lines.append(
+                f".{self.class_name}_{key.lower()}"
+                f"{{background-position:-{x}px -{y}px}}"
+            )
+        return "\n".join(lines)
+
+    def get_html(
+        self, identifier: EmojiIdentifierTypes, title: str | None = None
+    ) -> str | None:
+        """
+        Returns the HTML code showing a single emoji of the atlas.
+
+        Requires the style sheet provided by :meth:`get_css`.
+
+        :param identifier: The emoji's identifier, see :func:`render_emoji`
+        :param title: The tooltip to show
+        :return: The HTML code if the emoji is part of the atlas
+        """
+        emoji_class = self.get_emoji_class(identifier)
+        if emoji_class is None:
+            return None
+        title = f' title="{html.escape(title)}"' if title is not None else ""
+        return f'<span class="{self.class_name} {emoji_class}"{title}></span>'
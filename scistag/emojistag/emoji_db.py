@@ -6,14 +6,18 @@ such as the unicode encoding or their category.
 """
 
 from __future__ import annotations
+import hashlib
 import io
 import json
-from fnmatch import fnmatch
+import os
+import tempfile
 
 import scistag.addons
+from scistag.common.configuration import ESSENTIAL_DATA_MD5
 from scistag.common.mt.stag_lock import StagLock
 from scistag.common.essential_data import get_edp
 from scistag.filestag.file_stag import FileStag
+from scistag.filestag.shared_archive import SharedArchive
 
 from .emoji_definitions import (
     EmojiIdentifierTypes,
@@ -21,9 +25,14 @@ from .emoji_definitions import (
     EMOJI_NAMES,
     EMOJI_DB_NAME,
     EMOJI_NAMES_MARKDOWN,
+    EMOJI_INDEX_NAME,
 )
+from .emoji_index import EmojiIndex, EMOJI_INDEX_VERSION, sequence_key
 from .emoji_info import EmojiInfo
 
+PNG_PATH = "images/noto/cpngs/"
+"Path of the emoji PNGs within the essential data"
+
 
 class EmojiDb:
     """
@@ -53,6 +62,8 @@ class EmojiDb:
     Contains all details about every single known emoji such as name,
     category, subcategory and of course unicode sequence
     """
+    _index: EmojiIndex | None = None
+    "The compact emoji index used for all searches, see :meth:`get_index`"
 
     @classmethod
     def _get_markdown_dict(cls) -> dict:
@@ -123,6 +134,61 @@ class EmojiDb:
                 value["subcategory"] = value["subgroup"]
             return cls._main_dict
 
+    @classmethod
+    def get_index(cls) -> EmojiIndex:
+        """
+        Returns the compact index of all emojis.
+
+        The index is loaded from the essential data if it is provided there,
+        otherwise it is created once from the main database and cached in the
+        temp directory.
+
+        :return: The index
+        """
+        with cls._access_lock:
+            if cls._index is not None:
+                return cls._index
+            edp = get_edp()
+            index_data = FileStag.load(edp + EMOJI_INDEX_NAME)
+            cache_name = cls._get_index_cache_name()
+            if index_data is None and os.path.exists(cache_name):
+                index_data = FileStag.load(cache_name)
+            if index_data is not None:
+                try:
+                    cls._index = EmojiIndex.from_json(index_data)
+                    return cls._index
+                except (ValueError, KeyError):
+                    pass
+            png_keys = {
+                sequence_key(name[len("emoji_u") : -len(".png")].split("_"))
+                for name in SharedArchive.scan(
+                    edp,
+                    name_filter=PNG_PATH + "emoji_u*.png",
+                    long_identifier=False,
+                )
+                for name in [os.path.basename(name)]
+            }
+            cls._index = EmojiIndex.from_db(cls._get_main_dict(), png_keys)
+            os.makedirs(os.path.dirname(cache_name), exist_ok=True)
+            temp_name = f"{cache_name}.{os.getpid()}.tmp"
+            if FileStag.save(temp_name, cls._index.to_json()):
+                os.replace(temp_name, cache_name)
+            return cls._index
+
+    @staticmethod
+    def _get_index_cache_name() -> str:
+        """
+        Returns the name of the file in which the emoji index is cached
+
+        :return: The file name, unique for each version of the essential data
+        """
+        version = hashlib.md5(
+            f"{ESSENTIAL_DATA_MD5}_{EMOJI_INDEX_VERSION}".encode("utf-8")
+        ).hexdigest()
+        return os.path.join(
+            tempfile.gettempdir(), "scistag", f"emoji_index_{version}.json"
+        )
+
     @classmethod
     def get_sequence_for_name(cls, identifier: str) -> list:
         """
@@ -250,7 +316,7 @@ class EmojiDb:
         lower_cased = [element.lower() for element in sequence]
         combined = "_".join(lower_cased)
         edp = get_edp()
-        emoji_path = edp + f"images/noto/cpngs/emoji_u{combined}.png"
+        emoji_path = edp + PNG_PATH + f"emoji_u{combined}.png"
         return FileStag.load(emoji_path)
 
     @classmethod
@@ -262,10 +328,14 @@ class EmojiDb:
         :param sequence: The unicode sequence, e.g. ["1f98c"] for a stag
         :return: True if the PNG does exist.
         """
+        index = cls.get_index()
+        row = index.get_row(sequence)
+        if row is not None:
+            return index.has_png(row)
         lower_cased = [element.lower() for element in sequence]
         combined = "_".join(lower_cased)
         edp = get_edp()
-        emoji_path = edp + f"images/noto/cpngs/emoji_u{combined}.png"
+        emoji_path = edp + PNG_PATH + f"emoji_u{combined}.png"
         return FileStag.exists(emoji_path)
 
     @classmethod
@@ -276,11 +346,10 @@ class EmojiDb:
         :param sequence: The unicode sequence without leading zeros.
         :return: The EmojiInfo object if available
         """
-        main_db = cls._get_main_dict()
-        upper_cased = [element.upper() for element in sequence]
-        combined = "_".join(upper_cased)
-        if combined in main_db:
-            return EmojiInfo.model_validate(main_db[combined])
+        index = cls.get_index()
+        row = index.get_row(sequence)
+        if row is not None:
+            return index.get_info(row)
         return None
 
     @classmethod
@@ -290,9 +359,7 @@ class EmojiDb:
 
         :return: A list of all known emoji categories
         """
-        main_dict = cls._get_main_dict()
-        categories = set([element["category"] for element in main_dict.values()])
-        return sorted(list(categories))
+        return list(cls.get_index().category_names)
 
     @classmethod
     def get_sub_categories(cls, category: str) -> list[str]:
@@ -302,13 +369,16 @@ class EmojiDb:
         :param category: The category's name
         :return: A list of subcategories in this category
         """
-        main_dict = cls._get_main_dict()
-        filtered_list = [
-            element["subcategory"]
-            for element in main_dict.values()
-            if element["category"] == category
-        ]
-        return sorted(list(set(filtered_list)))
+        index = cls.get_index()
+        if category not in index.category_names:
+            return []
+        category_id = index.category_names.index(category)
+        filtered = {
+            index.subcategory_names[subcategory]
+            for cur_category, subcategory in zip(index.categories, index.subcategories)
+            if cur_category == category_id
+        }
+        return sorted(filtered)
 
     @classmethod
     def get_emojis_in_category(
@@ -323,21 +393,27 @@ class EmojiDb:
             provided all emojis in the category will be returned.
         :return: A list of all emojis in given category and subcategory
         """
-        main_dict = cls._get_main_dict()
-        if subcategory is not None:
-            filtered_list = [
-                EmojiInfo.model_validate(element)
-                for element in main_dict.values()
-                if element["category"] == category
-                and element["subcategory"] == subcategory
-            ]
-        else:
-            filtered_list = [
-                EmojiInfo.model_validate(element)
-                for element in main_dict.values()
-                if element["category"] == category
-            ]
-        return sorted(filtered_list, key=lambda element: element.name)
+        index = cls.get_index()
+        if category not in index.category_names or (
+            subcategory is not None and subcategory not in index.subcategory_names
+        ):
+            return []
+        category_id = index.category_names.index(category)
+        subcategory_id = (
+            index.subcategory_names.index(subcategory)
+            if subcategory is not None
+            else None
+        )
+        rows = [
+            row
+            for row, (cur_category, cur_subcategory) in enumerate(
+                zip(index.categories, index.subcategories)
+            )
+            if cur_category == category_id
+            and (subcategory_id is None or cur_subcategory == subcategory_id)
+        ]
+        rows = sorted(rows, key=lambda row: index.names[row])
+        return [index.get_info(row) for row in rows]
 
     @classmethod
     def find_emojis_by_name(
@@ -353,22 +429,9 @@ class EmojiDb:
             graphic for them exists.
         :return: A list of all matching Emojis
         """
-        main_dict = cls._get_main_dict()
-        if md:
-            result = [
-                EmojiInfo.model_validate(element)
-                for element in main_dict.values()
-                if fnmatch(element.get("markdownName", ""), name_mask)
-            ]
-        else:
-            result = [
-                EmojiInfo.model_validate(element)
-                for element in main_dict.values()
-                if fnmatch(element["name"], name_mask)
-            ]
-        if not find_all:
-            result = [element for element in result if cls.png_exists(element.sequence)]
-        return result
+        index = cls.get_index()
+        rows = index.find(name_mask, md=md, png_only=not find_all)
+        return [index.get_info(row) for row in rows]
 
     @classmethod
     def __getitem__(cls, key: str) -> EmojiInfo | None:
@@ -22,3 +22,9 @@ EMOJI_NAMES_MARKDOWN = "data/emoji/markdown_emoji_names.json"
 Markdown emoji conversion dictionary. Containing the unicode codes for common 
 Emoji names used in markdown
 """
+EMOJI_INDEX_NAME = "data/emoji/emoji_index.json"
+"""
+Precomputed, compact emoji index, see :class:`EmojiIndex`. If the essential data
+does not contain it yet it is created from :data:`EMOJI_DB_NAME` and cached in
+the temp directory.
+"""
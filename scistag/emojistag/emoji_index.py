@@ -0,0 +1,298 @@
+"""
+Defines the class :class:`EmojiIndex`, a compact, column based index of all
+emojis in the :class:`EmojiDb` which allows searching them by name without
+having to parse the full emoji database.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from bisect import bisect_left, bisect_right
+from fnmatch import translate
+
+from .emoji_info import EmojiInfo
+
+EMOJI_INDEX_VERSION = 1
+"Version of the index format, increased whenever the format changes"
+
+_WILDCARD_CHARACTERS = re.compile(r"[*?\[]")
+"Regular expression matching the special characters of a name mask"
+_WILDCARD_FRAGMENTS = re.compile(r"\*|\?|\[!?\]?[^\]]*\]|\[")
+"Regular expression splitting a name mask into its literal fragments"
+
+
+def sequence_key(sequence: list[str]) -> str:
+    """
+    Returns the key of an emoji within the index
+
+    :param sequence: The unicode sequence, e.g. ["1f98c"] for a stag
+    :return: The upper-cased, underscore separated key, e.g. "1F98C"
+    """
+    return "_".join(sequence).upper()
+
+
+class EmojiIndex:
+    """
+    Column based index of all known emojis.
+
+    Every emoji is identified by its row. The names are additionally sorted
+    to find all emojis starting with a given prefix via binary search and the
+    availability of a PNG graphic for each emoji is stored in a bitmap.
+
+    :class:`EmojiInfo` objects are only created for the emojis being returned.
+    """
+
+    def __init__(self, data: dict):
+        """
+        :param data: The index data as created by :meth:`from_db` or loaded
+            via :meth:`from_json`.
+        """
+        if data.get("version", 0) != EMOJI_INDEX_VERSION:
+            raise ValueError("Unsupported emoji index version")
+        self.sequences: list[str] = data["sequences"]
+        "The key of each emoji, see :func:`sequence_key`"
+        self.names: list[str] = data["names"]
+        "The unicode name of each emoji"
+        self.markdown_names: list[str | None] = data["markdownNames"]
+        "The GitHub markdown name of each emoji (if available)"
+        self.category_names: list[str] = data["categoryNames"]
+        "The names of all categories"
+        self.subcategory_names: list[str] = data["subcategoryNames"]
+        "The names of all subcategories"
+        self.categories: list[int] = data["categories"]
+        "The index of each emoji's category in :attr:`category_names`"
+        self.subcategories: list[int] = data["subcategories"]
+        "The index of each emoji's subcategory in :attr:`subcategory_names`"
+        self.country_codes: list[str | None] = data["countryCodes"]
+        "The country code of each flag emoji"
+        self.country_names: list[str | None] = data["countryNames"]
+        "The country name of each flag emoji"
+        self.png_bitmap = bytes.fromhex(data["pngBitmap"])
+        "Bitmap defining for which emoji a PNG graphic is available"
+        self._rows = {key: row for row, key in enumerate(self.sequences)}
+        "The row of each emoji by its key"
+        self._sorted_names = self._sort_rows(self.names)
+        "All names in sorted order and their corresponding rows"
+        self._sorted_markdown_names = self._sort_rows(self.markdown_names)
+        "All markdown names in sorted order and their corresponding rows"
+
+    @staticmethod
+    def _sort_rows(
+        names: list[str | None],
+    ) -> tuple[list[str], list[int], str, list[int]]:
+        """
+        Sorts the rows by name
+
+        :param names: The name of each row
+        :return: The sorted names (without undefined ones), the corresponding
+            rows, the sorted names joined to a single text with one name per
+            line and the offset of each line within this text.
+        """
+        order = sorted(
+            (name, row) for row, name in enumerate(names) if name is not None
+        )
+        sorted_names = [name for name, _ in order]
+        line_starts = []
+        offset = 0
+        for name in sorted_names:
+            line_starts.append(offset)
+            offset += len(name) + 1
+        return (
+            sorted_names,
+            [row for _, row in order],
+            "\n".join(sorted_names),
+            line_starts,
+        )
+
+    @classmethod
+    def from_db(cls, main_dict: dict, png_keys: set[str]) -> "EmojiIndex":
+        """
+        Creates the index from the main emoji database
+
+        :param main_dict: The emoji database. Every emoji's details, stored by
+            its key, see :func:`sequence_key`
+        :param png_keys: The keys of all emojis for which a PNG graphic
+            exists
+        :return: The index
+        """
+        category_names = sorted({element["group"] for element in main_dict.values()})
+        subcategory_names = sorted(
+            {element["subgroup"] for element in main_dict.values()}
+        )
+        category_ids = {name: index for index, name in enumerate(category_names)}
+        subcategory_ids = {name: index for index, name in enumerate(subcategory_names)}
+        elements = list(main_dict.items())
+        png_bitmap = bytearray((len(elements) + 7) // 8)
+        for row, (key, _) in enumerate(elements):
+            if key in png_keys:
+                png_bitmap[row >> 3] |= 1 << (row & 7)
+        return cls(
+            {
+                "version": EMOJI_INDEX_VERSION,
+                "sequences": [key for key, _ in elements],
+                "names": [element["name"] for _, element in elements],
+                "markdownNames": [
+                    element.get("markdownName", None) for _, element in elements
+                ],
+                "categoryNames": category_names,
+                "subcategoryNames": subcategory_names,
+                "categories": [category_ids[el["group"]] for _, el in elements],
+                "subcategories": [
+                    subcategory_ids[el["subgroup"]] for _, el in elements
+                ],
+                "countryCodes": [el.get("countryCode", None) for _, el in elements],
+                "countryNames": [el.get("countryName", None) for _, el in elements],
+                "pngBitmap": png_bitmap.hex(),
+            }
+        )
+
+    @classmethod
+    def from_json(cls, data: bytes) -> "EmojiIndex":
+        """
+        Loads an index stored via :meth:`to_json`
+
+        :param data: The json data
+        :return: The index
+        """
+        return cls(json.loads(data))
+
+    def to_json(self) -> bytes:
+        """
+        Serializes the index
+
+        :return: The json data
+        """
+        return json.dumps(
+            {
+                "version": EMOJI_INDEX_VERSION,
+                "sequences": self.sequences,
+                "names": self.names,
+                "markdownNames": self.markdown_names,
+                "categoryNames": self.category_names,
+                "subcategoryNames": self.subcategory_names,
+                "categories": self.categories,
+                "subcategories": self.subcategories,
+                "countryCodes": self.country_codes,
+                "countryNames": self.country_names,
+                "pngBitmap": self.png_bitmap.hex(),
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+    def __len__(self) -> int:
+        return len(self.sequences)
+
+    def get_row(self, sequence: list[str]) -> int | None:
+        """
+        Returns the row of an emoji
+
+        :param sequence: The unicode sequence, e.g. ["1f98c"] for a stag
+        :return: The row if the emoji is known
+        """
+        return self._rows.get(sequence_key(sequence), None)
+
+    def has_png(self, row: int) -> bool:
+        """
+        Returns if a PNG graphic exists for given emoji
+
+        :param row: The emoji's row
+        :return: True if the graphic exists
+        """
+        return bool(self.png_bitmap[row >> 3] & (1 << (row & 7)))
+
+    def get_info(self, row: int) -> EmojiInfo:
+        """
+        Returns the details of an emoji
+
+        :param row: The emoji's row
+        :return: The emoji's details
+        """
+        return EmojiInfo.model_construct(
+            sequence=self.sequences[row].split("_"),
+            name=self.names[row],
+            category=self.category_names[self.categories[row]],
+            subcategory=self.subcategory_names[self.subcategories[row]],
+            markdownName=self.markdown_names[row],
+            countryCode=self.country_codes[row],
+            countryName=self.country_names[row],
+        )
+
+    @staticmethod
+    def _scan(
+        name_mask: str,
+        names: list[str],
+        rows: list[int],
+        text: str,
+        line_starts: list[int],
+    ) -> set[int]:
+        """
+        Returns the rows of all names matching a mask which starts with a
+        wildcard.
+
+        Only the names containing the mask's longest literal fragment are
+        verified, the fragment is searched in all names at once.
+
+        :param name_mask: The name mask, e.g. "*sun*"
+        :param names: The sorted names
+        :param rows: The row of each name
+        :param text: The sorted names joined via newlines
+        :param line_starts: The offset of each name within the text
+        :return: The matching rows
+        """
+        if name_mask.strip("*") == "":
+            return set(rows)
+        matches = re.compile(translate(name_mask)).match
+        fragment = max(_WILDCARD_FRAGMENTS.split(name_mask), key=len)
+        if fragment == "":
+            return {row for name, row in zip(names, rows) if matches(name)}
+        contains_only = name_mask == f"*{fragment}*"
+        result = set()
+        position = text.find(fragment)
+        while position != -1:
+            line = bisect_right(line_starts, position) - 1
+            if contains_only or matches(names[line]):
+                result.add(rows[line])
+            next_line = line + 1
+            position = text.find(
+                fragment,
+                line_starts[next_line] if next_line < len(line_starts) else len(text),
+            )
+        return result
+
+    def find(self, name_mask: str, md: bool = False, png_only=False) -> list[int]:
+        """
+        Returns the rows of all emojis matching given name mask.
+
+        :param name_mask: The name mask to search for, e.g "*sun*". Supports the
+            same wildcards as :func:`fnmatch.fnmatch`.
+        :param md: Defines if the GitHub markdown names shall be searched
+            instead of the unicode names.
+        :param png_only: Defines if only emojis shall be returned for which a
+            PNG graphic exists
+        :return: The rows of all matching emojis in ascending order
+        """
+        names, rows, text, line_starts = (
+            self._sorted_markdown_names if md else self._sorted_names
+        )
+        wildcard = _WILDCARD_CHARACTERS.search(name_mask)
+        prefix = name_mask[: wildcard.start()] if wildcard else name_mask
+        result = set()
+        if md and prefix == "" and re.match(translate(name_mask), ""):
+            # emojis without markdown name match like an empty name
+            result = {row for row, name in enumerate(self.markdown_names) if not name}
+        if wildcard is not None and prefix == "":
+            result.update(self._scan(name_mask, names, rows, text, line_starts))
+        else:
+            matches = re.compile(translate(name_mask)).match if wildcard else None
+            index = bisect_left(names, prefix)
+            while index < len(names):
+                name = names[index]
+                if not name.startswith(prefix) or matches is None and name != prefix:
+                    break
+                if matches is None or matches(name):
+                    result.add(rows[index])
+                index += 1
+        if png_only:
+            result = {row for row in result if self.has_png(row)}
+        return sorted(result)
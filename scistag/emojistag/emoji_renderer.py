@@ -4,6 +4,9 @@ resolutions.
 """
 
 from __future__ import annotations
+from collections import OrderedDict
+from threading import Lock
+
 from scistag.imagestag import svg, Image, Size2D, ColorTypes, Color, Canvas
 from .emoji_db import EmojiDb
 from ..imagestag.size2d import Size2DTypes
@@ -25,8 +28,29 @@ class EmojiRenderer:
     """
     Renders an emoji by either rendering an SVG or resizing a pre-rendered
     PNG from the Noto Emoji database.
+
+    The most recently rendered emojis are kept in memory so that repeatedly
+    requesting the same emoji in the same size and style does not need to
+    decode and render it again.
     """
 
+    cache_size: int = 256
+    """
+    The maximum count of rendered emojis kept in memory. 0 disables the cache.
+    """
+    _cache: OrderedDict[tuple, Image] = OrderedDict()
+    "The rendered emojis, least recently used first"
+    _cache_lock = Lock()
+    "Access lock to the cache"
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Removes all rendered emojis from the cache
+        """
+        with cls._cache_lock:
+            cls._cache.clear()
+
     @classmethod
     def get_svg_support(cls) -> bool:
         """
@@ -76,10 +100,6 @@ class EmojiRenderer:
             used.
         :return: The SVG data on success, otherwise None
         """
-        svg_renderer_available = (
-            svg.SvgRenderer.available() and quality >= MINIMUM_SVG_RENDERING_QUALITY
-        )
-
         sequence = EmojiDb.get_character_sequence(identifier)
         # compute size
         if size is None:
@@ -101,6 +121,48 @@ class EmojiRenderer:
                 size = round(int(size)), round(int(size))
             else:
                 size = Size2D(size).to_int_tuple()
+        if cls.cache_size <= 0:
+            return cls._render(sequence, size, bg_color, quality)
+        key = (
+            tuple(element.upper() for element in sequence),
+            size,
+            Color(bg_color).to_int_rgba() if bg_color is not None else None,
+            quality,
+        )
+        with cls._cache_lock:
+            image = cls._cache.get(key, None)
+            if image is not None:
+                cls._cache.move_to_end(key)
+        if image is None:
+            image = cls._render(sequence, size, bg_color, quality)
+            if image is None:
+                return None
+            with cls._cache_lock:
+                cls._cache[key] = image
+                while len(cls._cache) > cls.cache_size:
+                    cls._cache.popitem(last=False)
+        return image.copy()
+
+    @classmethod
+    def _render(
+        cls,
+        sequence: list[str],
+        size: tuple[int, int],
+        bg_color: ColorTypes | None,
+        quality: int,
+    ) -> Image | None:
+        """
+        Renders an emoji, see :meth:`render_emoji`
+
+        :param sequence: The emoji's unicode sequence
+        :param size: The size in pixels
+        :param bg_color: The background color (if any)
+        :param quality: The desired quality
+        :return: The emoji image on success, otherwise None
+        """
+        svg_renderer_available = (
+            svg.SvgRenderer.available() and quality >= MINIMUM_SVG_RENDERING_QUALITY
+        )
         # try to fetch emoji data
         svg_data = None
         is_default_size = size == EMOJI_DEFAULT_SIZE.to_int_tuple()
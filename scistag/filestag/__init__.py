@@ -9,6 +9,7 @@ from .protocols import ZIP_SOURCE_PROTOCOL
 from .file_stag import FileStag, FileSourceTypes
 from .file_path import FilePath
 from .file_source import FileSource
+from .file_watcher import FileWatcher
 from .file_observer import FileDataObserver
 from .file_sink import FileSink, FileStorageOptions
 from .memory_zip import MemoryZip
@@ -24,5 +25,6 @@ __all__ = [
     "FileSink",
     "FileStorageOptions",
     "FileDataObserver",
+    "FileWatcher",
     "MemoryZip",
 ]
@@ -9,10 +9,12 @@ from __future__ import annotations
 import hashlib
 import io
 import os
+import time
 
 from scistag.common.observer import DataObserver
 from scistag.filestag import FileStag
 from scistag.filestag.file_source import FileSource
+from scistag.filestag.file_watcher import FileWatcher
 
 
 class FileDataObserver(DataObserver):
@@ -22,6 +24,12 @@ class FileDataObserver(DataObserver):
 
     When ever a single file is changed the observer is triggered and it's
     hash value changed.
+
+    If created with ``event_driven=True`` local files and directories are
+    observed via the process wide :class:`FileWatcher` instead. The files are
+    then neither scanned nor hashed again until the watcher reported a
+    modification, only the modified files are re-hashed and the hash is up to date
+    without waiting for the refresh interval.
     """
 
     def __init__(
@@ -29,13 +37,19 @@ class FileDataObserver(DataObserver):
         source: FileSource | list[FileSource | str] | None | str,
         max_content_size: int = 0,
         refresh_time_s: float = 1.0,
+        event_driven: bool = False,
     ):
         """
         :param source: The file source we shall observe
         :param max_content_size: Defines the maximum size in bytes up to which
             not just file stamps and file size are evaluated but actually also
             the content of the files themselves.
-        :param refresh_time_s: The minimum time gap between a refresh
+        :param refresh_time_s: The minimum time gap between a refresh. Only used
+            for sources which can not be observed event driven.
+        :param event_driven: Defines if local files and directories shall be
+            observed via :meth:`FileWatcher.shared` rather than being polled.
+            Modifications are reported with a short delay, see
+            :attr:`FileWatcher.debounce_s`.
         """
         super().__init__(refresh_time_s=refresh_time_s)
         self.max_content_size = max_content_size
@@ -57,6 +71,17 @@ class FileDataObserver(DataObserver):
         "The file sources to observe"
         self.files = [element for element in source if isinstance(element, str)]
         "The list of single files to observe"
+        self.watcher: FileWatcher | None = (
+            FileWatcher.shared() if event_driven else None
+        )
+        "The watcher reporting modifications of local files and directories"
+        self._watched: set[int | str] = set()
+        "The keys of the sources and files observed by the watcher"
+        self._hashes: dict[int | str, tuple[int, str | None]] = {}
+        """The revision and the last hash of each source and file observed by the
+        watcher"""
+        for element in self.sources + self.files:
+            self._watch(element)
 
     def add(self, source: FileSource | str):
         """
@@ -70,25 +95,110 @@ class FileDataObserver(DataObserver):
             self.files.append(source)
         else:
             self.sources.append(source)
+        self._watch(source)
+        self.last_update = None
+
+    def _watch(self, element: FileSource | str):
+        """
+        Registers a file or a local directory source at the watcher
+
+        :param element: The file source or filename
+        """
+        if self.watcher is None:
+            return
+        if isinstance(element, str):
+            if self.watcher.watch(element):
+                self._watched.add(self._key(element))
+            return
+        from scistag.filestag.sources.file_source_disk import FileSourceDisk
+
+        if isinstance(element, FileSourceDisk) and self.watcher.watch(
+            element.search_path, recursive=element.recursive
+        ):
+            self._watched.add(self._key(element))
+
+    @staticmethod
+    def _key(element: FileSource | str) -> int | str:
+        """
+        Returns the key under which the hash of a source or file is cached
+
+        :param element: The file source or filename
+        :return: The filename or the source's id
+        """
+        return element if isinstance(element, str) else id(element)
+
+    @property
+    def event_driven(self) -> bool:
+        """
+        Returns if all sources and files are observed by the watcher
+        """
+        if self.watcher is None:
+            return False
+        return all(
+            self._key(element) in self._watched for element in self.sources + self.files
+        )
+
+    def __hash__(self) -> int:
+        if self.event_driven:  # only modified elements are hashed again
+            self._last_hash = self.hash_int()
+            self.last_update = time.time()
+            return self._last_hash
+        return super().__hash__()
+
+    def _element_hash(self, element: FileSource | str) -> str | None:
+        """
+        Returns the hash of a single source or file. Elements observed by the
+        watcher are only hashed again after they were modified.
+
+        :param element: The file source or filename
+        :return: The hash, None if the file does not exist
+        """
+        revision = None
+        key = self._key(element)
+        if key in self._watched:
+            path = element if isinstance(element, str) else element.search_path
+            revision = self.watcher.revision(path)
+            cached = self._hashes.get(key, None)
+            if cached is not None and revision is not None and cached[0] == revision:
+                return cached[1]
+        if isinstance(element, str):
+            result = self._file_hash(element)
+        else:
+            element.refresh()
+            result = element.get_hash(max_content_size=self.max_content_size)
+        if revision is not None:
+            self._hashes[key] = (revision, result)
+        return result
+
+    def _file_hash(self, filename: str) -> str | None:
+        """
+        Computes the hash of a single file
+
+        :param filename: The file's name
+        :return: The hash, None if the file does not exist
+        """
+        if not os.path.isfile(filename):
+            return None
+        mod_date = os.path.getmtime(filename)
+        size = os.path.getsize(filename)
+        content_hash: str = ""
+        if size < self.max_content_size:
+            content_hash = hashlib.md5(FileStag.load(filename)).hexdigest()
+        stream = io.BytesIO()
+        stream.write(content_hash.encode("utf-8"))
+        stream.write(int(mod_date * 10).to_bytes(8, "little", signed=True))
+        stream.write(size.to_bytes(8, "little", signed=True))
+        return hashlib.md5(stream.getvalue()).hexdigest()
 
     def hash_int(self) -> int:
         hashes = "hi"
         for cur_source in self.sources:
-            cur_source.refresh()
-            hashes += cur_source.get_hash(max_content_size=self.max_content_size)
+            hashes += self._element_hash(cur_source)
         for element in self.files:
             if not FileStag.is_simple(element):
                 raise ValueError("Only local files supported as of now")
-            if not os.path.isfile(element):
+            file_hash = self._element_hash(element)
+            if file_hash is None:
                 return 0
-            mod_date = os.path.getmtime(element)
-            size = os.path.getsize(element)
-            content_hash: str = ""
-            if size < self.max_content_size:
-                content_hash = hashlib.md5(FileStag.load(element)).hexdigest()
-            stream = io.BytesIO()
-            stream.write(content_hash.encode("utf-8"))
-            stream.write(int(mod_date * 10).to_bytes(8, "little", signed=True))
-            stream.write(size.to_bytes(8, "little", signed=True))
-            hashes += hashlib.md5(stream.getvalue()).hexdigest()
+            hashes += file_hash
         return int(hashlib.md5(hashes.encode("utf-8")).hexdigest(), 16)
@@ -23,6 +23,7 @@ from scistag.common.trees.text_tree import TextTree
 from scistag.filestag.bundle import Bundle
 from scistag.filestag.file_source_iterator import (
     FileSourceIterator,
+    AsyncFileSourceIterator,
     FileIterationData,
     FilterCallback,
 )
@@ -575,6 +576,27 @@ class FileSource:
         """
         return FileSourceIterator(self)
 
+    def __aiter__(self) -> AsyncFileSourceIterator:
+        """
+        Returns an asynchronous iterator for this file source which fetches
+        multiple files concurrently, see :meth:`iter_async`.
+
+        :return: The iterator
+        """
+        return self.iter_async()
+
+    def iter_async(self, max_concurrency: int = 16) -> AsyncFileSourceIterator:
+        """
+        Returns an asynchronous iterator for this file source
+
+        ``async for element in source.iter_async(max_concurrency=64)``
+
+        :param max_concurrency: The maximum count of files to be fetched
+            concurrently
+        :return: The iterator
+        """
+        return AsyncFileSourceIterator(self, max_concurrency=max_concurrency)
+
     def __enter__(self) -> "FileSource":
         """
         Provides the FileSource context. Allows automated clean closing of
@@ -658,6 +680,18 @@ class FileSource:
             WebCache.store(unique_name, result)
         return result
 
+    async def afetch(self, filename: str) -> bytes | None:
+        """
+        Reads a file from this file source, identified by name, without
+        blocking the event loop.
+
+        See :meth:`fetch`.
+
+        :param filename: The name of the file to read
+        :return: The file's content on success, None otherwise
+        """
+        return await FileStag.run_async(self.fetch, filename)
+
     def exists(self, filename: str) -> bool:
         """
         Verifies if a file exists.
@@ -868,6 +902,24 @@ class FileSource:
             and iterator.processed_file_count >= self.max_file_count
         ):
             raise StopIteration
+        next_entry = self.handle_next_entry(iterator)
+        if next_entry is None:  # stop if no files are available anymore
+            return None
+        next_entry, target_name = next_entry
+        data = self.fetch(next_entry.filename) if not self.dont_load else None
+        return self.handle_provide_result(iterator, target_name, data)
+
+    def handle_next_entry(
+        self, iterator: FileSourceIterator
+    ) -> tuple[FileListEntry, str] | None:
+        """
+        Returns the next entry which passes all filters
+
+        :param iterator: The iterator object which keeps track of the current
+            processing
+        :return: The entry and the name under which it shall be provided. None
+            if no files are available anymore.
+        """
         while True:
             next_entry = self.handle_get_next_entry(iterator)
             if next_entry is None:  # stop if no files are available anymore
@@ -881,9 +933,7 @@ class FileSource:
                 )
             # continue if just the current file is skipped
             if target_name is not None:
-                break
-        data = self.fetch(next_entry.filename) if not self.dont_load else None
-        return self.handle_provide_result(iterator, target_name, data)
+                return next_entry, target_name
 
     def handle_get_next_entry(
         self, iterator: "FileSourceIterator"
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+from collections import deque
 from dataclasses import dataclass
 from typing import Callable, Union, TYPE_CHECKING
 
@@ -46,6 +48,113 @@ class FileSourceIterator:
         return result
 
 
+class AsyncFileSourceIterator:
+    """
+    Asynchronous iterator providing the data from a file source via
+    ``async for element in source``.
+
+    The data of up to ``max_concurrency`` files is fetched concurrently, the
+    elements are though provided in the same order as by the synchronous
+    iteration.
+    """
+
+    def __init__(self, source: "FileSource", max_concurrency: int = 16):
+        """
+        :param source: The file source to provide the data for
+        :param max_concurrency: The maximum count of files to be fetched
+            concurrently
+        """
+        self.source = source
+        "The FileSource which created this iterator"
+        self.iterator = FileSourceIterator(source)
+        "Keeps track of the file and processing indices"
+        self.max_concurrency = max(max_concurrency, 1)
+        "The maximum count of files being fetched concurrently"
+        self._pending: deque[tuple[str, asyncio.Future | None]] = deque()
+        "The target names and fetch tasks of the upcoming elements"
+        self._scheduled_count = 0
+        "The count of files scheduled for being fetched so far"
+        self._exhausted = False
+        "Defines if all files were scheduled"
+
+    def __aiter__(self) -> "AsyncFileSourceIterator":
+        return self
+
+    async def __anext__(self) -> "FileSourceElement":
+        """
+        Requests the next data from the file source
+
+        :return: The data object
+        """
+        await self._schedule()
+        if len(self._pending) == 0:
+            raise StopAsyncIteration
+        target_name, task = self._pending.popleft()
+        try:
+            data = await task if task is not None else None
+        except BaseException:
+            await self.aclose()
+            raise
+        return self.source.handle_provide_result(self.iterator, target_name, data)
+
+    async def aclose(self):
+        """
+        Stops the iteration and cancels fetching the files scheduled in advance,
+        e.g. if the iteration is stopped prematurely.
+
+        Is called automatically if fetching a file failed. Call it, e.g. in a
+        ``finally`` block, when leaving an ``async for`` loop via ``break``.
+        """
+        tasks = [task for _, task in self._pending if task is not None]
+        self.cancel()
+        if len(tasks):
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _schedule(self):
+        """
+        Starts fetching the upcoming files until :attr:`max_concurrency` files
+        are being fetched.
+        """
+        from scistag.filestag import FileStag
+
+        source = self.source
+        while not self._exhausted and len(self._pending) < self.max_concurrency:
+            if (
+                source.max_file_count != -1
+                and self._scheduled_count >= source.max_file_count
+            ):
+                self._exhausted = True
+                break
+            if source.file_list is not None:
+                next_entry = source.handle_next_entry(self.iterator)
+            else:  # entries are provided by the source live, e.g. via network
+                next_entry = await FileStag.run_async(
+                    source.handle_next_entry, self.iterator
+                )
+            if next_entry is None:
+                self._exhausted = True
+                break
+            entry, target_name = next_entry
+            task = (
+                asyncio.ensure_future(source.afetch(entry.filename))
+                if not source.dont_load
+                else None
+            )
+            self._scheduled_count += 1
+            self._pending.append((target_name, task))
+
+    def cancel(self):
+        """
+        Cancels fetching the files scheduled in advance, e.g. if the iteration
+        is stopped prematurely.
+        """
+        for _, task in self._pending:
+            if task is not None:
+                task.cancel()
+        self._pending.clear()
+        self._exhausted = True
+
+
 @dataclass
 class FileIterationData:
     """
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 import json
 import os
-from typing import Union
+from threading import RLock
+from typing import Union, Callable, Any
 
 from pydantic import SecretStr
 
@@ -37,8 +41,47 @@ class FileStag:
     """
     Helper class to load data from a variety of sources such as local files,
     registered archives of the web
+
+    Besides the blocking functions such as :meth:`load` FileStag provides
+    awaitable versions such as :meth:`aload` which execute the blocking work
+    in a shared pool of worker threads so that a single event loop can load
+    many files concurrently.
     """
 
+    max_async_workers: int = 32
+    """
+    The maximum count of worker threads executing the blocking operations of
+    the async functions such as :meth:`aload` concurrently.
+    """
+    _async_executor: ThreadPoolExecutor | None = None
+    "The worker threads used by the async functions"
+    _async_lock = RLock()
+    "Access lock to the async executor"
+
+    @classmethod
+    async def run_async(cls, func: Callable, *args, **kwargs) -> Any:
+        """
+        Executes a blocking function in FileStag's worker threads and waits
+        for its result without blocking the event loop.
+
+        At most :attr:`max_async_workers` functions are executed at the same
+        time, further calls are queued.
+
+        :param func: The function to execute
+        :param args: The positional arguments
+        :param kwargs: The keyword arguments
+        :return: The function's result
+        """
+        with cls._async_lock:
+            if cls._async_executor is None:
+                cls._async_executor = ThreadPoolExecutor(
+                    max_workers=cls.max_async_workers, thread_name_prefix="file_stag"
+                )
+            executor = cls._async_executor
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, functools.partial(func, *args, **kwargs)
+        )
+
     @classmethod
     def is_simple(cls, filename: FileSourceTypes | FileTargetTypes) -> bool:
         """
@@ -313,3 +356,79 @@ class FileStag:
         ):
             return web_fetch(filename, **params) is not None
         return os.path.exists(filename)
+
+    @classmethod
+    async def aload(
+        cls, source: FileSourceTypes, as_stream: bool = False, **params
+    ) -> bytes | BytesIO | None:
+        """
+        Loads a file by filename from a local file, a registered web archive
+        or the web without blocking the event loop.
+
+        See :meth:`load`.
+
+        :param source: The file's source such as a local filename or URL.
+            See :class:`FileNameType`
+        :param as_stream: Defines if the data shall be returned as stream
+        :param params: Advanced loading params passed to the file loader such
+            as ``timeout_s`` or ``max_cache_age`` for files from the web.
+        :return: The data if the file could be found
+        """
+        if isinstance(source, bytes):  # pass through
+            return cls.load(source, as_stream=as_stream)
+        return await cls.run_async(cls.load, source, as_stream=as_stream, **params)
+
+    @classmethod
+    async def asave(cls, target: FileTargetTypes, data: bytes, **params) -> bool:
+        """
+        Saves data to a file without blocking the event loop.
+
+        See :meth:`save`.
+
+        :param target: The file's target name, see :meth:`load_file`.
+        :param data: The data to be stored
+        :return: True on success
+        """
+        if data is None:
+            raise ValueError("No data provided")
+        return await cls.run_async(cls.save, target, data, **params)
+
+    @classmethod
+    async def aexists(cls, filename: FileSourceTypes, **params) -> bool:
+        """
+        Verifies if a file exists without blocking the event loop.
+
+        See :meth:`exists`.
+
+        :param filename: The file's source such as a local filename or URL.
+            See :class:`FileNameType`
+        :param params: Advanced parameters, protocol dependent
+        :return: True if the file exists
+        """
+        return await cls.run_async(cls.exists, filename, **params)
+
+    @classmethod
+    async def acopy(
+        cls,
+        source: FileSourceTypes,
+        target: FileTargetTypes,
+        create_dir: bool = False,
+        **params,
+    ) -> bool:
+        """
+        Copies a file from given source to given target location without
+        blocking the event loop.
+
+        See :meth:`copy`.
+
+        :param source: The source location
+        :param target: The target location
+        :param create_dir: Defines if a directory of the target
+            shall be created if needed
+        :param params: The parameters to be passed to the source loader, e.g.
+            max_cache_age etc.
+        :return: True on success
+        """
+        return await cls.run_async(
+            cls.copy, source, target, create_dir=create_dir, **params
+        )
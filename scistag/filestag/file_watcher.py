@@ -0,0 +1,557 @@
+"""
+Implements the class :class:`FileWatcher` which observes local files and
+directories in a background thread and provides a revision counter for each
+observed path which is increased when ever the path's content was modified.
+
+On Linux the kernel's inotify interface is used so modifications are reported
+as they happen without scanning the observed files. On all other platforms the
+observed paths are polled.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from threading import Condition, Event
+
+from scistag.common.mt import ManagedThread, StagLock
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+)
+"The inotify events we are interested in"
+
+_EVENT_HEADER = struct.Struct("iIII")
+"Header of an inotify event: watch descriptor, mask, cookie and name length"
+
+FILE_WATCHER_BACKEND_INOTIFY = "inotify"
+"Modifications are reported by the Linux kernel"
+
+FILE_WATCHER_BACKEND_POLLING = "polling"
+"The observed paths are scanned periodically"
+
+
+class _Watch:
+    """
+    A single observed file or directory
+    """
+
+    __slots__ = ("path", "recursive", "revision", "state", "polled")
+
+    def __init__(self, path: str, recursive: bool):
+        self.path = path
+        "The absolute path"
+        self.recursive = recursive
+        "Defines if the sub directories of a directory are observed as well"
+        self.revision = 0
+        "Is increased when ever the path's content was modified"
+        self.state = None
+        "The last scanned state (polled paths only)"
+        self.polled = False
+        "Defines if the path is polled because inotify could not watch it"
+
+    def covers(self, path: str) -> bool:
+        """
+        Returns if a modification of given path affects this watch
+
+        :param path: The modified path
+        :return: True if the watch's revision shall be increased
+        """
+        if path == self.path:
+            return True
+        if os.path.dirname(path) == self.path:
+            return True
+        return self.recursive and path.startswith(self.path + os.sep)
+
+    def requires(self, directory: str) -> bool:
+        """
+        Returns if the inotify watch of a directory is needed to observe this path
+
+        :param directory: The watched directory
+        :return: True if the directory's watch has to be kept
+        """
+        if directory == self.path:
+            return True
+        if self.recursive and directory.startswith(self.path + os.sep):
+            return True
+        return directory == os.path.dirname(self.path) and not os.path.isdir(self.path)
+
+
+class FileWatcher(ManagedThread):
+    """
+    Observes local files and directories for modifications.
+
+    Each observed path has a revision which is increased when ever the file, or
+    for directories any file within, was created, modified, moved or deleted.
+    Comparing revisions is O(1), so consumers such as
+    :class:`FileDataObserver` only need to re-scan or re-hash a path after its
+    revision changed.
+
+    Modifications are debounced: bursts of events, e.g. an editor writing a
+    temporary file and renaming it, increase a path's revision only once after
+    no further event arrived for :attr:`debounce_s` seconds.
+
+    On Linux inotify is used, otherwise (or if inotify is not available) the
+    observed paths are polled every :attr:`poll_interval_s` seconds.
+
+    Usually the process wide instance provided by :meth:`shared` is used.
+    """
+
+    _shared: FileWatcher | None = None
+    "The process wide watcher"
+    _shared_lock = StagLock()
+    "Access lock to the shared watcher"
+    _libc = None
+    "The C library providing the inotify functions"
+
+    def __init__(
+        self,
+        debounce_s: float = 0.05,
+        poll_interval_s: float = 0.5,
+        use_inotify: bool | None = None,
+    ):
+        """
+        :param debounce_s: The time in seconds no further event has to arrive for
+            a path before its modification is reported.
+        :param poll_interval_s: The interval in seconds in which the paths are
+            scanned if inotify is not available
+        :param use_inotify: Defines if inotify shall be used. By default it is used
+            if available.
+        """
+        super().__init__("filewatcher")
+        self.daemon = True
+        self.debounce_s = debounce_s
+        "Time in seconds a path has to be idle before its modification is reported"
+        self.poll_interval_s = poll_interval_s
+        "The scanning interval of the polling backend in seconds"
+        self._watches: dict[str, _Watch] = {}
+        "The observed paths"
+        self._pending: dict[str, float] = {}
+        "Modified paths and the time of their latest event"
+        self._condition = Condition()
+        "Protects the watches and is notified when ever a revision changed"
+        self._inotify_fd: int | None = None
+        "The inotify file descriptor"
+        self._dir_wds: dict[str, int] = {}
+        "The inotify watch descriptor of each observed directory"
+        self._wd_dirs: dict[int, str] = {}
+        "The directory of each inotify watch descriptor"
+        self._wake_event = Event()
+        "Event to wake up the polling thread when it shall terminate"
+        self._wake_pipe: tuple[int, int] | None = None
+        "Pipe to wake up the inotify thread when it shall terminate"
+        if use_inotify is None or use_inotify:
+            self._inotify_fd = self._init_inotify()
+        if self._inotify_fd is not None:
+            self._wake_pipe = os.pipe()
+        self._last_poll = 0.0
+        "The time of the last scan (polling backend only)"
+
+    @classmethod
+    def shared(cls) -> FileWatcher:
+        """
+        Returns the process wide watcher
+
+        :return: The watcher
+        """
+        with cls._shared_lock:
+            shared = cls._shared
+            if (
+                shared is None
+                or shared.terminate_event.is_set()
+                or (shared.ident is not None and not shared.is_alive())
+            ):
+                cls._shared = FileWatcher()
+            return cls._shared
+
+    @property
+    def backend(self) -> str:
+        """
+        Returns the backend in use, either :const:`FILE_WATCHER_BACKEND_INOTIFY`
+        or :const:`FILE_WATCHER_BACKEND_POLLING`.
+        """
+        if self._inotify_fd is not None:
+            return FILE_WATCHER_BACKEND_INOTIFY
+        return FILE_WATCHER_BACKEND_POLLING
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Returns if the watcher's thread is running and was not terminated
+        """
+        return self.is_alive() and not self.terminate_event.is_set()
+
+    @staticmethod
+    def _init_inotify() -> int | None:
+        """
+        Creates an inotify instance
+
+        :return: The file descriptor, None if inotify is not available
+        """
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        FileWatcher._libc = libc
+        return fd
+
+    @staticmethod
+    def normalized_path(path: str) -> str:
+        """
+        Returns the absolute, normalized version of a path
+
+        :param path: The path
+        :return: The normalized path
+        """
+        return os.path.normpath(os.path.abspath(path))
+
+    def watch(self, path: str, recursive: bool = False) -> bool:
+        """
+        Starts observing a file or directory.
+
+        Files do not need to exist yet, but their directory has to.
+
+        :param path: The path of the file or directory
+        :param recursive: Defines if also the sub directories of a directory
+            shall be observed
+        :return: True if the path can be observed
+        """
+        path = self.normalized_path(path)
+        with self._condition:
+            watch = self._watches.get(path, None)
+            if watch is not None:
+                watch.recursive = watch.recursive or recursive
+                if not recursive:
+                    return True
+            is_dir = os.path.isdir(path)
+            if not is_dir and not os.path.isdir(os.path.dirname(path)):
+                return False
+            polled = True
+            if self._inotify_fd is not None:
+                # directories inotify can not watch, e.g. because the user's
+                # watch limit was reached, are polled instead
+                if is_dir:
+                    polled = not self._add_directory(path, recursive)
+                else:
+                    polled = not self._add_directory(os.path.dirname(path), False)
+            if watch is None:
+                watch = _Watch(path, recursive)
+                self._watches[path] = watch
+            if polled:
+                watch.polled = True
+                watch.state = self._scan(watch)
+        if self.ident is None:  # never started
+            self.start()
+        return True
+
+    def unwatch(self, path: str):
+        """
+        Stops observing a path
+
+        :param path: The path passed to :meth:`watch`
+        """
+        path = self.normalized_path(path)
+        with self._condition:
+            watch = self._watches.pop(path, None)
+            if watch is None or self._inotify_fd is None:
+                return
+            # remove the directory watches no other observed path still needs
+            unused = [
+                directory
+                for directory in self._dir_wds
+                if watch.requires(directory)
+                and not any(
+                    other.requires(directory) for other in self._watches.values()
+                )
+            ]
+            for directory in unused:
+                wd = self._dir_wds.pop(directory)
+                del self._wd_dirs[wd]
+                self._libc.inotify_rm_watch(self._inotify_fd, wd)
+
+    def revision(self, path: str) -> int | None:
+        """
+        Returns the current revision of an observed path
+
+        :param path: The path passed to :meth:`watch`
+        :return: The revision, None if the path is not observed
+        """
+        path = self.normalized_path(path)
+        with self._condition:
+            watch = self._watches.get(path, None)
+            return watch.revision if watch is not None else None
+
+    def wait_for_change(self, timeout: float | None = None) -> bool:
+        """
+        Waits until the revision of any observed path changed
+
+        :param timeout: The maximum time to wait in seconds
+        :return: True if a modification was reported, False on timeout
+        """
+        with self._condition:
+            return self._condition.wait(timeout=timeout)
+
+    def _add_directory(self, path: str, recursive: bool) -> bool:
+        """
+        Adds an inotify watch to a directory
+
+        :param path: The directory
+        :param recursive: Defines if also all sub directories shall be watched
+        :return: True if the directory and, if recursive, all of its sub
+            directories could be watched
+        """
+        if path not in self._dir_wds:
+            wd = self._libc.inotify_add_watch(
+                self._inotify_fd, path.encode("utf-8"), _WATCH_MASK
+            )
+            if wd < 0:
+                return False
+            self._dir_wds[path] = wd
+            self._wd_dirs[wd] = path
+        success = True
+        if recursive:
+            for root, dirs, _ in os.walk(path):
+                for name in dirs:
+                    success = (
+                        self._add_directory(os.path.join(root, name), False) and success
+                    )
+        return success
+
+    def _poll_recursive_watches(self, path: str):
+        """
+        Switches all recursive watches covering a directory which could not be
+        watched via inotify to polling
+
+        :param path: The directory
+        """
+        for watch in self._watches.values():
+            if watch.recursive and watch.covers(path) and not watch.polled:
+                watch.polled = True
+                watch.state = self._scan(watch)
+
+    def _is_recursively_watched(self, path: str) -> bool:
+        """
+        Returns if a directory is part of a recursively observed directory
+
+        :param path: The directory
+        :return: True if the directory shall be watched as well
+        """
+        return any(
+            watch.recursive and watch.covers(path) for watch in self._watches.values()
+        )
+
+    def _read_events(self, timeout: float | None):
+        """
+        Waits for and reads inotify events
+
+        :param timeout: The maximum time to wait in seconds
+        """
+        readable, _, _ = select.select(
+            [self._inotify_fd, self._wake_pipe[0]], [], [], timeout
+        )
+        if self._inotify_fd not in readable:
+            return
+        try:
+            data = os.read(self._inotify_fd, 65536)
+        except BlockingIOError:
+            return
+        cur_time = time.time()
+        offset = 0
+        with self._condition:
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                if mask & _IN_Q_OVERFLOW:  # events were lost
+                    for watch in self._watches.values():
+                        self._pending[watch.path] = cur_time
+                    continue
+                directory = self._wd_dirs.get(wd, None)
+                if directory is None:
+                    continue
+                if mask & _IN_IGNORED:  # directory was removed
+                    del self._wd_dirs[wd]
+                    self._dir_wds.pop(directory, None)
+                    continue
+                path = directory
+                if len(name):
+                    path = os.path.join(directory, os.fsdecode(name))
+                self._pending[path] = cur_time
+                if (
+                    mask & _IN_ISDIR
+                    and mask & (_IN_CREATE | _IN_MOVED_TO)
+                    and self._is_recursively_watched(path)
+                    and not self._add_directory(path, True)
+                ):
+                    self._poll_recursive_watches(path)
+
+    @staticmethod
+    def _scan(watch: _Watch) -> tuple | None:
+        """
+        Scans the state of a polled path
+
+        :param watch: The watch
+        :return: The file stamps of the file or all files in the directory
+        """
+        try:
+            if not os.path.isdir(watch.path):
+                stat = os.stat(watch.path)
+                return stat.st_mtime_ns, stat.st_size
+            entries = []
+            directories = [watch.path]
+            while len(directories):
+                with os.scandir(directories.pop()) as iterator:
+                    for entry in iterator:
+                        stat = entry.stat(follow_symlinks=False)
+                        entries.append((entry.path, stat.st_mtime_ns, stat.st_size))
+                        if watch.recursive and entry.is_dir(follow_symlinks=False):
+                            directories.append(entry.path)
+            return tuple(sorted(entries))
+        except OSError:
+            return None
+
+    def _poll(self):
+        """
+        Scans all polled paths and flags the modified ones
+        """
+        with self._condition:
+            watches = [
+                watch
+                for watch in self._watches.values()
+                if self._inotify_fd is None or watch.polled
+            ]
+        cur_time = time.time()
+        for watch in watches:
+            state = self._scan(watch)
+            if state != watch.state:
+                watch.state = state
+                with self._condition:
+                    self._pending[watch.path] = cur_time
+
+    def _commit_settled(self):
+        """
+        Increases the revisions of all paths whose events settled
+        """
+        cur_time = time.time()
+        with self._condition:
+            settled = [
+                path
+                for path, event_time in self._pending.items()
+                if cur_time - event_time >= self.debounce_s
+            ]
+            if len(settled) == 0:
+                return
+            for path in settled:
+                del self._pending[path]
+            modified = False
+            for watch in self._watches.values():
+                if any(watch.covers(path) for path in settled):
+                    watch.revision += 1
+                    modified = True
+            if modified:
+                self._condition.notify_all()
+
+    def _next_timeout(self) -> float | None:
+        """
+        Returns the time until the next pending event settles or the next scan
+
+        :return: The time in seconds, None to wait for the next event
+        """
+        timeout = None
+        with self._condition:
+            if len(self._pending):
+                oldest = min(self._pending.values())
+                timeout = max(oldest + self.debounce_s - time.time(), 0.0)
+        if self._has_polled_paths():
+            next_poll = max(self._last_poll + self.poll_interval_s - time.time(), 0.0)
+            timeout = next_poll if timeout is None else min(timeout, next_poll)
+        return timeout
+
+    def _has_polled_paths(self) -> bool:
+        """
+        Returns if any observed path needs to be polled
+
+        :return: True if the paths shall be scanned regularly
+        """
+        if self._inotify_fd is None:
+            return True
+        with self._condition:
+            return any(watch.polled for watch in self._watches.values())
+
+    def run_loop(self):
+        timeout = self._next_timeout()
+        if self._inotify_fd is not None:
+            self._read_events(timeout)
+        else:
+            self._wake_event.wait(timeout)
+        if (
+            self._has_polled_paths()
+            and time.time() - self._last_poll >= self.poll_interval_s
+        ):
+            self._last_poll = time.time()
+            self._poll()
+        self._commit_settled()
+
+    def run(self) -> None:
+        super().run()
+        self._release()
+
+    def _release(self):
+        """
+        Closes the inotify instance and the wake-up pipe
+        """
+        with self._condition:
+            if self._inotify_fd is not None:
+                os.close(self._inotify_fd)
+                self._inotify_fd = None
+            if self._wake_pipe is not None:
+                for fd in self._wake_pipe:
+                    os.close(fd)
+                self._wake_pipe = None
+
+    def terminate(self):
+        if self.terminate_event.is_set():
+            return
+        super().terminate()
+        self._wake_event.set()
+        # the pipe is closed by the finishing thread holding the same lock, so
+        # it can not be closed (and its descriptor reused) while writing to it
+        with self._condition:
+            if not self.is_alive():
+                self._release()
+            elif self._wake_pipe is not None:
+                os.write(self._wake_pipe[1], b"\0")
@@ -1,12 +1,30 @@
 from __future__ import annotations
 import io
+import mmap
 import os
+import struct
+import threading
 import zipfile
+import zlib
+from collections import OrderedDict
 from multiprocessing import RLock
 import fnmatch
 
 from scistag.filestag.protocols import ZIP_SOURCE_PROTOCOL
 
+DEFAULT_ARCHIVE_CACHE_SIZE = 32 * 2**20
+"""
+Default size of the cache of decompressed files of archives registered via
+:meth:`SharedArchive.register` in bytes
+"""
+
+_LOCAL_HEADER = struct.Struct(zipfile.structFileHeader)
+"The header in front of each file's data in the archive"
+_LOCAL_HEADER_FILENAME_LENGTH = 10
+"Index of the filename length in the local header"
+_LOCAL_HEADER_EXTRA_LENGTH = 11
+"Index of the extra field length in the local header"
+
 
 class SharedArchive:
     """
@@ -23,6 +41,11 @@ class SharedArchive:
     FileStag.load_file("https://www....")
 
     Note: Registered zip files have to add an @ in front of their identifier.
+
+    Archives stored on disk are memory mapped and files are decompressed
+    directly from the mapped memory, so multiple threads can read from the same
+    archive at the same time without waiting for each other. Recently loaded
+    files can optionally be kept in memory, see ``cache_size``.
     """
 
     access_lock = RLock()
@@ -30,13 +53,18 @@ class SharedArchive:
     archives: dict[str, "SharedArchive"] = {}
     "Dictionary of the loaded archives, identifier: SharedArchive"
 
-    def __init__(self, source: str | bytes, identifier: str, cache=False):
+    def __init__(
+        self, source: str | bytes, identifier: str, cache=False, cache_size: int = 0
+    ):
         """
         Initializer
 
         :param source: The source, either a filename or a bytes object
         :param identifier: The identifier via which this object can be accessed
         :param cache: Defines if this archive shall be cached in memory
+        :param cache_size: The maximum total size in bytes of decompressed files
+            which shall be kept in memory to serve repeated requests without
+            decompressing them again. 0 = disabled.
         """
         self.identifier = identifier
         "The archive's unique identifier"
@@ -44,22 +72,52 @@ class SharedArchive:
         "Access lock (for multi-threading)"
         self.filename = ""
         "The archive's filename (if loaded from a file), otherwise empty"
+        self._buffer: bytes | mmap.mmap
+        "The archive's raw data, either in memory or memory mapped"
         if isinstance(source, str):
             self.filename = os.path.normpath(source)
-            if cache:
-                with open(source, "rb") as source_file:
-                    source = io.BytesIO(source_file.read())
-        elif isinstance(source, bytes):
-            source = io.BytesIO(source)
-        self.zip_file = zipfile.ZipFile(source)
+            with open(source, "rb") as source_file:
+                if cache or os.path.getsize(source) == 0:
+                    self._buffer = source_file.read()
+                else:
+                    self._buffer = mmap.mmap(
+                        source_file.fileno(), 0, access=mmap.ACCESS_READ
+                    )
+        else:
+            self._buffer = source
+        self.zip_file = zipfile.ZipFile(
+            io.BytesIO(self._buffer)
+            if isinstance(self._buffer, bytes)
+            else self.filename
+        )
+        "The archive, used to read files which can not be decompressed directly"
+        self._entries: dict[str, zipfile.ZipInfo] = {
+            info.filename: info for info in self.zip_file.infolist()
+        }
+        "Dictionary of all files in the archive, name: ZipInfo"
+        self.cache_size = cache_size
+        "The maximum total size of the decompressed files kept in memory"
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
+        "The most recently loaded files, least recently used first"
+        self._cached_bytes = 0
+        "The total size of all files in the cache"
+        self._cache_lock = threading.Lock()
+        "Access lock to the cache"
 
     def close(self):
         """
         Closes the archive to unload and not having to wait for the gc
         """
-        if self.zip_file is not None:
-            self.zip_file.close()
-            self.zip_file = None
+        with self.access_lock:
+            self._entries = {}
+            with self._cache_lock:
+                self._cache.clear()
+                self._cached_bytes = 0
+            if self.zip_file is not None:
+                self.zip_file.close()
+                self.zip_file = None
+            if isinstance(self._buffer, mmap.mmap):
+                self._buffer.close()
 
     def find_files(self, name_filter: str = "*") -> list[str]:
         """
@@ -68,13 +126,7 @@ class SharedArchive:
         :param name_filter: The filter
         :return: The list of found elements
         """
-        with self.access_lock:
-            elements = [
-                element.filename
-                for element in self.zip_file.filelist
-                if fnmatch.fnmatch(element.filename, name_filter)
-            ]
-            return elements
+        return [name for name in self._entries if fnmatch.fnmatch(name, name_filter)]
 
     def exists(self, name: str) -> bool:
         """
@@ -83,8 +135,7 @@ class SharedArchive:
         :param name: The file's name
         :return: True if it exists
         """
-        with self.access_lock:
-            return name in self.zip_file.namelist()
+        return name in self._entries
 
     def read_file(self, name: str) -> bytes | None:
         """
@@ -93,14 +144,68 @@ class SharedArchive:
         :param name: The name of the file to load
         :return: The file's data. None if the file could not be found
         """
-        with self.access_lock:
-            if name not in self.zip_file.namelist():
-                return None
-            return self.zip_file.open(name, "r").read()
+        info = self._entries.get(name, None)
+        if info is None:
+            return None
+        if self.cache_size > 0:
+            with self._cache_lock:
+                data = self._cache.get(name, None)
+                if data is not None:
+                    self._cache.move_to_end(name)
+                    return data
+        data = self._decompress(info)
+        if 0 < len(data) <= self.cache_size:
+            with self._cache_lock:
+                if name not in self._cache:
+                    self._cache[name] = data
+                    self._cached_bytes += len(data)
+                    while self._cached_bytes > self.cache_size:
+                        _, removed = self._cache.popitem(last=False)
+                        self._cached_bytes -= len(removed)
+        return data
+
+    def _decompress(self, info: zipfile.ZipInfo) -> bytes:
+        """
+        Decompresses a file directly from the archive's data without
+        locking so multiple threads can decompress files concurrently.
+
+        Encrypted files and compression methods other than deflate are read
+        via :attr:`zip_file` instead.
+
+        :param info: The file's entry
+        :return: The file's data
+        """
+        if info.flag_bits & 0x1 or info.compress_type not in (
+            zipfile.ZIP_STORED,
+            zipfile.ZIP_DEFLATED,
+        ):
+            with self.access_lock:
+                return self.zip_file.read(info)
+        header = _LOCAL_HEADER.unpack(
+            self._buffer[info.header_offset : info.header_offset + _LOCAL_HEADER.size]
+        )
+        if header[0] != zipfile.stringFileHeader:
+            raise zipfile.BadZipFile(f"Bad magic number for file {info.filename}")
+        data_offset = (
+            info.header_offset
+            + _LOCAL_HEADER.size
+            + header[_LOCAL_HEADER_FILENAME_LENGTH]
+            + header[_LOCAL_HEADER_EXTRA_LENGTH]
+        )
+        data = self._buffer[data_offset : data_offset + info.compress_size]
+        if info.compress_type == zipfile.ZIP_DEFLATED:
+            data = zlib.decompress(data, -zlib.MAX_WBITS, info.file_size)
+        if zlib.crc32(data) != info.CRC:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename}")
+        return data
 
     @classmethod
     def register(
-        cls, source: str | bytes, identifier: str, cache=False
+        cls,
+        source: str | bytes,
+        identifier: str,
+        cache=False,
+        cache_size: int = DEFAULT_ARCHIVE_CACHE_SIZE,
     ) -> "SharedArchive":
         """
         Registers a new archive.
@@ -108,13 +213,17 @@ class SharedArchive:
         :param source: The source, either a filename or a bytes object
         :param identifier: The identifier via which this object can be accessed
         :param cache: Defines if this archive shall be cached in memory
+        :param cache_size: The maximum total size of decompressed files kept in
+            memory in bytes. See :class:`SharedArchive`.
         :return: The archive
         """
         assert len(identifier)
         with cls.access_lock:
             if identifier in cls.archives:
                 return cls.archives[identifier]
-            new_archive = SharedArchive(source, identifier, cache)
+            new_archive = SharedArchive(
+                source, identifier, cache, cache_size=cache_size
+            )
             cls.archives[identifier] = new_archive
             return new_archive
 
@@ -1,3 +1,4 @@
+from .git_ignore import GitIgnore
 from .git_scanner import GitScanner
 
-__all__ = ["GitScanner"]
+__all__ = ["GitIgnore", "GitScanner"]
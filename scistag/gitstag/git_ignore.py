@@ -0,0 +1,189 @@
+"""
+Implements the class :class:`GitIgnore` which compiles the rules of a
+.gitignore file into regular expressions.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+
+
+class GitIgnore:
+    """
+    The compiled rules of a single .gitignore file.
+
+    Supports the gitignore pattern format: comments, negations via ``!``,
+    directory-only patterns ending with ``/``, patterns anchored to the
+    .gitignore's directory if they contain a ``/`` and ``**`` wildcards. As
+    defined by git the last matching rule wins and rules of nested .gitignore
+    files take precedence over those of their parent directories.
+
+    Consecutive rules of the same kind are combined into a single regular
+    expression, so the cost of a check grows with the count of switches
+    between ignoring and negated rules rather than with the count of rules.
+    """
+
+    def __init__(self, base_path: str, lines: list[str]):
+        """
+        :param base_path: The path of the .gitignore's directory relative to
+            the scanned root directory, separated by "/". An empty string for
+            the root directory itself.
+        :param lines: The .gitignore file's lines
+        """
+        self.base_path = base_path
+        "The .gitignore's directory relative to the scan's root directory"
+        self.runs: list[tuple[bool, re.Pattern | None, re.Pattern]] = []
+        """
+        The combined rules. For each group of consecutive rules: If they
+        are negated, the expression matching files and the expression
+        matching directories.
+        """
+        rules = [self.translate(line) for line in lines]
+        rules = [rule for rule in rules if rule is not None]
+        start = 0
+        for index in range(1, len(rules) + 1):
+            if index < len(rules) and rules[index][2] == rules[start][2]:
+                continue
+            group = rules[start:index]
+            file_rules = [regex for regex, dir_only, _ in group if not dir_only]
+            self.runs.append(
+                (
+                    group[0][2],
+                    self._combine(file_rules) if len(file_rules) else None,
+                    self._combine([regex for regex, _, _ in group]),
+                )
+            )
+            start = index
+
+    @classmethod
+    def from_file(cls, base_path: str, filename: str) -> GitIgnore | None:
+        """
+        Loads a .gitignore file
+
+        :param base_path: The path of the .gitignore's directory relative to
+            the scan's root directory
+        :param filename: The .gitignore file's name
+        :return: The rules if the file exists and defines any
+        """
+        if not os.path.exists(filename):
+            return None
+        with open(filename, "r", encoding="utf-8", errors="replace") as ignore_file:
+            git_ignore = cls(base_path, ignore_file.read().splitlines())
+        return git_ignore if len(git_ignore.runs) else None
+
+    @staticmethod
+    def _combine(expressions: list[str]) -> re.Pattern:
+        """
+        Combines multiple regular expressions into a single one
+
+        :param expressions: The expressions
+        :return: The compiled expression matching if any expression matches
+        """
+        return re.compile("|".join(f"(?:{expression})" for expression in expressions))
+
+    @classmethod
+    def translate(cls, line: str) -> tuple[str, bool, bool] | None:
+        """
+        Translates a single line of a .gitignore file to a regular expression
+
+        :param line: The line
+        :return: The regular expression, if the rule only matches directories
+            and if the rule is negated. None if the line does not define a
+            rule.
+        """
+        if line.startswith("#"):
+            return None
+        negated = line.startswith("!")
+        if negated or line.startswith("\\!") or line.startswith("\\#"):
+            line = line[1:]
+        # trailing spaces are ignored unless escaped
+        stripped = line.rstrip(" ")
+        if stripped.endswith("\\") and len(stripped) < len(line):
+            stripped += " "
+        line = stripped
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if len(line) == 0:
+            return None
+        anchored = "/" in line
+        segments = line.lstrip("/").split("/")
+        parts = []
+        for index, segment in enumerate(segments):
+            last = index == len(segments) - 1
+            if segment == "**":
+                parts.append(".*" if last else "(?:.*/)?")
+            else:
+                parts.append(cls._translate_segment(segment) + ("" if last else "/"))
+        prefix = "" if anchored else "(?:.*/)?"
+        return prefix + "".join(parts), dir_only, negated
+
+    @staticmethod
+    def _translate_segment(segment: str) -> str:
+        """
+        Translates a single path segment of a pattern
+
+        :param segment: The segment, e.g. "*.py"
+        :return: The regular expression
+        """
+        result = []
+        index = 0
+        while index < len(segment):
+            char = segment[index]
+            index += 1
+            if char == "*":
+                result.append("[^/]*")
+            elif char == "?":
+                result.append("[^/]")
+            elif char == "\\" and index < len(segment):
+                result.append(re.escape(segment[index]))
+                index += 1
+            elif char == "[":
+                end = segment.find("]", index + 1)
+                if end == -1:
+                    result.append(re.escape(char))
+                    continue
+                content = segment[index:end].replace("\\", "\\\\")
+                if content[0] in "!^":
+                    content = "^" + content[1:]
+                result.append(f"[{content}]")
+                index = end + 1
+            else:
+                result.append(re.escape(char))
+        return "".join(result)
+
+    def match(self, path: str, is_dir: bool) -> bool | None:
+        """
+        Checks a path against the rules
+
+        :param path: The path relative to the .gitignore's directory
+        :param is_dir: Defines if the path is a directory
+        :return: True if the path is ignored, False if it is explicitly
+            included again and None if no rule matches
+        """
+        for negated, file_regex, dir_regex in reversed(self.runs):
+            regex = dir_regex if is_dir else file_regex
+            if regex is not None and regex.fullmatch(path):
+                return not negated
+        return None
+
+    @staticmethod
+    def is_ignored(ignores: tuple[GitIgnore, ...], path: str, is_dir: bool) -> bool:
+        """
+        Checks a path against the rules of all .gitignore files of its parent
+        directories
+
+        :param ignores: The rules, ordered from the root to the path's
+            directory
+        :param path: The path relative to the scan's root directory
+        :param is_dir: Defines if the path is a directory
+        :return: True if the path is ignored
+        """
+        for git_ignore in reversed(ignores):
+            relative_path = (
+                path[len(git_ignore.base_path) + 1 :] if git_ignore.base_path else path
+            )
+            result = git_ignore.match(relative_path, is_dir)
+            if result is not None:
+                return result
+        return False
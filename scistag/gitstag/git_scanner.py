@@ -1,7 +1,99 @@
-import os
+from __future__ import annotations
+
 import fnmatch
-from stat import S_ISDIR
-from typing import List
+import os
+import re
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from .git_ignore import GitIgnore
+
+
+class GitScanResult:
+    """
+    The files and directories found in a directory tree
+    """
+
+    def __init__(self):
+        self.files: list[tuple[str, int]] = []
+        "The non ignored files' names and sizes in bytes"
+        self.dir_list: list[dict] = []
+        'The directories parsed. Format: {"path": path, "ignored": false}'
+        self.size_tree: dict[str, int] = {}
+        "The total size of the non ignored files within each directory"
+
+    def merge(self, other: GitScanResult):
+        """
+        Adds the results of another scan
+
+        :param other: The other scan's results
+        """
+        self.files += other.files
+        self.dir_list += other.dir_list
+        self.size_tree.update(other.size_tree)
+
+
+def _scan_directory(
+    path: str,
+    rel_path: str,
+    ignores: tuple[GitIgnore, ...],
+    result: GitScanResult,
+    executor: ProcessPoolExecutor | None = None,
+    futures: list[Future] | None = None,
+) -> int:
+    """
+    Finds all valid files in a directory and its subdirectories
+
+    :param path: The directory's path
+    :param rel_path: The directory's path relative to the scan's root, separated
+        by "/"
+    :param ignores: The rules of the .gitignore files of all parent directories
+    :param result: The result to extend
+    :param executor: If provided the subdirectories are scanned by the
+        executor's worker processes
+    :param futures: Receives the futures of the subdirectories' scans
+    :return: The total size of all files found
+    """
+    git_ignore = GitIgnore.from_file(rel_path, os.path.join(path, ".gitignore"))
+    if git_ignore is not None:
+        ignores = ignores + (git_ignore,)
+    total_size = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            entry_rel_path = f"{rel_path}/{entry.name}" if rel_path else entry.name
+            is_dir = entry.is_dir()
+            is_ignored = GitIgnore.is_ignored(ignores, entry_rel_path, is_dir)
+            if is_dir:
+                result.dir_list.append({"path": entry.path, "ignored": is_ignored})
+            if is_ignored:
+                continue
+            if not is_dir:
+                size = entry.stat().st_size
+                result.files.append((entry.path, size))
+                total_size += size
+            elif executor is not None:
+                futures.append(
+                    executor.submit(_scan_tree, entry.path, entry_rel_path, ignores)
+                )
+            else:
+                total_size += _scan_directory(
+                    entry.path, entry_rel_path, ignores, result
+                )
+    result.size_tree[path] = total_size
+    return total_size
+
+
+def _scan_tree(path: str, rel_path: str, ignores: tuple[GitIgnore, ...]):
+    """
+    Scans a subtree, e.g. in a worker process
+
+    :param path: The subtree's path
+    :param rel_path: The subtree's path relative to the scan's root
+    :param ignores: The rules of the .gitignore files of all parent directories
+    :return: The scan's result
+    """
+    result = GitScanResult()
+    _scan_directory(path, rel_path, ignores, result)
+    return result
 
 
 class GitScanner:
@@ -10,14 +102,17 @@ class GitScanner:
 
     This is used in the unit test to verify no garbage is committed into the repo.
 
-    Note that this class is a very minimalistic approach for a coarse validity check and does not
-    fulfill all git standards ignore masks etc. So feel free to use this class but don't complain ;).
+    The .gitignore files are evaluated as defined by git, see :class:`GitIgnore`,
+    but global excludes and ``.git/info/exclude`` are not taken into account.
     """
 
-    def __init__(self):
+    def __init__(self, workers: int = 0):
         """
-        Initiailizer
+        :param workers: The count of processes scanning the root directory's
+            subdirectories in parallel. 0 to scan in the calling process.
         """
+        self.workers = workers
+        "The count of processes scanning the subdirectories"
         self.total_size = 0
         "The count of valid directories"
         self.file_count = 0
@@ -27,99 +122,24 @@ class GitScanner:
         self.dir_list: list[dict] = []
         """The list of all directories parsed. Format: {"path": path, "ignored": false}. Note that only the highest
         'level ignored directories will be listed, not the nested ones."""
-        self.file_list: list[dict] = []
-        'The list of all non ignored files. Format: {"filename": name, "size": size_in_bytes}'
-        self.file_list_by_size: list[dict] = []
-        'The list of all non ignored files by size. Format: {"filename": name, "size": size_in_bytes}'
+        self.files: list[tuple[str, int]] = []
+        "The names and sizes of all non ignored files, sorted descending by size"
+        self.size_tree: dict[str, int] = {}
+        "The total size of all non ignored files within each non ignored directory"
 
-    @classmethod
-    def get_is_ignored(cls, name: str, is_dir: bool, ignore_list: list[str]):
+    @property
+    def file_list(self) -> list[dict]:
         """
-        Check is a given name is ignored
-        :param name: The file or directory name
-        :param is_dir: Is  the element a directory?
-        :param ignore_list: The ignore list
-        :return: True if the element shall be ignored
+        The list of all non ignored files. Format: {"filename": name, "size": size_in_bytes}
         """
-        for element in ignore_list:
-            if "dart_tool" in element and "dart_tool" in name:
-                pass
-            if element.endswith("/"):
-                if is_dir and fnmatch.fnmatch(name, element[0:-1]):
-                    return True
-            else:
-                if fnmatch.fnmatch(name, element):
-                    return True
-        return False
+        return [{"filename": name, "size": size} for name, size in self.files]
 
-    @classmethod
-    def add_git_ignore(cls, base_path, org_list: list[str], filename: str) -> list[str]:
+    @property
+    def file_list_by_size(self) -> list[dict]:
         """
-        Creates an update gitignore mask list for the current directory
-        :param base_path: The base path we are starting in
-        :param org_list: The previous ignore list
-        :param filename: The path of the .gitignore file
-        :return:
+        The list of all non ignored files by size. Format: {"filename": name, "size": size_in_bytes}
         """
-        with open(filename, "r") as ignore_file:
-            all_lines = ignore_file.readlines()
-            all_lines = [
-                element.rstrip("\n")
-                for element in all_lines
-                if not element.startswith("#")
-            ]
-            all_lines = [element for element in all_lines if not len(element) == 0]
-            all_lines = [
-                os.path.normpath(f"{base_path}/{element}")
-                if element.startswith("/")
-                else f"*/" + element
-                for element in all_lines
-            ]
-            return org_list + all_lines
-
-    @classmethod
-    def find_valid_repo_files(
-        cls, path: str, file_list: List, ignore_list: List, dir_list: List
-    ) -> None:
-        """
-        Finds a list of valid files in the current directory. Continues the search in subdirectories
-        :param path: The base path
-        :param file_list: The current list of file
-        :param ignore_list: The ignore list
-        :param dir_list: The list of parsed directories
-        """
-        cur_content = os.listdir(path)
-        git_ignore_path = f"{path}/.gitignore"
-        if os.path.exists(git_ignore_path):
-            ignore_list = cls.add_git_ignore(path, ignore_list, git_ignore_path)
-        for cur_element in cur_content:
-            full_path = os.path.normpath(f"{path}/{cur_element}")
-            cur_stat = os.stat(full_path)
-            is_dir: bool = S_ISDIR(cur_stat.st_mode)
-            is_ignored = cls.get_is_ignored(
-                full_path, is_dir=is_dir, ignore_list=ignore_list
-            )
-            if is_dir:
-                dir_list.append({"path": full_path, "ignored": is_ignored})
-            if not is_ignored:
-                if is_dir:
-                    cls.find_valid_repo_files(
-                        full_path, file_list, ignore_list, dir_list=dir_list
-                    )
-                else:
-                    file_list.append({"filename": full_path, "size": cur_stat.st_size})
-
-    @classmethod
-    def compute_total_size(cls, filelist: List) -> int:
-        """
-        Computes the total size of the non ignored files
-        :param filelist: The list of files
-        :return: The size in bytes
-        """
-        total_size = 0
-        for element in filelist:
-            total_size += element["size"]
-        return total_size
+        return self.file_list
 
     def scan(self, path: str):
         """
@@ -127,18 +147,24 @@ class GitScanner:
         (.file_list, .total_sub_node_count etc.)
         :param path: The repository base path
         """
-        res_file_list = []
-        cur_ignore_list = ["*/.git/*"]
-        self.dir_list.clear()
-        self.find_valid_repo_files(
-            path, res_file_list, ignore_list=cur_ignore_list, dir_list=self.dir_list
-        )
-        self.total_size = self.compute_total_size(res_file_list)
-        self.file_list = res_file_list
-        res_file_list = sorted(res_file_list, key=lambda x: x["size"], reverse=True)
+        path = os.path.normpath(path)
+        ignores = (GitIgnore("", [".git/"]),)
+        result = GitScanResult()
+        if self.workers > 0:
+            futures = []
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                _scan_directory(path, "", ignores, result, executor, futures)
+                for future in futures:
+                    result.merge(future.result())
+        else:
+            _scan_directory(path, "", ignores, result)
+        self.files = sorted(result.files, key=lambda x: x[1], reverse=True)
+        self.total_size = sum(size for _, size in self.files)
+        self.size_tree = result.size_tree
+        self.size_tree[path] = self.total_size
+        self.dir_list = result.dir_list
         self.dir_count = len(self.dir_list)
-        self.file_count = len(self.file_list)
-        self.file_list_by_size = res_file_list
+        self.file_count = len(self.files)
 
     def get_large_files(
         self, min_size: int, ignore_list: list[str], hard_limit_size: int = -1
@@ -149,21 +175,27 @@ class GitScanner:
         :param hard_limit_size: If this size is exceeded even files on the ignore list will not be ignored. -1 if there
         is no hard limit.
         :param ignore_list: Masks of the files to ignore
-        :return: The list of all remaining files
+        :return: The list of all remaining files, sorted descending by size
         """
-        large_elements = [
-            element for element in self.file_list if element["size"] >= min_size
-        ]
+        ignore_mask = (
+            re.compile(
+                "|".join(
+                    fnmatch.translate(os.path.normcase(element))
+                    for element in ignore_list
+                )
+            )
+            if len(ignore_list)
+            else None
+        )
         result_list: list[str] = []
-        for element in large_elements:
-            skip = False
-            if hard_limit_size == -1 or element["size"] < hard_limit_size:
-                for ignore_entry in ignore_list:
-                    if fnmatch.fnmatch(element["filename"], ignore_entry):
-                        skip = True
-                        break
-            if skip:
+        for filename, size in self.files:
+            if size < min_size:
+                break
+            if (
+                ignore_mask is not None
+                and (hard_limit_size == -1 or size < hard_limit_size)
+                and ignore_mask.match(os.path.normcase(filename))
+            ):
                 continue
-            else:
-                result_list.append(element["filename"])
+            result_list.append(filename)
         return result_list
@@ -31,6 +31,37 @@ TERMINAL_COLORS = FileStag.load_json(
 """Definition of the Xterm terminal colors"""
 
 
+def _byte_words(text: str) -> np.ndarray:
+    """
+    Encodes a text as UTF-8 and zero pads it to a multiple of four bytes
+
+    :param text: The text to encode
+    :return: The encoded text as array of 32 bit words
+    """
+    data = text.encode("utf-8")
+    data = data.ljust((len(data) + 3) // 4 * 4, b"\0")
+    return np.frombuffer(data, dtype=np.uint32)
+
+
+_ESCAPE_PREFIX = _byte_words("\N{ESC}[38;2;")
+"The start of a true color escape sequence as zero padded words"
+
+_CHANNEL_TABLE = np.concatenate([_byte_words(f"{value};") for value in range(256)])
+"Zero padded byte representations of a color channel followed by a semicolon"
+
+_CHANNEL_LAST_TABLE = np.concatenate([_byte_words(f"{value}m") for value in range(256)])
+"Zero padded byte representations of the last color channel of a sequence"
+
+_FULL_BLOCK = _byte_words("\N{FULL BLOCK}")[0]
+"The zero padded full block character representing a single visible pixel"
+
+_SPACE = _byte_words(" ")[0]
+"The zero padded space character representing a single invisible pixel"
+
+_NEW_LINE = _byte_words("\n")[0]
+"The zero padded new line character"
+
+
 class AsciiImageMethod(IntEnum):
     """
     Defines the method which is used to convert an image to gray scale
@@ -75,6 +106,10 @@ class AsciiImage:
         :param min_columns: The minimum width in pixels
         :param max_columns: The maximum characters per row
         :param params: Advanced parameters
+
+            - color_quantization - For COLOR_ASCII: Quantizes each color
+                channel to multiples of this value. Values above 1 merge
+                similar colors into longer runs and reduce the output size.
         """
         self.image = image
         "The image to be converted"
@@ -101,6 +136,8 @@ class AsciiImage:
         "The minimum width of the output image, e.g. to center or right align it"
         self.alignment = align
         'The text alignment, either "left", "center" or "right"'
+        self.color_quantization = max(int(params.get("color_quantization", 1)), 1)
+        "The step size to which color channels are quantized in COLOR_ASCII mode"
 
     def convert(self) -> AsciiImage:
         """
@@ -121,7 +158,7 @@ class AsciiImage:
         else:
             self.scaled_image.convert("rgb", bg_fill=Colors.BLACK)
             pixels = self.scaled_image.get_pixels_gray()
-            rows = [self.convert_row(row) for row in pixels]
+            rows = self.convert_rows(pixels)
         self.is_converted = True
         if self.min_columns is not None and self.alignment != "left":
             missing = self.min_columns - self.max_columns
@@ -133,34 +170,57 @@ class AsciiImage:
 
         return self
 
-    def create_color_ascii(self):
+    def create_color_ascii(self) -> list[str]:
         """
         Creates a color ASCII representation
+
+        The escape sequences are assembled from precomputed byte tables for
+        all pixels at once. A color escape sequence is only emitted where the
+        color differs from the previous visible pixel of the same row, so runs
+        of identical colors share a single escape sequence.
+
+        :return: The single rows
         """
         pixels = self.scaled_image.pixels
         if pixels.shape[2] == 4:
             self.scaled_image.convert("rgb", bg_fill=Colors.BLACK)
-        rgb_pixels = self.scaled_image.pixels
-        if pixels.shape[2] == 4:
-            out_rows = []
-            for row, a_row in zip(rgb_pixels, pixels):
-                elements = [
-                    f"\N{ESC}[38;2;{col[0]};{col[1]};{col[2]}m█" if acol[3] > 5 else " "
-                    for col, acol in zip(row, a_row)
-                ]
-                cur_row = "".join(elements)
-                out_rows.append(cur_row)
+            rgb_pixels = self.scaled_image.pixels
+            visible = pixels[:, :, 3] > 5
         else:
-            out_rows = []
-            for row in rgb_pixels:
-                elements = [
-                    f"\N{ESC}[38;2;{col[0]};{col[1]};{col[2]}m█"
-                    if sum(col) >= 10
-                    else " "
-                    for col in row
-                ]
-                cur_row = "".join(elements)
-                out_rows.append(cur_row)
+            rgb_pixels = pixels
+            visible = None
+        if self.color_quantization > 1:
+            step = self.color_quantization
+            rgb_pixels = rgb_pixels // step * step
+        channels = [rgb_pixels[:, :, index].astype(np.int32) for index in range(3)]
+        if visible is None:
+            visible = (channels[0] + channels[1] + channels[2]) >= 10
+        height, width = visible.shape
+        colors = (channels[0] << 16) | (channels[1] << 8) | channels[2]
+        # detect color changes between neighboring visible pixels of a row
+        last_visible = np.where(visible, np.arange(width)[None, :], -1)
+        last_visible = np.maximum.accumulate(last_visible, axis=1)
+        prev_visible = np.full((height, width), -1, dtype=last_visible.dtype)
+        prev_visible[:, 1:] = last_visible[:, :-1]
+        prev_colors = np.take_along_axis(colors, np.maximum(prev_visible, 0), axis=1)
+        needs_escape = visible & ((prev_visible < 0) | (colors != prev_colors))
+        # assemble fixed width blocks of 32 bit words per pixel, zero bytes are
+        # dropped afterwards
+        prefix_size = len(_ESCAPE_PREFIX)
+        blocks = np.zeros((height, width + 1, prefix_size + 4), dtype=np.uint32)
+        pixel_blocks = blocks[:, :width]
+        pixel_blocks[:, :, :prefix_size] = _ESCAPE_PREFIX
+        for index, table in enumerate(
+            (_CHANNEL_TABLE, _CHANNEL_TABLE, _CHANNEL_LAST_TABLE)
+        ):
+            pixel_blocks[:, :, prefix_size + index] = np.take(table, channels[index])
+        pixel_blocks[:, :, : prefix_size + 3] *= needs_escape.astype(np.uint32)[
+            :, :, None
+        ]
+        pixel_blocks[:, :, prefix_size + 3] = np.where(visible, _FULL_BLOCK, _SPACE)
+        blocks[:, width, 0] = _NEW_LINE
+        data = blocks.tobytes().translate(None, b"\0")
+        out_rows = data.decode("utf-8").split("\n")[:-1]
         out_rows[-1] += f"\N{ESC}[0m"
         return out_rows
 
@@ -171,10 +231,21 @@ class AsciiImage:
         :param pixels: The pixel data
         :return: The characters
         """
+        return self.convert_rows(np.asarray(pixels).reshape((1, -1)))[0]
+
+    def convert_rows(self, pixels: np.ndarray) -> list[str]:
+        """
+        Converts a gray scale image from pixels to characters
+
+        :param pixels: The gray scale pixel data
+        :return: The characters of each row
+        """
         ascd = self.dictionary
         factor = (len(ascd) - 1) / 255
-        result = "".join([ascd[int(pixel * factor)] for pixel in pixels])
-        return result
+        palette = np.frombuffer(ascd.encode("ascii"), dtype=np.uint8)
+        indices = (pixels.astype(np.float64) * factor).astype(np.intp)
+        characters = np.take(palette, indices)
+        return [row.tobytes().decode("ascii") for row in characters]
 
     def get_ascii(self) -> str:
         """
@@ -5,7 +5,7 @@ into an image.
 from __future__ import annotations
 from dataclasses import dataclass
 from enum import IntEnum
-from math import ceil
+from math import ceil, modf
 from typing import Literal
 
 import PIL.Image
@@ -52,6 +52,14 @@ class Canvas:
     lines, circles or text into an Image's pixel buffer.
     """
 
+    batch_threshold: int = 8
+    """
+    The minimum count of rectangles for which :meth:`rectangle_list` rasterizes
+    them directly via numpy rather than painting them one by one
+    """
+    _BATCH_MODES = {"RGB", "RGBA", "L"}
+    "The pixel formats supported by the numpy backed batch drawing functions"
+
     def __init__(
         self,
         size: Size2DTypes = None,
@@ -413,8 +421,8 @@ class Canvas:
 
     def rectangle_list(
         self,
-        rectangles: list[RawBoundingType],
-        colors: list[RawColorType] | None = None,
+        rectangles: list[RawBoundingType] | np.ndarray,
+        colors: list[RawColorType] | np.ndarray | None = None,
         single_color: RawColorType | None = None,
         outline_width: int = 0,
     ) -> Canvas:
@@ -427,7 +435,12 @@ class Canvas:
         you just draw a single rectangle but should be preferred if you draw
         many ones.
 
-        :param rectangles: The list of rectangles ((x,y),(x2,y2))
+        Batches of at least :attr:`batch_threshold` rectangles are rasterized
+        directly into the pixel buffer via numpy, pixel identical to drawing
+        them one by one.
+
+        :param rectangles: The list of rectangles ((x,y),(x2,y2)). Alternatively
+            a numpy array of the shape (n, 2, 2) or (n, 4).
         :param colors: The list of colors (has to match the length of
             rectangles)
         :param single_color: The rectangle color (if all rectangles have the
@@ -436,6 +449,68 @@ class Canvas:
             frame width will be painted
         :return: Self
         """
+        if isinstance(outline_width, float):
+            raise TypeError("Outline has to be defined as integer")
+        if single_color is None:
+            if colors is None:
+                raise ValueError("No colors specified")
+            if len(rectangles) != len(colors):
+                raise ValueError(
+                    "The count of colors has to match the count" "of rectangles."
+                )
+        if len(rectangles) == 0:
+            return self
+        if (
+            len(rectangles) >= self.batch_threshold
+            and self.target_image.mode in self._BATCH_MODES
+        ):
+            coords = np.asarray(rectangles, dtype=float).reshape(-1, 4) + np.array(
+                self.offset * 2, dtype=float
+            )
+            # truncate and sort the edges like the rasterizer of PIL does
+            coords = coords.astype(np.int64)
+            x0 = np.minimum(coords[:, 0], coords[:, 2])
+            y0 = np.minimum(coords[:, 1], coords[:, 3])
+            x1 = np.maximum(coords[:, 0], coords[:, 2])
+            y1 = np.maximum(coords[:, 1], coords[:, 3])
+            pixel_colors = (
+                self._get_batch_colors(colors) if single_color is None else None
+            )
+            if outline_width != 0:
+                # split each frame into its top, bottom, left and right border
+                width = abs(outline_width)
+                # the sides span from below the top border to the bottom
+                # border, excluding the end point, in either direction
+                side_start, side_end = y0 + width, y1 - width + 1
+                upwards = side_start > side_end
+                side_y0 = np.where(upwards, side_end + 1, side_start)
+                side_y1 = np.where(upwards, side_start, side_end - 1)
+                x0, y0, x1, y1 = (
+                    np.stack(edges, axis=1).reshape(-1)
+                    for edges in (
+                        (x0, x0, x0, x1 - width + 1),
+                        (y0, y1 - width + 1, side_y0, side_y0),
+                        (x1, x1, x0 + width - 1, x1),
+                        (y0 + width - 1, y1, side_y1, side_y1),
+                    )
+                )
+                if pixel_colors is not None:
+                    pixel_colors = np.repeat(pixel_colors, 4, axis=0)
+            self._fill_rectangles(
+                np.stack([x0, y0, x1, y1], axis=1),
+                colors=pixel_colors,
+                single_color=self._get_batch_colors([single_color])[0]
+                if single_color is not None
+                else None,
+            )
+            return self
+        if isinstance(rectangles, np.ndarray):
+            rectangles = [
+                (tuple(rect[0]), tuple(rect[1]))
+                for rect in rectangles.reshape(-1, 2, 2).tolist()
+            ]
+        if isinstance(colors, np.ndarray):
+            colors = [tuple(color) for color in colors.tolist()]
         ox, oy = self.offset
         if self.offset[0] != 0 or self.offset[1] != 0:
             rectangles = [
@@ -443,20 +518,12 @@ class Canvas:
                 for cur in rectangles
             ]
         if outline_width != 0:
-            if isinstance(outline_width, float):
-                raise TypeError("Outline has to be defined as integer")
             if single_color is not None:
                 for cur_rect in rectangles:
                     self.image_draw.rectangle(
                         xy=cur_rect, outline=single_color, width=outline_width
                     )
             else:
-                if colors is None:
-                    raise ValueError("No colors specified")
-                if len(rectangles) != len(colors):
-                    raise ValueError(
-                        "The count of colors has to match the count" "of rectangles."
-                    )
                 for cur_rect, cur_color in zip(rectangles, colors):
                     self.image_draw.rectangle(
                         xy=cur_rect, outline=cur_color, width=outline_width
@@ -466,16 +533,379 @@ class Canvas:
                 for cur_rect in rectangles:
                     self.image_draw.rectangle(xy=cur_rect, fill=single_color)
             else:
-                if colors is None:
-                    raise ValueError("No colors specified")
-                if len(rectangles) != len(colors):
-                    raise ValueError(
-                        "The count of colors has to match the count" "of rectangles."
-                    )
                 for cur_rect, cur_color in zip(rectangles, colors):
                     self.image_draw.rectangle(xy=cur_rect, fill=cur_color)
         return self
 
+    def line_list(
+        self,
+        lines: list[tuple[Pos2DTypes, Pos2DTypes]] | np.ndarray,
+        colors: list[RawColorType] | np.ndarray | None = None,
+        single_color: RawColorType | None = None,
+        width: int = 1,
+    ) -> Canvas:
+        """
+        Draws a large amount of independent lines in a single or multiple
+        colors.
+
+        Lines with a width of one pixel are rasterized all at once into the
+        pixel buffer via numpy, pixel identical to drawing them one by one via
+        :meth:`line`.
+
+        :param lines: The lines ((x,y),(x2,y2)), alternatively a numpy array
+            of the shape (n, 2, 2) or (n, 4)
+        :param colors: The color of each line
+        :param single_color: The color of all lines (alternative to colors)
+        :param width: The line width in pixels
+        :return: Self
+        """
+        coords = self._get_batch_coords(lines, 4)
+        colors = self._verify_batch_colors(len(coords), colors, single_color)
+        if len(coords) == 0:
+            return self
+        if width != 1:
+            colors = colors if colors is not None else [single_color] * len(coords)
+            for cur_line, cur_color in zip(coords.tolist(), colors):
+                self.image_draw.line(
+                    xy=cur_line,
+                    fill=tuple(cur_color) if isinstance(cur_color, list) else cur_color,
+                    width=width,
+                )
+            return self
+        # PIL truncates the end points and rasterizes via Bresenham, stepping
+        # along the major axis and rounding ties on the minor axis upwards
+        coords = coords.astype(np.int64)
+        delta = coords[:, 2:] - coords[:, :2]
+        distance = np.abs(delta)
+        x_major = distance[:, 0] > distance[:, 1]
+        major = np.where(x_major, distance[:, 0], distance[:, 1])
+        minor = np.where(x_major, distance[:, 1], distance[:, 0])
+        counts = major + 1
+        indices = np.repeat(np.arange(len(coords)), counts)
+        steps = np.arange(len(indices)) - np.repeat(np.cumsum(counts) - counts, counts)
+        minor_steps = (2 * minor[indices] * steps + major[indices]) // (
+            2 * np.maximum(major[indices], 1)
+        )
+        signs = np.where(delta[indices] < 0, -1, 1)
+        line_major = x_major[indices]
+        points = coords[indices, :2] + signs * np.stack(
+            [
+                np.where(line_major, steps, minor_steps),
+                np.where(line_major, minor_steps, steps),
+            ],
+            axis=1,
+        )
+        self._set_points(points, indices, colors, single_color)
+        return self
+
+    def polyline_list(
+        self,
+        polylines: list[list[Pos2DTypes] | np.ndarray],
+        colors: list[RawColorType] | np.ndarray | None = None,
+        single_color: RawColorType | None = None,
+        width: int = 1,
+    ) -> Canvas:
+        """
+        Draws a large amount of lines connecting two or more points each.
+
+        Polylines with a width of one pixel are rasterized all at once into the
+        pixel buffer via numpy, see :meth:`line_list`.
+
+        :param polylines: The polylines, each defined by a list of at least two
+            x,y coordinates
+        :param colors: The color of each polyline
+        :param single_color: The color of all polylines (alternative to colors)
+        :param width: The line width in pixels
+        :return: Self
+        """
+        colors = self._verify_batch_colors(len(polylines), colors, single_color)
+        if len(polylines) == 0:
+            return self
+        if width != 1:
+            colors = colors if colors is not None else [single_color] * len(polylines)
+            for cur_line, cur_color in zip(polylines, colors):
+                self.line(cur_line, color=cur_color, width=width)
+            return self
+        segments = [
+            np.concatenate([points[:-1], points[1:]], axis=1)
+            for points in (np.asarray(line, dtype=float) for line in polylines)
+        ]
+        if colors is not None:
+            colors = np.repeat(
+                colors, [len(segment) for segment in segments], axis=0
+            ).tolist()
+        return self.line_list(
+            np.concatenate(segments), colors=colors, single_color=single_color
+        )
+
+    def point_list(
+        self,
+        points: list[Pos2DTypes] | np.ndarray,
+        colors: list[RawColorType] | np.ndarray | None = None,
+        single_color: RawColorType | None = None,
+    ) -> Canvas:
+        """
+        Sets a large amount of single pixels at once
+
+        :param points: The x,y coordinates of all points, alternatively a numpy
+            array of the shape (n, 2)
+        :param colors: The color of each point
+        :param single_color: The color of all points (alternative to colors)
+        :return: Self
+        """
+        coords = self._get_batch_coords(points, 2)
+        colors = self._verify_batch_colors(len(coords), colors, single_color)
+        if len(coords) == 0:
+            return self
+        self._set_points(np.trunc(coords), np.arange(len(coords)), colors, single_color)
+        return self
+
+    def circle_list(
+        self,
+        coords: list[Pos2DTypes] | np.ndarray,
+        radius: float | list[float] | np.ndarray,
+        colors: list[RawColorType] | np.ndarray | None = None,
+        single_color: RawColorType | None = None,
+        outline_width: int = 0,
+    ) -> Canvas:
+        """
+        Draws a large amount of circles at once.
+
+        The pixels covered by a circle are rasterized by PIL once per circle
+        size and then stamped at the positions of all circles of this size, so
+        the result is pixel identical to drawing them one by one via
+        :meth:`circle`.
+
+        :param coords: The center of each circle, alternatively a numpy array
+            of the shape (n, 2)
+        :param radius: The radius of all circles or of each circle in pixels
+        :param colors: The color of each circle
+        :param single_color: The color of all circles (alternative to colors)
+        :param outline_width: If defined non-filled circles with given
+            outline width will be painted
+        :return: Self
+        """
+        centers = self._get_batch_coords(coords, 2)
+        colors = self._verify_batch_colors(len(centers), colors, single_color)
+        if len(centers) == 0:
+            return self
+        radii = np.broadcast_to(np.asarray(radius, dtype=float), (len(centers),))
+        # PIL truncates the bounding box, the shape only depends on its size
+        boxes = np.concatenate(
+            [centers - radii[:, None], centers + radii[:, None]], axis=1
+        ).astype(np.int64)
+        sizes, groups = np.unique(
+            boxes[:, 2:] - boxes[:, :2], axis=0, return_inverse=True
+        )
+        groups = groups.reshape(-1)
+        points = []
+        indices = []
+        for group, (width, height) in enumerate(sizes.tolist()):
+            mask = PIL.Image.new("1", (width + 1, height + 1))
+            PIL.ImageDraw.Draw(mask).ellipse(
+                (0, 0, width, height),
+                fill=1 if outline_width == 0 else None,
+                outline=1 if outline_width != 0 else None,
+                width=outline_width,
+            )
+            offset_y, offset_x = np.nonzero(np.array(mask))
+            offsets = np.stack([offset_x, offset_y], axis=1)
+            members = np.nonzero(groups == group)[0]
+            points.append(
+                (boxes[members, None, :2] + offsets[None, :, :]).reshape(-1, 2)
+            )
+            indices.append(np.repeat(members, len(offsets)))
+        points = np.concatenate(points)
+        indices = np.concatenate(indices)
+        if len(sizes) > 1:
+            # keep the painting order of the circles
+            order = np.argsort(indices, kind="stable")
+            points, indices = points[order], indices[order]
+        self._set_points(points, indices, colors, single_color)
+        return self
+
+    def _get_batch_coords(
+        self, coords: list | np.ndarray, values_per_element: int
+    ) -> np.ndarray:
+        """
+        Converts the coordinates of a batch of primitives to a numpy array and
+        applies the canvas' offset
+
+        :param coords: The coordinates
+        :param values_per_element: The count of values per primitive, e.g. 2
+            for points and 4 for lines
+        :return: A float array of the shape (n, values_per_element)
+        """
+        coords = np.asarray(coords, dtype=float).reshape(-1, values_per_element)
+        if self.transformations_applied:
+            coords = coords + np.array(
+                self.offset * (values_per_element // 2), dtype=float
+            )
+        return coords
+
+    @staticmethod
+    def _verify_batch_colors(
+        count: int,
+        colors: list[RawColorType] | np.ndarray | None,
+        single_color: RawColorType | None,
+    ) -> list | None:
+        """
+        Verifies the colors passed to one of the batch drawing functions
+
+        :param count: The count of primitives
+        :param colors: The color of each primitive
+        :param single_color: The color of all primitives
+        :return: The colors of each primitive as list (if not a single color
+            is used)
+        """
+        if single_color is not None:
+            return None
+        if colors is None:
+            raise ValueError("No colors specified")
+        if len(colors) != count:
+            raise ValueError("The count of colors has to match the count of elements")
+        return colors.tolist() if isinstance(colors, np.ndarray) else list(colors)
+
+    def _get_batch_colors(self, colors: list[RawColorType] | np.ndarray) -> np.ndarray:
+        """
+        Converts raw colors to pixel values of the canvas' pixel format as PIL
+        would do.
+
+        :param colors: The colors, either RGB(A) tuples or gray values
+        :return: An uint8 array with one row per color, one value per color in
+            case of a grayscale canvas.
+        """
+        if self.target_image.mode not in self._BATCH_MODES:
+            raise NotImplementedError("Unsupported pixel format for batch drawing")
+        values = np.clip(np.asarray(colors, dtype=np.int64), 0, 255)
+        if values.ndim == 1:  # gray values
+            values = values.reshape(-1, 1)
+        if self.target_image.mode == "L":
+            if values.shape[1] >= 3:
+                values = (
+                    values[:, 0] * 19595
+                    + values[:, 1] * 38470
+                    + values[:, 2] * 7471
+                    + 0x8000
+                ) >> 16
+                return values.astype(np.uint8)
+            return values[:, 0].astype(np.uint8)
+        if values.shape[1] < 3:
+            values = np.repeat(values[:, :1], 3, axis=1)
+        if self.target_image.mode == "RGBA" and values.shape[1] == 3:
+            values = np.concatenate(
+                [values, np.full((len(values), 1), 255, dtype=np.int64)], axis=1
+            )
+        return values[:, : len(self.target_image.mode)].astype(np.uint8)
+
+    def _fill_rectangles(
+        self,
+        rectangles: np.ndarray,
+        colors: np.ndarray | None = None,
+        single_color: np.ndarray | None = None,
+    ):
+        """
+        Fills rectangles directly in the pixel buffer
+
+        :param rectangles: Integer array of the shape (n, 4) containing the
+            inclusive coordinates x, y, x2, y2 of each rectangle
+        :param colors: The pixel value of each rectangle
+        :param single_color: The pixel value of all rectangles
+        """
+        width, height = self.target_image.size
+        x0 = np.clip(rectangles[:, 0], 0, width)
+        y0 = np.clip(rectangles[:, 1], 0, height)
+        x1 = np.clip(rectangles[:, 2] + 1, 0, width)
+        y1 = np.clip(rectangles[:, 3] + 1, 0, height)
+        visible = (x1 > x0) & (y1 > y0)
+        if not np.any(visible):
+            return
+        x0, y0, x1, y1 = x0[visible], y0[visible], x1[visible], y1[visible]
+        box = (int(x0.min()), int(y0.min()), int(x1.max()), int(y1.max()))
+        if single_color is not None:
+            # a single color allows to paint all rectangles at once through
+            # a coverage mask, integrated from the rectangles' corners on the
+            # grid of all distinct edges
+            edges_x = np.unique(np.concatenate([x0, x1]))
+            edges_y = np.unique(np.concatenate([y0, y1]))
+            if len(edges_x) * len(edges_y) > (box[2] - box[0]) * (box[3] - box[1]):
+                edges_x = np.arange(box[0], box[2] + 1)
+                edges_y = np.arange(box[1], box[3] + 1)
+            x0, x1 = np.searchsorted(edges_x, x0), np.searchsorted(edges_x, x1)
+            y0, y1 = np.searchsorted(edges_y, y0), np.searchsorted(edges_y, y1)
+            stride = len(edges_x)
+            corners = np.concatenate(
+                [y0 * stride + x0, y0 * stride + x1, y1 * stride + x0, y1 * stride + x1]
+            )
+            weights = np.repeat([1.0, -1.0, -1.0, 1.0], len(x0))
+            coverage = np.bincount(
+                corners, weights, minlength=len(edges_y) * stride
+            ).reshape(-1, stride)
+            covered = coverage.cumsum(axis=0).cumsum(axis=1)[:-1, :-1] > 0.5
+            mask = np.repeat(
+                np.repeat(covered, np.diff(edges_y), axis=0), np.diff(edges_x), axis=1
+            )
+            self.target_image.paste(
+                single_color.item() if single_color.ndim == 0 else tuple(single_color),
+                box,
+                PIL.Image.fromarray(mask),
+            )
+            return
+        pixels = np.array(self.target_image.crop(box))
+        x0, x1 = x0 - box[0], x1 - box[0]
+        y0, y1 = y0 - box[1], y1 - box[1]
+        for cx0, cy0, cx1, cy1, color in zip(
+            x0.tolist(), y0.tolist(), x1.tolist(), y1.tolist(), colors[visible].tolist()
+        ):
+            pixels[cy0:cy1, cx0:cx1] = color
+        self.target_image.paste(
+            PIL.Image.fromarray(pixels, self.target_image.mode), box[:2]
+        )
+
+    def _set_points(
+        self,
+        points: np.ndarray,
+        indices: np.ndarray,
+        colors: list[RawColorType] | None,
+        single_color: RawColorType | None,
+    ):
+        """
+        Sets the pixels of a batch of rasterized primitives in a single pass.
+
+        Where primitives overlap the pixel of the last one is kept.
+
+        :param points: The x,y coordinates of all pixels to set
+        :param indices: The index of the primitive each pixel belongs to
+        :param colors: The color of each primitive
+        :param single_color: The color of all primitives
+        """
+        points = np.floor(points + 0.5).astype(np.int64)
+        width, height = self.target_image.size
+        visible = (
+            (points[:, 0] >= 0)
+            & (points[:, 0] < width)
+            & (points[:, 1] >= 0)
+            & (points[:, 1] < height)
+        )
+        if not np.any(visible):
+            return
+        points = points[visible]
+        box = (
+            int(points[:, 0].min()),
+            int(points[:, 1].min()),
+            int(points[:, 0].max()) + 1,
+            int(points[:, 1].max()) + 1,
+        )
+        pixels = np.array(self.target_image.crop(box))
+        if single_color is not None:
+            values = self._get_batch_colors([single_color])[0]
+        else:
+            values = self._get_batch_colors(colors)[indices[visible]]
+        pixels[points[:, 1] - box[1], points[:, 0] - box[0]] = values
+        self.target_image.paste(
+            PIL.Image.fromarray(pixels, self.target_image.mode), box[:2]
+        )
+
     def polygon(
         self,
         coords: list[Pos2DTypes] | np.ndarray,
@@ -666,10 +1096,14 @@ class Canvas:
             if not isinstance(color, Color)
             else color.to_int_rgba()
         )
-        stroke_color = (
-            Color(stroke_color).to_int_rgba() if stroke_color is not None else None
-        )
-        pil_font = font.get_handle()
+        ink = self.image_draw.draw.draw_ink(color)
+        stroke_ink = None
+        if stroke_width:
+            stroke_ink = (
+                self.image_draw.draw.draw_ink(Color(stroke_color).to_int_rgba())
+                if stroke_color is not None
+                else ink
+            )
         org_pos = pos
         for index, row in enumerate(lines):
             row_spacing = font.row_height + line_spacing
@@ -687,15 +1121,9 @@ class Canvas:
                     outline_width=1,
                     outline_color=Colors.GREEN,
                 )
-            self.image_draw.text(
-                xy=(xy[0], xy[1]),
-                text=row,
-                font=pil_font,
-                align="left",
-                fill=color,
-                stroke_width=stroke_width,
-                stroke_fill=stroke_color,
-            )
+            if stroke_ink is not None:
+                self._draw_text_mask(xy, row, font, stroke_ink, stroke_width)
+            self._draw_text_mask(xy, row, font, ink)
         if _show_formatting:
             org_pos = Pos2D(org_pos)
             self.rect(
@@ -703,6 +1131,35 @@ class Canvas:
             )
         return self
 
+    def _draw_text_mask(
+        self,
+        xy: tuple[float, float],
+        line: str,
+        font: Font,
+        ink: int,
+        stroke_width: int = 0,
+    ):
+        """
+        Blends the (cached) mask of a single line of text onto the canvas
+
+        :param xy: The line's top left position in pixels
+        :param line: The line's text
+        :param font: The font
+        :param ink: The low level fill color
+        :param stroke_width: The stroke width in pixels
+        """
+        x_fraction, x = modf(xy[0])
+        y_fraction, y = modf(xy[1])
+        mask, offset = font.get_mask(
+            line,
+            self.image_draw.fontmode,
+            stroke_width=stroke_width,
+            start=(x_fraction, y_fraction),
+        )
+        self.image_draw.draw.draw_bitmap(
+            (int(x) + offset[0], int(y) + offset[1]), mask, ink
+        )
+
 
 __all__ = [
     "Canvas",
@@ -6,9 +6,11 @@ measure text size, align text etc.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from enum import IntEnum
 from io import BytesIO
-from typing import Literal, Union
+from threading import Lock
+from typing import Literal, Union, Any
 
 import PIL.ImageFont
 
@@ -24,8 +26,18 @@ from .text_alignment_definitions import (
 class Font:
     """
     SDK independent font handle
+
+    The bounding of each measured line and the anti-aliased masks of each
+    rendered line are kept in memory so that texts which are measured and
+    drawn repeatedly - such as labels and titles - do not need to be processed
+    by FreeType again.
     """
 
+    max_cached_bboxes = 1024
+    "The maximum count of line boundings cached per font. 0 disables the cache."
+    max_cached_masks = 256
+    "The maximum count of line masks cached per font. 0 disables the cache."
+
     def __init__(
         self, source: str | bytes | BytesIO, size: int, framework: ImsFramework, index=0
     ):
@@ -76,6 +88,12 @@ class Font:
         Dictionary for converting a vertical alignment to a relative y
         starting offset
         """
+        self._bboxes: OrderedDict[str, tuple[int, int, int, int]] = OrderedDict()
+        "The bounding of the most recently measured lines"
+        self._masks: OrderedDict[tuple, tuple[Any, tuple[int, int]]] = OrderedDict()
+        "The masks of the most recently rendered lines and their offsets"
+        self._cache_lock = Lock()
+        "Access lock to the caches and the font handle"
 
     def get_handle(self) -> PIL.ImageFont.FreeTypeFont:
         """
@@ -84,6 +102,66 @@ class Font:
         """
         return self._font_handle
 
+    def get_bbox(self, line: str) -> tuple[int, int, int, int]:
+        """
+        Returns the area covered by a single line of text
+
+        :param line: The line's text
+        :return: The bounding (x, y, x2, y2) in pixels relative to the line's
+            top left corner
+        """
+        with self._cache_lock:
+            bbox = self._bboxes.get(line, None)
+            if bbox is not None:
+                self._bboxes.move_to_end(line)
+                return bbox
+            bbox = self._font_handle.getbbox(line)
+            if self.max_cached_bboxes > 0:
+                self._bboxes[line] = bbox
+                while len(self._bboxes) > self.max_cached_bboxes:
+                    self._bboxes.popitem(last=False)
+            return bbox
+
+    def get_mask(
+        self,
+        line: str,
+        mode: str = "L",
+        stroke_width: int = 0,
+        start: tuple[float, float] = (0.0, 0.0),
+    ) -> tuple[Any, tuple[int, int]]:
+        """
+        Returns the rendered mask of a single line of text
+
+        :param line: The line's text
+        :param mode: The mask's mode, "L" for an anti-aliased mask
+        :param stroke_width: The stroke width in pixels
+        :param start: The sub-pixel offset of the line in x and y direction
+        :return: The low level mask and its offset in pixels relative to the
+            line's top left corner
+        """
+        key = (line, mode, stroke_width, start)
+        with self._cache_lock:
+            entry = self._masks.get(key, None)
+            if entry is not None:
+                self._masks.move_to_end(key)
+                return entry
+            entry = self._font_handle.getmask2(
+                line, mode, stroke_width=stroke_width, start=start
+            )
+            if self.max_cached_masks > 0:
+                self._masks[key] = entry
+                while len(self._masks) > self.max_cached_masks:
+                    self._masks.popitem(last=False)
+            return entry
+
+    def clear_cache(self):
+        """
+        Removes all cached line boundings and masks
+        """
+        with self._cache_lock:
+            self._bboxes.clear()
+            self._masks.clear()
+
     def get_y_offset(self, vert_alignment: VTextAlignmentTypes):
         """
         Returns the relative y starting offset for given vertical alignment
@@ -120,7 +198,7 @@ class Font:
             out_widths.clear()
         width = 0
         for row in lines:
-            cur_width = self._font_handle.getbbox(row)[2]
+            cur_width = self.get_bbox(row)[2]
             if out_widths is not None:
                 out_widths.append(cur_width)
             width = max(cur_width, width)
@@ -154,7 +232,7 @@ class Font:
         lines = text.split("\n")
         if self.framework == ImsFramework.PIL:
             for cur_line in lines:
-                cur_box = self._font_handle.getbbox(cur_line)
+                cur_box = self.get_bbox(cur_line)
                 x_offset = 0
                 if h_align == "center":
                     x_offset = -cur_box[2] // 2
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from collections import OrderedDict
 from threading import RLock
 from scistag.common import get_edp
 from scistag.filestag import FileStag
@@ -35,6 +36,8 @@ class RegisteredFont:
         "Has the font a totally flexible weight?"
         self.variations = variations
         "Different main variations, e.g. Italic"
+        self._data: dict[str, bytes] = {}
+        "The font files loaded so far by file name"
 
     def get_handle(self, size: int, flags: set[str] | None = None) -> Font | None:
         """
@@ -50,7 +53,12 @@ class RegisteredFont:
         for variation in self.variations:
             if flags == variation[1]:
                 full_name = self.base_path + variation[0] + self.extension
-                data = FileStag.load(full_name)
+                data = self._data.get(full_name, None)
+                if data is None:
+                    data = FileStag.load(full_name)
+                    if data is None:
+                        return None
+                    self._data[full_name] = data
                 font = Font(source=data, size=size, framework=ImsFramework.PIL)
                 return font
         return None
@@ -68,6 +76,13 @@ class FontRegistry:
     "Defines if the base fonts were configured already"
     fonts = {}
     "Dictionary of registered fonts"
+    max_font_handles = 64
+    """
+    The maximum count of font handles kept alive for reuse, see :meth:`get_font`.
+    0 disables the pooling.
+    """
+    _handles: OrderedDict[tuple, Font] = OrderedDict()
+    "The most recently requested font handles by face, size and flags"
 
     @classmethod
     def register_font(
@@ -99,6 +114,10 @@ class FontRegistry:
         """
         Tries to create a font handle for given font
 
+        Font handles are shared: Requesting the same font in the same size
+        again returns the same handle (and thus its cached text metrics) as
+        long as it was not evicted from the pool, see :attr:`max_font_handles`.
+
         :param font_face: The font's face
         :param size: The font's size
         :param flags: The flags such as {'Bold'} or {'Bold', 'Italic'}
@@ -106,13 +125,29 @@ class FontRegistry:
         """
         if not cls._base_fonts_registered:
             cls._ensure_setup()
-        reg_font = None
+        key = (font_face, size, frozenset(flags) if flags else frozenset())
         with cls.access_lock:
-            if font_face in cls.fonts:
-                reg_font = cls.fonts[font_face]
+            font = cls._handles.get(key, None)
+            if font is not None:
+                cls._handles.move_to_end(key)
+                return font
+            reg_font = cls.fonts.get(font_face, None)
             if reg_font is None:
                 return None
-        return reg_font.get_handle(size, flags)
+            font = reg_font.get_handle(size, flags)
+            if font is not None and cls.max_font_handles > 0:
+                cls._handles[key] = font
+                while len(cls._handles) > cls.max_font_handles:
+                    cls._handles.popitem(last=False)
+            return font
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Releases all pooled font handles
+        """
+        with cls.access_lock:
+            cls._handles.clear()
 
     @classmethod
     def get_fonts(cls):
@@ -4,6 +4,10 @@ Provides functions for handling media such as camera, video and audio streams
 
 from .video_source import VideoSource
 from .video_source_movie import VideoSourceMovie
+from .video_decoding_thread import VideoDecodingThread
+from .shared_frame_buffer import SharedFrameBuffer
+from .camera_frame import CameraFrame
+from .camera_redirect import CameraRedirect
 from .video_source_camera import VideoSourceCamera
 from .video_source_datastag import VideoSourceDataStag
 from .camera_cv2 import CameraCv2
@@ -0,0 +1,55 @@
+"""
+Defines the class :class:`CameraFrame` which represents a single frame
+captured by a camera.
+"""
+
+from __future__ import annotations
+
+from threading import RLock
+
+import numpy as np
+
+from scistag.imagestag import Image
+
+
+class CameraFrame:
+    """
+    A frame captured by a camera, passed to all of the camera's redirects.
+
+    The raw pixels and encoded versions of the frame are computed once on
+    first request and then shared between all redirects.
+    """
+
+    def __init__(self, timestamp: float, image: Image, capture_time: float):
+        """
+        :param timestamp: The frame's timestamp as provided by the camera
+        :param image: The frame's image
+        :param capture_time: The time when the frame was received from the
+            camera
+        """
+        self.timestamp = timestamp
+        "The frame's timestamp as provided by the camera"
+        self.image = image
+        "The frame's image"
+        self.capture_time = capture_time
+        "The time when the frame was received from the camera"
+        self._data: dict[str | None, np.ndarray | bytes] = {}
+        "The frame's raw pixels (None) and encodings by file type"
+        self._lock = RLock()
+        "Access lock to the data"
+
+    def get_data(self, encoding: str | None = None) -> np.ndarray | bytes:
+        """
+        Returns the frame's raw pixels or encoded data
+
+        :param encoding: The file type, e.g. ".png". None for the raw pixels.
+        :return: The pixels or the encoded data
+        """
+        with self._lock:
+            if encoding not in self._data:
+                self._data[encoding] = (
+                    self.image.get_pixels()
+                    if encoding is None
+                    else self.image.encode(encoding)
+                )
+            return self._data[encoding]
@@ -0,0 +1,137 @@
+"""
+Defines the class :class:`CameraRedirect` which forwards a camera's frames to
+a single consumer.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from threading import Condition, RLock
+from typing import Callable, Union
+
+from scistag.imagestag import Image
+from .camera_frame import CameraFrame
+from .shared_frame_buffer import SharedFrameBuffer
+
+CameraRedirectTarget = Union[str, SharedFrameBuffer, Callable[[float, Image], None]]
+"""
+A target of a camera's frames. A DataStag target identifier, a shared frame
+buffer or a function receiving the frame's timestamp and image.
+"""
+
+
+class CameraRedirect:
+    """
+    Forwards a camera's frames to a single consumer.
+
+    Each redirect queues a limited count of frames. If the consumer can not
+    keep up the oldest queued frames are dropped, so a slow consumer only
+    falls behind itself but never stalls the camera or the other consumers.
+    """
+
+    def __init__(
+        self,
+        target: CameraRedirectTarget,
+        timeout_s: float = 5.0,
+        encoding: str | None = None,
+        max_queued_frames: int = 2,
+    ):
+        """
+        :param target: The target, see :meth:`VideoSourceCamera.add_redirect`
+        :param timeout_s: The timeout in seconds for how long the frames shall
+            be kept in the DataStag vault
+        :param encoding: The file type into which the frames are encoded before
+            they are stored in the vault. None to store the raw pixels.
+        :param max_queued_frames: The maximum count of frames waiting for their
+            delivery
+        """
+        self.target = target
+        "The consumer of the frames"
+        self.timeout_s = timeout_s
+        "The timeout in seconds of frames stored in the DataStag vault"
+        self.encoding = encoding
+        "The file type into which the frames are encoded, None if raw"
+        self.frames: deque[CameraFrame] = deque(maxlen=max(max_queued_frames, 1))
+        "The frames waiting for their delivery"
+        self.delivered = 0
+        "The count of frames delivered"
+        self.dropped = 0
+        "The count of frames dropped because the consumer was too slow"
+        self.latency = 0.0
+        "The seconds passed between the capture and delivery of the last frame"
+        self.error: Exception | None = None
+        "The last error raised by the consumer"
+        self.scheduled = False
+        "Defines if a delivery of the queued frames is pending or running"
+        self._lock = RLock()
+        "Access lock to the queue"
+        self._idle = Condition(self._lock)
+        "Notified when all queued frames were delivered"
+
+    def enqueue(self, frame: CameraFrame) -> bool:
+        """
+        Adds a frame to the queue, dropping the oldest one if it is full
+
+        :param frame: The new frame
+        :return: True if a delivery needs to be scheduled via :meth:`deliver`
+        """
+        with self._lock:
+            if len(self.frames) == self.frames.maxlen:
+                self.dropped += 1
+            self.frames.append(frame)
+            if self.scheduled:
+                return False
+            self.scheduled = True
+            return True
+
+    def deliver(self):
+        """
+        Delivers all queued frames to the consumer
+        """
+        while True:
+            with self._lock:
+                if len(self.frames) == 0:
+                    self.scheduled = False
+                    self._idle.notify_all()
+                    return
+                frame = self.frames.popleft()
+            try:
+                self.handle_frame(frame)
+            except Exception as exception:
+                self.error = exception
+            with self._lock:
+                self.delivered += 1
+                self.latency = time.time() - frame.capture_time
+
+    def wait_idle(self, timeout_s: float | None = None) -> bool:
+        """
+        Waits until all queued frames were delivered
+
+        :param timeout_s: The maximum time to wait in seconds. None to wait
+            without a timeout.
+        :return: True if no delivery is pending anymore
+        """
+        with self._lock:
+            return self._idle.wait_for(lambda: not self.scheduled, timeout_s)
+
+    def handle_frame(self, frame: CameraFrame):
+        """
+        Passes a single frame to the consumer
+
+        :param frame: The frame
+        """
+        if isinstance(self.target, SharedFrameBuffer):
+            self.target.write(frame.timestamp, frame.get_data())
+        elif isinstance(self.target, str):
+            from ..datastag import DataStagConnection
+
+            local_connection = DataStagConnection(local=True)
+            local_connection.set_ts(
+                self.target,
+                frame.get_data(self.encoding),
+                timeout_s=self.timeout_s,
+                timestamp=frame.timestamp,
+            )
+        else:
+            self.target(frame.timestamp, frame.image)
@@ -0,0 +1,172 @@
+"""
+Implements the class :class:`SharedFrameBuffer` which shares a camera's frames
+with other processes via shared memory.
+"""
+
+from __future__ import annotations
+
+import time
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+
+class SharedFrameBuffer:
+    """
+    A ring buffer in shared memory through which raw video frames can be
+    passed to other processes without encoding them.
+
+    The buffer is created by the producer, e.g. by passing it to
+    :meth:`VideoSourceCamera.add_redirect`, and attached by its :attr:`name`
+    in the consuming processes:
+
+    ..  code-block:: python
+
+        buffer = SharedFrameBuffer(name=buffer_name)
+        counter = 0
+        while True:
+            counter, timestamp, frame = buffer.read(counter)
+            if frame is not None:
+                ...
+    """
+
+    _HEADER_SIZE = 3
+    "Count of header values: the slot count, the slot size and the counter"
+
+    _SLOT_HEADER_SIZE = 5
+    "Count of values per slot: counter, timestamp, height, width and channels"
+
+    def __init__(
+        self,
+        name: str | None = None,
+        max_resolution: tuple[int, int] = (1920, 1080),
+        slots: int = 4,
+    ):
+        """
+        :param name: The name of an existing buffer to attach to. If None a new
+            buffer is created.
+        :param max_resolution: The maximum resolution of the frames in pixels
+            when creating a buffer
+        :param slots: The count of frames a new buffer can hold
+        """
+        self.owner = name is None
+        "Defines if the buffer was created by this object"
+        if self.owner:
+            slot_size = max_resolution[0] * max_resolution[1] * 4
+            header_values = self._HEADER_SIZE + slots * self._SLOT_HEADER_SIZE
+            self._memory = SharedMemory(
+                create=True, size=header_values * 8 + slots * slot_size
+            )
+            "The shared memory block"
+            self._header = np.ndarray(
+                (header_values,), dtype=np.float64, buffer=self._memory.buf
+            )
+            "The buffer's header and the header of each slot"
+            self._header[:] = 0.0
+            self._header[0:2] = slots, slot_size
+        else:
+            self._memory = SharedMemory(name=name)
+            slots = int(np.ndarray((1,), dtype=np.float64, buffer=self._memory.buf)[0])
+            header_values = self._HEADER_SIZE + slots * self._SLOT_HEADER_SIZE
+            self._header = np.ndarray(
+                (header_values,), dtype=np.float64, buffer=self._memory.buf
+            )
+        self.slots = slots
+        "The count of frames the buffer can hold"
+        self.slot_size = int(self._header[1])
+        "The maximum size of a single frame in bytes"
+        self._data = np.ndarray(
+            (slots, self.slot_size),
+            dtype=np.uint8,
+            buffer=self._memory.buf,
+            offset=header_values * 8,
+        )
+        "The frames' pixels, one row per slot"
+
+    @property
+    def name(self) -> str:
+        """
+        Returns the name under which other processes can attach the buffer
+        """
+        return self._memory.name
+
+    @property
+    def counter(self) -> int:
+        """
+        Returns the count of frames written so far
+        """
+        return int(self._header[2])
+
+    def write(self, timestamp: float, pixels: np.ndarray):
+        """
+        Stores a new frame in the buffer, replacing its oldest frame
+
+        :param timestamp: The frame's timestamp
+        :param pixels: The frame's pixels as uint8 array of shape (height,
+            width) or (height, width, channels)
+        """
+        if pixels.dtype != np.uint8 or pixels.nbytes > self.slot_size:
+            raise ValueError("The frame exceeds the buffer's maximum resolution")
+        counter = self.counter + 1
+        slot_header = self._get_slot_header(counter)
+        slot_header[0] = -1.0  # flag as being written
+        height, width = pixels.shape[0:2]
+        channels = pixels.shape[2] if pixels.ndim == 3 else 1
+        self._data[counter % self.slots, : pixels.nbytes] = pixels.reshape(-1)
+        slot_header[1:5] = timestamp, height, width, channels
+        slot_header[0] = counter
+        self._header[2] = counter
+
+    def read(
+        self, counter: int = 0, timeout: float = 0.5
+    ) -> tuple[int, float, np.ndarray | None]:
+        """
+        Returns the most recent frame if it is newer than given frame
+
+        :param counter: The counter of the frame received previously
+        :param timeout: The maximum time in seconds to wait for a frame which is
+            currently being written, e.g. if its producer crashed while writing it
+        :return: The new frame's counter, its timestamp and a copy of its
+            pixels. The given counter, 0.0 and None if no newer frame is
+            available.
+        """
+        start_time: float | None = None
+        while True:
+            latest = self.counter
+            if latest == counter or latest == 0:
+                return counter, 0.0, None
+            slot_header = self._get_slot_header(latest)
+            if slot_header[0] == latest:
+                timestamp = float(slot_header[1])
+                height, width, channels = (int(value) for value in slot_header[2:5])
+                frame = self._data[latest % self.slots, : height * width * channels]
+                shape = (height, width, channels) if channels > 1 else (height, width)
+                frame = frame.reshape(shape).copy()
+                if slot_header[0] == latest:  # not overwritten while copying
+                    return latest, timestamp, frame
+            # the slot is being written, give the producer time to finish it
+            if start_time is None:
+                start_time = time.time()
+            elif time.time() - start_time >= timeout:
+                return counter, 0.0, None
+            time.sleep(0.0005)
+
+    def _get_slot_header(self, counter: int) -> np.ndarray:
+        """
+        Returns the header of the slot storing given frame
+
+        :param counter: The frame's counter
+        :return: The slot's header values
+        """
+        start = self._HEADER_SIZE + (counter % self.slots) * self._SLOT_HEADER_SIZE
+        return self._header[start : start + self._SLOT_HEADER_SIZE]
+
+    def close(self):
+        """
+        Detaches from the shared memory and releases it if this object
+        created it
+        """
+        self._header = self._data = None
+        self._memory.close()
+        if self.owner:
+            self._memory.unlink()
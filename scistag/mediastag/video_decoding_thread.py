@@ -0,0 +1,137 @@
+"""
+Implements the class :class:`VideoDecodingThread` which decodes the frames of
+a video clip ahead of their playback.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from threading import Thread, Event, Condition
+from typing import Any
+
+import numpy as np
+
+
+class VideoDecodingThread(Thread):
+    """
+    Decodes the frames of a video clip sequentially in the background and
+    keeps them in a bounded ring buffer until they are requested.
+
+    Frames are addressed by their index at the clip's native frame rate.
+    Requesting the following frames, or frames shortly ahead, is served from
+    the buffer. Only jumping backwards or far ahead restarts the decoding at
+    the new position.
+    """
+
+    def __init__(self, clip: Any, buffer_size: int = 16, frame_count: int = 0):
+        """
+        :param clip: The clip to decode. Needs to provide the attribute fps and
+            the method get_frame(time_s), such as moviepy's VideoFileClip.
+        :param buffer_size: The maximum count of frames decoded in advance
+        :param frame_count: The clip's total count of frames
+        """
+        super().__init__(daemon=True)
+        self.clip = clip
+        "The clip being decoded"
+        self.fps: float = clip.fps
+        "The clip's frames per second"
+        self.buffer_size = max(buffer_size, 1)
+        "The maximum count of frames decoded in advance"
+        self.frame_count = frame_count
+        "The clip's total count of frames"
+        self.kill_event = Event()
+        "Event to stop the thread"
+        self.error: Exception | None = None
+        "The error which stopped the decoding"
+        self._condition = Condition()
+        "Synchronizes the buffer between the decoder and its consumers"
+        self._frames: deque[tuple[int, np.ndarray]] = deque()
+        "The decoded frames and their indices in ascending order"
+        self._next_index = 0
+        "The index of the next frame to decode"
+        self._decoding: int | None = None
+        "The index of the frame being decoded right now"
+        self._generation = 0
+        "Increased on every restart to discard frames decoded before it"
+
+    def run(self) -> None:
+        while True:
+            with self._condition:
+                while not self.kill_event.is_set() and (
+                    len(self._frames) >= self.buffer_size
+                    or self._next_index >= self.frame_count
+                ):
+                    self._condition.wait()
+                if self.kill_event.is_set():
+                    return
+                index = self._decoding = self._next_index
+                generation = self._generation
+                self._next_index += 1
+            try:
+                frame = self.clip.get_frame(index / self.fps)
+            except Exception as exception:
+                with self._condition:
+                    self.error = exception
+                    self._decoding = None
+                    self._condition.notify_all()
+                return
+            with self._condition:
+                self._decoding = None
+                if generation == self._generation:
+                    self._frames.append((index, frame))
+                self._condition.notify_all()
+
+    def get_frame(self, index: int, timeout_s: float = 10.0) -> np.ndarray:
+        """
+        Returns the frame at given index and discards all frames before it
+        from the buffer.
+
+        :param index: The frame's index
+        :param timeout_s: The maximum time in seconds to wait for the frame
+        :return: The frame's pixels
+        """
+        index = min(max(index, 0), self.frame_count - 1)
+        with self._condition:
+            if not self._will_decode(index):
+                self._frames.clear()
+                self._generation += 1
+                self._next_index = index
+                self._decoding = None
+            while True:
+                while len(self._frames) and self._frames[0][0] < index:
+                    self._frames.popleft()
+                self._condition.notify_all()
+                if len(self._frames) and self._frames[0][0] == index:
+                    return self._frames[0][1]
+                if self.error is not None:
+                    raise self.error
+                if not self.is_alive():
+                    raise RuntimeError("The decoding thread is not running")
+                if not self._condition.wait(timeout_s):
+                    raise TimeoutError("Timeout exceeded")
+
+    def _will_decode(self, index: int) -> bool:
+        """
+        Returns if given frame is buffered or will be decoded soon without
+        restarting the decoding.
+
+        :param index: The frame's index
+        :return: True if the frame is or will be available
+        """
+        if len(self._frames):
+            first_index = self._frames[0][0]
+        else:
+            first_index = (
+                self._decoding if self._decoding is not None else self._next_index
+            )
+        return first_index <= index < self._next_index + self.buffer_size
+
+    def stop(self):
+        """
+        Stops the decoding and waits for the thread to finish
+        """
+        with self._condition:
+            self.kill_event.set()
+            self._condition.notify_all()
+        if self.is_alive():
+            self.join()
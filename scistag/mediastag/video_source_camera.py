@@ -1,10 +1,13 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from threading import Thread, Event, RLock
-from typing import Callable
 import abc
+import time
 
 import scistag.imagestag
 
+from .camera_frame import CameraFrame
+from .camera_redirect import CameraRedirect, CameraRedirectTarget
 from .video_source import VideoSource
 from ..imagestag import Image
 
@@ -25,10 +28,19 @@ class VideoRetrievalThread(Thread):
 
     def run(self) -> None:
         self.camera.handle_initialize_camera()
+        next_fetch = time.monotonic()
         while not self.kill_event.is_set():
+            if self.camera.target_fps is not None:
+                # throttle to the target frame rate without accumulating delays
+                if self.kill_event.wait(max(next_fetch - time.monotonic(), 0.0)):
+                    break
+                next_fetch = max(
+                    next_fetch + 1.0 / self.camera.target_fps, time.monotonic()
+                )
+            fetch_time = time.time()
             timestamp, image = self.camera.handle_fetch()
             if image is not None:
-                self.camera.set_image(timestamp, image)
+                self.camera.set_image(timestamp, image, fetch_time=fetch_time)
 
 
 class VideoSourceCamera(VideoSource):
@@ -51,7 +63,7 @@ class VideoSourceCamera(VideoSource):
         "The most recent image"
         self.recent_timestamp: float = 0.0
         "The most recent image's time stamp"
-        self.redirections = []
+        self.redirections: list[CameraRedirect] = []
         "Targets the camera image shall be redirected to"
         self.started = False
         "Defines if the remote thread was started"
@@ -60,18 +72,58 @@ class VideoSourceCamera(VideoSource):
         self.source = ""
         "The camera's source as unique identifier"
         self.video_resolution = (1920, 1080)
-
-    def add_redirect(self, target: str | Callable[[float, Image], None], timeout_s=5.0):
+        self.target_fps: float | None = None
+        "The maximum count of frames to capture per second. None = unlimited"
+        self.max_queued_frames = 2
+        "The maximum count of frames queued per redirect before dropping any"
+        self.redirect_workers = 4
+        """
+        The count of threads delivering the frames to the redirects. If 0 the
+        frames are delivered by the capturing thread itself.
+        """
+        self.recent_capture_time = 0.0
+        "The time when the most recent image was received"
+        self.capture_latency = 0.0
+        """
+        The seconds between the start of fetching the most recent frame from the
+        camera and its receival, see :meth:`set_image`
+        """
+        self._executor: ThreadPoolExecutor | None = None
+        "The threads delivering the frames to the redirects"
+
+    def add_redirect(
+        self,
+        target: CameraRedirectTarget,
+        timeout_s=5.0,
+        encoding: str | None = None,
+    ) -> CameraRedirect:
         """
         Redirects the camera's data into a local or remote DataStag storage
 
+        Each redirect is served by its own queue, see :class:`CameraRedirect`,
+        so a slow target does not delay the capturing or the other targets.
+
         :param target: If a string this is interpreted as a DataStag target
-            identifier, otherwise a function to be
+            identifier. A :class:`SharedFrameBuffer` shares the frames with
+            other processes. Otherwise a function to be called.
         :param timeout_s: The timeout in seconds for how long the local camera
             streams shall be kept in the vault
-        called.
+        :param encoding: The file type, e.g. ".png", into which the frames
+            shall be encoded before they are stored in the DataStag vault. By
+            default the raw pixels are stored by reference, so local consumers
+            do not need to decode them and they are only serialized when a
+            remote consumer requests them.
+        :return: The redirect, providing statistics about the delivered and
+            dropped frames
         """
-        self.redirections.append((target, timeout_s))
+        redirect = CameraRedirect(
+            target,
+            timeout_s=timeout_s,
+            encoding=encoding,
+            max_queued_frames=self.max_queued_frames,
+        )
+        with self._lock:
+            self.redirections.append(redirect)
         if isinstance(target, str):  # register local camera
             from ..datastag import DataStagConnection
 
@@ -80,6 +132,7 @@ class VideoSourceCamera(VideoSource):
                 target + self.LOCAL_CAMERA_STREAM_IDENTIFIER_TYPE,
                 str(type(self)) + "/" + str(self.source),
             )
+        return redirect
 
     @classmethod
     def get_local_camera(cls, source: int | str) -> str | None:
@@ -140,25 +193,51 @@ class VideoSourceCamera(VideoSource):
             redirections = list(self.redirections)
             recent_image = self.recent_image
             recent_timestamp = self.recent_timestamp
-        if recent_image is None:
+            capture_time = self.recent_capture_time
+        if recent_image is None or len(redirections) == 0:
             return
-        for entry in redirections:
-            element = entry[0]
-            timeout = entry[1]
-            if isinstance(element, str):
-                image = (
-                    recent_image
-                    if isinstance(recent_image, scistag.imagestag.Image)
-                    else Image(recent_image)
-                )
-                image: scistag.imagestag.Image
-                image_data = image.encode(filetype=".png")
-                from ..datastag import DataStagConnection
+        image = (
+            recent_image
+            if isinstance(recent_image, scistag.imagestag.Image)
+            else Image(recent_image)
+        )
+        frame = CameraFrame(recent_timestamp, image, capture_time)
+        for redirect in redirections:
+            if not redirect.enqueue(frame):
+                continue  # a delivery is already in progress
+            if self.redirect_workers <= 0:
+                redirect.deliver()
+            else:
+                self._get_executor().submit(redirect.deliver)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Returns the executor delivering the frames to the redirects
 
-                local_connection = DataStagConnection(local=True)
-                local_connection.set_ts(
-                    element, image_data, timeout_s=timeout, timestamp=recent_timestamp
+        :return: The executor
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.redirect_workers,
+                    thread_name_prefix="camera_redirect",
                 )
+            return self._executor
+
+    def flush(self, timeout_s: float = 5.0) -> bool:
+        """
+        Waits until all frames received so far were delivered to the redirects
+
+        :param timeout_s: The maximum time to wait in seconds
+        :return: True if all frames were delivered
+        """
+        deadline = time.monotonic() + timeout_s
+        with self._lock:
+            redirections = list(self.redirections)
+        for redirect in redirections:
+            if not redirect.wait_idle(max(deadline - time.monotonic(), 0.0)):
+                return False
+        return True
 
     def update_progress(self) -> bool:
         """
@@ -187,14 +266,24 @@ class VideoSourceCamera(VideoSource):
                 return self.recent_timestamp, None
             return self.recent_timestamp, self.recent_image
 
-    def set_image(self, timestamp: float, image: Image) -> None:
+    def set_image(
+        self, timestamp: float, image: Image, fetch_time: float | None = None
+    ) -> None:
         """
         Updates the current image
 
         :param timestamp: The timestamp
         :param image: The newest image
+        :param fetch_time: The time when fetching the image from the camera was
+            started, see :attr:`capture_latency`. If None the latency is measured
+            from the timestamp, which then needs to be the time the device
+            captured the frame at.
         """
         with self._lock:
+            self.recent_capture_time = time.time()
+            self.capture_latency = self.recent_capture_time - (
+                fetch_time if fetch_time is not None else timestamp
+            )
             self.recent_timestamp = timestamp
             self.recent_image = image
             self.video_resolution = image.get_size()
@@ -210,6 +299,8 @@ class VideoSourceCamera(VideoSource):
         super().start()
         if not self.started:
             self.started = True
+            if self._remote_thread.kill_event.is_set():  # restart after a stop
+                self._remote_thread = VideoRetrievalThread(self)
             self._remote_thread.start()
         return self
 
@@ -224,6 +315,10 @@ class VideoSourceCamera(VideoSource):
             self.started = False
             self._remote_thread.kill_event.set()
             self._remote_thread.join()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
         return self
 
     @classmethod
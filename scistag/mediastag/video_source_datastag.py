@@ -3,7 +3,6 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from scistag.datastag import DataStagConnection
-import numpy as np
 
 from scistag.imagestag import Image
 from scistag.mediastag import VideoSource
@@ -69,9 +68,8 @@ class VideoSourceDataStag(VideoSource):
             return timestamp, None
         self.last_update_timestamp = new_timestamp
         self.valid = True
-        if not isinstance(new_data, np.ndarray):
-            self.last_image = Image(new_data)
-            self.handle_datastag_image_changed()
-            return new_timestamp, self.last_image
+        # raw frames stored by a local camera are used as they are, encoded
+        # ones, e.g. received from a remote vault, need to be decoded
         self.last_image = Image(new_data)
+        self.handle_datastag_image_changed()
         return new_timestamp, self.last_image
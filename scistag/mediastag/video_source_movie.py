@@ -6,7 +6,10 @@ a video file such as an mp4.
 from __future__ import annotations
 import os
 
+import numpy as np
+
 from .video_source import VideoSource
+from .video_decoding_thread import VideoDecodingThread
 from ..imagestag import Image
 
 
@@ -15,16 +18,44 @@ class VideoSourceMovie(VideoSource):
     Provides a video stream from a file source, e.g. an mp4 file
     """
 
-    def __init__(self, filename: str, media_paths: list[str] | None = None):
+    def __init__(
+        self,
+        filename: str,
+        media_paths: list[str] | None = None,
+        buffer_size: int = 0,
+        frame_step: bool = False,
+        target_resolution: tuple[int | None, int | None] | None = None,
+    ):
         """
         :param filename: The video filename
         :param media_paths: The media paths to seek within
+        :param buffer_size: If greater than zero the frames are decoded in a
+            background thread which reads up to this count of frames ahead.
+        :param frame_step: If set every image request returns the next frame
+            of the video at its native frame rate, independent of the time
+            passed, e.g. to extract all frames of a video as fast as they can
+            be decoded.
+        :param target_resolution: If defined the frames are scaled to the
+            given (height, width) by the decoder itself. Either value may be
+            None to keep the aspect ratio.
         """
         from moviepy.editor import VideoFileClip
 
         super().__init__()
         valid_path = None
         self.moviepy: "VideoFileClip" = None
+        self.buffer_size = buffer_size
+        "The count of frames to decode ahead. 0 to decode on request"
+        self.frame_step = frame_step
+        "Defines if the video shall be stepped through frame by frame"
+        self.frame_count = 0
+        "The video's count of frames"
+        self._frame_index = 0
+        "The index of the next frame to return in frame step mode"
+        self._decoder: VideoDecodingThread | None = None
+        "The decoding thread if frames are decoded ahead"
+        self._image: tuple[int, Image] | None = None
+        "The most recently decoded frame and its index"
         media_paths = [""] if media_paths is None else media_paths
         for path in media_paths:
             cur_path = f"{path}/{filename}" if len(path) > 0 else filename
@@ -32,11 +63,35 @@ class VideoSourceMovie(VideoSource):
                 valid_path = cur_path
         if valid_path is not None:
             self.valid = True
-            self.moviepy = VideoFileClip(valid_path)
+            self.moviepy = VideoFileClip(
+                valid_path, target_resolution=target_resolution
+            )
             self.video_size = self.moviepy.w, self.moviepy.h
             self.duration = self.moviepy.duration
             self.fps = self.moviepy.fps
             self.time_per_frame = 1.0 / self.fps
+            self.frame_count = max(self.get_frame_index(self.duration), 1)
+
+    def get_frame_index(self, position: float) -> int:
+        """
+        Returns the index of the frame shown at given position
+
+        :param position: The position in seconds
+        :return: The frame's index
+        """
+        # same rounding as used by moviepy's reader to stay frame accurate
+        return int(self.fps * position + 0.00001)
+
+    def update_progress(self) -> bool:
+        if self.frame_step:  # progresses with every frame requested instead
+            return False
+        return super().update_progress()
+
+    def stop(self):
+        super().stop()
+        if self._decoder is not None:
+            self._decoder.stop()
+            self._decoder = None
 
     def _get_image_int(
         self, timestamp: float | None = None
@@ -48,4 +103,34 @@ class VideoSourceMovie(VideoSource):
         """
         if not self.valid:
             return timestamp, None
-        return self.last_update_timestamp, Image(self.moviepy.get_frame(self.position))
+        if self.frame_step:
+            index = self._frame_index
+            if index >= self.frame_count:
+                if not self.repeat:
+                    return timestamp, None
+                index = 0
+            self._frame_index = index + 1
+            self.position = index * self.time_per_frame
+            new_timestamp = self.position
+        else:
+            index = min(self.get_frame_index(self.position), self.frame_count - 1)
+            new_timestamp = self.last_update_timestamp
+        if self._image is None or self._image[0] != index:
+            self._image = index, Image(self._decode_frame(index))
+        return new_timestamp, self._image[1]
+
+    def _decode_frame(self, index: int) -> np.ndarray:
+        """
+        Decodes a single frame
+
+        :param index: The frame's index
+        :return: The frame's pixels
+        """
+        if self.buffer_size <= 0:
+            return self.moviepy.get_frame(index * self.time_per_frame)
+        if self._decoder is None:
+            self._decoder = VideoDecodingThread(
+                self.moviepy, self.buffer_size, self.frame_count
+            )
+            self._decoder.start()
+        return self._decoder.get_frame(index)
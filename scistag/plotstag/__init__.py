@@ -8,5 +8,6 @@ from .plot import Plot
 from .figure import Figure, GridSteppingMode
 from .matplot_lock import MPLock
 from .matplot_helper import MPHelper
+from .matplot_pool import MPPool
 
-__all__ = ["Plot", "Figure", "GridSteppingMode", "MPLock", "MPHelper"]
+__all__ = ["Plot", "Figure", "GridSteppingMode", "MPLock", "MPHelper", "MPPool"]
@@ -17,6 +17,7 @@ from scistag.imagestag.size2d import Size2DTypes
 from scistag.imagestag.font import Font
 from scistag.imagestag.font_registry import FontRegistry
 from scistag.plotstag import Plot
+from scistag.plotstag.revision_tracker import RevisionTracker
 
 if TYPE_CHECKING:
     from .layers.matplot_layer import MPLayerLock
@@ -138,11 +139,14 @@ class FigureGridIterator:
         return self.figure.add_plot(col, row)
 
 
-class Figure:
+class Figure(RevisionTracker):
     """
     Defines a canvas onto which one or multiple :class:`Plot`s may be printed,
     manages their appearance, their behavior and different methods
     to rasterize or export plots.
+
+    The figure's rendering is cached until the figure or one of its plots is
+    modified, see :class:`RevisionTracker`.
     """
 
     def __init__(
@@ -299,6 +303,18 @@ class Figure:
         self.title_color = Colors.BLACK
         "The title's color"
         self._update_blocked_space()
+        self._layout_state: tuple | None = None
+        "The revisions of the figure and its plots after the last layouting"
+        self._rendering: Image | None = None
+        "The figure's last rendering"
+        self._rendering_revision = -1
+        "The figure's revision at the time of the last rendering"
+        self._rendered_plots: dict[tuple[int, int], tuple[int, ...]] = {}
+        "The revision of each plot at the time of the last rendering"
+        self._png_data: bytes | None = None
+        "The last rendering encoded as PNG"
+        self._png_source: Image | None = None
+        "The rendering from which :attr:`_png_data` was encoded"
 
     def _repr_png_(self) -> bytes:
         """
@@ -306,7 +322,11 @@ class Figure:
 
         :return: PNG data as bytes
         """
-        return self.render().to_png()
+        image = self.render()
+        if self._png_source is not image:
+            self._png_data = image.to_png()
+            self._png_source = image
+        return self._png_data
 
     def set_title(self, title: str | None) -> Figure:
         """
@@ -527,11 +547,53 @@ class Figure:
 
     def render(self) -> Image:
         """
-        Renders the figure and returns it as image
+        Renders the figure and returns it as image.
+
+        The rendering is cached and returned again until the figure or one of
+        its plots is modified. If just some plots were modified only these
+        are repainted.
 
-        :return: The visualization of the plot as :class:`Image`
+        :return: The visualization of the plot as :class:`Image`. The image is
+            shared with subsequent calls, copy it before modifying it.
+        """
+        if self._get_revisions() != self._layout_state:
+            self.update_layouts()
+            self._layout_state = self._get_revisions()
+        revision, plot_revisions = self._layout_state
+        if self._rendering is not None and revision == self._rendering_revision:
+            modified = {
+                key
+                for key in plot_revisions.keys() | self._rendered_plots.keys()
+                if plot_revisions.get(key, None) != self._rendered_plots.get(key, None)
+            }
+            if len(modified) == 0:
+                return self._rendering
+            canvas = Canvas(target_image=self._rendering.copy())
+            self._render_plots(canvas, modified)
+        else:
+            canvas = self._render_figure()
+        self._rendering = canvas.to_image()
+        self._rendering_revision = revision
+        self._rendered_plots = plot_revisions
+        return self._rendering
+
+    def _get_revisions(self) -> tuple[int, dict[tuple[int, int], tuple[int, ...]]]:
+        """
+        Returns the revision of the figure and of each of its plots
+
+        :return: The figure's revision and the revision of each plot by its
+            column and row
+        """
+        return self.revision, {
+            key: plot.get_revision() for key, plot in self.plots.items()
+        }
+
+    def _render_figure(self) -> Canvas:
+        """
+        Paints the whole figure
+
+        :return: The canvas containing the figure
         """
-        self.update_layouts()
         size = self.size.to_int_tuple()
         canvas = Canvas(size=size, default_color=self.background_color)
         if self.border_width != 0.0:  # frame
@@ -553,22 +615,31 @@ class Figure:
             )
 
         self._render_plots(canvas)
-        return canvas.to_image()
+        return canvas
 
-    def _render_plots(self, canvas):
+    def _render_plots(self, canvas, cells: set[tuple[int, int]] | None = None):
         """
         Renders the single plots
 
         :param canvas: The target canvas
+        :param cells: The column and row of the cells to repaint. Their
+            previous content is cleared. All cells by default.
         """
         y_off = self.margins[1]
         for cur_row in range(self.row_count):
             x_off = self.margins[0]
             for cur_col in range(self.column_count):
-                canvas.push_state()
-                if (cur_col, cur_row) in self.plots:
-                    self._render_single_plot(canvas, cur_col, cur_row, x_off, y_off)
-                canvas.pop_state()
+                if cells is not None and (cur_col, cur_row) in cells:
+                    canvas.rect(
+                        pos=(x_off, y_off),
+                        size=(self._col_widths[cur_col], self._row_heights[cur_row]),
+                        color=self.background_color,
+                    )
+                if cells is None or (cur_col, cur_row) in cells:
+                    canvas.push_state()
+                    if (cur_col, cur_row) in self.plots:
+                        self._render_single_plot(canvas, cur_col, cur_row, x_off, y_off)
+                    canvas.pop_state()
                 x_off += self._col_widths[cur_col] + self.grid_spacing.width
             y_off += self._row_heights[cur_row] + self.grid_spacing.height
 
@@ -79,18 +79,19 @@ class ImageLayer(PlotLayer):
     def update_layout(
         self, desired_size: Size2D | None = None, forced_size: Size2D | None = None
     ):
-        super().update_layout(desired_size=None, forced_size=forced_size)
+        if forced_size is None and self.fixed_size is not None:
+            self.size = self.fixed_size
+            return
         if forced_size is not None:
             desired_size = forced_size
-            self.size = None
-        if self.size is None:  # keep aspect ratio in proposed area
-            scaling_x = desired_size.width / self._image.width
-            scaling_y = desired_size.height / self._image.height
-            eff_scaling = min(scaling_x, scaling_y)
-            self.size = Size2D(
-                round(self._image.width * eff_scaling),
-                round(self._image.height * eff_scaling),
-            )
+        # keep aspect ratio in proposed area
+        scaling_x = desired_size.width / self._image.width
+        scaling_y = desired_size.height / self._image.height
+        eff_scaling = min(scaling_x, scaling_y)
+        self.size = Size2D(
+            round(self._image.width * eff_scaling),
+            round(self._image.height * eff_scaling),
+        )
 
     @staticmethod
     def generate_checkerboard(
@@ -124,17 +125,17 @@ class ImageLayer(PlotLayer):
             self._scaled_image.pixel_format == PixelFormat.RGBA
             and self.bg_fill is not None
         ):
-            if self.bg_fill == CHECKERBOARD_BACKGROUND:
-                cb = self.get_cb_pattern()
-                canvas.pattern(
-                    cb, ((0, 0), (self._scaled_image.width, self._scaled_image.height))
-                )
-            elif isinstance(self.bg_fill, Color):
+            if isinstance(self.bg_fill, Color):
                 canvas.rect(
                     pos=(0, 0),
                     size=(self._scaled_image.width, self._scaled_image.height),
                     color=self.bg_fill,
                 )
+            elif self.bg_fill == CHECKERBOARD_BACKGROUND:
+                cb = self.get_cb_pattern()
+                canvas.pattern(
+                    cb, ((0, 0), (self._scaled_image.width, self._scaled_image.height))
+                )
         canvas.draw_image(self._scaled_image, (0, 0))
 
     @classmethod
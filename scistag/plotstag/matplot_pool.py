@@ -0,0 +1,245 @@
+"""
+Implements the class :class:`MPPool` which renders matplotlib figures in a pool
+of worker processes so that multiple figures can be rendered in parallel.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from threading import RLock
+from typing import Callable, Literal
+
+import numpy as np
+
+from scistag.imagestag import Image
+from scistag.plotstag.matplot_helper import MPHelper
+from scistag.plotstag.matplot_lock import MPLock
+
+MPPoolOutputTypes = Literal["png", "rgba"]
+"""
+The output formats of the pool's workers. Either a PNG encoded figure or
+the raw RGBA pixels.
+"""
+
+
+def _init_worker():
+    """
+    Prepares a worker process for background rendering
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _render_figure(
+    builder: Callable,
+    args: tuple,
+    kwargs: dict,
+    figure_params: dict,
+    output: MPPoolOutputTypes,
+    transparent: bool,
+) -> bytes | tuple[str, tuple[int, ...]]:
+    """
+    Builds and renders a figure
+
+    :param builder: The function building the figure, see :meth:`MPPool.submit`
+    :param args: The builder's positional arguments
+    :param kwargs: The builder's keyword arguments
+    :param figure_params: The parameters of the figure to create
+    :param output: The output format
+    :param transparent: Defines if the figure's background shall be transparent
+    :return: The PNG data or the name of the shared memory block containing
+        the RGBA pixels and the pixels' shape
+    """
+    import matplotlib.pyplot as plt
+
+    figure = plt.figure(**figure_params)
+    try:
+        built_figure = builder(plt, *args, **kwargs)
+        if isinstance(built_figure, plt.Figure):
+            figure = built_figure
+        if output == "png":
+            return MPHelper.figure_to_png(figure, transparent=transparent)
+        if transparent:
+            figure.patch.set_alpha(0.0)
+            for axes in figure.axes:
+                axes.patch.set_alpha(0.0)
+        figure.canvas.draw()
+        pixels = np.asarray(figure.canvas.buffer_rgba())
+        memory = SharedMemory(create=True, size=pixels.nbytes)
+        np.ndarray(pixels.shape, dtype=np.uint8, buffer=memory.buf)[:] = pixels
+        memory.close()
+        return memory.name, pixels.shape
+    finally:
+        plt.close("all")
+
+
+def _receive_figure(result: bytes | tuple[str, tuple[int, ...]]) -> Image:
+    """
+    Converts the result of :func:`_render_figure` to an image
+
+    :param result: The PNG data or the shared memory block's name and the
+        pixels' shape
+    :return: The image
+    """
+    if isinstance(result, bytes):
+        return Image(source=result)
+    name, shape = result
+    memory = SharedMemory(name=name)
+    try:
+        pixels = np.ndarray(shape, dtype=np.uint8, buffer=memory.buf).copy()
+    finally:
+        memory.close()
+        memory.unlink()
+    return Image(pixels)
+
+
+class MPPool:
+    """
+    Renders matplotlib figures in a pool of worker processes, each using its
+    own Agg backend, so that multiple figures can be rendered in parallel on
+    multi-core machines rather than one at a time behind :class:`MPLock`.
+
+    The figures are built by functions which receive the worker's pyplot
+    module. These functions and their arguments need to be picklable, so
+    they have to be defined at module level. Raw RGBA results are returned
+    via shared memory, PNG results directly.
+
+    Usage:
+
+    ..  code-block:: python
+
+        def plot_data(plt, data):
+            plt.title("Data")
+            plt.plot(data)
+
+        with MPPool(workers=4) as pool:
+            futures = [pool.submit(plot_data, data) for data in datasets]
+            images = [future.result() for future in futures]
+    """
+
+    _shared_pool: MPPool | None = None
+    "The pool shared by all PlotStag components, see :meth:`shared`"
+    _shared_lock = RLock()
+    "Access lock to the shared pool"
+
+    def __init__(self, workers: int | None = None):
+        """
+        :param workers: The count of worker processes. By default one per
+            CPU core. If 0 the figures are rendered in the calling thread
+            using :class:`MPLock`.
+        """
+        self.workers = workers
+        "The count of worker processes"
+        self._executor: ProcessPoolExecutor | None = None
+        "The worker processes, started on first use"
+        self._lock = RLock()
+        "Access lock to the executor"
+
+    @classmethod
+    def shared(cls) -> MPPool:
+        """
+        Returns the pool shared within the process, e.g. for
+        :meth:`Plot.add_matplot`. It is created on first use.
+
+        :return: The pool
+        """
+        with cls._shared_lock:
+            if cls._shared_pool is None:
+                cls._shared_pool = MPPool()
+            return cls._shared_pool
+
+    def __enter__(self) -> MPPool:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    def submit(
+        self,
+        builder: Callable,
+        *args,
+        builder_kwargs: dict | None = None,
+        figure: dict | None = None,
+        output: MPPoolOutputTypes = "png",
+        transparent: bool = True,
+    ) -> Future[Image]:
+        """
+        Builds and renders a figure in one of the worker processes
+
+        :param builder: The function building the figure. It receives the
+            pyplot module followed by the passed arguments. A figure is
+            created before calling it. If the function returns a figure that
+            figure is rendered instead.
+        :param args: The builder's positional arguments
+        :param builder_kwargs: The builder's keyword arguments. They are passed
+            separately so they can not collide with the rendering options.
+        :param figure: The parameters passed to ``plt.figure``, e.g. figsize
+        :param output: Defines if the figure shall be PNG encoded before it is
+            returned or if its raw pixels shall be returned via shared memory.
+        :param transparent: Defines if the figure's background shall be
+            transparent
+        :return: A future providing the rendered figure
+        """
+        params = (
+            builder,
+            args,
+            builder_kwargs or {},
+            figure or {},
+            output,
+            transparent,
+        )
+        if self.workers == 0:
+            result = Future()
+            try:
+                with MPLock():
+                    result.set_result(_receive_figure(_render_figure(*params)))
+            except Exception as exception:
+                result.set_exception(exception)
+            return result
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                )
+            rendering = self._executor.submit(_render_figure, *params)
+        result = Future()
+
+        def receive(finished: Future):
+            # always receive the pixels, even if nobody waits for the result,
+            # to release the shared memory
+            try:
+                result.set_result(_receive_figure(finished.result()))
+            except Exception as exception:
+                result.set_exception(exception)
+
+        rendering.add_done_callback(receive)
+        return result
+
+    def render(self, builder: Callable, *args, **kwargs) -> Image:
+        """
+        Builds and renders a figure in one of the worker processes and waits
+        for the result.
+
+        :param builder: The function building the figure
+        :param args: The builder's positional arguments
+        :param kwargs: The builder's keyword arguments (``builder_kwargs``) and
+            the rendering options, see :meth:`submit`
+        :return: The rendered figure
+        """
+        return self.submit(builder, *args, **kwargs).result()
+
+    def shutdown(self):
+        """
+        Stops the worker processes after all pending figures were rendered.
+
+        They are restarted automatically when the next figure is submitted.
+        """
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
@@ -4,7 +4,7 @@ Implements the :class:`Plot` class which visualizes a single plot within a
 """
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING, Union
+from typing import Callable, Optional, TYPE_CHECKING, Union
 
 import numpy as np
 
@@ -14,13 +14,14 @@ from scistag.imagestag.font import Font, VTextAlignment
 from scistag.imagestag.font_registry import FontRegistry
 from scistag.imagestag import Size2D, Pos2D, Canvas, Colors, Image, Color
 from scistag.plotstag.plot_layer import PlotLayer
+from scistag.plotstag.revision_tracker import RevisionTracker
 
 if TYPE_CHECKING:
     from scistag.plotstag.figure import Figure
     import matplotlib.pyplot as plt
 
 
-class Plot:
+class Plot(RevisionTracker):
     """
     Defines a single plot.
 
@@ -28,6 +29,10 @@ class Plot:
     one or multiple plots overlaying of each other using the
     :class:`PlotLayer`s provided such as line charts, scatter plots, images
     etc.
+
+    Modifying the plot or one of its layers increases the plot's revision,
+    see :meth:`get_revision`. The figure only repaints plots whose revision
+    changed since its last rendering.
     """
 
     def __init__(self, target_size: Size2DTypes | None = None):
@@ -80,7 +85,7 @@ class Plot:
 
         :return: The PNG data
         """
-        return self.render().to_png()
+        return self.get_figure()._repr_png_()
 
     def set_figure(self, figure: "Figure") -> None:
         """
@@ -117,6 +122,15 @@ class Plot:
         :param layer: The new layer
         """
         self.layers.append(layer)
+        self.invalidate()
+
+    def get_revision(self) -> tuple[int, ...]:
+        """
+        Returns the revision of the plot and of all of its layers
+
+        :return: The plot's revision followed by the revision of each layer
+        """
+        return (self.revision,) + tuple(layer.revision for layer in self.layers)
 
     def update_margins(self):
         """
@@ -160,18 +174,16 @@ class Plot:
         hor_margins = margins[0] + margins[2]
         ver_margins = margins[1] + margins[3]
         plot_default_size: Size2D = self.get_figure().plot_default_size
+        # the size is only assigned once to not modify the plot's revision
         if self.target_size is not None:
-            self.size = self.target_size
-            forced_size = Size2D(
-                self.size.width - hor_margins, self.size.width - ver_margins
-            )
+            size = self.target_size
+            forced_size = Size2D(size.width - hor_margins, size.width - ver_margins)
             for layer in self.layers:
                 layer.update_layout(forced_size=forced_size)
         elif len(self.layers) == 0:
-            self.size = Size2D(0, 0)
-            self.layer_size = self.size
+            size = Size2D(0, 0)
         else:
-            self.size = plot_default_size
+            size = plot_default_size
             desired_size = Size2D(
                 plot_default_size.width - hor_margins,
                 plot_default_size.width - ver_margins,
@@ -183,13 +195,14 @@ class Plot:
                 layer.update_layout(desired_size=desired_size)
         if len(self.layers):
             layer_zero = self.layers[0]
-            self.size = Size2D(
+            size = Size2D(
                 layer_zero.size.width + hor_margins,
                 layer_zero.size.height + ver_margins,
             )
             self.layer_size = layer_zero.size
         else:
             self.layer_size = Size2D(0, 0)
+        self.size = size
 
     def paint(self, canvas: Canvas):
         """
@@ -306,6 +319,7 @@ class Plot:
         self,
         figure: Union["plt.Figure", None] = None,
         size_ratio: float | None = None,
+        builder: Callable | None = None,
         **params,
     ):
         """
@@ -313,10 +327,15 @@ class Plot:
 
         :param figure: The figure to be added
         :param size_ratio: If set the plot will be scaled with given factor
+        :param builder: A function building the figure in a worker process of
+            the shared :class:`MPPool`, so that figures added from multiple
+            threads are rendered in parallel. It receives the pyplot module,
+            further arguments can be bound via ``functools.partial``. See
+            :meth:`MPPool.submit`.
         :param params: The parameters to be passed to the figure if a new figure
             shall be created.
-        :return: The Plot if a figure was passed (and so no further action is
-            required).
+        :return: The Plot if a figure or builder was passed (and so no further
+            action is required).
 
             Otherwise an MPLayerLock which shall be used the following way:
 
@@ -333,5 +352,10 @@ class Plot:
             self.add_image(
                 MPHelper.figure_to_image(figure), size_ratio=size_ratio, bg_fill=None
             )
+        elif builder is not None:
+            from scistag.plotstag.matplot_pool import MPPool
+
+            image = MPPool.shared().render(builder, figure=params)
+            self.add_image(image, size_ratio=size_ratio, bg_fill=None)
         else:
             return MPLayerLock(self, size_ratio=size_ratio, **params)
@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from abc import abstractmethod
 
 from scistag.imagestag import Size2D, Canvas
+from scistag.plotstag.revision_tracker import RevisionTracker
 
 
 @dataclass
@@ -29,12 +30,15 @@ PlotValueRange3D = tuple[ValueRange1D, ValueRange1D, ValueRange1D]
 "Defines the value range of a 3D plot (X,Y,Z)"
 
 
-class PlotLayer:
+class PlotLayer(RevisionTracker):
     """
     The :class:`PlotLayer` visualizes a plot's content.
 
     Such content types can be bar graphs, scatter plots, line graphs, pie
     charts, images, matrices etc.
+
+    Modifying a layer's attributes increases its revision so that the plot
+    containing it gets repainted, see :class:`RevisionTracker`.
     """
 
     def __init__(self, fixed_size: Size2D | None = None):
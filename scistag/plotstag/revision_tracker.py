@@ -0,0 +1,65 @@
+"""
+Defines the class :class:`RevisionTracker`, the base class of all PlotStag
+elements whose renderings are cached until they are modified.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+_UNDEFINED = object()
+"Marker for attributes which were not assigned yet"
+
+
+def _differs(old_value: Any, new_value: Any) -> bool:
+    """
+    Returns if a new attribute value differs from its previous value
+
+    :param old_value: The previous value
+    :param new_value: The new value
+    :return: True if the values differ or can not be compared
+    """
+    if old_value is new_value:
+        return False
+    try:
+        return bool(old_value != new_value)
+    except (AttributeError, TypeError, ValueError):
+        return True
+
+
+class RevisionTracker:
+    """
+    Counts the modifications of an object's public attributes.
+
+    Whenever a public attribute is assigned a value differing from its
+    previous one the object's :attr:`revision` is increased, so renderings of
+    the object can be cached until its revision changes.
+
+    Modifications which do not assign an attribute, e.g. changing an element
+    of a list in place, are not detected. Call :meth:`invalidate` after such
+    modifications.
+    """
+
+    _revision: int = 0
+    "The count of modifications"
+
+    def __setattr__(self, key: str, value: Any):
+        if not key.startswith("_") and _differs(
+            self.__dict__.get(key, _UNDEFINED), value
+        ):
+            self.__dict__["_revision"] = self._revision + 1
+        super().__setattr__(key, value)
+
+    @property
+    def revision(self) -> int:
+        """
+        Returns the object's revision, increased with every modification
+        """
+        return self._revision
+
+    def invalidate(self):
+        """
+        Flags the object as modified so that all of its cached renderings are
+        discarded
+        """
+        self._revision += 1
@@ -9,5 +9,6 @@ use them in your interactive UI application or dash board.
 """
 
 from .shape import Shape
+from .shape_list import ShapeList
 
-__all__ = ["Shape"]
+__all__ = ["Shape", "ShapeList"]
@@ -5,6 +5,8 @@ from __future__ import annotations
 import math
 import typing
 
+import numpy as np
+
 from scistag.imagestag import (
     Canvas,
     Color,
@@ -103,20 +105,11 @@ class Checkerboard(Shape):
         ox, oy = self.bounding.pos.to_tuple()
         sx, sy = self.tile_size.width, self.tile_size.height
         # collect geometry for all rectangles
-        dark_rects = []
-        bright_rects = []
-        for cur_row in range(self.rows):
-            cur_y = oy + cur_row * sy
-            for cur_col in range(self.columns):
-                cur_x = ox + cur_col * sy
-                if (cur_col + cur_row) % 2 == 0:
-                    bright_rects.append(
-                        ((cur_x, cur_y), (cur_x + sx - 1, cur_y + sy - 1))
-                    )
-                else:
-                    dark_rects.append(
-                        ((cur_x, cur_y), (cur_x + sx - 1, cur_y + sy - 1))
-                    )
+        cols, rows = np.meshgrid(np.arange(self.columns), np.arange(self.rows))
+        cur_x = ox + cols * sx
+        cur_y = oy + rows * sy
+        rects = np.stack([cur_x, cur_y, cur_x + sx - 1, cur_y + sy - 1], axis=-1)
+        bright = (cols + rows) % 2 == 0
         # draw dark and bright rects in one batch each
-        target.rectangle_list(bright_rects, single_color=self.color_b.to_int_rgba())
-        target.rectangle_list(dark_rects, single_color=self.color_a.to_int_rgba())
+        target.rectangle_list(rects[bright], single_color=self.color_b.to_int_rgba())
+        target.rectangle_list(rects[~bright], single_color=self.color_a.to_int_rgba())
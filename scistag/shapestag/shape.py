@@ -6,21 +6,31 @@ from __future__ import annotations
 import hashlib
 import typing
 from abc import abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from scistag.imagestag import Canvas, Colors, Bounding2D, Image
+import numpy as np
+
+from scistag.imagestag import Canvas, Colors, Bounding2D, Image, ColorTypes
+from scistag.imagestag.pixel_format import PixelFormatTypes
 
 
 @dataclass
 class Shape:
     """
     Defines a shape which can be rendered
+
+    Shapes which are expensive to draw but rarely change can be flagged as
+    :attr:`cache_layer`. They are then rasterized once into an offscreen image
+    with alpha channel which is reused by :meth:`paint` until the shape's
+    hash changes or :meth:`invalidate` is called.
     """
 
     shape_class: str = ""
     "The shape's class"
 
-    bounding: Bounding2D = Bounding2D((0.0, 0.0, 0.0, 0.0))
+    bounding: Bounding2D = field(
+        default_factory=lambda: Bounding2D((0.0, 0.0, 0.0, 0.0))
+    )
     "The region to be covered overall"
 
     HASHABLE_PROPERTIES: typing.ClassVar = {"shape_class"}
@@ -36,8 +46,23 @@ class Shape:
         super().__init__()
         self.shape_class = class_name
         "The shape's class"
+        self.bounding = Bounding2D((0.0, 0.0, 0.0, 0.0))
+        "The region to be covered overall"
         self.__dict__["_hashable_properties"] = hashable_properties
         "The properties which can be used to create a unique hash"
+        self.visible = True
+        "Defines if the shape shall be painted by :meth:`paint`"
+        self.opacity = 1.0
+        "The opacity (0.0 .. 1.0) with which the shape is painted"
+        self.cache_layer = False
+        """
+        Defines if the shape shall be rasterized into an offscreen image once
+        and be reused until it is modified. See :meth:`get_layer`.
+        """
+        self._layer: Image | None = None
+        "The rasterized shape"
+        self._layer_hash: str | None = None
+        "The hash of the shape and the options at the time the layer was rasterized"
 
     @abstractmethod
     def draw(self, target: Canvas, options: dict | None = None):
@@ -50,7 +75,65 @@ class Shape:
         """
         pass
 
-    def to_image(self, background_color=Colors.TRANSPARENT) -> Image:
+    def paint(self, target: Canvas, options: dict | None = None):
+        """
+        Paints the shape into the defined canvas, respecting its visibility,
+        opacity and cached layer.
+
+        :param target: The canvas to render onto
+        :param options: Advanced options, see :meth:`draw`
+        """
+        if not self.visible or self.opacity <= 0.0:
+            return
+        if not self.cache_layer and self.opacity >= 1.0:
+            self.draw(target, options)
+            return
+        layer = (
+            self.get_layer(options)
+            if self.cache_layer
+            else self.to_image(Colors.TRANSPARENT, pixel_format="RGBA", options=options)
+        )
+        if self.opacity < 1.0:
+            pixels = layer.get_pixels().copy()
+            pixels[..., 3] = (pixels[..., 3] * self.opacity).astype(np.uint8)
+            layer = Image(pixels)
+        target.draw_image(layer, self.bounding.pos.to_tuple())
+
+    def get_layer(self, options: dict | None = None) -> Image:
+        """
+        Returns the shape rasterized into an RGBA image covering its bounding.
+
+        The image is reused until the shape's hash or the options change or
+        :meth:`invalidate` is called.
+
+        :param options: Advanced options, see :meth:`draw`
+        :return: The image
+        """
+        layer_hash = self.get_hash()
+        if options:
+            options_data = repr(sorted(options.items(), key=lambda item: item[0]))
+            layer_hash += hashlib.md5(bytearray(options_data, "utf-8")).hexdigest()
+        if self._layer is None or layer_hash != self._layer_hash:
+            self._layer = self.to_image(
+                Colors.TRANSPARENT, pixel_format="RGBA", options=options
+            )
+            self._layer_hash = layer_hash
+        return self._layer
+
+    def invalidate(self):
+        """
+        Discards the rasterized layer, e.g. after properties of the shape were
+        modified which are not covered by its hash.
+        """
+        self._layer = None
+        self._layer_hash = None
+
+    def to_image(
+        self,
+        background_color: ColorTypes = Colors.TRANSPARENT,
+        pixel_format: PixelFormatTypes = "RGB",
+        options: dict | None = None,
+    ) -> Image:
         """
         Renders the shape to an image.
 
@@ -58,6 +141,9 @@ class Shape:
         member variable to be convertible.
 
         :param background_color: The background color
+        :param pixel_format: The image's pixel format, RGBA to preserve the
+            transparency of the background.
+        :param options: Advanced options, see :meth:`draw`
         """
         bounding: Bounding2D = self.bounding
         offset = bounding.pos.to_tuple()
@@ -67,10 +153,12 @@ class Shape:
         # is still in the image (in this case at 0,0)
         offset = (-offset[0], -offset[1])
         size = bounding.get_size_tuple()
-        tar = Canvas(size=size, default_color=background_color)
+        tar = Canvas(
+            size=size, default_color=background_color, pixel_format=pixel_format
+        )
         if offset != (0.0, 0.0):
             tar.add_offset_shift(offset)
-        self.draw(tar)
+        self.draw(tar, options)
         return tar.to_image()
 
     def get_hash(self) -> str:
@@ -81,12 +169,12 @@ class Shape:
         :return: The hash value
         """
         data = []
-        for element in self.__dict__["hashable_properties"]:
-            element_data = self.__dict__[element]
-            if isinstance(element, list):
-                for index, data in enumerate(element_data):
+        for element in sorted(self.__dict__["_hashable_properties"]):
+            element_data = self.__dict__.get(element, None)
+            if isinstance(element_data, list):
+                for index, cur_data in enumerate(element_data):
                     data.append(f"@{element}.{index}")
-                    data.append(str(data))
+                    data.append(str(cur_data))
             else:
                 data.append(f"@{element}")
                 data.append(str(element_data))
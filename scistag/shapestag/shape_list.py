@@ -1,19 +1,74 @@
 """
 Defines the :class:`ShapeList` class
 """
-from typing import DefaultDict
+from __future__ import annotations
 
-from scistag.imagestag import Canvas
+import hashlib
+
+from scistag.imagestag import Canvas, Bounding2D
 from scistag.shapestag import Shape
 
 
 class ShapeList(Shape):
     """
-    A collection of shapes
+    A collection of shapes which are painted in the order of their insertion.
+
+    If the list is flagged as :attr:`cache_layer` the whole subtree is
+    rasterized into a single offscreen image which is reused until any of its
+    shapes is modified.
     """
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, shapes: list[Shape] | None = None):
+        """
+        :param shapes: The initial shapes
+        """
+        super().__init__(
+            self.__class__.__name__, hashable_properties=self.HASHABLE_PROPERTIES
+        )
+        self.shapes: list[Shape] = []
+        "The shapes in painting order"
+        for shape in shapes if shapes is not None else []:
+            self.add(shape)
+
+    def add(self, shape: Shape) -> Shape:
+        """
+        Adds a shape to the list
+
+        :param shape: The shape to add
+        :return: The shape
+        """
+        self.shapes.append(shape)
+        self.update_bounding()
+        return shape
+
+    def update_bounding(self):
+        """
+        Updates the list's bounding to the region covered by all of its shapes
+        """
+        boundings = [
+            shape.bounding.to_coord_tuple()
+            for shape in self.shapes
+            if shape.bounding is not None
+        ]
+        if len(boundings) == 0:
+            self.bounding = Bounding2D((0.0, 0.0, 0.0, 0.0))
+            return
+        self.bounding = Bounding2D(
+            (
+                min(bounding[0] for bounding in boundings),
+                min(bounding[1] for bounding in boundings),
+                max(bounding[2] for bounding in boundings),
+                max(bounding[3] for bounding in boundings),
+            )
+        )
+
+    def draw(self, target: Canvas, options: dict | None = None):
+        for shape in self.shapes:
+            shape.paint(target, options)
 
-    def draw(self, target: Canvas, options: dict = None):
-        pass
+    def get_hash(self) -> str:
+        self.update_bounding()
+        data = [super().get_hash()]
+        for shape in self.shapes:
+            data.append(f"{shape.get_hash()}:{shape.visible}:{shape.opacity}")
+        return hashlib.md5(bytearray(";".join(data), "utf-8")).hexdigest()
@@ -0,0 +1,114 @@
+"""
+Tests the compact emoji index
+"""
+import time
+from fnmatch import fnmatch
+from unittest import mock
+
+import pytest
+
+from scistag.emojistag import EmojiDb
+from scistag.emojistag.emoji_index import EmojiIndex
+
+EMOJI_COUNT = 4000
+"Count of emojis in the test database"
+
+
+@pytest.fixture(scope="module")
+def main_dict() -> dict:
+    """
+    Provides an emoji database in the format of the essential data
+    """
+    words = ["sun", "face", "cat", "smiling", "flag", "deer", "heart", "star"]
+    result = {}
+    for index in range(EMOJI_COUNT):
+        key = f"1F{index:03X}" if index % 3 else f"1F{index:03X}_FE0F"
+        element = {
+            "name": f"{words[index % 8]} {words[(index // 8) % 8]} {index}",
+            "group": f"group {index % 5}",
+            "subgroup": f"subgroup {index % 11}",
+        }
+        if index % 4 == 0:
+            element["markdownName"] = f"{words[index % 8]}_{index}"
+        if index % 50 == 0:
+            element["countryCode"] = "DE"
+            element["countryName"] = "Germany"
+        result[key] = element
+    return result
+
+
+def test_emoji_index(main_dict):
+    """
+    Tests searching the index
+    """
+    png_keys = {key for index, key in enumerate(main_dict) if index % 2 == 0}
+    index = EmojiIndex.from_db(main_dict, png_keys)
+    assert len(index) == EMOJI_COUNT
+    # the index survives serialization
+    index = EmojiIndex.from_json(index.to_json())
+    names = list(main_dict.keys())
+    for mask in ["*sun*", "sun*", "sun face 8", "s?n*", "[cd]*", "*", "nothing*"]:
+        expected = [
+            row
+            for row, element in enumerate(main_dict.values())
+            if fnmatch(element["name"], mask)
+        ]
+        assert index.find(mask) == expected
+        assert index.find(mask, png_only=True) == [
+            row for row in expected if row % 2 == 0
+        ]
+    for mask in ["sun_*", "*_4?", "*"]:
+        expected = [
+            row
+            for row, element in enumerate(main_dict.values())
+            if fnmatch(element.get("markdownName", ""), mask)
+        ]
+        assert index.find(mask, md=True) == expected
+    info = index.get_info(index.get_row(["1f000", "fe0f"]))
+    assert info.sequence == ["1F000", "FE0F"] and info.name == "sun sun 0"
+    assert info.category == "group 0" and info.subcategory == "subgroup 0"
+    assert info.markdownName == "sun_0" and info.countryCode == "DE"
+    assert index.get_row(["1f001"]) == 1 and index.get_row(["ffff"]) is None
+    assert index.has_png(0) and not index.has_png(1)
+    assert names[index.find("sun face 8")[0]] == "1F008"
+    with pytest.raises(ValueError):
+        EmojiIndex({"version": 0})
+    # glob and prefix searches
+    start = time.perf_counter()
+    for _ in range(20):
+        index.find("*smiling*", png_only=True)
+        index.find("smiling*")
+    assert (time.perf_counter() - start) / 40 < 0.02
+
+
+def test_emoji_db_search(main_dict):
+    """
+    Tests the search functions of the EmojiDb using the index
+    """
+    index = EmojiIndex.from_db(main_dict, set(list(main_dict)[:100]))
+    with mock.patch.object(EmojiDb, "_index", index):
+        results = EmojiDb.find_emojis_by_name("sun*")
+        assert len(results) == 13
+        assert all(element.name.startswith("sun") for element in results)
+        assert len(EmojiDb.find_emojis_by_name("sun*", find_all=True)) == 500
+        assert EmojiDb.find_emojis_by_name("flag_4", md=True)[0].name == "flag sun 4"
+        assert EmojiDb.png_exists(["1f001"]) and not EmojiDb.png_exists(["1f101"])
+        assert EmojiDb.get_details(["1f001"]).name == "face sun 1"
+        assert EmojiDb.get_details(["ffff"]) is None
+        assert EmojiDb.get_categories() == [f"group {index}" for index in range(5)]
+        assert EmojiDb.get_sub_categories("group 0") == sorted(
+            f"subgroup {index}" for index in range(11)
+        )
+        assert EmojiDb.get_sub_categories("unknown") == []
+        in_category = EmojiDb.get_emojis_in_category("group 1", "subgroup 1")
+        assert len(in_category) == len(
+            [
+                element
+                for element in main_dict.values()
+                if element["group"] == "group 1" and element["subgroup"] == "subgroup 1"
+            ]
+        )
+        assert [element.name for element in in_category] == sorted(
+            element.name for element in in_category
+        )
+        assert len(EmojiDb.get_emojis_in_category("group 1", None)) == 800
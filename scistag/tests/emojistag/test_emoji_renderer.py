@@ -1,12 +1,17 @@
 """
 Implements the tests for the Emoji rendering
 """
+from unittest import mock
+
+import numpy as np
 import pytest
 
 from . import vl
-from ...emojistag import render_emoji, EmojiRenderer
-from ...imagestag import Colors
+from ...emojistag import render_emoji, EmojiRenderer, EmojiAtlas, EmojiDb
+from ...emojistag.emoji_info import EmojiInfo
+from ...imagestag import Colors, Image
 from ...common.sytem_info import SystemInfo
+from ...vislog import VisualLog
 
 SKIP_SVG = SystemInfo.os_type.is_windows and not EmojiRenderer.get_svg_support()
 
@@ -97,3 +102,97 @@ def test_emoji_background():
         white_emoji,
         hash_val="984b8551d2def77519b01051acd41b0d",
     )
+
+
+def _fake_render(sequence, size, bg_color, quality):
+    """
+    Creates a single colored emoji image instead of rendering it
+    """
+    if sequence == ["ffff"]:
+        return None
+    color = (int(sequence[0][-2:], 16), 0, 0, 255)
+    return Image(np.full((size[1], size[0], 4), color, dtype=np.uint8))
+
+
+def test_render_cache():
+    """
+    Tests the caching of rendered emojis
+    """
+    EmojiRenderer.clear_cache()
+    with mock.patch.object(EmojiRenderer, "cache_size", 2), mock.patch.object(
+        EmojiRenderer, "_render", side_effect=_fake_render
+    ) as render:
+        first = render_emoji(["1f98c"], size=32)
+        assert first.get_size() == (32, 32)
+        first.get_pixels()[:] = 0
+        second = render_emoji(["1F98C"], size=32)
+        assert render.call_count == 1
+        # a copy is returned so modifications do not affect the cache
+        assert second.get_pixels()[0, 0, 0] == 0x8C
+        # size and background color are part of the key
+        render_emoji(["1f98c"], size=16)
+        render_emoji(["1f98c"], size=16, bg_color=Colors.WHITE)
+        assert render.call_count == 3
+        # the least recently used emoji was evicted
+        render_emoji(["1f98c"], size=32)
+        assert render.call_count == 4
+        assert render_emoji(["ffff"], size=32) is None
+    EmojiRenderer.clear_cache()
+
+
+def test_atlas():
+    """
+    Tests the composition of an emoji sprite atlas
+    """
+    EmojiRenderer.clear_cache()
+    with mock.patch.object(EmojiRenderer, "_render", side_effect=_fake_render):
+        sequences = [["1f6" + f"{index:02x}"] for index in range(5)]
+        atlas = EmojiAtlas(
+            sequences + [["ffff"], ["1F600"]], size=10, columns=2, class_name="ea"
+        )
+    EmojiRenderer.clear_cache()
+    assert len(atlas) == 5 and atlas.cell_size == (10, 10)
+    assert atlas.image.get_size() == (20, 30)
+    assert atlas.get_position(["1f603"]) == (10, 10)
+    assert ["ffff"] not in atlas and atlas.get_html(["ffff"]) is None
+    pixels = atlas.image.get_pixels()
+    assert pixels[25, 5, 0] == 4 and pixels[25, 15, 3] == 0
+    css = atlas.get_css()
+    assert css.startswith(".ea{display:inline-block;width:10px;height:10px;")
+    assert "data:image/png;base64," in css
+    assert ".ea_1f603{background-position:-10px -10px}" in css
+    assert (
+        atlas.get_html(["1f603"], title="<x>")
+        == '<span class="ea ea_1f603" title="&lt;x&gt;"></span>'
+    )
+
+
+@pytest.mark.parametrize("formats_out", [{"html"}, {"html", "md"}])
+def test_atlas_logging(formats_out):
+    """
+    Tests that the atlas is only used if HTML is the log's only output format
+    """
+    options = VisualLog.setup_options()
+    options.output.formats_out = formats_out
+    log = VisualLog(options=options)
+    builder = log.default_builder
+    emoji = EmojiInfo(
+        sequence=["1f603"],
+        name="grinning face with big eyes",
+        category="Smileys & Emotion",
+        subcategory="face-smiling",
+    )
+    with (
+        mock.patch.object(EmojiRenderer, "_render", side_effect=_fake_render),
+        mock.patch.object(EmojiDb, "find_emojis_by_name", return_value=[emoji]),
+        mock.patch.object(EmojiDb, "get_character_sequence", return_value=["1f603"]),
+    ):
+        builder.emoji.atlas([["1f603"]], size=14)
+        builder.emoji("*grinning*")
+    EmojiRenderer.clear_cache()
+    builder.flush()
+    html = log.default_page.get_body("html")
+    if formats_out == {"html"}:
+        assert b'_1f603"' in html and b"<img" not in html
+    else:  # logged as image so the other formats can present it as well
+        assert b'_1f603"' not in html and b"<img" in html
@@ -4,10 +4,13 @@ Tests the :class:`FileSource` class.
 With the :class:`FileSource` class you can iterate through directories, archives or cloud storage sources
 file by file with a minimum of code.
 """
+import asyncio
 import hashlib
+import io
 import os.path
 import shutil
 import time
+import zipfile
 from unittest import mock
 
 import pytest
@@ -74,6 +77,79 @@ def test_iteration():
     assert total_size >= 5000
 
 
+@pytest.mark.parametrize("fetch_file_list", [True, False])
+def test_async_iteration(tmp_path, fetch_file_list):
+    """
+    Tests iterating directories and archives asynchronously
+    """
+    zip_data = io.BytesIO()
+    with zipfile.ZipFile(zip_data, "w") as archive:
+        for index in range(60):
+            FileStag.save(str(tmp_path / f"{index:02d}.txt"), f"{index}".encode())
+            archive.writestr(f"{index:02d}.txt", f"{index}".encode())
+        archive.writestr("skipped.md", b"")
+
+    async def collect(source: FileSource, **params) -> list[tuple[str, bytes]]:
+        if len(params):
+            return [
+                (element.filename, element.data)
+                async for element in source.iter_async(**params)
+            ]
+        return [(element.filename, element.data) async for element in source]
+
+    expected = [(f"{index:02d}.txt", f"{index}".encode()) for index in range(60)]
+    for source_data in [str(tmp_path), zip_data.getvalue()]:
+        with FileSource.from_source(
+            source_data, search_mask="*.txt", fetch_file_list=fetch_file_list
+        ) as source:
+            elements = sorted(asyncio.run(collect(source, max_concurrency=8)))
+            assert elements == expected
+        with FileSource.from_source(
+            source_data,
+            search_mask="*.txt",
+            fetch_file_list=fetch_file_list,
+            max_file_count=10,
+            index_filter=(2, 1),
+        ) as source:
+            elements = asyncio.run(collect(source))
+            assert len(elements) == 10
+            assert all(int(data) % 2 == 1 for _, data in elements)
+    with FileSource.from_source(
+        str(tmp_path), search_mask="*.txt", fetch_file_list=True
+    ) as source:
+        # elements are provided in the same order as by the sync iteration
+        assert asyncio.run(collect(source, max_concurrency=4)) == [
+            (element.filename, element.data) for element in source
+        ]
+    with FileSource.from_source(
+        str(tmp_path), search_mask="*.txt", dont_load=True
+    ) as source:
+        elements = asyncio.run(collect(source))
+        assert len(elements) == 60 and all(data is None for _, data in elements)
+
+    async def close_early(source: FileSource) -> tuple[str, list[asyncio.Future]]:
+        iterator = source.iter_async(max_concurrency=8)
+        first = await iterator.__anext__()
+        tasks = [task for _, task in iterator._pending]
+        await iterator.aclose()
+        with pytest.raises(StopAsyncIteration):
+            await iterator.__anext__()
+        return first.filename, tasks
+
+    async def slow_fetch(_, filename: str) -> bytes:
+        if filename != "00.txt":
+            await asyncio.sleep(60.0)
+        return b"0"
+
+    with FileSource.from_source(
+        str(tmp_path), search_mask="*.txt", fetch_file_list=True
+    ) as source, mock.patch.object(FileSource, "afetch", slow_fetch):
+        # stopping the iteration cancels the prefetched files
+        filename, tasks = asyncio.run(close_early(source))
+        assert filename == "00.txt"
+        assert len(tasks) == 7 and all(task.cancelled() for task in tasks)
+
+
 def test_context():
     """
     Tests entering and leaving the context
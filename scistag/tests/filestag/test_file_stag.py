@@ -1,6 +1,7 @@
 """
 Tests the FileStag class
 """
+import asyncio
 import os.path
 import shutil
 
@@ -139,3 +140,33 @@ def test_copy(tmp_path):
         SecretStr(TestConstants.STAG_URL), SecretStr(sub_folder + "/stag.jpg")
     )
     assert os.path.getsize(sub_folder + "/stag.jpg") == 308019
+
+
+def test_async(tmp_path):
+    """
+    Tests FileStag's awaitable functions
+    """
+    filenames = [str(tmp_path / f"file_{index}.bin") for index in range(50)]
+
+    async def run():
+        results = await asyncio.gather(
+            *[
+                FileStag.asave(filename, f"{index}".encode())
+                for index, filename in enumerate(filenames)
+            ]
+        )
+        assert all(results)
+        assert await FileStag.aexists(filenames[3])
+        assert not await FileStag.aexists(str(tmp_path / "missing.bin"))
+        data = await asyncio.gather(*[FileStag.aload(name) for name in filenames])
+        assert data == [f"{index}".encode() for index in range(50)]
+        assert (await FileStag.aload(filenames[1], as_stream=True)).read() == b"1"
+        assert await FileStag.aload(b"123") == b"123"
+        assert await FileStag.aload(str(tmp_path / "missing.bin")) is None
+        target = str(tmp_path / "sub" / "copy.bin")
+        assert await FileStag.acopy(filenames[5], target, create_dir=True)
+        assert FileStag.load(target) == b"5"
+        with pytest.raises(ValueError):
+            await FileStag.asave(filenames[0], None)
+
+    asyncio.run(run())
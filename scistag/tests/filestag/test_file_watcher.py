@@ -0,0 +1,187 @@
+"""
+Tests the FileWatcher class and the event driven FileDataObserver
+"""
+import os
+import sys
+import time
+from unittest import mock
+
+import pytest
+
+from scistag.filestag import FileStag, FileSource, FileDataObserver, FileWatcher
+from scistag.filestag.file_watcher import (
+    FILE_WATCHER_BACKEND_INOTIFY,
+    FILE_WATCHER_BACKEND_POLLING,
+)
+
+
+def _wait_for_revision(watcher: FileWatcher, path: str, revision: int) -> int:
+    """
+    Waits until a path's revision changed
+
+    :param watcher: The watcher
+    :param path: The observed path
+    :param revision: The previous revision
+    :return: The new revision
+    """
+    start_time = time.time()
+    while watcher.revision(path) == revision and time.time() - start_time < 5.0:
+        watcher.wait_for_change(timeout=0.05)
+    return watcher.revision(path)
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_file_watcher(tmp_path, use_inotify):
+    """
+    Tests observing files and directories
+    """
+    watcher = FileWatcher(debounce_s=0.1, poll_interval_s=0.05, use_inotify=use_inotify)
+    if use_inotify and not sys.platform.startswith("linux"):
+        assert watcher.backend == FILE_WATCHER_BACKEND_POLLING
+        watcher.terminate()
+        return
+    assert watcher.backend == (
+        FILE_WATCHER_BACKEND_INOTIFY if use_inotify else FILE_WATCHER_BACKEND_POLLING
+    )
+    filename = str(tmp_path / "data.txt")
+    other_filename = str(tmp_path / "other.txt")
+    sub_dir = tmp_path / "sub"
+    sub_dir.mkdir()
+    FileStag.save(filename, b"1")
+    FileStag.save(other_filename, b"1")
+    assert watcher.watch(filename)
+    assert watcher.watch(other_filename)
+    assert watcher.watch(str(tmp_path), recursive=True)
+    assert not watcher.watch(str(tmp_path / "missing" / "file.txt"))
+    assert watcher.revision(filename) == 0
+    # a burst of modifications is reported once
+    for index in range(5):
+        FileStag.save(filename, f"{index * 100}".encode())
+        time.sleep(0.01)
+    assert _wait_for_revision(watcher, filename, 0) == 1
+    time.sleep(0.3)
+    assert watcher.revision(filename) == 1
+    assert watcher.revision(other_filename) == 0
+    dir_revision = watcher.revision(str(tmp_path))
+    assert dir_revision >= 1
+    # modifications in sub directories
+    FileStag.save(str(sub_dir / "new.txt"), b"new")
+    assert _wait_for_revision(watcher, str(tmp_path), dir_revision) > dir_revision
+    os.remove(filename)
+    assert _wait_for_revision(watcher, filename, 1) == 2
+    watcher.unwatch(filename)
+    assert watcher.revision(filename) is None
+    watcher.terminate()
+    watcher.join()
+    assert not watcher.is_running
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify only")
+def test_unwatch_directories(tmp_path):
+    """
+    Tests that unwatching a path removes the inotify watches no other path needs
+    """
+    watcher = FileWatcher(debounce_s=0.05)
+    assert watcher.backend == FILE_WATCHER_BACKEND_INOTIFY
+    sub_dir = tmp_path / "sub"
+    (sub_dir / "nested").mkdir(parents=True)
+    filename = str(tmp_path / "data.txt")
+    other_filename = str(tmp_path / "other.txt")
+    assert watcher.watch(filename)
+    assert watcher.watch(other_filename)
+    assert watcher.watch(str(sub_dir), recursive=True)
+    assert watcher.watch(str(sub_dir / "nested"))
+    directories = {str(tmp_path), str(sub_dir), str(sub_dir / "nested")}
+    assert set(watcher._dir_wds) == directories
+    watcher.unwatch(str(sub_dir))
+    assert set(watcher._dir_wds) == {str(tmp_path), str(sub_dir / "nested")}
+    watcher.unwatch(str(sub_dir / "nested"))
+    watcher.unwatch(filename)
+    assert set(watcher._dir_wds) == {str(tmp_path)}
+    watcher.unwatch(other_filename)
+    assert watcher._dir_wds == {} and watcher._wd_dirs == {}
+    # the directory can be watched again
+    assert watcher.watch(filename)
+    FileStag.save(filename, b"1")
+    assert _wait_for_revision(watcher, filename, 0) == 1
+    watcher.terminate()
+    watcher.join()
+
+
+def test_terminate_releases_descriptors(tmp_path):
+    """
+    Tests that terminating a watcher while its thread finishes closes the inotify
+    instance and the wake-up pipe exactly once
+    """
+    for _ in range(20):
+        watcher = FileWatcher()
+        assert watcher.watch(str(tmp_path))
+        watcher.terminate()
+        watcher.terminate()
+        watcher.join()
+        assert watcher._inotify_fd is None and watcher._wake_pipe is None
+    watcher = FileWatcher()
+    watcher.terminate()  # never started
+    assert watcher._inotify_fd is None and watcher._wake_pipe is None
+
+
+def test_file_watcher_fallbacks(tmp_path):
+    """
+    Tests polling directories inotify can not watch and replacing a shared
+    watcher whose thread stopped
+    """
+    watcher = FileWatcher(debounce_s=0.05, poll_interval_s=0.05)
+    filename = str(tmp_path / "data.txt")
+    FileStag.save(filename, b"1")
+    # e.g. the user's inotify watch limit was reached
+    with mock.patch.object(FileWatcher, "_add_directory", return_value=False):
+        assert watcher.watch(str(tmp_path), recursive=True)
+    FileStag.save(filename, b"22")
+    assert _wait_for_revision(watcher, str(tmp_path), 0) >= 1
+    assert watcher.is_running
+    watcher.terminate()
+    watcher.join()
+    assert not watcher.is_running
+    assert watcher.watch(filename)  # does not try to restart the thread
+    shared = FileWatcher.shared()
+    assert FileWatcher.shared() is shared
+    assert shared.watch(filename)
+    shared.terminate()
+    shared.join()
+    assert FileWatcher.shared() is not shared
+
+
+def test_event_driven_observer(tmp_path):
+    """
+    Tests that an event driven observer only re-hashes modified files
+    """
+    file_a = str(tmp_path / "a.bin")
+    file_b = str(tmp_path / "b.bin")
+    FileStag.save(file_a, b"123")
+    FileStag.save(file_b, b"456")
+    observer = FileDataObserver(file_a, max_content_size=8, event_driven=True)
+    observer.add(file_b)
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    FileStag.save(str(source_dir / "c.bin"), b"789")
+    observer.add(FileSource.from_source(str(source_dir), search_mask="*.bin"))
+    assert observer.event_driven
+    with mock.patch.object(
+        FileDataObserver, "_file_hash", wraps=observer._file_hash
+    ) as file_hash:
+        hash_val = hash(observer)
+        assert file_hash.call_count == 2
+        for _ in range(10):
+            assert hash(observer) == hash_val
+        assert file_hash.call_count == 2
+        revision = observer.watcher.revision(file_b)
+        FileStag.save(file_b, b"000")
+        _wait_for_revision(observer.watcher, file_b, revision)
+        new_hash = hash(observer)  # no refresh interval to wait for
+        assert new_hash != hash_val
+        assert file_hash.call_count == 3
+        file_hash.assert_called_with(file_b)
+    revision = observer.watcher.revision(str(source_dir))
+    FileStag.save(str(source_dir / "d.bin"), b"1")
+    _wait_for_revision(observer.watcher, str(source_dir), revision)
+    assert hash(observer) != new_hash
@@ -1,6 +1,10 @@
 """
 Tests the functionality of the SharedArchive class
 """
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
 import pytest
 
 from scistag.common.essential_data import get_edp, ESSENTIAL_DATA_ARCHIVE_NAME
@@ -84,3 +88,47 @@ def test_url_verification():
         )
     with pytest.raises(ValueError):
         SharedArchive._split_identifier_and_filename(ZIP_SOURCE_PROTOCOL + "@someFile")
+
+
+def test_concurrent_reads(tmp_path):
+    """
+    Tests reading from an archive from multiple threads and the cache of
+    decompressed files
+    """
+    archive_name = str(tmp_path / "test.zip")
+    contents = {
+        f"file_{index}.txt": f"{index} ".encode() * index for index in range(64)
+    }
+    with zipfile.ZipFile(archive_name, "w") as zip_file:
+        for name, data in contents.items():
+            zip_file.writestr(
+                name,
+                data,
+                compress_type=zipfile.ZIP_DEFLATED
+                if len(data) % 2
+                else zipfile.ZIP_STORED,
+            )
+        zip_file.writestr("data.lzma", b"lzma" * 100, compress_type=zipfile.ZIP_LZMA)
+    archive = SharedArchive(archive_name, "concurrentTest", cache_size=1000)
+    assert archive.exists("file_3.txt") and not archive.exists("file_64.txt")
+    assert len(archive.find_files("file_*.txt")) == 64
+    assert archive.read_file("file_64.txt") is None
+    assert archive.read_file("data.lzma") == b"lzma" * 100
+
+    def read_all(_) -> bool:
+        return all(archive.read_file(name) == data for name, data in contents.items())
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(read_all, range(32)))
+    assert 0 < archive._cached_bytes <= 1000
+    with mock.patch.object(archive, "_decompress") as decompress:
+        cached_name = next(reversed(archive._cache))
+        assert archive.read_file(cached_name) == contents[cached_name]
+        decompress.assert_not_called()
+    archive.close()
+    assert not archive.exists("file_3.txt")
+    # from memory, without cache
+    with open(archive_name, "rb") as archive_file:
+        archive = SharedArchive(archive_file.read(), "concurrentTest")
+    assert read_all(0)
+    assert len(archive._cache) == 0
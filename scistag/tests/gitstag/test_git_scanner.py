@@ -0,0 +1,104 @@
+"""
+Tests the evaluation of .gitignore files by the GitScanner
+"""
+
+import os
+
+from scistag.gitstag import GitIgnore, GitScanner
+
+
+def _write(path: str, content: str | bytes):
+    """
+    Writes a file and creates its directory
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb" if isinstance(content, bytes) else "w") as file:
+        file.write(content)
+
+
+def test_git_ignore_rules():
+    """
+    Tests the translation of gitignore patterns
+    """
+    rules = GitIgnore(
+        "",
+        [
+            "# comment",
+            "*.log",
+            "!keep.log",
+            "/build/",
+            "doc/*.txt",
+            "**/cache/**",
+            "a/**/b",
+            "temp?.[ch]",
+            "\\#hash",
+            "",
+        ],
+    )
+    assert rules.match("x/error.log", False)
+    assert rules.match("keep.log", False) is False
+    assert rules.match("build", True)
+    assert rules.match("build", False) is None
+    assert rules.match("src/build", True) is None
+    assert rules.match("doc/notes.txt", False)
+    assert rules.match("doc/sub/notes.txt", False) is None
+    assert rules.match("x/cache/data.bin", False)
+    assert rules.match("a/b", False) and rules.match("a/x/y/b", False)
+    assert rules.match("temp1.c", False) and not rules.match("temp12.c", False)
+    assert rules.match("#hash", False)
+    nested = GitIgnore("sub", ["*.bin", "!important.bin"])
+    root = GitIgnore("", ["*.bin", "*.tmp"])
+    assert GitIgnore.is_ignored((root, nested), "sub/data.bin", False)
+    assert not GitIgnore.is_ignored((root, nested), "sub/important.bin", False)
+    assert GitIgnore.is_ignored((root, nested), "sub/x.tmp", False)
+    assert not GitIgnore.is_ignored((root, nested), "main.py", False)
+
+
+def test_git_scanner(tmp_path):
+    """
+    Tests scanning a directory tree in process and via worker processes
+    """
+    base = str(tmp_path)
+    _write(f"{base}/.gitignore", "*.log\nbuild/\n")
+    _write(f"{base}/main.py", b"0" * 100)
+    _write(f"{base}/debug.log", b"0" * 1000)
+    _write(f"{base}/build/out.bin", b"0" * 1000)
+    _write(f"{base}/.git/HEAD", b"0" * 1000)
+    _write(f"{base}/src/.gitignore", "*.bin\n!model.bin\n")
+    _write(f"{base}/src/model.bin", b"0" * 500)
+    _write(f"{base}/src/data.bin", b"0" * 500)
+    _write(f"{base}/src/deep/code.py", b"0" * 50)
+    for workers in [0, 2]:
+        scanner = GitScanner(workers=workers)
+        scanner.scan(base)
+        names = sorted(os.path.relpath(name, base) for name, _ in scanner.files)
+        assert names == sorted(
+            [
+                ".gitignore",
+                "main.py",
+                os.path.join("src", ".gitignore"),
+                os.path.join("src", "model.bin"),
+                os.path.join("src", "deep", "code.py"),
+            ]
+        )
+        assert scanner.file_count == 5
+        assert scanner.dir_count == 4  # including the ignored build and .git
+        assert scanner.total_size == sum(size for _, size in scanner.files)
+        assert scanner.size_tree[base] == scanner.total_size
+        assert scanner.size_tree[os.path.join(base, "src", "deep")] == 50
+        assert scanner.file_list_by_size[0]["size"] == 500
+        assert scanner.get_large_files(min_size=100, ignore_list=[]) == [
+            os.path.join(base, "src", "model.bin"),
+            os.path.join(base, "main.py"),
+        ]
+        assert scanner.get_large_files(min_size=100, ignore_list=["*/main.py"]) == [
+            os.path.join(base, "src", "model.bin")
+        ]
+        assert (
+            len(
+                scanner.get_large_files(
+                    min_size=100, ignore_list=["*.bin"], hard_limit_size=400
+                )
+            )
+            == 2
+        )
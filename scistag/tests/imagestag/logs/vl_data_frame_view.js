@@ -0,0 +1 @@
+function vlSetupDfView(view) {let scroll = document.getElementById(view.id + "_SCROLL");view.vlState = {total: parseInt(view.dataset.total),pageSize: parseInt(view.dataset.page_size),start: 0,count: view.querySelector("tbody.vl_df_view_rows").rows.length,rowHeight: 0,sort: "",ascending: 1,filter: "",pending: false,dirty: false,timer: null};vlDfViewUpdatePadding(view);scroll.addEventListener("scroll", function () {vlDfViewScheduleUpdate(view, false);});}function vlDfViewRowHeight(view) {let state = view.vlState;if (state.rowHeight <= 0) {let rows = view.querySelector("tbody.vl_df_view_rows").rows;if (rows.length > 0) {state.rowHeight = rows[0].offsetHeight;}}return state.rowHeight > 0 ? state.rowHeight : 24;}const VL_DF_VIEW_MAX_HEIGHT = 8000000;function vlDfViewScale(view) {let height = vlDfViewRowHeight(view);return Math.max(1, view.vlState.total * height / VL_DF_VIEW_MAX_HEIGHT);}function vlDfViewRowOffset(view, row) {let state = view.vlState;let height = vlDfViewRowHeight(view);let scale = vlDfViewScale(view);let windowEnd = state.start + state.count;if (row < state.start) {return row * height / scale;}let top = state.start * height / scale;if (row < windowEnd) {return top + (row - state.start) * height;}return top + state.count * height + (row - windowEnd) * height / scale;}function vlDfViewRowAt(view, offset) {let state = view.vlState;let height = vlDfViewRowHeight(view);let scale = vlDfViewScale(view);let top = state.start * height / scale;let windowBottom = top + state.count * height;let row;if (offset < top) {row = Math.floor(offset * scale / height);} else if (offset < windowBottom) {row = state.start + Math.floor((offset - top) / height);} else {row = state.start + state.count +Math.floor((offset - windowBottom) * scale / height);}return Math.max(0, Math.min(row, state.total - 1));}function vlDfViewUpdatePadding(view) {let state = view.vlState;let pads = view.querySelectorAll("td.vl_df_view_pad");let height = vlDfViewRowHeight(view);let scale = vlDfViewScale(view);let remaining = Math.max(0, state.total - state.start - state.count);pads[0].style.height = Math.round(state.start * height / scale) + "px";pads[1].style.height = Math.round(remaining * height / scale) + "px";document.getElementById(view.id + "_INFO").textContent = state.total + " rows";}function vlDfViewScheduleUpdate(view, reload) {let state = view.vlState;if (reload) {state.dirty = true;}if (state.timer !== null) {return;}state.timer = setTimeout(function () {state.timer = null;vlDfViewUpdate(view);}, reload ? 250 : 50);}function vlDfViewUpdate(view) {let state = view.vlState;if (state.pending) {vlDfViewScheduleUpdate(view, false);return;}let scroll = document.getElementById(view.id + "_SCROLL");let height = vlDfViewRowHeight(view);let first = vlDfViewRowAt(view, scroll.scrollTop);let visible = Math.ceil(scroll.clientHeight / height);if (!state.dirty && first >= state.start &&first + visible <= state.start + state.count) {return;}let start = Math.max(0, first - Math.floor((state.pageSize - visible) / 2));let params = new URLSearchParams({widget: view.id,start: start,count: state.pageSize,sort: state.sort,ascending: state.ascending,filter: state.filter});state.pending = true;state.dirty = false;fetch("vl_data_frame_view?" + params.toString()).then(response => response.json()).then(function (data) {let topRow = vlDfViewRowAt(view, scroll.scrollTop);let compressed = vlDfViewScale(view) > 1;state.total = data.total;state.start = data.start;let rows = view.querySelector("tbody.vl_df_view_rows");rows.innerHTML = data.rows;state.count = rows.rows.length;vlDfViewUpdatePadding(view);if (compressed || vlDfViewScale(view) > 1) {scroll.scrollTop = vlDfViewRowOffset(view, topRow);}}).catch(function () {}).finally(function () {state.pending = false;});}function vlDfViewSort(cell) {let view = cell.closest("div.vl_df_view");let state = view.vlState;let column = cell.dataset.column;state.ascending = state.sort === column && state.ascending === 1 ? 0 : 1;state.sort = column;cell.parentElement.querySelectorAll("th").forEach(function (element) {element.classList.remove("vl_df_view_asc", "vl_df_view_desc");});cell.classList.add(state.ascending ? "vl_df_view_asc" : "vl_df_view_desc");vlDfViewScheduleUpdate(view, true);}function vlDfViewSetFilter(input) {let view = input.closest("div.vl_df_view");view.vlState.filter = input.value;vlDfViewScheduleUpdate(view, true);}
@@ -1,6 +1,8 @@
 """
 Tests the :class:`Canvas` class.
 """
+from unittest import mock
+
 import numpy as np
 import pytest
 
@@ -251,3 +253,98 @@ def test_clip():
     assert canvas.clip((50, 50), (60, 65)) == canvas
     assert canvas.offset == (50, 50)
     assert canvas.clip_region == ((50, 50), (110, 115))
+
+
+@pytest.mark.skipif(skip_imagestag, reason="ImageStag tests disabled")
+def test_batch_primitives():
+    """
+    Tests drawing large batches of primitives via numpy
+    """
+    rng = np.random.default_rng(42)
+    rectangles = np.sort(rng.uniform(-30, 130, (200, 2, 2)), axis=1)
+    colors = [tuple(color) for color in rng.integers(0, 300, (200, 4)).tolist()]
+    for pixel_format in ["RGB", "RGBA", "G"]:
+        for outline_width in [0, 1, 5]:
+            for params in [{"single_color": colors[0]}, {"colors": colors}]:
+                if pixel_format == "G":
+                    params = {
+                        key: value[0]
+                        if key == "single_color"
+                        else [c[0] for c in value]
+                        for key, value in params.items()
+                    }
+                canvases = []
+                for threshold in [1, 10**9]:
+                    canvas = Canvas(size=(100, 90), pixel_format=pixel_format)
+                    canvas.add_offset_shift((3.5, -2.25))
+                    with mock.patch.object(Canvas, "batch_threshold", threshold):
+                        canvas.rectangle_list(
+                            rectangles, outline_width=outline_width, **params
+                        )
+                    canvases.append(canvas.to_image().get_pixels())
+                # rasterizing via numpy is pixel identical to PIL
+                assert np.array_equal(canvases[0], canvases[1])
+    with pytest.raises(ValueError):
+        Canvas(size=(10, 10)).rectangle_list(rectangles, colors=colors[:3])
+    # points, lines and polylines
+    canvas = Canvas(size=(100, 100))
+    canvas.add_offset_shift((5, 5))
+    canvas.point_list(
+        [(0, 0), (94, 94), (200, 3)], colors=[(1, 2, 3), (4, 5, 6), (7, 8, 9)]
+    )
+    pixels = canvas.to_image().get_pixels()
+    assert pixels[5, 5].tolist() == [1, 2, 3] and pixels[99, 99].tolist() == [4, 5, 6]
+    canvas = Canvas(size=(8, 8))
+    canvas.line_list(np.array([[1, 1, 6, 3]]), single_color=(255, 0, 0))
+    reference = Canvas(size=(8, 8))
+    reference.line([(1, 1), (6, 3)], color=(255, 0, 0))
+    assert np.array_equal(
+        canvas.to_image().get_pixels(), reference.to_image().get_pixels()
+    )
+    canvas = Canvas(size=(100, 100))
+    canvas.polyline_list(
+        [[(0, 0), (50, 0), (50, 50)], np.array([(10, 10), (20, 20)])],
+        colors=[(255, 0, 0), (0, 255, 0)],
+    )
+    pixels = canvas.to_image().get_pixels()
+    assert np.all(pixels[0, :51, 0] == 255) and np.all(pixels[:51, 50, 0] == 255)
+    assert pixels[15, 15].tolist() == [0, 255, 0]
+    with pytest.raises(ValueError):
+        canvas.line_list([((0, 0), (5, 5))])
+    # circles
+    canvas = Canvas(size=(100, 100), pixel_format="G")
+    canvas.circle_list([(50, 50), (20, 20)], [10, 3], colors=[255, 128])
+    canvas.circle_list([(50, 50)], 20, single_color=64, outline_width=2)
+    pixels = canvas.to_image().get_pixels()
+    assert pixels[50, 40:61].tolist() == [255] * 21
+    assert pixels[50, 39] == 0 and pixels[20, 17:24].tolist() == [128] * 7
+    assert pixels[50, 30:32].tolist() == [64, 64] and pixels[50, 32] == 0
+    # lines and circles are pixel identical to drawing them one by one via PIL
+    lines = rng.uniform(-20, 120, (300, 4))
+    centers = rng.uniform(-10, 110, (100, 2))
+    radii = rng.choice([0.0, 0.5, 1.0, 2.5, 3.0, 7.25, 12.0], 100)
+    shape_colors = [tuple(color) for color in rng.integers(0, 256, (300, 3)).tolist()]
+    for outline_width in [0, 1, 3]:
+        canvas = Canvas(size=(100, 100))
+        canvas.add_offset_shift((1.5, -0.75))
+        canvas.line_list(lines, colors=shape_colors)
+        canvas.circle_list(
+            centers, radii, colors=shape_colors[:100], outline_width=outline_width
+        )
+        reference = Canvas(size=(100, 100))
+        reference.add_offset_shift((1.5, -0.75))
+        for line, color in zip(lines.tolist(), shape_colors):
+            reference.line([line[:2], line[2:]], color=color)
+        for center, radius, color in zip(centers.tolist(), radii, shape_colors):
+            if outline_width == 0:
+                reference.circle(center, float(radius), color=color)
+            else:
+                reference.circle(
+                    center,
+                    float(radius),
+                    outline_color=color,
+                    outline_width=outline_width,
+                )
+        assert np.array_equal(
+            canvas.to_image().get_pixels(), reference.to_image().get_pixels()
+        )
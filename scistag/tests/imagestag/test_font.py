@@ -1,7 +1,13 @@
+import os
+from collections import OrderedDict
+from unittest import mock
+
+import numpy as np
 import pytest
 
 from . import vl
 from scistag.imagestag import Canvas, Colors, HTextAlignment, VTextAlignment, Font
+from scistag.imagestag.font_registry import FontRegistry
 from ...imagestag.anchor2d import Anchor2D
 from . import skip_imagestag
 
@@ -190,3 +196,73 @@ def test_h_alignment():
     area = font.get_covered_area("Hello World!", h_align="center")
     assert 125 < area.width() < 135
     assert 20 < area.height() < 25
+
+
+@pytest.fixture
+def dejavu_dir() -> str:
+    """
+    Provides the directory of the DejaVu fonts shipped with matplotlib
+    """
+    matplotlib = pytest.importorskip("matplotlib")
+    return os.path.join(matplotlib.get_data_path(), "fonts/ttf/")
+
+
+def test_text_caches(dejavu_dir):
+    """
+    Tests the pooling of font handles and the caching of text metrics and masks
+    """
+    with mock.patch.object(FontRegistry, "fonts", {}), mock.patch.object(
+        FontRegistry, "_handles", OrderedDict()
+    ), mock.patch.object(FontRegistry, "_base_fonts_registered", True):
+        FontRegistry.register_font(
+            "DejaVu Sans",
+            dejavu_dir + "DejaVuSans",
+            variations=[("", set()), ("-Bold", {"Bold"})],
+        )
+        font = FontRegistry.get_font("DejaVu Sans", size=20)
+        assert FontRegistry.get_font("DejaVu Sans", size=20) is font
+        bold = FontRegistry.get_font("DejaVu Sans", size=20, flags={"Bold"})
+        assert bold is not font
+        assert FontRegistry.get_font("DejaVu Sans", size=21) is not font
+        assert FontRegistry.get_font("Unknown", size=20) is None
+        with mock.patch.object(FontRegistry, "max_font_handles", 1):
+            FontRegistry.get_font("DejaVu Sans", size=22)
+            assert FontRegistry.get_font("DejaVu Sans", size=20) is not font
+    # text metrics are only computed once
+    handle = font.get_handle()
+    with mock.patch.object(handle, "getbbox", wraps=handle.getbbox) as getbbox:
+        size = font.get_text_size("Hello\nWorld")
+        assert font.get_text_size("Hello\nWorld") == size
+        assert font.get_covered_area("Hello").width() > 0
+        assert getbbox.call_count == 2
+    # cached masks are rendered pixel-identical
+    for stroke_width, stroke_color in [(0, None), (2, Colors.RED)]:
+        canvas = Canvas(size=(200, 100), pixel_format="RGBA")
+        reference = Canvas(size=(200, 100), pixel_format="RGBA")
+        for pos in [(10, 10), (20.5, 40.25), (-3.7, 60)]:
+            for _ in range(2):
+                canvas.text(
+                    pos,
+                    "Hello ÄÖÜ",
+                    color=(255, 255, 0, 200),
+                    font=font,
+                    stroke_width=stroke_width,
+                    stroke_color=stroke_color,
+                )
+                reference.image_draw.text(
+                    pos,
+                    "Hello ÄÖÜ",
+                    font=handle,
+                    fill=(255, 255, 0, 200),
+                    stroke_width=stroke_width,
+                    stroke_fill=stroke_color.to_int_rgba() if stroke_color else None,
+                )
+        assert np.array_equal(
+            canvas.to_image().get_pixels(), reference.to_image().get_pixels()
+        )
+    assert len(font._masks) == 6  # 3 sub-pixel offsets, with and without stroke
+    with mock.patch.object(Font, "max_cached_masks", 2):
+        canvas.text((0, 0), "A\nB\nC", font=font)
+    assert len(font._masks) == 2
+    font.clear_cache()
+    assert len(font._masks) == 0 and len(font._bboxes) == 0
@@ -0,0 +1,3 @@
+"""
+Tests the MediaStag video sources
+"""
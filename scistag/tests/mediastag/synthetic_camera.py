@@ -0,0 +1,48 @@
+"""
+Implements the class :class:`SyntheticCamera`, a camera for tests and
+benchmarks which does not require any camera hardware.
+"""
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from scistag.imagestag import Image
+from scistag.mediastag import VideoSourceCamera
+
+
+class SyntheticCamera(VideoSourceCamera):
+    """
+    A camera providing frames filled with their frame index
+    """
+
+    def __init__(self, resolution: tuple[int, int] = (64, 48)):
+        super().__init__()
+        self.resolution = resolution
+        "The frames' resolution in pixels"
+        self.frame_index = 0
+        "The index of the next frame"
+        self.fetch_delay_s = 0.0
+        "The time in seconds a fetch waits for the next frame of the camera"
+
+    def create_frame(self) -> Image:
+        """
+        Returns the next frame
+        """
+        pixels = np.full(
+            (self.resolution[1], self.resolution[0], 3),
+            self.frame_index % 256,
+            dtype=np.uint8,
+        )
+        self.frame_index += 1
+        return Image(pixels)
+
+    def handle_initialize_camera(self):
+        pass
+
+    def handle_fetch(self) -> tuple[float, Image | None]:
+        if self.fetch_delay_s > 0.0:
+            time.sleep(self.fetch_delay_s)
+        # stamped after the frame was received, like CameraCv2 does
+        return time.time(), self.create_frame()
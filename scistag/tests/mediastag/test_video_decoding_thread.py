@@ -0,0 +1,52 @@
+"""
+Tests the decoding of video frames ahead of their playback
+"""
+import numpy as np
+import pytest
+
+from scistag.mediastag import VideoDecodingThread
+
+
+class FakeClip:
+    """
+    A clip providing a gray frame with the brightness of its frame index
+    """
+
+    fps = 25.0
+
+    def __init__(self):
+        self.requests = []
+        "The times of all decoded frames"
+
+    def get_frame(self, time_s: float) -> np.ndarray:
+        self.requests.append(time_s)
+        index = int(time_s * self.fps + 0.00001)
+        if index == 42:
+            raise ValueError("Corrupt frame")
+        return np.full((4, 4, 3), index, dtype=np.uint8)
+
+
+def test_video_decoding_thread():
+    """
+    Tests sequential read-ahead, restarts on seeks and error handling
+    """
+    clip = FakeClip()
+    decoder = VideoDecodingThread(clip, buffer_size=4, frame_count=40)
+    decoder.start()
+    for index in range(10):
+        assert decoder.get_frame(index)[0, 0, 0] == index
+    assert decoder.get_frame(9)[0, 0, 0] == 9
+    assert decoder.get_frame(11)[0, 0, 0] == 11
+    # sequential access decodes every frame exactly once and in order
+    assert [round(time * clip.fps) for time in clip.requests[:12]] == list(range(12))
+    # jumping backwards restarts the decoding
+    assert decoder.get_frame(2)[0, 0, 0] == 2
+    assert decoder.get_frame(39)[0, 0, 0] == 39
+    assert decoder.get_frame(100)[0, 0, 0] == 39
+    decoder.stop()
+    assert not decoder.is_alive()
+    decoder = VideoDecodingThread(clip, buffer_size=4, frame_count=50)
+    decoder.start()
+    with pytest.raises(ValueError):
+        decoder.get_frame(42)
+    decoder.stop()
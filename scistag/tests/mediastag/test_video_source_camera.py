@@ -0,0 +1,101 @@
+"""
+Tests the redirection of camera frames to local consumers
+"""
+import time
+
+from scistag.imagestag import Image
+from scistag.mediastag import (
+    VideoSourceDataStag,
+    SharedFrameBuffer,
+)
+from .synthetic_camera import SyntheticCamera
+
+
+def test_camera_redirects():
+    """
+    Tests storing raw and encoded frames in the vault and sharing them via
+    shared memory
+    """
+    camera = SyntheticCamera()
+    raw_target = camera.get_local_camera_name("synthetic_raw")
+    png_target = camera.get_local_camera_name("synthetic_png")
+    camera.add_redirect(raw_target)
+    camera.add_redirect(png_target, encoding=".png")
+    frame_buffer = SharedFrameBuffer(max_resolution=(64, 48), slots=2)
+    camera.add_redirect(frame_buffer)
+    consumer = SharedFrameBuffer(name=frame_buffer.name)
+    assert consumer.read() == (0, 0.0, None)
+    assert camera.get_local_camera_exists("synthetic_raw")
+    for timestamp in [1.0, 2.0, 3.0]:
+        camera.set_image(timestamp, camera.create_frame())
+        assert camera.flush()
+    source = VideoSourceDataStag(None, raw_target)
+    source.start()
+    _, image = source.get_image()
+    assert image.get_pixels()[0, 0, 0] == 2
+    assert source.video_resolution == (64, 48)
+    source = VideoSourceDataStag(None, png_target)
+    source.start()
+    _, image = source.get_image()
+    assert image.get_pixels()[0, 0, 0] == 2
+    counter, timestamp, frame = consumer.read()
+    assert counter == 3 and timestamp == 3.0 and frame[0, 0, 0] == 2
+    assert frame.shape == (48, 64, 3)
+    assert consumer.read(counter) == (counter, 0.0, None)
+    # a frame whose producer stopped while writing it is not waited for forever
+    frame_buffer._get_slot_header(counter)[0] = -1.0
+    start_time = time.time()
+    assert consumer.read(counter - 1, timeout=0.1) == (counter - 1, 0.0, None)
+    assert time.time() - start_time < 1.0
+    consumer.close()
+    frame_buffer.close()
+
+
+def test_capture_pipeline():
+    """
+    Tests the frame rate limit and that slow consumers drop frames instead of
+    stalling the capturing or other consumers
+    """
+    camera = SyntheticCamera()
+    camera.target_fps = 100.0
+    fast_frames = []
+    slow_frames = []
+
+    def slow_consumer(timestamp: float, image: Image):
+        time.sleep(0.05)
+        slow_frames.append(timestamp)
+
+    fast = camera.add_redirect(lambda timestamp, _: fast_frames.append(timestamp))
+    slow = camera.add_redirect(slow_consumer)
+    camera.start()
+    time.sleep(0.5)
+    camera.stop()
+    assert 10 <= camera.frame_index <= 60
+    assert fast.delivered == len(fast_frames)
+    assert fast.delivered + fast.dropped == camera.frame_index
+    assert fast.dropped < slow.dropped
+    assert fast_frames == sorted(fast_frames)
+    assert slow.dropped > 0
+    assert slow.delivered == len(slow_frames) < camera.frame_index // 2
+    assert slow.delivered + slow.dropped == camera.frame_index
+    assert 0.0 <= camera.capture_latency < 0.5
+    assert 0.04 <= slow.latency < 0.5
+    # restart without frame rate limit
+    frame_count = camera.frame_index
+    camera.target_fps = None
+    camera.start()
+    time.sleep(0.1)
+    camera.stop()
+    assert camera.frame_index - frame_count > 60
+    # the latency covers waiting for the camera, even if it stamps the frames
+    # after receiving them
+    camera.fetch_delay_s = 0.03
+    camera.start()
+    time.sleep(0.2)
+    camera.stop()
+    assert 0.025 <= camera.capture_latency < 0.5
+    # flush waits for the delivery to slow consumers
+    camera.set_image(time.time(), camera.create_frame())
+    assert not camera.flush(timeout_s=0.0)
+    assert camera.flush()
+    assert slow.delivered + slow.dropped == camera.frame_index
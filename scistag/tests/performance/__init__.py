@@ -4,3 +4,24 @@ Implements performance tests to ensure that SciStag works as fast as intended.
 This test should be executed on its own to prevent caching for previously
 loaded libraries.
 """
+
+import time
+from typing import Callable
+
+
+def best_time(function: Callable[[], object], repetitions: int = 5) -> float:
+    """
+    Returns the best execution time of given function, e.g. to compare two
+    implementations of the same task without being affected by outliers.
+
+    :param function: The function to measure
+    :param repetitions: The count of executions
+    :return: The shortest execution time in seconds
+    """
+    best = None
+    for _ in range(repetitions):
+        start_time = time.perf_counter()
+        function()
+        time_diff = time.perf_counter() - start_time
+        best = time_diff if best is None else min(best, time_diff)
+    return best
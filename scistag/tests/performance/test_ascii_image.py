@@ -0,0 +1,65 @@
+"""
+Benchmarks the vectorized ASCII image conversion against a straight forward
+per pixel conversion.
+"""
+
+import numpy as np
+
+from scistag.imagestag import Image
+from scistag.imagestag.ascii_image import AsciiImage, AsciiImageMethod
+from scistag.tests.performance import best_time
+
+
+def _per_pixel_color_ascii(pixels: np.ndarray) -> list[str]:
+    """
+    Reference implementation creating one escape sequence per pixel as
+    AsciiImage did before its vectorization
+
+    :param pixels: The RGB pixels
+    :return: The rows
+    """
+    return [
+        "".join(
+            [
+                f"\N{ESC}[38;2;{col[0]};{col[1]};{col[2]}m█" if sum(col) >= 10 else " "
+                for col in row
+            ]
+        )
+        for row in pixels
+    ]
+
+
+def test_color_ascii_speed():
+    """
+    Benchmarks the color ASCII conversion of a 120 column image
+    """
+    rng = np.random.default_rng(42)
+    image = Image(rng.integers(0, 256, (400, 600, 3), dtype=np.uint8))
+    ascii_image = AsciiImage(
+        image, method=AsciiImageMethod.COLOR_ASCII, max_columns=120
+    ).convert()
+    pixels = ascii_image.scaled_image.pixels
+    reference_time = best_time(lambda: _per_pixel_color_ascii(pixels))
+    vectorized_time = best_time(ascii_image.create_color_ascii)
+    assert reference_time / vectorized_time >= 20.0
+
+
+def test_gray_ascii_speed():
+    """
+    Benchmarks the gray scale ASCII conversion of a 120 column image
+    """
+    rng = np.random.default_rng(42)
+    image = Image(rng.integers(0, 256, (400, 600, 3), dtype=np.uint8))
+    ascii_image = AsciiImage(
+        image, method=AsciiImageMethod.GRAY_LEVELS_69, max_columns=120
+    ).convert()
+    pixels = ascii_image.scaled_image.get_pixels_gray()
+    palette = ascii_image.dictionary
+    factor = (len(palette) - 1) / 255
+    reference_time = best_time(
+        lambda: [
+            "".join([palette[int(pixel * factor)] for pixel in row]) for row in pixels
+        ]
+    )
+    vectorized_time = best_time(lambda: ascii_image.convert_rows(pixels))
+    assert reference_time / vectorized_time >= 20.0
@@ -0,0 +1,43 @@
+"""
+Benchmarks redirecting camera frames into the local DataStag vault as raw
+pixels against encoding each frame as PNG.
+"""
+
+import time
+
+import numpy as np
+
+from scistag.imagestag import Image
+from scistag.tests.mediastag.synthetic_camera import SyntheticCamera
+
+
+def _get_fps(redirect_count: int, encoding: str | None, frames: list[Image]) -> float:
+    """
+    Returns the count of frames per second which can be forwarded to given
+    count of redirects
+    """
+    camera = SyntheticCamera()
+    camera.redirect_workers = 0  # measure the delivery itself
+    for index in range(redirect_count):
+        camera.add_redirect(
+            camera.get_local_camera_name(f"benchmark_{index}"), encoding=encoding
+        )
+    start_time = time.perf_counter()
+    for timestamp, frame in enumerate(frames):
+        camera.set_image(float(timestamp + 1), frame)
+    return len(frames) / (time.perf_counter() - start_time)
+
+
+def test_camera_redirect_speed():
+    """
+    Benchmarks the frame rate of 1, 2 and 4 redirects of a VGA camera
+    """
+    generator = np.random.default_rng(42)
+    frames = [
+        Image(generator.integers(0, 256, (480, 640, 3), dtype=np.uint8))
+        for _ in range(10)
+    ]
+    for redirect_count in [1, 2, 4]:
+        png_fps = _get_fps(redirect_count, ".png", frames)
+        raw_fps = _get_fps(redirect_count, None, frames)
+        assert raw_fps / png_fps >= 5.0
@@ -0,0 +1,56 @@
+"""
+Benchmarks the numpy backed batch drawing functions of the Canvas against
+drawing each primitive via PIL one by one.
+"""
+
+from unittest import mock
+
+import numpy as np
+
+from scistag.imagestag import Canvas
+from scistag.shapestag.checkerboard import Checkerboard
+from scistag.tests.performance import best_time
+
+
+def test_rectangle_batch_speed():
+    """
+    Benchmarks painting a checkerboard with 16384 tiles
+    """
+    board = Checkerboard(bounding=((0, 0), (1024, 1024)), tile_size=8)
+    canvas = Canvas(size=(1024, 1024))
+    with mock.patch.object(Canvas, "batch_threshold", 10**9):
+        single_time = best_time(lambda: board.draw(canvas))
+        reference = canvas.to_image().get_pixels()
+    canvas.clear()
+    batch_time = best_time(lambda: board.draw(canvas))
+    assert np.array_equal(canvas.to_image().get_pixels(), reference)
+    assert single_time / batch_time >= 3.0
+
+
+def test_circle_and_line_batch_speed():
+    """
+    Benchmarks painting 5000 small circles and 5000 short lines, e.g. the
+    markers and segments of a scatter plot
+    """
+    rng = np.random.default_rng(0)
+    centers = rng.uniform(0, 512, (5000, 2))
+    lines = np.concatenate([centers, centers + rng.uniform(-8, 8, (5000, 2))], axis=1)
+    colors = [tuple(color) for color in rng.integers(0, 256, (5000, 3)).tolist()]
+    canvas = Canvas(size=(512, 512))
+
+    def draw_single():
+        for center, color in zip(centers.tolist(), colors):
+            canvas.circle(center, radius=3, color=color)
+        for line, color in zip(lines.tolist(), colors):
+            canvas.line([line[:2], line[2:]], color=color)
+
+    def draw_batch():
+        canvas.circle_list(centers, 3, colors=colors)
+        canvas.line_list(lines, colors=colors)
+
+    single_time = best_time(draw_single, repetitions=3)
+    reference = canvas.to_image().get_pixels()
+    canvas.clear()
+    batch_time = best_time(draw_batch, repetitions=3)
+    assert np.array_equal(canvas.to_image().get_pixels(), reference)
+    assert single_time / batch_time >= 3.0
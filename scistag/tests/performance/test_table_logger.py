@@ -0,0 +1,47 @@
+"""
+Benchmarks the bulk table generation of the TableLogger against the per-cell
+conversion.
+"""
+
+import time
+
+from scistag.vislog import VisualLog
+
+
+def _log_table(**params) -> tuple[float, dict[str, bytes]]:
+    """
+    Logs a 10.000 cell table to a new log
+
+    :param params: Additional table parameters
+    :return: The time required in seconds and the output of each format
+    """
+    options = VisualLog.setup_options()
+    options.output.setup(formats={"html", "md", "txt"})
+    builder = VisualLog(options=options).default_builder
+    data = [
+        [f"Cell <{row}>\nÄ" if col == 0 else row * col + 0.5 for col in range(10)]
+        for row in range(1000)
+    ]
+    start_time = time.perf_counter()
+    builder.table(data, index=True, header=True, **params)
+    time_diff = time.perf_counter() - start_time
+    output = {
+        cur_format: builder.page_session.render_element(output_format=cur_format)[1]
+        for cur_format in ["html", "md", "txt"]
+    }
+    return time_diff, output
+
+
+def test_bulk_table_speed():
+    """
+    Compares the bulk generation with the per-cell fallback which is used when a
+    mimetype is defined.
+    """
+    bulk_time, bulk_output = _log_table()
+    per_cell_time, per_cell_output = _log_table(mimetype="text/plain")
+    assert bulk_output == per_cell_output
+    assert (
+        b"<tr><td><b>Cell &lt;5&gt;<br>\xc3\x84</b></td><td>5.5</td>"
+        in bulk_output["html"]
+    )
+    assert per_cell_time / bulk_time >= 10.0
@@ -0,0 +1,44 @@
+"""
+Benchmarks the rendering of a figure's titles with pooled font handles and
+cached text metrics and masks against rendering them without any caching.
+"""
+
+import os
+from collections import OrderedDict
+from unittest import mock
+
+import pytest
+
+from scistag.imagestag import Font
+from scistag.imagestag.font_registry import FontRegistry
+from scistag.plotstag import Figure
+from scistag.tests.performance import best_time
+
+
+def _render_figure():
+    """
+    Creates and renders a figure with 16 titled plots
+    """
+    figure = Figure(cols=4, rows=4)
+    figure.set_title("Benchmark figure")
+    for index, plot in enumerate(figure):
+        plot.set_title(f"Plot {index % 4}")
+    figure.render()
+
+
+def test_figure_text_speed():
+    """
+    Benchmarks the repeated rendering of a figure
+    """
+    matplotlib = pytest.importorskip("matplotlib")
+    font_dir = os.path.join(matplotlib.get_data_path(), "fonts/ttf/")
+    with mock.patch.object(FontRegistry, "fonts", {}), mock.patch.object(
+        FontRegistry, "_handles", OrderedDict()
+    ), mock.patch.object(FontRegistry, "_base_fonts_registered", True):
+        FontRegistry.register_font("Roboto", font_dir + "DejaVuSans", [("", set())])
+        with mock.patch.object(Font, "max_cached_bboxes", 0), mock.patch.object(
+            Font, "max_cached_masks", 0
+        ), mock.patch.object(FontRegistry, "max_font_handles", 0):
+            uncached_time = best_time(_render_figure)
+        cached_time = best_time(_render_figure)
+    assert uncached_time / cached_time >= 3.0
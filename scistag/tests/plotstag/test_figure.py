@@ -1,9 +1,12 @@
 """
 Tests the Figure class - the container for plots
 """
+from unittest import mock
 
+import numpy as np
 import pytest
 
+from scistag.imagestag import Color, Colors
 from scistag.plotstag import Figure, Plot
 from scistag.plotstag.figure import GridSteppingMode
 from .test_image_layer import stag
@@ -109,3 +112,50 @@ def test_grid_stepping():
     """
     assert GridSteppingMode("ld") == GridSteppingMode.LEFT_DOWN
     assert GridSteppingMode("downRight") == GridSteppingMode.DOWN_RIGHT
+
+
+@pytest.mark.skipif(skip_plotstag, reason="PlotStag tests disabled")
+def test_render_cache():
+    """
+    Tests the caching of a figure's rendering
+    """
+
+    def create_figure() -> Figure:
+        new_figure = Figure(cols=2, rows=2)
+        for index, plot in enumerate(new_figure):
+            pixels = np.zeros((32, 48, 4), dtype=np.uint8)
+            pixels[:, :, index % 3] = 255
+            pixels[8:24, :, 3] = 128 * (index % 2) + 64
+            plot.add_image(pixels)
+        return new_figure
+
+    figure = create_figure()
+    image = figure.render()
+    assert figure.render() is image
+    png_data = figure._repr_png_()
+    assert figure._repr_png_() is png_data
+    assert figure.plots[(0, 0)]._repr_png_() is png_data
+    # only modified plots are repainted
+    with mock.patch.object(
+        Plot, "paint", autospec=True, side_effect=Plot.paint
+    ) as paint:
+        figure.plots[(1, 0)].layers[0].bg_fill = Color(Colors.RED)
+        figure.plots[(0, 1)].border_color = Colors.BLUE
+        modified = figure.render()
+        painted = [call.args[0] for call in paint.call_args_list]
+        assert sorted((plot.column, plot.row) for plot in painted) == [(0, 1), (1, 0)]
+    assert modified is not image and figure._repr_png_() is not png_data
+    reference = create_figure()
+    reference.plots[(1, 0)].layers[0].bg_fill = Color(Colors.RED)
+    reference.plots[(0, 1)].border_color = Colors.BLUE
+    assert np.array_equal(modified.get_pixels(), reference.render().get_pixels())
+    assert not np.array_equal(modified.get_pixels(), image.get_pixels())
+    # modifying the figure itself repaints everything
+    with mock.patch.object(
+        Plot, "paint", autospec=True, side_effect=Plot.paint
+    ) as paint:
+        figure.background_color = Colors.GRAY
+        figure.render()
+        assert paint.call_count == 4
+        figure.render()
+        assert paint.call_count == 4
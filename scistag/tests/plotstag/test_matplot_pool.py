@@ -0,0 +1,80 @@
+"""
+Tests the MPPool class which renders matplotlib figures in worker processes
+"""
+from functools import partial
+
+import pytest
+
+from scistag.imagestag import PixelFormat
+from scistag.plotstag import MPPool, Plot
+from . import skip_plotstag
+
+
+def _plot_line(plt, values, title="Line"):
+    """
+    Builds a simple line plot
+    """
+    plt.title(title)
+    plt.plot(values)
+
+
+def _plot_options(plt, figure, output):
+    """
+    Builds a plot using arguments named like the pool's rendering options
+    """
+    plt.title(f"{figure} {output}")
+    plt.plot([0, 1])
+
+
+def _fail(plt):
+    """
+    Raises an error while building the figure
+    """
+    raise ValueError("Invalid data")
+
+
+@pytest.mark.skipif(skip_plotstag, reason="PlotStag tests disabled")
+def test_matplot_pool():
+    """
+    Tests rendering figures in the worker processes and in-process
+    """
+    figure = {"figsize": (2, 1), "dpi": 50}
+    with MPPool(workers=2) as pool:
+        futures = [
+            pool.submit(_plot_line, [0, index], figure=figure, output=output)
+            for index in range(2)
+            for output in ["png", "rgba"]
+        ]
+        images = [future.result() for future in futures]
+        for image in images:
+            assert image.get_size() == (100, 50)
+            assert image.pixel_format == PixelFormat.RGBA
+        assert images[0].get_pixels()[0, 0, 3] == 0
+        with pytest.raises(ValueError):
+            pool.render(_fail)
+    assert pool._executor is None
+    image = MPPool(workers=0).render(
+        _plot_line,
+        [1, 2],
+        builder_kwargs={"title": "In-process"},
+        figure=figure,
+        transparent=False,
+    )
+    assert image.get_size() == (100, 50)
+    assert image.get_pixels()[0, 0, 3] == 255
+    # builder arguments do not collide with the rendering options
+    image = MPPool(workers=0).render(
+        _plot_options,
+        builder_kwargs={"figure": "A", "output": "B"},
+        figure=figure,
+        output="rgba",
+    )
+    assert image.get_size() == (100, 50)
+    with pytest.raises(ValueError):
+        MPPool(workers=0).render(_fail)
+    plot = Plot()
+    builder = partial(_plot_line, values=[2, 1])
+    plot.add_matplot(builder=builder, size_ratio=1.0, figsize=(2, 1), dpi=50)
+    MPPool.shared().shutdown()
+    assert len(plot.layers) == 1
+    assert plot.layers[0].fixed_size.to_int_tuple() == (100, 50)
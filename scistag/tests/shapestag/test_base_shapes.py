@@ -1,9 +1,13 @@
 """
 Implements the tests for the checkerbaord shape
 """
+from unittest import mock
 
-from scistag.imagestag import Colors
+import numpy as np
+
+from scistag.imagestag import Colors, Color, Size2D
 from scistag.imagestag.canvas import Canvas
+from scistag.shapestag import ShapeList
 from scistag.shapestag.checkerboard import Checkerboard
 from scistag.tests.visual_test_log_scistag import VisualTestLogSciStag
 
@@ -53,3 +57,72 @@ def test_checkerboard():
     ).to_image()
 
     vl.test.assert_image("checkerboard", cb, "4abd42ecb2be7c39466fc23d78a1b425")
+
+
+
+def test_non_square_tiles():
+    """
+    Tests that the columns of a checkerboard are spaced by the tile width
+    """
+    board = Checkerboard(bounding=(0, 0, 40, 10), tile_size=10)
+    board.tile_size = Size2D(20, 10)
+    board.columns = 2
+    canvas = Canvas(size=(40, 10), default_color=Colors.RED)
+    board.draw(canvas)
+    pixels = canvas.to_image().pixels
+    assert np.all(pixels[:, :20] == 255)  # white tile
+    assert np.all(pixels[:, 20:] == 0)  # black tile
+
+def test_cached_layers():
+    """
+    Tests rasterizing shapes into reusable offscreen layers
+    """
+    board = Checkerboard(bounding=(10, 10, 70, 50), tile_size=10)
+    overlay = Checkerboard(bounding=(40, 30, 100, 90), tile_size=20, color_a=Colors.RED)
+    shapes = ShapeList([board, overlay])
+    assert shapes.bounding.to_coord_tuple() == (10, 10, 100, 90)
+    reference = Canvas(size=(128, 128), default_color=Colors.BLUE)
+    board.draw(reference)
+    overlay.draw(reference)
+    shapes.cache_layer = True
+    canvas = Canvas(size=(128, 128), default_color=Colors.BLUE)
+    with mock.patch.object(
+        Checkerboard, "draw", autospec=True, side_effect=Checkerboard.draw
+    ) as draw:
+        shapes.paint(canvas)
+        shapes.paint(canvas)
+        assert draw.call_count == 2  # each board was only rasterized once
+        assert np.array_equal(canvas.to_image().pixels, reference.to_image().pixels)
+        # modifications, visibility and opacity changes invalidate the layer
+        overlay.color_a = Color(Colors.GREEN)
+        shapes.paint(canvas)
+        assert draw.call_count == 4
+        shapes.invalidate()
+        shapes.paint(canvas)
+        assert draw.call_count == 6
+        overlay.visible = False
+        shapes.paint(canvas)
+        assert draw.call_count == 7
+    canvas.clear(Colors.BLACK)
+    board.cache_layer = True
+    board.opacity = 0.5
+    board.paint(canvas)
+    pixels = canvas.to_image().pixels
+    assert tuple(pixels[15, 15]) == (127, 127, 127)  # white tile at 50 percent
+    board.visible = False
+    canvas.clear(Colors.BLACK)
+    board.paint(canvas)
+    assert canvas.to_image().pixels.max() == 0
+    # the options are passed to the cached layer and are part of its key
+    board.visible = True
+    board.opacity = 1.0
+    with mock.patch.object(
+        Checkerboard, "draw", autospec=True, side_effect=Checkerboard.draw
+    ) as draw:
+        board.paint(canvas, {"quality": 1})
+        board.paint(canvas, {"quality": 1})
+        assert draw.call_count == 1
+        assert draw.call_args.args[2] == {"quality": 1}
+        board.paint(canvas, {"quality": 2})
+        assert draw.call_count == 2
+        assert draw.call_args.args[2] == {"quality": 2}
@@ -0,0 +1 @@
+function vlSetupComparator(o){let n,d=0,i,e;function t(e){e.preventDefault(),d=1,window.addEventListener("mousemove",f),window.addEventListener("touchmove",f)}function s(){d=0}function f(e){let t;if(0===d)return!1;t=function(e){let t,n=0;return e=e.changedTouches?e.changedTouches[0]:e,t=o.getBoundingClientRect(),n=e.pageX-t.left,n-=window.pageXOffset,n}(e),t<0&&(t=0),t>i&&(t=i),e=t,o.style.width=e+"px",n.style.left=o.offsetWidth-n.offsetWidth/2+"px"}i=o.offsetWidth,e=o.offsetHeight,o.style.width=i/2+"px",n=document.createElement("div"),n.setAttribute("class","vl-comp-slider"),o.parentElement.insertBefore(n,o),n.style.top=e/2-n.offsetHeight/2+"px",n.style.left=i/2-n.offsetWidth/2+"px",n.addEventListener("mousedown",t),window.addEventListener("mouseup",s),n.addEventListener("touchstart",t),window.addEventListener("touchend",s)}
\ No newline at end of file
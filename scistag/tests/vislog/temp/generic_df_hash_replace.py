@@ -0,0 +1,3 @@
+
+def dummy_test_df(vl, df):
+    vl.test.assert_df("testdf", df, hash_val="914de108cea30eb542f1fb57dcb18afc")
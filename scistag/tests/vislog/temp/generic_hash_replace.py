@@ -0,0 +1,5 @@
+
+def dummy_test(vl):
+    vl.test.checkpoint("shouldFail")
+    vl.text("This should fail on purpose for a test")
+    vl.test.assert_cp_diff("044f0e22ba5b0e39dbcd6a9129cc9d4d")
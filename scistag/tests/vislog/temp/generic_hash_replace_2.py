@@ -0,0 +1,8 @@
+
+def dummy_test2(vl):
+    from scistag.vislog import VisualLog
+    other = VisualLog().default_builder
+    vl.test.checkpoint("shouldFail")
+    vl.text("This should fail on purpose for a test")
+    vl.test.assert_cp_diff("044f0e22ba5b0e39dbcd6a9129cc9d4d", target=other, ref=True)
+    
\ No newline at end of file
@@ -0,0 +1,8 @@
+
+def dummy_test3(vl):
+    from scistag.vislog import VisualLog
+    other = VisualLog().default_builder
+    vl.test.checkpoint("shouldFail")
+    vl.text("This should fail on purpose for a test")
+    vl.test.assert_cp_diff("locked123456", target=other, ref=True)
+        
\ No newline at end of file
@@ -0,0 +1,8 @@
+
+def dummy_testc(vl):
+    from scistag.vislog import VisualLog
+    other = VisualLog().default_builder
+    vl.test.checkpoint("shouldFail")
+    vl.text("This should fail on purpose for a testx")
+    vl.test.assert_cp_diff("locked871c5bd6f3259422f3ea1f4b911ac2de", target=other, ref=True)
+    
\ No newline at end of file
@@ -0,0 +1,199 @@
+"""
+Tests the push based rebuild scheduling of cells via the CellDependencyGraph
+"""
+
+import threading
+import time
+
+from scistag.vislog import VisualLog, LogBuilder, cell
+
+
+def test_rebuild_order():
+    """
+    Tests that producers are built before their consumers and that each cell is
+    built once per modification.
+    """
+    log = VisualLog()
+    builder = log.default_builder
+    calls = []
+
+    def consumer():
+        calls.append(("consumer", builder.cache.get("derived")))
+
+    def producer():
+        calls.append(("producer",))
+        builder.cache.set("derived", builder.cache.get("source", 0) * 2)
+
+    builder.cell.add(on_build=consumer, uses=["source", "derived"])
+    builder.cell.add(on_build=producer, uses="source", output="derived")
+    log.handle_page_events()
+    assert calls[-1] == ("consumer", 0)
+    calls.clear()
+    # nothing modified - nothing to build
+    for _ in range(3):
+        assert log.handle_page_events() is None
+    assert calls == []
+    builder.cache.set("unrelated", 1)
+    log.handle_page_events()
+    assert calls == []
+    builder.cache.set("source", 5)
+    log.handle_page_events()
+    assert calls == [("producer",), ("consumer", 10)]
+    calls.clear()
+    builder.cache.lpush("source_list", 1)
+    builder.cache.set("source", 6)
+    builder.cache.set("source", 7)
+    log.handle_page_events()
+    assert calls == [("producer",), ("consumer", 14)]
+
+
+def test_requirements_and_visibility():
+    """
+    Tests that cells are built as soon as their requirements are fulfilled or they
+    become visible
+    """
+    log = VisualLog()
+    builder = log.default_builder
+    builds = {"required": 0, "grouped": 0}
+
+    def required():
+        builds["required"] += 1
+
+    def grouped():
+        builds["grouped"] += 1
+
+    required_cell = builder.cell.add(on_build=required, requires="items>0")
+    builder.cell.add(on_build=grouped, groups="extra")
+    log.handle_page_events()
+    assert builds == {"required": 0, "grouped": 0}
+    assert not required_cell.could_build
+    builder.cache.lpush("items", 1)
+    assert required_cell.detect_changes()
+    log.handle_page_events()
+    assert builds["required"] == 1 and required_cell.could_build
+    assert not required_cell.detect_changes()
+    builder.visible_groups.add("extra")
+    log.handle_page_events()
+    assert builds == {"required": 1, "grouped": 1}
+    log.handle_page_events()
+    assert builds == {"required": 1, "grouped": 1}
+
+
+def test_data_source_modification(tmp_path):
+    """
+    Tests that cells are rebuilt when a file they depend on is modified
+    """
+    log = VisualLog()
+    builder = log.default_builder
+    filename = str(tmp_path / "data.txt")
+    with open(filename, "w") as file:
+        file.write("1")
+    contents = []
+
+    def load():
+        builder.data_loader.add_dependency(filename)
+        with open(filename) as file:
+            contents.append(file.read())
+
+    builder.cell.add(on_build=load)
+    log.handle_page_events()
+    assert contents == ["1"]
+    with open(filename, "w") as file:
+        file.write("22")
+    # the modification is reported by the file watcher
+    start_time = time.time()
+    while len(contents) == 1 and time.time() - start_time < 5.0:
+        log.handle_page_events()
+        time.sleep(0.01)
+    assert contents == ["1", "22"]
+    log.handle_page_events()
+    assert contents == ["1", "22"]
+
+
+class ParallelLog(LogBuilder):
+    """
+    Log with slow, independent cells and a producer / consumer pair
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.threads = set()
+        self.intervals = {}
+
+    def _load(self, index: int):
+        self.threads.add(threading.get_ident())
+        start_time = time.time()
+        time.sleep(0.25)
+        self.text(f"Loaded {index}")
+        self.intervals[index] = (start_time, time.time())
+
+    @cell(parallel=True)
+    def load_0(self):
+        self._load(0)
+
+    @cell(parallel=True)
+    def load_1(self):
+        self._load(1)
+
+    @cell(parallel=True, uses="data")
+    def consumer(self):
+        self.text(f"Total {self.cache.get('data', 0) + 1}")
+        self.widget.button("Reload")
+
+    @cell(parallel=True, output="data")
+    def producer(self):
+        time.sleep(0.1)
+        self.cache.set("data", 41)
+
+
+def test_parallel_cells():
+    """
+    Tests building independent cells concurrently
+    """
+    log = VisualLog()
+    log.run(builder=ParallelLog)
+    builder: ParallelLog = log.default_builder
+    assert len(builder.threads) == 2
+    # both loaders were running at the same time
+    assert builder.intervals[1][0] < builder.intervals[0][1]
+    assert builder.intervals[0][0] < builder.intervals[1][1]
+    assert threading.get_ident() not in builder.threads
+    content = log.default_page.get_page("html")
+    assert content.index(b"Loaded 0") < content.index(b"Loaded 1")
+    assert content.index(b"Loaded 1") < content.index(b"Total 42")
+    assert b"Total 1<" not in content
+    assert builder.consumer.cell.statistics.builds == 1
+    widgets = builder.widget.find_all_widgets().values()
+    assert any(widget.__class__.__name__ == "LButton" for widget in widgets)
+    builder.cache.set("data", 1)
+    log.handle_page_events()
+    log.default_page.render()
+    assert b"Total 2<" in log.default_page.get_page("html")
+    # finalizing the log stops the worker threads
+    log.finalize()
+    alive = {thread.ident for thread in threading.enumerate()}
+    assert not builder.threads & alive
+
+
+def test_static_parallel_cell():
+    """
+    Tests that parallel cells added to a static log outside of a builder's cell
+    methods are built right away
+    """
+    log = VisualLog()
+    builder = log.default_builder
+    builder.cell.add(
+        on_build=lambda: builder.text("Imperative parallel"), parallel=True
+    )
+
+    def outer():
+        builder.text("Outer")
+        builder.cell.add(
+            on_build=lambda: builder.text("Nested parallel"), parallel=True
+        )
+
+    builder.cell.add(on_build=outer)
+    builder.flush()
+    content = log.default_page.get_page("html")
+    assert b"Imperative parallel" in content
+    assert content.index(b"Outer") < content.index(b"Nested parallel")
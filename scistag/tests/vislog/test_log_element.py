@@ -0,0 +1,162 @@
+"""
+Tests the LogElement class and its copy-on-write snapshots
+"""
+import gc
+
+from scistag.vislog.common.log_element import LogElement
+
+
+def _history_length(element: LogElement) -> int:
+    """
+    Returns the count of states an element preserves
+    """
+    state = element._state
+    count = 0
+    while state is not None:
+        count += 1
+        state = state.previous
+    return count
+
+
+def test_snapshot():
+    """
+    Tests that a snapshot preserves the state at the time of its creation
+    """
+    root = LogElement("vlbody", output_formats={"html", "md"})
+    root.add_data("html", b"a")
+    sub = root.add_sub_element("sub")
+    sub.add_data("html", b"b")
+    snapshot = root.snapshot()
+    sub.add_data("html", b"c")
+    root.add_data("html", b"d")
+    new_sub = root.add_sub_element("new_sub")
+    new_sub.add_data("html", b"e")
+    assert snapshot.build("html") == b"ab"
+    assert root.build("html") == b"abcde"
+    assert "sub" in snapshot and "new_sub" not in snapshot
+    assert snapshot["sub"].build("html") == b"b"
+    paths = [element.path for element in snapshot.list_elements_recursive()]
+    assert paths == ["vlbody", "vlbody.sub"]
+    assert snapshot.last_direct_change_time <= root.last_direct_change_time
+    root.clear()
+    assert snapshot.build("html") == b"ab"
+    assert root.build("html") == b""
+
+
+def test_snapshot_copy_on_write():
+    """
+    Tests that creating a snapshot does not copy any data and that only the
+    modified elements are copied afterwards
+    """
+    root = LogElement("vlbody", output_formats={"html"})
+    elements = [root.add_sub_element(f"element{index}") for index in range(100)]
+    for element in elements:
+        element.add_data("html", b"content")
+    states = [element._state for element in elements]
+    root_data = root._state.data
+    snapshot = root.snapshot()
+    assert all(element._state is state for element, state in zip(elements, states))
+    elements[5].add_data("html", b"modified")
+    assert elements[5]._state is not states[5]
+    assert all(
+        element._state is state
+        for index, (element, state) in enumerate(zip(elements, states))
+        if index != 5
+    )
+    # the parent's timestamps were updated but its data was not copied
+    assert root._state is not snapshot._state
+    assert root._state.data is root_data
+    assert snapshot["element5"].build("html") == b"content"
+
+
+def test_snapshot_history_bounded():
+    """
+    Tests that states which are not visible to any snapshot are dropped
+    """
+    root = LogElement("vlbody", output_formats={"html"})
+    sub = root.add_sub_element("sub")
+    long_living = root.snapshot()
+    for _ in range(100):
+        snapshot = root.snapshot()
+        sub.add_data("html", b"x")
+        root.add_data("html", b"y")
+        del snapshot
+    assert _history_length(sub) <= 3
+    assert _history_length(root) <= 3
+    assert long_living.build("html") == b""
+    long_living.release()
+    gc.collect()
+    sub.add_data("html", b"x")
+    root.add_data("html", b"y")
+    assert root._tree.alive_snapshots == 0
+    assert _history_length(sub) == 1
+    assert _history_length(root) == 1
+
+
+def test_clone():
+    """
+    Tests creating a deep copy of an element tree
+    """
+    root = LogElement("vlbody", output_formats={"html"})
+    sub = root.add_sub_element("sub")
+    sub.add_data("html", b"a")
+    copy = root.clone()
+    sub.add_data("html", b"b")
+    assert copy.build("html") == b"a"
+    assert copy["sub"].parent is copy
+    copy["sub"].add_data("html", b"c")
+    assert root.build("html") == b"ab"
+    assert copy.build("html") == b"ac"
+
+
+def test_shared_builds():
+    """
+    Tests that unchanged elements are only built once
+    """
+    root = LogElement("vlbody", output_formats={"html", "md"})
+    root.add_data("html", b"a")
+    sub = root.add_sub_element("sub")
+    sub.add_data("html", b"b")
+    static = root.add_sub_element("static")
+    static.add_data("html", b"s")
+    first = root.build("html")
+    assert first == b"abs" and root.build("html") is first
+    static_build = static.build("html")
+    snapshot = root.snapshot()
+    assert snapshot.build("html") is first
+    # modifying a sub element invalidates its parents but not its siblings
+    sub.add_data("html", b"c")
+    assert root.build("html") == b"abcs"
+    assert static.build("html") is static_build
+    assert snapshot.build("html") is first
+    assert root.build("md") == b""
+    sub.clear()
+    assert root.build("html") == b"as"
+    other = LogElement("other", output_formats={"html", "md"})
+    other.add_data("html", b"x")
+    sub.replace_content(other)
+    assert root.build("html") == b"axs"
+    snapshot.release()
+
+
+def test_build_interleaved_with_write():
+    """
+    Tests that a build which is interrupted by a write does not keep its
+    outdated result
+    """
+    root = LogElement("vlbody", output_formats={"html"})
+    first = root.add_sub_element("first")
+    first.add_data("html", b"a")
+    second = root.add_sub_element("second")
+    second.add_data("html", b"b")
+    original_build = second._build
+
+    def build_and_write(output_format, generation):
+        # simulates a writer thread modifying an element which was joined already
+        first.add_data("html", b"c")
+        return original_build(output_format, generation)
+
+    second._build = build_and_write
+    assert root.build("html") == b"ab"
+    second._build = original_build
+    assert root.build("html") == b"acb"
@@ -38,7 +38,10 @@ def test_page_session_backup():
     assert lock is vp._page_lock
     assert b"HelloWorld" in re.build("html")
     vp.end_update()
+    assert vp._log_backup is not None
     vp.end_update()
+    assert vp._log_backup is None
+    assert vp._logs._tree.alive_snapshots == 0
     assert b"HelloWorld" in re.build("html")
     assert b"HelloWorld" in vp.render_element(name="vlbody", output_format="html")[1]
 
@@ -257,3 +260,74 @@ class CellTest(LogBuilder):
 def test_stack():
     """Verifies the cell stack and widget iteration methods"""
     CellTest.run()
+
+
+def test_async_render(tmp_path):
+    """
+    Tests rendering and writing the pages in a background thread
+    """
+    options = VisualLog.setup_options("disk")
+    options.output.setup(formats={"html", "md", "txt"}, target_dir=str(tmp_path))
+    options.run.async_render = True
+    log = VisualLog(options=options)
+    vl = log.default_builder
+    page = log.default_page
+    assert page.async_render
+    for index in range(50):
+        vl.text(f"Line {index}")
+        vl.handle_modified()
+    vl.flush()
+    assert page.wait_for_render(timeout=10.0)
+    render_thread = page._render_thread
+    assert render_thread is not None and not render_thread.busy
+    assert 1 <= render_thread.renders <= render_thread._requested
+    assert b"Line 49" in page.get_page("txt")
+    assert b"Line 49" in page.get_page("html")
+    assert b"Line 49" in (tmp_path / "index.md").read_bytes()
+    # the rendered content matches the synchronous rendering
+    async_body = page.get_body("txt")
+    options.run.async_render = False
+    page.render()
+    assert page.get_body("txt") == async_body
+    log.finalize()
+    assert page._render_thread is None
+    assert not render_thread.is_alive()
+
+
+def test_idle_polling():
+    """
+    Tests that polls of an up to date client neither visit the element tree nor
+    transfer cells which were rebuilt with unchanged content
+    """
+    log = VisualLog()
+    vl = log.default_builder
+    vp = log.default_page
+    text = "Static"
+    static_cell = vl.cell.add(on_build=lambda: vl.log(text))
+    vp.get_events_js("client")
+    assert vp.get_events_js("client") == ({}, None)
+    with mock.patch.object(LogElement, "list_elements_recursive") as listing:
+        assert vp.get_events_js("client") == ({}, None)
+        assert listing.call_count == 0
+    sleep_min(1.0 / 50)
+    static_cell.build()
+    assert static_cell.statistics.skipped_updates == 1
+    assert vp.get_events_js("client") == ({}, None)
+    sleep_min(1.0 / 50)
+    text = "Modified"
+    static_cell.build()
+    assert static_cell.statistics.skipped_updates == 1
+    assert b"Modified" in vp.get_events_js("client")[1]
+    sleep_min(1.0 / 50)
+    static_cell.clear()
+    assert b"Modified" not in vp.get_events_js("client")[1]
+    # a cleared cell is transferred again even if its content did not change
+    sleep_min(1.0 / 50)
+    with mock.patch.object(
+        LogElement, "build", autospec=True, side_effect=LogElement.build
+    ) as building:
+        static_cell.build()
+        renders = [call for call in building.call_args_list if call.args[1] == "html"]
+        assert [call.args[0] for call in renders] == [static_cell.sub_element]
+    assert static_cell.statistics.skipped_updates == 1
+    assert b"Modified" in vp.get_events_js("client")[1]
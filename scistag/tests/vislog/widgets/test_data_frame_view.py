@@ -0,0 +1,114 @@
+"""
+Tests the LDataFrameView widget
+"""
+import json
+
+import numpy as np
+import pandas as pd
+
+from scistag.vislog import VisualLog
+from scistag.vislog.widgets import LDataFrameView
+from scistag.vislog.widgets.data_frame_view import INDEX_COLUMN
+from scistag.webstag.server import WebRequest
+from .. import vl
+
+
+def _create_data_frame(rows: int) -> pd.DataFrame:
+    """
+    Creates a test data frame
+    """
+    return pd.DataFrame(
+        {
+            "number": np.arange(rows) * 2,
+            "text": [f"item <{index}>" for index in range(rows)],
+        },
+        index=[f"r{index}" for index in range(rows)],
+    )
+
+
+def test_window():
+    """
+    Tests the insertion and the row window handling
+    """
+    ll = VisualLog(fixed_session_id="dataFrameView").default_builder
+    df = _create_data_frame(100000)
+    view = ll.widget.data_frame(df, page_size=50)
+    assert isinstance(view, LDataFrameView)
+    page = ll.page_session.render_element()[1]
+    assert b"vlSetupDfView" in page
+    assert b"<th>r49</th>" in page and b"<th>r50</th>" not in page
+    assert b"item &lt;3&gt;" in page
+    total, start, rows = view.get_window(1000, 10)
+    assert total == 100000 and start == 1000
+    assert rows.count("<tr>") == 10
+    assert rows.startswith("<tr><th>r1000</th><td>2000</td><td>item &lt;1000&gt;")
+    # clamped to the end of the view
+    total, start, rows = view.get_window(99995, 10)
+    assert start == 99990 and rows.count("<tr>") == 10
+
+
+def test_sort_and_filter():
+    """
+    Tests sorting and filtering on server side
+    """
+    ll = VisualLog(fixed_session_id="dataFrameView").default_builder
+    df = _create_data_frame(1000)
+    view = ll.widget.data_frame(df, page_size=20)
+    total, start, rows = view.get_window(0, 3, sort=0, ascending=False)
+    assert total == 1000
+    assert rows.startswith("<tr><th>r999</th><td>1998</td>")
+    total, start, rows = view.get_window(0, 2, sort=INDEX_COLUMN)
+    assert rows.startswith("<tr><th>r0</th>") and "<th>r1</th>" in rows
+    total, start, rows = view.get_window(0, 100, filter_text="ITEM <99")
+    assert total == 11 and rows.count("<tr>") == 11
+    total, start, rows = view.get_window(0, 100, sort=0, filter_text="r12")
+    assert total == 11  # r12 and r120...r129
+    total, start, rows = view.get_window(0, 100, filter_text=".")
+    assert total == 0  # the filter is not a regular expression
+    # service endpoint
+    request = WebRequest(
+        path="vl_data_frame_view",
+        parameters={
+            "widget": view.identifier,
+            "start": "5",
+            "count": "5",
+            "sort": "1",
+            "ascending": "0",
+            "filter": "item",
+        },
+    )
+    response = ll.service.handle_web_request(request)
+    assert response.status == 200
+    data = json.loads(response.body)
+    assert data["total"] == 1000 and data["start"] == 5
+    assert data["rows"].count("<tr>") == 5
+    request.parameters["widget"] = "unknown"
+    response = ll.service.handle_web_request(request)
+    assert response.status == 400
+    request.parameters["widget"] = view.identifier
+    request.parameters["start"] = "abc"
+    response = ll.service.handle_web_request(request)
+    assert response.status == 400
+
+
+def test_pandas_logger_virtual():
+    """
+    Tests logging a DataFrame as virtual table via the pandas logger
+    """
+    options = VisualLog.setup_options()
+    options.output.setup(formats={"html", "txt", "md"})
+    ll = VisualLog(options=options, fixed_session_id="dataFrameView").default_builder
+    df = _create_data_frame(10000)
+    ll.pd(df, virtual=True, max_rows=30)
+    html = ll.page_session.render_element()[1]
+    assert b"vl_df_view" in html and b"<th>r29</th>" in html
+    assert b"<th>r30</th>" not in html
+    widgets = ll.widget.find_all_widgets()
+    assert any(isinstance(widget, LDataFrameView) for widget in widgets.values())
+
+
+def teardown_module(_):
+    """
+    Finalize the test
+    """
+    vl.flush()
@@ -0,0 +1,142 @@
+"""
+Tests the indexed WebCache
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+import pytest
+
+from scistag.webstag import WebCache
+from scistag.webstag.web_cache import INDEX_FILE_NAME
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """
+    Provides an isolated, empty cache directory
+    """
+    cache_dir = str(tmp_path / "cache") + "/"
+    with mock.patch.object(WebCache, "cache_dir", cache_dir), mock.patch.object(
+        WebCache, "max_cache_size", 1000
+    ):
+        WebCache.flush()
+        yield cache_dir
+        WebCache.flush()
+
+
+def _store_many(cache_dir: str, offset: int) -> int:
+    """
+    Stores multiple files in the cache from a separate process
+
+    :param cache_dir: The cache directory
+    :param offset: The first file index
+    :return: The count of files stored
+    """
+    WebCache.cache_dir = cache_dir
+    WebCache.max_cache_size = 1000
+    for index in range(offset, offset + 20):
+        WebCache.store(f"http://test/{index}", b"x" * 100)
+    return 20
+
+
+def test_lru_eviction(cache_dir):
+    """
+    Tests exact size accounting and the removal of the least recently used files
+    """
+    for index in range(8):
+        WebCache.store(f"http://test/{index}", b"x" * 100, {"ETag": f'"{index}"'})
+    assert WebCache.total_size == 800
+    # overwriting an entry does not count twice
+    WebCache.store("http://test/7", b"y" * 100)
+    assert WebCache.total_size == 800
+    assert WebCache.get_validators("http://test/7") == {}
+    assert WebCache.get_validators("http://test/6") == {"If-None-Match": '"6"'}
+    time.sleep(0.01)
+    assert WebCache.fetch("http://test/0", max_age=60) == b"x" * 100
+    WebCache.store("http://test/8", b"z" * 400)
+    assert WebCache.total_size == 1000
+    # entry 0 was used recently so 1 and 2 got evicted
+    assert WebCache.find("http://test/0") is not None
+    assert WebCache.find("http://test/1") is None
+    assert WebCache.find("http://test/2") is None
+    assert not os.path.exists(cache_dir + WebCache.encoded_name("http://test/1"))
+    assert WebCache.fetch("http://test/8", max_age=60) == b"z" * 400
+    # outdated files without validators are removed
+    assert WebCache.fetch("http://test/7", max_age=0.0) is None
+    assert WebCache.find("http://test/7") is None
+    assert WebCache.fetch("http://test/6", max_age=0.0) is None
+    assert WebCache.find("http://test/6") is not None
+    assert WebCache.revalidate("http://test/6") is not None
+    assert WebCache.revalidate("http://test/7") is None
+    assert WebCache.total_size == 900
+    assert set(os.listdir(cache_dir)) - {
+        INDEX_FILE_NAME,
+        INDEX_FILE_NAME + "-wal",
+        INDEX_FILE_NAME + "-shm",
+    } == {WebCache.encoded_name(f"http://test/{index}") for index in [0, 3, 4, 5, 6, 8]}
+
+
+def test_cleanup(cache_dir):
+    """
+    Tests the synchronization of the index with the directory
+    """
+    WebCache.store("http://test/a", b"a" * 10)
+    WebCache.store("http://test/b", b"b" * 10)
+    os.remove(WebCache.find("http://test/a"))
+    with open(cache_dir + "orphan.tmp", "wb") as file:
+        file.write(b"123")
+    old_time = time.time() - WebCache.max_general_age - 10
+    os.utime(cache_dir + "orphan.tmp", (old_time, old_time))
+    WebCache.cleanup()
+    assert WebCache.find("http://test/a") is None
+    assert WebCache.find("http://test/b") is not None
+    assert not os.path.exists(cache_dir + "orphan.tmp")
+    assert WebCache.total_size == 10
+    # the index persists
+    WebCache._close_index()
+    assert WebCache.fetch("http://test/b", max_age=60) == b"b" * 10
+
+
+def test_failed_transaction(cache_dir):
+    """
+    Tests that a failing store or cleanup leaves the index unchanged
+    """
+    WebCache.store("http://test/a", b"a" * 10)
+    with mock.patch.object(WebCache, "_evict", side_effect=OSError("Failed")):
+        with pytest.raises(OSError):
+            WebCache.store("http://test/b", b"b" * 10)
+        assert WebCache.find("http://test/b") is None
+        assert not os.path.exists(cache_dir + WebCache.encoded_name("http://test/b"))
+        os.remove(WebCache.find("http://test/a"))
+        with pytest.raises(OSError):
+            WebCache.cleanup()
+    WebCache._close_index()
+    index = WebCache._get_index()
+    names = {name for (name,) in index.execute("SELECT name FROM entries")}
+    assert names == {WebCache.encoded_name("http://test/a")}
+    # the index is still usable
+    WebCache.store("http://test/c", b"c" * 10)
+    assert WebCache.fetch("http://test/c", max_age=60) == b"c" * 10
+    # a file exceeding the cache's size is evicted right away
+    WebCache.store("http://test/d", b"d" * 2000)
+    assert WebCache.find("http://test/d") is None
+    assert not os.path.exists(cache_dir + WebCache.encoded_name("http://test/d"))
+    assert not any(name.endswith(".tmp") for name in os.listdir(cache_dir))
+
+
+def test_shared_between_processes(cache_dir):
+    """
+    Tests multiple processes writing to the same cache
+    """
+    WebCache.store("http://test/main", b"m")
+    WebCache._close_index()
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        counts = list(executor.map(_store_many, [cache_dir] * 2, [0, 20]))
+    assert counts == [20, 20]
+    WebCache.cleanup()
+    assert WebCache.total_size <= 1000
+    stored = [index for index in range(40) if WebCache.find(f"http://test/{index}")]
+    assert len(stored) * 100 == WebCache.total_size
+    assert not any(name.endswith(".tmp") for name in os.listdir(cache_dir))
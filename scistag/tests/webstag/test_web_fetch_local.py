@@ -0,0 +1,171 @@
+"""
+Tests connection reuse, conditional requests and streaming of web_fetch against
+a local http server
+"""
+import hashlib
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import pytest
+
+from scistag.webstag import web_fetch, web_fetch_many, WebCache
+from scistag.webstag.web_fetch import (
+    FROM_CACHE,
+    REVALIDATED,
+    STATUS_CODE,
+    STORED_IN_CACHE,
+    close_sessions,
+)
+
+LARGE_FILE_SIZE = 3 * 2**20 + 17
+"Size of the large file served, spans multiple stream chunks"
+
+
+class _TestHandler(BaseHTTPRequestHandler):
+    """
+    Serves a small text file with validators, a large binary file and a slow
+    file which tracks the count of concurrent requests.
+    """
+
+    protocol_version = "HTTP/1.1"
+    files = {
+        "/data.txt": b"Hello SciStag",
+        "/large.bin": bytes(range(256)) * (LARGE_FILE_SIZE // 256)
+        + b"x" * (LARGE_FILE_SIZE % 256),
+    }
+    stats = {"downloads": 0, "connections": set(), "active": 0, "max_active": 0}
+    stats_lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        with self.stats_lock:
+            self.stats["connections"].add(self.client_address)
+        if self.path.startswith("/slow/"):
+            with self.stats_lock:
+                self.stats["active"] += 1
+                self.stats["max_active"] = max(
+                    self.stats["max_active"], self.stats["active"]
+                )
+            time.sleep(0.05)
+            with self.stats_lock:
+                self.stats["active"] -= 1
+            self._send(200, self.path.encode("utf-8"))
+            return
+        data = self.files.get(self.path, None)
+        if data is None:
+            self._send(404, b"")
+            return
+        etag = '"' + hashlib.md5(data).hexdigest() + '"'
+        if self.headers.get("If-None-Match", None) == etag:
+            self._send(304, None, {"ETag": etag})
+            return
+        with self.stats_lock:
+            self.stats["downloads"] += 1
+        self._send(200, data, {"ETag": etag})
+
+    def _send(self, code: int, data: bytes | None, headers: dict | None = None):
+        self.send_response(code)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(data) if data else 0))
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+
+@pytest.fixture
+def local_server(tmp_path):
+    """
+    Provides the base url of a local http server and an isolated web cache
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _TestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    _TestHandler.stats.update(
+        {"downloads": 0, "connections": set(), "active": 0, "max_active": 0}
+    )
+    (tmp_path / "cache").mkdir()
+    with mock.patch.object(WebCache, "cache_dir", str(tmp_path / "cache") + "/"):
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    close_sessions()
+    server.shutdown()
+    server.server_close()
+
+
+def test_revalidation(local_server):
+    """
+    Tests that outdated files are revalidated instead of being downloaded again
+    """
+    url = local_server + "/data.txt"
+    details = {}
+    assert web_fetch(url, max_cache_age=0.2, out_response_details=details) == (
+        b"Hello SciStag"
+    )
+    assert details[STORED_IN_CACHE] and not details[FROM_CACHE]
+    assert WebCache.get_validators(url)["If-None-Match"].startswith('"')
+    time.sleep(0.3)
+    details = {}
+    assert web_fetch(url, max_cache_age=0.2, out_response_details=details) == (
+        b"Hello SciStag"
+    )
+    assert details[STATUS_CODE] == 304
+    assert details[FROM_CACHE] and details[REVALIDATED]
+    # revalidation refreshed the cache entry's age
+    details = {}
+    web_fetch(url, max_cache_age=0.2, out_response_details=details)
+    assert details[FROM_CACHE] and STATUS_CODE not in details
+    assert _TestHandler.stats["downloads"] == 1
+    # all requests shared a single connection
+    assert len(_TestHandler.stats["connections"]) == 1
+    assert web_fetch(local_server + "/missing.txt") is None
+
+
+def test_streaming(local_server, tmp_path):
+    """
+    Tests streaming large files to disk
+    """
+    url = local_server + "/large.bin"
+    filename = str(tmp_path / "large.bin")
+    assert web_fetch(url, filename=filename, stream=True) == b""
+    with open(filename, "rb") as file:
+        assert file.read() == _TestHandler.files["/large.bin"]
+    assert not any(name.endswith(".part") for name in os.listdir(tmp_path))
+    # streamed files are cached and copied from the cache
+    os.remove(filename)
+    details = {}
+    assert web_fetch(url, filename=filename, stream=True, max_cache_age=60.0) == b""
+    assert (
+        web_fetch(
+            url,
+            filename=filename,
+            stream=True,
+            max_cache_age=60.0,
+            out_response_details=details,
+        )
+        == b""
+    )
+    assert details[FROM_CACHE]
+    assert os.path.getsize(filename) == LARGE_FILE_SIZE
+    assert _TestHandler.stats["downloads"] == 2
+
+
+def test_web_fetch_many(local_server, tmp_path):
+    """
+    Tests fetching multiple files concurrently
+    """
+    urls = [local_server + f"/slow/{index}" for index in range(12)]
+    results = web_fetch_many(urls, max_workers=8, max_per_host=3)
+    assert results == [f"/slow/{index}".encode("utf-8") for index in range(12)]
+    assert 1 < _TestHandler.stats["max_active"] <= 3
+    filenames = [str(tmp_path / f"{index}.txt") for index in range(2)]
+    web_fetch_many(urls[:2], filenames=filenames)
+    with open(filenames[1], "rb") as file:
+        assert file.read() == b"/slow/1"
+    assert web_fetch_many([]) == []
+    with pytest.raises(ValueError):
+        web_fetch_many(urls, filenames=filenames)
@@ -19,7 +19,7 @@ from importlib import reload
 from typing import Union, TYPE_CHECKING
 
 from scistag.common import StagLock
-from scistag.filestag import FileStag
+from scistag.filestag import FileStag, FileWatcher
 from scistag.vislog import VisualLog
 from scistag.vislog.options import LogOptions
 
@@ -59,6 +59,9 @@ class VisualLogAutoReloader:
     "A backup of the log's cache from the last execution session"
     content = None
     "The last file content state"
+    _content_revision: int | None = None
+    """The watcher's revision of the source file when its content was loaded the
+    last time. None if the file can not be observed and has to be polled."""
     imp_module = None
     "The name of the module we need to reimport"
     was_sick: bool = False
@@ -153,8 +156,10 @@ class VisualLogAutoReloader:
             restarting/module reloading approach this log will be re-created
             each start and thus the object updated.
         :param server: Defines if the auto-reloader shall be started in server mode
-        :param check_time_s: The time interval at which files are checked
-            for modification.
+        :param check_time_s: The time interval at which events are handled and
+            files are checked for modification. Modifications of the source file
+            are reported by :class:`FileWatcher` and handled as soon as they
+            occur.
         :param _stack_level: The (relative) stack level of the file which
             shall be auto_reloaded.
         """
@@ -167,6 +172,10 @@ class VisualLogAutoReloader:
             return
         cls._reloading = True
         cls._initial_filename = inspect.stack()[_stack_level].filename
+        watcher = FileWatcher.shared()
+        cls._content_revision = None
+        if watcher.watch(cls._initial_filename):
+            cls._content_revision = watcher.revision(cls._initial_filename)
         cls.content = FileStag.load(cls._initial_filename)
         short_name = os.path.splitext(os.path.basename(cls._initial_filename))[0]
         import importlib.util
@@ -201,7 +210,7 @@ class VisualLogAutoReloader:
                     sht = cls._shall_terminate
                     if sht:
                         break
-                time.sleep(check_time_s)
+                watcher.wait_for_change(timeout=check_time_s)
                 cls._run_loop()
             with cls._access_lock:
                 cls._shall_terminate = False
@@ -231,6 +240,7 @@ class VisualLogAutoReloader:
             del cls.main_log
             cls.main_log = None
             cls.content = None
+            cls._content_revision = None
             cls.was_sick = False
             cls.imp_module = None
             cls._test_client = None
@@ -258,9 +268,7 @@ class VisualLogAutoReloader:
             events = widgets.get_events(clear=True)
             for event in events:
                 cls._embedded_log.default_builder.widget.add_event(event)
-        new_content = FileStag.load(cls._initial_filename)
-        if new_content is None:
-            new_content = b""
+        new_content = cls._load_modified_content()
         try:
             cls._embedded_log.default_page.handle_events()
             if cls.content == new_content and not cls._embedded_log.invalid:
@@ -293,6 +301,24 @@ class VisualLogAutoReloader:
                 raise KeyboardInterrupt
         cls._reloading = False
 
+    @classmethod
+    def _load_modified_content(cls) -> bytes:
+        """
+        Loads the source file's content if the watcher reported a modification
+        since it was loaded the last time.
+
+        :return: The file's content, the previous content if it was not modified
+        """
+        if cls._content_revision is not None:
+            revision = FileWatcher.shared().revision(cls._initial_filename)
+            if revision == cls._content_revision:
+                return cls.content
+            cls._content_revision = revision
+        new_content = FileStag.load(cls._initial_filename)
+        if new_content is None:
+            new_content = b""
+        return new_content
+
     @classmethod
     def get_cache_backup(cls) -> Union["Cache", None]:
         """
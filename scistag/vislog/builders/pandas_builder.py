@@ -8,6 +8,7 @@ import pandas as pd
 from pydantic import BaseModel, validator
 
 from scistag.vislog import LogBuilder, cell
+from scistag.vislog.common.html_table import data_frame_to_html
 
 
 class PandasBuilderParams(BaseModel):
@@ -59,13 +60,4 @@ class PandasBuilder(LogBuilder):
         if df is None:
             return
         df = df.iloc[start : end + 1]
-        with self.table.begin(
-            header=True, index=True, html_class="vl_data_table"
-        ) as table:
-            table.add_row([""] + df.keys().tolist())
-            for row_index, index in enumerate(df.index):
-                row_data = df.iloc[row_index]
-                index_name = df.index[row_index]
-                content: list = row_data.to_numpy().tolist()
-                content.insert(0, index_name)
-                table.add_row(content)
+        self.page_session.write_html(data_frame_to_html(df, index=True))
@@ -30,6 +30,7 @@ def cell(
     page: int | str | None = None,
     capture_stdout: bool = False,
     ctype: str | None = None,
+    parallel: bool = False,
 ):
     """
     Decorates a method or function within the current LogBuilder subclass or
@@ -77,6 +78,10 @@ def cell(
         always only one page is displayed at a time.
     :param capture_stdout: Defines if stdout (e.g. print outputs) shall be captured and
         added to the log
+    :param parallel: Defines if the cell may be built in a worker thread
+        concurrently to other parallel cells. Declare the cache keys the cell
+        reads and writes via uses, requires and output so cells consuming the
+        output of another cell are built after it. See :class:`Cell`.
     :return: The decorated method or function
     """
 
@@ -105,6 +110,7 @@ def cell(
                 "page": page,
                 "capture_stdout": capture_stdout,
                 "ctype": ctype,
+                "parallel": parallel,
             },
         )
         return func_o
@@ -0,0 +1,376 @@
+"""
+Implements the class :class:`CellDependencyGraph` which tracks the data dependencies
+of the cells of a :class:`LogBuilder` and schedules their rebuilds when ever one of
+their dependencies was modified.
+"""
+
+from __future__ import annotations
+
+import time
+import weakref
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from scistag.common import StagLock
+
+if TYPE_CHECKING:
+    from scistag.vislog.log_builder import LogBuilder
+    from scistag.vislog.widgets.cells import Cell
+
+
+class CellDependencyGraph:
+    """
+    Push based scheduler for the rebuilds of cells.
+
+    Rather than letting every cell poll the revisions of all of its cache keys and
+    data sources on every event loop turn, the graph subscribes to the modifications
+    of the builder's cache and gets notified by the data loader when a data source
+    changed. The affected cells are flagged and rebuilt in the next loop turn, each
+    of them at most once, producers (see :attr:`Cell.output`) before the cells
+    which consume their output.
+
+    If nothing was modified a loop turn costs a single comparison of the builder's
+    visibility settings.
+
+    Cells flagged as ``parallel`` are built concurrently in worker threads as long
+    as none of them consumes the output of another cell of the same batch.
+    """
+
+    def __init__(self, builder: "LogBuilder"):
+        """
+        :param builder: The builder whose cells shall be tracked
+        """
+        self.builder = builder
+        "The builder whose cells we are tracking"
+        self._lock = StagLock()
+        "Protects the subscriptions and the modification flags"
+        self._cells: weakref.WeakSet[Cell] = weakref.WeakSet()
+        "All registered cells"
+        self._key_subscribers: dict[str, weakref.WeakSet[Cell]] = {}
+        "The cells subscribed to each cache key"
+        self._source_subscribers: dict[str, weakref.WeakSet[Cell]] = {}
+        "The cells subscribed to each data source"
+        self._modified: set[Cell] = set()
+        "Cells of which at least one dependency was modified"
+        self._recheck: set[Cell] = set()
+        "Cells whose visibility shall be verified because the page or groups changed"
+        self._sequence = 0
+        "Counter defining the registration order of the cells"
+        self._visibility: tuple | None = None
+        "The builder's visibility settings in the last turn"
+        self.builds = 0
+        "The count of cell builds triggered by the graph"
+        self._executor: ThreadPoolExecutor | None = None
+        "The worker threads building parallel cells"
+        self._deferring = 0
+        "Count of active scopes after which the scheduled builds are executed"
+        builder.cache.add_revision_listener(self.handle_key_modified)
+
+    @staticmethod
+    def normalized_key(key: str) -> str:
+        """
+        Returns the name of a cache key as tracked by the cache's revisions
+
+        :param key: The key as passed to the cell, e.g. "data>0" or "mode==1"
+        :return: The plain key name
+        """
+        from scistag.vislog.widgets.cells import Cell
+
+        return Cell._clean_key_name(key).split("@")[0]
+
+    def register(self, cell: "Cell"):
+        """
+        Registers a cell and subscribes it to its uses and requires keys
+
+        :param cell: The cell to register
+        """
+        keys = {self.normalized_key(key) for key in cell.uses.union(cell.requires)}
+        with self._lock:
+            self._sequence += 1
+            cell._graph_sequence = self._sequence
+            cell._graph_keys = keys
+            cell._graph_outputs = {self.normalized_key(key) for key in cell.output}
+            self._cells.add(cell)
+            for key in keys:
+                self._key_subscribers.setdefault(key, weakref.WeakSet()).add(cell)
+
+    def unregister(self, cell: "Cell"):
+        """
+        Removes a cell and all of its subscriptions
+
+        :param cell: The cell to remove
+        """
+        with self._lock:
+            self._cells.discard(cell)
+            for subscribers in self._key_subscribers.values():
+                subscribers.discard(cell)
+            for subscribers in self._source_subscribers.values():
+                subscribers.discard(cell)
+            self._modified.discard(cell)
+            self._recheck.discard(cell)
+
+    def add_source_dependency(self, cell: "Cell", source: str):
+        """
+        Subscribes a cell to the modifications of a data source
+
+        :param cell: The cell
+        :param source: The source's name as passed to :class:`DataLoaderExtension`
+        """
+        with self._lock:
+            self._source_subscribers.setdefault(source, weakref.WeakSet()).add(cell)
+
+    def clear_source_dependencies(self, cell: "Cell"):
+        """
+        Removes all data source subscriptions of a cell
+
+        :param cell: The cell
+        """
+        with self._lock:
+            for subscribers in self._source_subscribers.values():
+                subscribers.discard(cell)
+
+    def handle_key_modified(self, key: str):
+        """
+        Is called by the cache when ever the revision of a key changed.
+
+        Note that this is called while the cache is locked and possibly from another
+        thread, so this method only flags the affected cells.
+
+        :param key: The modified key
+        """
+        with self._lock:
+            subscribers = self._key_subscribers.get(key, None)
+            if subscribers is not None:
+                self._modified.update(subscribers)
+
+    def handle_sources_modified(self, sources: Iterable[str]):
+        """
+        Is called when data sources were modified
+
+        :param sources: The modified sources
+        """
+        with self._lock:
+            for source in sources:
+                subscribers = self._source_subscribers.get(source, None)
+                if subscribers is not None:
+                    self._modified.update(subscribers)
+
+    def schedule_build(self, cell: "Cell"):
+        """
+        Flags a cell to be built in the next loop turn
+
+        :param cell: The cell
+        """
+        with self._lock:
+            self._modified.add(cell)
+
+    @property
+    def defers_builds(self) -> bool:
+        """
+        Returns if a loop turn is going to build the cells scheduled via
+        :meth:`schedule_build`.
+
+        If not, e.g. if a cell is added to a static log outside of the builder's
+        cell methods, the cell needs to be built right away.
+        """
+        with self._lock:
+            return self._deferring > 0
+
+    @contextmanager
+    def deferred_builds(self) -> Iterator[None]:
+        """
+        Defines a scope at the end of which :meth:`handle_loop` is going to be
+        called, so parallel cells added within it can be scheduled rather than
+        being built right away.
+        """
+        with self._lock:
+            self._deferring += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._deferring -= 1
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Returns the executor building the parallel cells
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(self.builder.options.run.cell_workers, 1),
+                thread_name_prefix="vl_cell",
+            )
+        return self._executor
+
+    def shutdown(self):
+        """
+        Stops the worker threads building the parallel cells once their current
+        builds are finished.
+
+        The workers are started again if another parallel cell needs to be built.
+        """
+        executor = self._executor
+        self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def is_modified(self, cell: "Cell") -> bool:
+        """
+        Returns if any dependency of the cell was modified since its last build
+
+        :param cell: The cell
+        :return: True if the cell is going to be rebuilt
+        """
+        with self._lock:
+            return cell in self._modified
+
+    def handle_cell_built(self, cell: "Cell"):
+        """
+        Is called after a cell was built. Modifications which happened until then
+        are covered by the build.
+
+        :param cell: The cell which was built
+        """
+        with self._lock:
+            self._modified.discard(cell)
+            self._recheck.discard(cell)
+
+    def _check_visibility(self):
+        """
+        Flags all cells for a visibility check if the builder's current page or its
+        visible or hidden groups changed.
+        """
+        builder = self.builder
+        visibility = (
+            builder.current_page,
+            tuple(sorted(builder.visible_groups)),
+            tuple(sorted(builder.hidden_groups)),
+        )
+        if visibility == self._visibility:
+            return
+        self._visibility = visibility
+        with self._lock:
+            self._recheck.update(self._cells)
+
+    def _sorted_cells(self, cells: set["Cell"]) -> list["Cell"]:
+        """
+        Sorts cells so producers of cache keys are built before their consumers.
+        Independent cells are kept in their registration order.
+
+        :param cells: The cells to sort
+        :return: The sorted list
+        """
+        ordered = sorted(cells, key=lambda cell: cell._graph_sequence)
+        producers: dict[str, list[Cell]] = {}
+        for cell in ordered:
+            for key in cell._graph_outputs:
+                producers.setdefault(key, []).append(cell)
+        if len(producers) == 0:
+            return ordered
+        result = []
+        state: dict[Cell, int] = {}  # 1 = visiting, 2 = done
+
+        def visit(cur_cell: "Cell"):
+            if state.get(cur_cell, 0) != 0:  # done or in a cycle
+                return
+            state[cur_cell] = 1
+            for key in sorted(cur_cell._graph_keys):
+                for producer in producers.get(key, []):
+                    if producer is not cur_cell:
+                        visit(producer)
+            state[cur_cell] = 2
+            result.append(cur_cell)
+
+        for cell in ordered:
+            visit(cell)
+        return result
+
+    def _finish_batch(self, batch: list[tuple["Cell", Future]]):
+        """
+        Waits for all cells of a batch of parallel builds and inserts their content
+        into the page in the batch's order.
+
+        :param batch: The cells and their build futures. Cleared afterwards.
+        """
+        try:
+            for cell, future in batch:
+                cell.finish_build(future)
+        finally:
+            batch.clear()
+
+    def handle_loop(self) -> float | None:
+        """
+        Rebuilds all cells whose dependencies were modified.
+
+        Cells flagged while the current turn is executed, e.g. because a producer
+        updated a cache value, are built in the same turn unless they were built
+        in it already.
+
+        :return: The timestamp of the next turn required, None if all modifications
+            were handled.
+        """
+        with self.deferred_builds():
+            return self._handle_modified_cells()
+
+    def _handle_modified_cells(self) -> float | None:
+        """
+        Executes a single loop turn, see :meth:`handle_loop`
+
+        :return: The timestamp of the next turn required, None if all modifications
+            were handled.
+        """
+        self._check_visibility()
+        if len(self._source_subscribers):
+            modified_sources = self.builder.data_loader.get_modified_sources()
+            if len(modified_sources):
+                self.handle_sources_modified(modified_sources)
+        with self._lock:
+            if len(self._modified) == 0 and len(self._recheck) == 0:
+                return None
+        built = set()
+        while True:
+            # only cells which are still part of the page are built
+            live_ids = {
+                id(widget) for widget in self.builder.widget.find_all_widgets().values()
+            }
+            with self._lock:
+                pending = (self._modified | self._recheck) - built
+                dead = {cell for cell in pending if id(cell) not in live_ids}
+                self._modified -= dead
+                self._recheck -= dead
+                pending -= dead
+                if len(pending) == 0:
+                    break
+            batch: list[tuple[Cell, Future]] = []
+            batch_outputs: set[str] = set()
+            for cell in self._sorted_cells(pending):
+                with self._lock:
+                    modified = cell in self._modified
+                    if not modified and cell not in self._recheck:
+                        continue
+                built.add(cell)
+                if not cell.requires_build(visibility_only=not modified):
+                    self.handle_cell_built(cell)
+                    continue
+                if len(batch_outputs) and not batch_outputs.isdisjoint(
+                    cell._graph_keys
+                ):  # wait for the producers
+                    self._finish_batch(batch)
+                    batch_outputs.clear()
+                self.builds += 1
+                if cell.supports_parallel_build:
+                    future = cell.start_build(self.executor)
+                    if future is not None:
+                        batch.append((cell, future))
+                        batch_outputs.update(cell._graph_outputs)
+                        continue
+                else:
+                    cell.handle_dependencies_modified()
+                self.handle_cell_built(cell)
+            self._finish_batch(batch)
+        with self._lock:
+            if len(self._modified) or len(self._recheck):
+                return time.time()
+        return None
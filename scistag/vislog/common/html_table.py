@@ -0,0 +1,131 @@
+"""
+Helper functions for converting large tables, e.g. Pandas DataFrames, to HTML in
+bulk rather than cell by cell.
+"""
+
+from __future__ import annotations
+
+import html
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_SEPARATOR = "\0"
+"Separator used to escape all values of a column in a single pass"
+
+
+def escape_html(text: str, line_break: str = "<br>", ascii_only: bool = True) -> str:
+    """
+    Escapes text so it can be embedded into HTML. Line breaks are converted to
+    <br> tags and non-ascii characters to character references.
+
+    :param text: The original unicode text
+    :param line_break: The code by which line breaks are replaced
+    :param ascii_only: Defines if non-ascii characters shall be replaced by
+        character references
+    :return: The escaped text
+    """
+    escaped = html.escape(text).replace("\n", line_break)
+    if not ascii_only:
+        return escaped
+    return escaped.encode("ascii", "xmlcharrefreplace").decode("ascii")
+
+
+def escape_html_values(
+    values: Iterable, line_break: str = "<br>", ascii_only: bool = True
+) -> list[str]:
+    """
+    Converts a sequence of values to strings and escapes them for HTML.
+
+    All values are joined, escaped in a single pass and split again, so the costs
+    are independent of the Python call overhead per value.
+
+    :param values: The values to be converted, e.g. a Pandas Series
+    :param line_break: The code by which line breaks are replaced
+    :param ascii_only: Defines if non-ascii characters shall be replaced by
+        character references
+    :return: The list of escaped strings
+    """
+    texts = [str(value) for value in values]
+    joined = _SEPARATOR.join(texts)
+    if joined.count(_SEPARATOR) != max(len(texts) - 1, 0):
+        return [escape_html(text, line_break, ascii_only) for text in texts]
+    if len(texts) == 0:
+        return []
+    return escape_html(joined, line_break, ascii_only).split(_SEPARATOR)
+
+
+def data_frame_header_html(
+    df: "pd.DataFrame", index: bool = True, cell_attributes: list[str] | None = None
+) -> str:
+    """
+    Returns the header row of a DataFrame as HTML table row
+
+    :param df: The data frame
+    :param index: Defines if the table shows the index column
+    :param cell_attributes: Additional attributes for each header cell, including
+        the index cell if index is True.
+    :return: The HTML code, e.g. "<tr><th></th><th>name</th></tr>\\n"
+    """
+    names = escape_html_values(df.columns)
+    if index:
+        names.insert(0, "")
+    if cell_attributes is None:
+        cells = "".join([f"<th>{name}</th>" for name in names])
+    else:
+        cells = "".join(
+            [
+                f"<th{attributes}>{name}</th>"
+                for name, attributes in zip(names, cell_attributes)
+            ]
+        )
+    return f"<tr>{cells}</tr>\n"
+
+
+def data_frame_rows_html(df: "pd.DataFrame", index: bool = True) -> str:
+    """
+    Converts all rows of a DataFrame to HTML table rows.
+
+    The values are escaped column-wise and the rows are assembled via string joins
+    so this scales to large windows of a DataFrame.
+
+    :param df: The data frame
+    :param index: Defines if the index shall be added as first (header) column
+    :return: The HTML code, one <tr> per row
+    """
+    columns = [escape_html_values(df.iloc[:, col]) for col in range(df.shape[1])]
+    if index:
+        index_column = escape_html_values(df.index)
+        if len(columns) == 0:
+            return "".join([f"<tr><th>{value}</th></tr>\n" for value in index_column])
+        return "".join(
+            [
+                f"<tr><th>{row[0]}</th><td>{'</td><td>'.join(row[1:])}</td></tr>\n"
+                for row in zip(index_column, *columns)
+            ]
+        )
+    if len(columns) == 0:
+        return "<tr></tr>\n" * df.shape[0]
+    return "".join(
+        [f"<tr><td>{'</td><td>'.join(row)}</td></tr>\n" for row in zip(*columns)]
+    )
+
+
+def data_frame_to_html(
+    df: "pd.DataFrame", index: bool = True, html_class: str = "vl_data_table"
+) -> str:
+    """
+    Converts a DataFrame to a HTML table
+
+    :param df: The data frame
+    :param index: Defines if the index shall be shown
+    :param html_class: The table's html class
+    :return: The HTML code
+    """
+    return (
+        f"<table class={html_class}>"
+        + data_frame_header_html(df, index=index)
+        + data_frame_rows_html(df, index=index)
+        + "</table>\n"
+    )
@@ -1,11 +1,21 @@
 """
 Defines LogElement, a nestable data container storing the data of each log
 component in a hierarchical manner.
+
+The content of each element is stored copy-on-write. :meth:`LogElement.snapshot`
+freezes the current state of an element tree in O(1) and provides a
+:class:`LogElementSnapshot` which can be read (e.g. rendered) from another
+thread while the original tree continues being modified. An element's state is
+only copied when it is modified for the first time after a snapshot was taken.
 """
 from __future__ import annotations
 
 import time
+import weakref
+from bisect import bisect_left, insort
 from dataclasses import dataclass
+from threading import Lock
+from typing import Union
 
 
 @dataclass
@@ -20,10 +30,159 @@ class LogElementReference:
     """The element's relative name"""
     path: str
     """The element's absolute name path, separated by dots"""
-    element: "LogElement"
+    element: Union["LogElement", "LogElementSnapshot"]
     """The referred element"""
 
 
+class _LogElementState:
+    """
+    Stores the content of a :class:`LogElement` at a specific generation of its
+    element tree.
+
+    A state is only modified as long as its generation is the tree's current
+    generation. Once a snapshot was taken it is frozen and replaced by a copy
+    upon the next modification.
+    """
+
+    __slots__ = (
+        "generation",
+        "data",
+        "sub_elements",
+        "owns_data",
+        "release_count",
+        "last_direct_change_time",
+        "last_child_update_time",
+        "previous",
+        "built",
+    )
+
+    def __init__(
+        self,
+        generation: int,
+        data: dict[str, list[bytes | LogElement]],
+        sub_elements: dict[str, LogElement],
+        change_time: float,
+    ):
+        self.generation = generation
+        "The tree generation at which this state was created"
+        self.data = data
+        "The data of each output format"
+        self.sub_elements = sub_elements
+        "The nested sub elements"
+        self.owns_data = True
+        "Defines if data and sub_elements may be modified in-place"
+        self.release_count = 0
+        "The tree's count of released snapshots when the history was last pruned"
+        self.last_direct_change_time = change_time
+        "Timestamp when the element itself was directly extended the last time"
+        self.last_child_update_time = change_time
+        "Timestamp when an embedded sub-element was updated the last time"
+        self.previous: _LogElementState | None = None
+        "The previous (frozen) state which is still visible to a snapshot"
+        self.built: dict[str, bytes] = {}
+        """
+        The combined data of each output format including all sub elements as
+        built the last time. Replaced by an empty dictionary whenever the state
+        or the state of a sub element is modified.
+        """
+
+    def copy(self, generation: int) -> _LogElementState:
+        """
+        Creates a shallow copy which shares the data until it is modified
+
+        :param generation: The new state's generation
+        :return: The new state
+        """
+        new_state = _LogElementState(
+            generation, self.data, self.sub_elements, self.last_direct_change_time
+        )
+        new_state.last_child_update_time = self.last_child_update_time
+        new_state.owns_data = False
+        return new_state
+
+
+class _LogElementTree:
+    """
+    Versioning information shared by all elements of a single element tree.
+
+    Keeps track of the current generation and of all generations which are
+    still referenced by alive snapshots so states no longer visible to any
+    reader can be dropped.
+    """
+
+    def __init__(self):
+        self.generation = 0
+        "The current (writable) generation"
+        self.releases = 0
+        "The count of released snapshots"
+        self._alive: list[int] = []
+        "Sorted list of the generations of all alive snapshots"
+        self._lock = Lock()
+        "Access lock to the list of alive snapshots"
+
+    def freeze(self) -> int:
+        """
+        Freezes the current generation for a new snapshot
+
+        :return: The generation which is visible to the snapshot
+        """
+        with self._lock:
+            generation = self.generation
+            self.generation += 1
+            insort(self._alive, generation)
+        return generation
+
+    def release(self, generation: int):
+        """
+        Releases a snapshot's generation
+
+        :param generation: The generation as returned by :meth:`freeze`
+        """
+        with self._lock:
+            index = bisect_left(self._alive, generation)
+            if index < len(self._alive) and self._alive[index] == generation:
+                del self._alive[index]
+                self.releases += 1
+
+    def is_visible(self, first: int, end: int) -> bool:
+        """
+        Returns if any alive snapshot can see a state which is valid from
+        generation first until (excluding) generation end.
+
+        :param first: The state's generation
+        :param end: The generation of the state which superseded it
+        :return: True if the state is still required
+        """
+        with self._lock:
+            index = bisect_left(self._alive, first)
+            return index < len(self._alive) and self._alive[index] < end
+
+    @property
+    def alive_snapshots(self) -> int:
+        """
+        Returns the count of alive snapshots
+        """
+        with self._lock:
+            return len(self._alive)
+
+
+class _SnapshotHandle:
+    """
+    Registers a snapshot's generation as long as any view of it is referenced
+    """
+
+    def __init__(self, tree: _LogElementTree):
+        self.generation = tree.freeze()
+        "The snapshot's generation"
+        self._finalizer = weakref.finalize(self, tree.release, self.generation)
+
+    def release(self):
+        """
+        Releases the snapshot explicitly
+        """
+        self._finalizer()
+
+
 class LogElement:
     """
     Defines a single data element within the log.
@@ -52,29 +211,123 @@ class LogElement:
         """The element's globally unique name"""
         self.parent: LogElement | None = parent
         """The element's parent element"""
-        self.last_direct_change_time: float = time.time()
-        """Timestamp when the element itself was directly extended the last time"""
-        self.last_child_update_time: float = self.last_direct_change_time
-        """Timestamp when an embedded sub-element was updated the last time"""
+        self._tree: _LogElementTree = (
+            parent._tree if parent is not None else _LogElementTree()
+        )
+        """The versioning information shared with all elements of the tree"""
+        self._state = _LogElementState(
+            self._tree.generation,
+            {element: [b""] for element in output_formats},
+            {},
+            time.time(),
+        )
+        """The element's current state"""
         self.direct_modifications: int = 0
         """Count of direct modifications of this cell"""
         self.total_modifications: int = 0
         """Count of direct and indirect modifications of this cell"""
-        self.data: dict[str, list[bytes | LogElement]] = {
-            element: [b""] for element in output_formats
-        }
-        """A dictionary storing the data for each output format type. 
-        
-        The data can be described as raw bytes string or via a nested sub element."""
-        self.sub_elements: dict[str, LogElement] = {}
-        """
-        Dictionary of nested sub elements 
-        """
         self.flags: dict = {}
         """
         Usage specific flags (such as the back-link to a widget)
         """
 
+    @property
+    def data(self) -> dict[str, list[bytes | LogElement]]:
+        """
+        A dictionary storing the data for each output format type.
+
+        The data can be described as raw bytes string or via a nested sub element.
+        """
+        return self._state.data
+
+    @property
+    def sub_elements(self) -> dict[str, LogElement]:
+        """
+        Dictionary of nested sub elements
+        """
+        return self._state.sub_elements
+
+    @property
+    def last_direct_change_time(self) -> float:
+        """
+        Timestamp when the element itself was directly extended the last time
+        """
+        return self._state.last_direct_change_time
+
+    @last_direct_change_time.setter
+    def last_direct_change_time(self, value: float):
+        self._writable_state().last_direct_change_time = value
+
+    @property
+    def last_child_update_time(self) -> float:
+        """
+        Timestamp when an embedded sub-element was updated the last time
+        """
+        return self._state.last_child_update_time
+
+    @last_child_update_time.setter
+    def last_child_update_time(self, value: float):
+        self._writable_state().last_child_update_time = value
+
+    def _writable_state(self, data: bool = False) -> _LogElementState:
+        """
+        Returns the element's current state, copies it first if it is visible to
+        a snapshot.
+
+        :param data: Defines if the data and sub elements shall be modified
+        :return: The state which may be modified
+        """
+        state = self._state
+        tree = self._tree
+        if state.generation != tree.generation:
+            new_state = state.copy(tree.generation)
+            new_state.previous = state
+            self._state = state = new_state
+            self._prune_history(state)
+        elif state.previous is not None and state.release_count != tree.releases:
+            self._prune_history(state)
+        if data and not state.owns_data:
+            state.data = {key: list(value) for key, value in state.data.items()}
+            state.sub_elements = dict(state.sub_elements)
+            state.owns_data = True
+        # always replace the dictionary (even an empty one) so a build running
+        # concurrently stores its outdated result in the dropped dictionary
+        state.built = {}
+        return state
+
+    def _prune_history(self, state: _LogElementState):
+        """
+        Removes all previous states which are not visible to any alive snapshot
+
+        :param state: The element's current state
+        """
+        tree = self._tree
+        state.release_count = tree.releases
+        end = state.generation
+        last_kept = state
+        cur_state = state.previous
+        while cur_state is not None:
+            if tree.is_visible(cur_state.generation, end):
+                last_kept.previous = cur_state
+                last_kept = cur_state
+            end = cur_state.generation
+            cur_state = cur_state.previous
+        last_kept.previous = None
+
+    def _get_state(self, generation: int | None) -> _LogElementState:
+        """
+        Returns the state visible at given generation
+
+        :param generation: The generation. None for the current state.
+        :return: The state
+        """
+        state = self._state
+        if generation is None:
+            return state
+        while state.generation > generation:
+            state = state.previous
+        return state
+
     def add_data(self, output_format: str, data: bytes):
         """
         Adds a single data element to the log
@@ -83,15 +336,18 @@ class LogElement:
             added
         :param data: The data to add
         """
-        self.last_direct_change_time = time.time()
+        change_time = time.time()
         self.direct_modifications += 1
         self.total_modifications += 1
-        if output_format not in self.data:
+        if output_format not in self._state.data:
+            self.last_direct_change_time = change_time
             return
-        data_list = self.data[output_format]
+        state = self._writable_state(data=True)
+        state.last_direct_change_time = change_time
+        data_list = state.data[output_format]
         data_list[-1] += data
         if self.parent is not None:
-            self.parent.handle_child_changed(self.last_direct_change_time)
+            self.parent.handle_child_changed(change_time)
 
     def add_sub_element(self, name: str) -> LogElement:
         """
@@ -100,17 +356,18 @@ class LogElement:
         :param name: The sub element's name
         :return: The element handle
         """
-        new_element = LogElement(name, list(self.data.keys()), parent=self)
-        self.last_direct_change_time = time.time()
-        self.last_child_update_time = self.last_direct_change_time
+        new_element = LogElement(name, list(self._state.data.keys()), parent=self)
+        state = self._writable_state(data=True)
+        state.last_direct_change_time = time.time()
+        state.last_child_update_time = state.last_direct_change_time
         self.direct_modifications += 1
         self.total_modifications += 1
         if self.parent is not None:
-            self.parent.handle_child_changed(self.last_direct_change_time)
-        for output_format in self.data.keys():
-            self.data[output_format].append(new_element)
-            self.data[output_format].append(b"")
-        self.sub_elements[name] = new_element
+            self.parent.handle_child_changed(state.last_direct_change_time)
+        for output_format in state.data.keys():
+            state.data[output_format].append(new_element)
+            state.data[output_format].append(b"")
+        state.sub_elements[name] = new_element
         return new_element
 
     def build(self, output_format: str) -> bytes:
@@ -120,14 +377,36 @@ class LogElement:
         :param output_format: The output format to retrieve
         :return: The data
         """
-        output = b""
-        for element in self.data[output_format]:
+        return self._build(output_format, None)
+
+    def _build(self, output_format: str, generation: int | None) -> bytes:
+        """
+        Combines all data elements of given generation to the full data bytes string
+
+        The result is kept until the element or one of its sub elements is
+        modified, so all readers - clients polling for updates, the page
+        renderer and snapshots - share a single build of each unchanged element.
+
+        :param output_format: The output format to retrieve
+        :param generation: The generation to build. None for the current state.
+        :return: The data
+        """
+        state = self._get_state(generation)
+        built = state.built
+        result = built.get(output_format, None)
+        if result is not None:
+            return result
+        output = []
+        for element in state.data[output_format]:
             if isinstance(element, LogElement):
-                data = element.build(output_format)
+                output.append(element._build(output_format, generation))
             else:
-                data = element
-            output += data
-        return output
+                output.append(element)
+        result = b"".join(output)
+        # if the state was modified meanwhile the outdated dictionary was
+        # replaced already so the result is only stored in the dropped one
+        built[output_format] = result
+        return result
 
     def handle_child_changed(self, update_time: float):
         """
@@ -146,12 +425,56 @@ class LogElement:
         """
         self.direct_modifications += 1
         self.total_modifications += 1
-        self.last_direct_change_time = time.time()
-        self.last_child_update_time = self.last_direct_change_time
-        self.data: dict[str, list[bytes | LogElement]] = {
-            element: [b""] for element in self.data.keys()
-        }
+        state = self._writable_state()
+        state.last_direct_change_time = time.time()
+        state.last_child_update_time = state.last_direct_change_time
+        state.data = {element: [b""] for element in state.data.keys()}
+        state.sub_elements = dict(state.sub_elements)
+        state.owns_data = True
         self.flags = {}
+        if self.parent is not None:
+            self.parent.handle_child_changed(state.last_direct_change_time)
+
+    def replace_content(self, source: LogElement):
+        """
+        Replaces the element's content by the content of an element which was
+        built independently of this element's tree, e.g. in a worker thread, and
+        takes over its sub elements.
+
+        The element's flags are kept. The source element may not be used
+        afterwards.
+
+        :param source: The element providing the new content
+        """
+        change_time = time.time()
+        self.direct_modifications += 1
+        self.total_modifications += 1
+        source_state = source._state
+        state = self._writable_state()
+        state.data = source_state.data
+        state.sub_elements = source_state.sub_elements
+        state.owns_data = True
+        state.last_direct_change_time = change_time
+        state.last_child_update_time = change_time
+        for sub_element in state.sub_elements.values():
+            sub_element._attach(self)
+        if self.parent is not None:
+            self.parent.handle_child_changed(change_time)
+
+    def _attach(self, parent: LogElement):
+        """
+        Moves this element and its sub elements into the tree of a new parent
+
+        :param parent: The new parent element
+        """
+        self.parent = parent
+        self._tree = parent._tree
+        state = self._state
+        state.generation = self._tree.generation
+        state.previous = None
+        state.release_count = self._tree.releases
+        for sub_element in state.sub_elements.values():
+            sub_element._attach(self)
 
     def clone(self, parent=None) -> LogElement:
         """
@@ -159,24 +482,40 @@ class LogElement:
 
         :return: A copy of this element
         """
-        new_element = LogElement(self.name, output_formats=list(self.data.keys()))
-        new_element.parent = parent
-        new_element.last_direct_change_time = self.last_direct_change_time
-        new_element.last_child_update_time = self.last_child_update_time
+        new_element = LogElement(
+            self.name, output_formats=list(self.data.keys()), parent=parent
+        )
+        new_state = new_element._state
+        new_state.data = {key: [] for key in self.data.keys()}
+        new_state.last_direct_change_time = self.last_direct_change_time
+        new_state.last_child_update_time = self.last_child_update_time
         new_element.total_modifications = self.total_modifications
         new_element.direct_modifications = self.direct_modifications
         new_element.flags = dict(self.flags)
         for cur_sub_name, cur_sub in self.sub_elements.items():
-            sub_clone = cur_sub.clone(parent=self)
-            new_element.sub_elements[cur_sub_name] = sub_clone
+            sub_clone = cur_sub.clone(parent=new_element)
+            new_state.sub_elements[cur_sub_name] = sub_clone
         for key, data_list in self.data.items():
             for element in data_list:
                 if isinstance(element, LogElement):
-                    new_element.data[key].append(new_element.sub_elements[element.name])
+                    new_state.data[key].append(new_state.sub_elements[element.name])
                 else:
-                    new_element.data[key].append(element)
+                    new_state.data[key].append(element)
         return new_element
 
+    def snapshot(self) -> LogElementSnapshot:
+        """
+        Creates a read-only snapshot of this element and all its sub elements.
+
+        Creating the snapshot is O(1), the elements' states are only copied when
+        they are modified afterwards. The snapshot can safely be read from other
+        threads, but it has to be created by the thread modifying the tree (or
+        while holding the lock protecting it).
+
+        :return: The snapshot
+        """
+        return LogElementSnapshot(self, _SnapshotHandle(self._tree))
+
     def list_elements_recursive(
         self, path: str = "", target: list[LogElementReference] | None = None
     ) -> list[LogElementReference]:
@@ -223,3 +562,125 @@ class LogElement:
         :return: The element
         """
         return self.sub_elements[item]
+
+
+class LogElementSnapshot:
+    """
+    Read-only view of a :class:`LogElement` and all its sub elements at the
+    point in time when :meth:`LogElement.snapshot` was called.
+
+    Provides the reading methods of :class:`LogElement`.
+    """
+
+    def __init__(self, element: LogElement, handle: _SnapshotHandle):
+        """
+        :param element: The element being viewed
+        :param handle: The snapshot's handle, shared by all views of the snapshot
+        """
+        self.element = element
+        "The viewed element"
+        self._handle = handle
+        "The snapshot's handle, the generation stays frozen as long as it exists"
+        self._state = element._get_state(handle.generation)
+        "The element's state at the time of the snapshot"
+
+    @property
+    def name(self) -> str:
+        """
+        The element's name
+        """
+        return self.element.name
+
+    @property
+    def generation(self) -> int:
+        """
+        The generation of the element tree visible to this snapshot
+        """
+        return self._handle.generation
+
+    @property
+    def last_direct_change_time(self) -> float:
+        """
+        Timestamp when the element itself was directly extended the last time
+        """
+        return self._state.last_direct_change_time
+
+    @property
+    def last_child_update_time(self) -> float:
+        """
+        Timestamp when an embedded sub-element was updated the last time
+        """
+        return self._state.last_child_update_time
+
+    @property
+    def sub_elements(self) -> dict[str, LogElementSnapshot]:
+        """
+        Dictionary of views of the nested sub elements
+        """
+        return {
+            name: LogElementSnapshot(element, self._handle)
+            for name, element in self._state.sub_elements.items()
+        }
+
+    def build(self, output_format: str) -> bytes:
+        """
+        Combines all data elements to the full data bytes string
+
+        :param output_format: The output format to retrieve
+        :return: The data
+        """
+        return self.element._build(output_format, self._handle.generation)
+
+    def list_elements_recursive(
+        self, path: str = "", target: list[LogElementReference] | None = None
+    ) -> list[LogElementReference]:
+        """
+        Creates a linear list of this element and all its sub elements in hierarchical
+        order.
+
+        See :meth:`LogElement.list_elements_recursive`
+
+        :param path: The absolute path name
+        :param target: The list to which the new elements shall be stored.
+        :return: The final list
+        """
+        if target is not None:
+            if len(path) == 0:
+                target.clear()
+        else:
+            target = []
+        target.append(
+            LogElementReference(name=self.name, path=path + self.name, element=self)
+        )
+        for value in self.sub_elements.values():
+            value.list_elements_recursive(path=path + self.name + ".", target=target)
+        return target
+
+    def release(self):
+        """
+        Releases the snapshot so the element tree does not need to preserve its
+        state any longer.
+
+        The snapshot and all views of it may not be used afterwards.
+        """
+        self._handle.release()
+
+    def __contains__(self, item):
+        """
+        Defines if given sub element exists
+
+        :param item: The element's name
+        :return: True if the sub element with given name does exist
+        """
+        return item in self._state.sub_elements
+
+    def __getitem__(self, item) -> LogElementSnapshot:
+        """
+        Returns a view of given sub element.
+
+        Raises KeyError if the element does not exist.
+
+        :param item: The element's name
+        :return: The element
+        """
+        return LogElementSnapshot(self._state.sub_elements[item], self._handle)
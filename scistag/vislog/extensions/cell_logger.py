@@ -8,6 +8,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Union, Callable
 
 from scistag.vislog import BuilderExtension, LogBuilder
+from scistag.vislog.common.cell_dependency_graph import CellDependencyGraph
 from scistag.vislog.widgets.cells import Cell
 
 if TYPE_CHECKING:
@@ -33,6 +34,11 @@ class CellLogger(BuilderExtension):
         """
         Dictionary of all registered cells
         """
+        self.graph = CellDependencyGraph(builder)
+        """
+        Tracks the cells' dependencies and rebuilds them when ever a dependency was
+        modified
+        """
 
     def add(
         self,
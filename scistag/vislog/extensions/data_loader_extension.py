@@ -27,6 +27,9 @@ class DataLoaderExtension(BuilderExtension):
         super().__init__(builder=builder)
         self._sources: Dict[str, DataObserver] = {}
         """List of observed elements"""
+        self._source_hashes: Dict[str, int] = {}
+        """The hash of each source when it was checked for modifications the last
+        time"""
 
     def normalized_source(self, source: str) -> str:
         """
@@ -67,8 +70,9 @@ class DataLoaderExtension(BuilderExtension):
             return
         if isinstance(source, str):
             if FileStag.exists(source):
-                fdo = FileDataObserver(source)
+                fdo = FileDataObserver(source, event_driven=True)
                 self._sources[source] = fdo
+                self._source_hashes[source] = hash(fdo)
 
     def get_hash(self, source: str) -> int | None:
         """
@@ -82,6 +86,24 @@ class DataLoaderExtension(BuilderExtension):
             return self._sources[source].hash_int()
         return None
 
+    def get_modified_sources(self) -> list[str]:
+        """
+        Returns all sources which were modified since the last call.
+
+        Local files are observed event driven, so verifying them does not require
+        accessing the files. Other sources are verified at most once per their
+        observer's refresh interval.
+
+        :return: The list of modified sources
+        """
+        modified = []
+        for source, observer in self._sources.items():
+            cur_hash = hash(observer)
+            if cur_hash != self._source_hashes.get(source, None):
+                self._source_hashes[source] = cur_hash
+                modified.append(source)
+        return modified
+
     def handle_cell_modified(self, cell: "Cell") -> None:
         """
         Is called from a cell when it got modified
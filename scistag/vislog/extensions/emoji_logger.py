@@ -6,9 +6,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Union, Callable
 
-from scistag.emojistag import EmojiDb, EmojiRenderer
+from scistag.emojistag import EmojiDb, EmojiRenderer, EmojiAtlas
+from scistag.emojistag.emoji_definitions import EmojiIdentifierTypes
 from scistag.emojistag.emoji_info import EmojiInfo
 from scistag.imagestag import Image
+from scistag.vislog import HTML
 from scistag.vislog.extensions.builder_extension import BuilderExtension
 
 if TYPE_CHECKING:
@@ -26,6 +28,8 @@ class EmojiLogger(BuilderExtension):
         """
         super().__init__(builder)
         self.show = self.__call__
+        self._atlas: EmojiAtlas | None = None
+        "The sprite atlas of the emojis used in this log, see :meth:`atlas`"
 
     def find(self, search_mask: str = "") -> list[EmojiInfo]:
         """
@@ -39,6 +43,28 @@ class EmojiLogger(BuilderExtension):
         results = EmojiDb.find_emojis_by_name(search_mask)
         return results
 
+    def atlas(
+        self, identifiers: list[EmojiIdentifierTypes], size: int = 14
+    ) -> EmojiAtlas:
+        """
+        Pre-renders a set of emojis into a single sprite image and inserts its
+        style sheet into the log.
+
+        All emojis of the atlas logged afterwards in the same size are inserted
+        as lightweight HTML elements referencing the atlas instead of as one
+        image each - as long as HTML is the log's only output format, otherwise
+        they are logged as images so the other formats can present them as well.
+
+        :param identifiers: The emojis to pre-render, see :class:`EmojiAtlas`
+        :param size: The size of the emojis in pixels
+        :return: The atlas
+        """
+        class_name = self.page_session.reserve_unique_name("emoji_atlas")
+        atlas = EmojiAtlas(identifiers, size=size, class_name=class_name)
+        self.builder.style.add_css(atlas.get_css(), class_name=f"@{class_name}")
+        self._atlas = atlas
+        return atlas
+
     def __call__(
         self, search_mask: str = "", size: int = None, return_image: bool = False
     ) -> Union["LogBuilder", Image]:
@@ -58,6 +84,17 @@ class EmojiLogger(BuilderExtension):
         results = EmojiDb.find_emojis_by_name(search_mask)
         if len(results) == 0:
             results = EmojiDb.find_emojis_by_name("sad*")
+        if (
+            not return_image
+            and self._atlas is not None
+            and self._atlas.cell_size == (size, size)
+            and self.page_session.log_formats == {HTML}
+            and not self.page_session.options.output.log_to_stdout
+        ):
+            code = self._atlas.get_html(results[0].sequence, title=results[0].name)
+            if code is not None:
+                self.builder.html(code, br=False)
+                return self.builder
         image = EmojiRenderer.render_emoji(results[0].name, size=size)
         if not return_image:
             self.builder.image.show(image, br=False, name=results[0].name)
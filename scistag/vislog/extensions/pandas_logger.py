@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 
 from scistag.vislog import BuilderExtension, LogBuilder, HTML, MD, TXT, CONSOLE
 from scistag.vislog.builders.pandas_builder import PandasBuilder, PandasBuilderParams
+from scistag.vislog.widgets import LDataFrameView
 from scistag.vislog.options.table_options import (
     TABULATE_ROUNDED_OUTLINE,
     TABULATE_GITHUB,
@@ -36,6 +37,7 @@ class PandasLogger(BuilderExtension):
         name: str | None = None,
         index: bool = True,
         max_rows: int = 100,
+        virtual: bool = False,
     ):
         """
         Logs a dataframe to the log
@@ -44,7 +46,14 @@ class PandasLogger(BuilderExtension):
         :param df: The data frame
         :param index: Defines if the index shall be printed
         :param max_rows: The maximum number of rows to log
+        :param virtual: Defines if the data frame shall be shown as virtual table
+            in html logs. The data frame is then kept on the server and all of its
+            rows can be browsed, sorted and filtered in the live view, see
+            :class:`LDataFrameView`. max_rows defines the count of rows transferred
+            at once.
         """
+        if virtual and HTML in self.builder.options.output.formats_out:
+            LDataFrameView(self.builder, df, index=index, page_size=max_rows)
         if df.shape[0] > max_rows:
             df = df.head(max_rows)
         if name is None:
@@ -65,7 +74,7 @@ class PandasLogger(BuilderExtension):
                 return df.to_markdown(index=index, tablefmt=cur_format)
             return df.to_string(index=index)
 
-        if HTML in formats:
+        if HTML in formats and not virtual:
             tf = to.data_table_format[HTML]
             code = get_table_in_format(tf)
             if not tf.startswith("vl_"):
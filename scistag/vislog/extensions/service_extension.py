@@ -45,6 +45,7 @@ class LogServiceExtension(BuilderExtension):
         self.js_sources: dict[str, str] = {}
         "Dictionary of additional JavaScript sources"
         self.publish("vl_upload_file", self.handle_file_upload)
+        self.publish("vl_data_frame_view", self.handle_data_frame_view)
 
     def publish(
         self,
@@ -227,3 +228,26 @@ class LogServiceExtension(BuilderExtension):
         widget.handle_file_upload(request)
 
         return WebResponse(status=200, body=b"OK")
+
+    def handle_data_frame_view(self, request: WebRequest):
+        """
+        Handles the request of a window of rows of a :class:`LDataFrameView`
+
+        :param request: The request, see :meth:`LDataFrameView.handle_window_request`
+        :return: The response
+        """
+        params = dict(request.parameters)
+        params.update(request.form)
+        widget_name = params.get("widget", "")
+        if widget_name == "":
+            return WebResponse(status=400, body=b"Error - no widget name defined")
+        widgets = self.builder.widget.find_all_widgets()
+        if widget_name not in widgets:
+            return WebResponse(status=400, body=b"Error - unknown target")
+
+        widget = widgets[widget_name]
+        from scistag.vislog.widgets import LDataFrameView
+
+        if not isinstance(widget, LDataFrameView):
+            return WebResponse(status=400, body=b"Error - invalid widget")
+        return widget.handle_window_request(request)
@@ -5,10 +5,12 @@ log.
 """
 
 from __future__ import annotations
+
 from typing import TYPE_CHECKING, Union, Callable, Any, Literal
 
 from scistag.vislog import TXT
 from scistag.vislog.common.element_context import ElementContext
+from scistag.vislog.common.html_table import escape_html_values
 
 from scistag.vislog.extensions import BuilderExtension
 from scistag.vislog.options import TableOptions
@@ -36,6 +38,9 @@ ColumnContent = Union[
 ]
 "Defines the types for potential content of a column"
 
+SIMPLE_CELL_TYPES = (str, int, float, bool)
+"Cell types which can be converted in bulk, without a per-cell element update"
+
 
 class TableContext(ElementContext):
     """
@@ -497,32 +502,102 @@ class TableLogger(BuilderExtension):
             using_txt = TXT in session.log_formats
             if using_txt:
                 session.log_formats.remove(TXT)
-            for row_index, row in enumerate(tc):
-                for col_index, col in enumerate(row):
-                    cur_data = data[row_index][col_index]
-                    if isinstance(cur_data, (str, int, float, bool)):
-                        is_index = False
-                        if index and col_index == 0:
-                            self.page_session.write_html("<b>")
-                            is_index = True
-                        major_cell = (
-                            row_index == 0 and header or col_index == 0 and index
-                        )
-                        if major_cell and not is_index:
-                            self.page_session.write_html("<b>")
-                            self.builder.add(cur_data, mimetype=mimetype)
-                            self.page_session.write_html("</b>")
-                        else:
-                            self.builder.add(cur_data, mimetype=mimetype)
-                        if index and col_index == 0:
-                            self.page_session.write_html("</b>")
-                    else:
-                        self.builder.add(cur_data)
+            simple_rows = []
+            for row_index, row in enumerate(data):
+                if mimetype is None and all(
+                    isinstance(element, SIMPLE_CELL_TYPES) for element in row
+                ):
+                    simple_rows.append(row_index)
+                    tc.cur_row += 1
+                    continue
+                # rows containing rich content are added cell by cell
+                self._write_simple_rows(data, simple_rows, index, header)
+                simple_rows = []
+                with tc.add_row() as table_row:
+                    for col_index, cur_data in enumerate(row):
+                        with table_row.add():
+                            self._add_cell(
+                                cur_data, row_index, col_index, index, header, mimetype
+                            )
+            self._write_simple_rows(data, simple_rows, index, header)
             if using_txt:
                 session.log_formats.add(TXT)
                 self._log_simple_text_table(data)
         return self.builder
 
+    def _add_cell(
+        self,
+        cur_data: ColumnContent,
+        row_index: int,
+        col_index: int,
+        index: bool,
+        header: bool,
+        mimetype: str | None,
+    ) -> None:
+        """
+        Adds a single cell's content to the current column context
+
+        :param cur_data: The cell's content
+        :param row_index: The row index
+        :param col_index: The column index
+        :param index: Defines if the table has an index column
+        :param header: Defines if the table has a header
+        :param mimetype: Defines the explicit mime type of the content
+        """
+        if not isinstance(cur_data, SIMPLE_CELL_TYPES):
+            self.builder.add(cur_data)
+            return
+        major_cell = row_index == 0 and header or col_index == 0 and index
+        if major_cell:
+            self.page_session.write_html("<b>")
+        self.builder.add(cur_data, mimetype=mimetype)
+        if major_cell:
+            self.page_session.write_html("</b>")
+
+    def _write_simple_rows(
+        self, data: list[list[Any]], rows: list[int], index: bool, header: bool
+    ) -> None:
+        """
+        Writes a block of rows which only contain simple types such as strings and
+        numbers.
+
+        The rows are converted in a single pass and added as one chunk per output
+        format, so the costs do not scale with the count of element updates per
+        cell. The output equals the one of adding each cell via
+        :meth:`LogBuilder.add`.
+
+        :param data: The table data
+        :param rows: The indices of the rows to write
+        :param index: Defines if the table has an index column
+        :param header: Defines if the table has a header
+        """
+        if len(rows) == 0:
+            return
+        values = [element for row_index in rows for element in data[row_index]]
+        html_cells = escape_html_values(values, ascii_only=False)
+        md_cells = escape_html_values(values, line_break="<br>\n", ascii_only=False)
+        html_rows = []
+        md_rows = []
+        offset = 0
+        for row_index in rows:
+            col_count = len(data[row_index])
+            row_html = html_cells[offset : offset + col_count]
+            row_md = md_cells[offset : offset + col_count]
+            offset += col_count
+            if header and row_index == 0:
+                row_html = [f"<b>{cell}</b>" for cell in row_html]
+            elif index and col_count > 0:
+                row_html[0] = f"<b>{row_html[0]}</b>"
+            html_rows.append(
+                "<tr>" + "".join([f"<td>{cell}</td>" for cell in row_html]) + "</tr>\n"
+            )
+            md_rows.append(
+                "<tr>" + "".join([f"<td>{cell}</td>" for cell in row_md]) + "</tr>\n"
+            )
+        self.builder.add_html("".join(html_rows))
+        self.builder.add_md("".join(md_rows), br=False)
+        self.builder.handle_modified()
+
     def simple_table(
         self,
         data: list[list[str | int | float | bool]],
@@ -609,10 +684,5 @@ class TableLogger(BuilderExtension):
 
         :param data: A 2D list containing the data to be logged.
         """
-        for row in data:
-            row_text = "| "
-            for index, col in enumerate(row):
-                col = str(col)
-                row_text += col + " | "
-            row_text += "\n"
-            self.page_session.write_txt(row_text, targets="-md")
+        lines = ["| " + "".join([f"{col} | " for col in row]) + "\n" for row in data]
+        self.page_session.write_txt("".join(lines), targets="-md")
@@ -15,7 +15,7 @@ from scistag.vislog.widgets.button import CLICK_EVENT_TYPE, LClickEvent
 if TYPE_CHECKING:
     from scistag.vislog.log_builder import LogBuilder
     from scistag.vislog.widgets import LButton
-    from scistag.vislog.widgets import LSlider, LFileUpload
+    from scistag.vislog.widgets import LSlider, LFileUpload, LDataFrameView
 
 
 class WidgetLogger(BuilderExtension):
@@ -57,8 +57,14 @@ class WidgetLogger(BuilderExtension):
             if next_event is not None:
                 if next_execution is None or next_event < next_execution:
                     next_execution = next_event
-        for element in event_list:
-            self.handle_event(element, widgets)
+        with self.builder.cell.graph.deferred_builds():
+            for element in event_list:
+                self.handle_event(element, widgets)
+        # rebuild the cells affected by modifications of the cache or data sources
+        next_event = self.builder.cell.graph.handle_loop()
+        if next_event is not None:
+            if next_execution is None or next_event < next_execution:
+                next_execution = next_event
         return next_execution
 
     def find_all_widgets(self) -> dict[str, LWidget]:
@@ -158,6 +164,21 @@ class WidgetLogger(BuilderExtension):
         new_widget = LFileUpload(self.builder, *args, **kwargs)
         return new_widget
 
+    def data_frame(
+        self,
+        *args,
+        **kwargs,
+    ) -> "LDataFrameView":
+        """
+        Adds a virtual, scrollable view of a Pandas DataFrame to the log
+
+        For further details see :class:`LDataFrameView`
+        """
+        from scistag.vislog.widgets import LDataFrameView
+
+        new_widget = LDataFrameView(self.builder, *args, **kwargs)
+        return new_widget
+
     def handle_client_event(self, **params):
         """
         Handles a client event (sent from JavaScript)
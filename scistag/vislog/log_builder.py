@@ -259,6 +259,14 @@ class LogBuilder(LogBuilderBase):
         )
         self.service.register_css("VlComparatorWidget", "vl_comparator.css")
         self.service.register_js("VlComparatorWidget", "vl_comparator.js")
+        self.service.publish(
+            "vl_data_frame_view.css", ext_path + "dataframe/vl_data_frame_view.css"
+        )
+        self.service.publish(
+            "vl_data_frame_view.js", ext_path + "dataframe/vl_data_frame_view.js"
+        )
+        self.service.register_css("VlDataFrameView", "vl_data_frame_view.css")
+        self.service.register_js("VlDataFrameView", "vl_data_frame_view.js")
 
         self._setup_extensions()  # register custom css, js etc.
 
@@ -375,11 +383,14 @@ class LogBuilder(LogBuilderBase):
                 if LOG_CELL_METHOD_FLAG in attr.__dict__:
                     cell_methods.append(attr)
 
-        for cur_method in cell_methods:
-            cell_config = cur_method.__dict__.get("__log_cell", {})
-            _ = self.cell.add(
-                on_build=cur_method, **cell_config, _builder_method=cur_method
-            )
+        with self.cell.graph.deferred_builds():
+            for cur_method in cell_methods:
+                cell_config = cur_method.__dict__.get("__log_cell", {})
+                _ = self.cell.add(
+                    on_build=cur_method, **cell_config, _builder_method=cur_method
+                )
+            # build the cells deferred for parallel building
+            self.cell.graph.handle_loop()
         self.page_session.render()
         self.stats.last_build_time_s = time.time() - start_time
         self.stats.total_build_time_s += self.stats.last_build_time_s
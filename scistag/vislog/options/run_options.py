@@ -40,6 +40,22 @@ class LogRunOptions(BaseModel):
     """Defines if then log shall be cleared automatically
     when being rebuild with `continuous=True`."""
 
+    async_render: bool = False
+    """
+    Defines if the pages shall be rendered and written to disk in a background
+    thread.
+
+    If enabled :meth:`LogBuilder.flush` and every modification of the page just
+    request a new rendering of the page's current state and return immediately.
+    Requests arriving while the previous rendering is still in progress are
+    coalesced. Use :meth:`PageSession.wait_for_render` to wait for the
+    renderings to be finished."""
+
+    cell_workers: int = 4
+    """
+    The maximum count of worker threads building the cells flagged as parallel
+    concurrently. See :class:`Cell`."""
+
     refresh_time_s: float = 0.25
     """
     The time interval with which the log shall be refreshed when using
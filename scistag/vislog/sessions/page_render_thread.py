@@ -0,0 +1,161 @@
+"""
+Implements :class:`PageRenderThread` which renders the pages of a
+:class:`PageSession` and writes them to disk in a background thread.
+"""
+from __future__ import annotations
+
+import logging
+from threading import Condition
+from typing import TYPE_CHECKING
+
+from scistag.common.mt import ManagedThread
+from scistag.vislog.common.log_element import LogElementSnapshot
+
+if TYPE_CHECKING:
+    from scistag.vislog.sessions.page_session import PageSession
+
+
+class _PageRenderRequest:
+    """
+    A pending render request. Requests arriving before the thread picked them up
+    are merged into a single one.
+    """
+
+    def __init__(
+        self,
+        snapshot: LogElementSnapshot,
+        render_formats: set[str],
+        write_formats: set[str],
+        custom_code: bytes,
+    ):
+        self.snapshot = snapshot
+        "The snapshot of the page's element tree to render"
+        self.render_formats = set(render_formats)
+        "The formats to render"
+        self.write_formats = set(write_formats)
+        "The formats to write to disk after rendering"
+        self.custom_code = custom_code
+        "The custom code to embed into the html page"
+
+    def merge(self, newer: _PageRenderRequest):
+        """
+        Merges a newer request into this one
+
+        :param newer: The newer request
+        """
+        self.snapshot.release()
+        self.snapshot = newer.snapshot
+        self.render_formats |= newer.render_formats
+        self.write_formats |= newer.write_formats
+        self.custom_code = newer.custom_code
+
+
+class PageRenderThread(ManagedThread):
+    """
+    Renders the pages of a :class:`PageSession` in the background.
+
+    The thread renders copy-on-write snapshots of the page's element tree so the
+    builder can continue modifying the page while the previous state is being
+    rendered and written to disk. Requests which arrive while the thread is busy
+    are coalesced, so only the newest state is rendered.
+    """
+
+    def __init__(self, page: PageSession):
+        """
+        :param page: The page to be rendered
+        """
+        super().__init__("vislogrenderthread")
+        self.daemon = True
+        self.page = page
+        "The page session being rendered"
+        self._condition = Condition()
+        "Condition triggered when a new request arrived or one was finished"
+        self._pending: _PageRenderRequest | None = None
+        "The request to be handled next"
+        self._requested = 0
+        "The count of requests received so far"
+        self._finished = 0
+        "The count of requests which were handled (or merged) so far"
+        self.renders = 0
+        "The count of renderings which were executed"
+
+    def request(
+        self,
+        snapshot: LogElementSnapshot,
+        render_formats: set[str],
+        write_formats: set[str],
+        custom_code: bytes,
+    ):
+        """
+        Requests the rendering of a snapshot.
+
+        If the previous request was not handled yet the requests are merged.
+
+        :param snapshot: The snapshot of the page's root element
+        :param render_formats: The formats to render
+        :param write_formats: The formats to write to disk after rendering
+        :param custom_code: The custom code to embed into the html page
+        """
+        new_request = _PageRenderRequest(
+            snapshot, render_formats, write_formats, custom_code
+        )
+        with self._condition:
+            if self._pending is not None:
+                self._pending.merge(new_request)
+            else:
+                self._pending = new_request
+            self._requested += 1
+            self._condition.notify_all()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Waits until all requests received so far were handled
+
+        :param timeout: The maximum time to wait in seconds
+        :return: True if all requests were handled
+        """
+        with self._condition:
+            target = self._requested
+            return self._condition.wait_for(
+                lambda: self._finished >= target or not self.is_alive(), timeout
+            )
+
+    @property
+    def busy(self) -> bool:
+        """
+        Returns if any request is still pending or being handled
+        """
+        with self._condition:
+            return self._finished < self._requested
+
+    def run_loop(self):
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._pending is not None or self.terminate_event.is_set(),
+                timeout=1.0,
+            )
+            request = self._pending
+            self._pending = None
+            target = self._requested
+        if request is None:
+            return
+        try:
+            self.page.render_snapshot(
+                request.snapshot,
+                request.render_formats,
+                custom_code=request.custom_code,
+            )
+            self.page.write_pages(request.write_formats)
+            self.renders += 1
+        except Exception:  # the thread must survive errors of single renderings
+            logging.exception("Rendering page in background failed")
+        finally:
+            request.snapshot.release()
+            with self._condition:
+                self._finished = target
+                self._condition.notify_all()
+
+    def terminate(self):
+        super().terminate()
+        with self._condition:
+            self._condition.notify_all()
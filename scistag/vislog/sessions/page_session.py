@@ -7,6 +7,7 @@ from __future__ import annotations
 import os
 import random
 import sys
+import threading
 import time
 from typing import Union, TYPE_CHECKING, Callable
 from collections import Counter
@@ -14,7 +15,11 @@ from collections import Counter
 from scistag.common import StagLock
 from scistag.filestag import FileStag, FilePath
 from scistag.logstag.console_stag import Console
-from scistag.vislog.common.log_element import LogElement, LogElementReference
+from scistag.vislog.common.log_element import (
+    LogElement,
+    LogElementReference,
+    LogElementSnapshot,
+)
 from scistag.vislog.options import LogOptions
 from scistag.vislog.renderers.log_renderer import LogRenderer
 from scistag.webstag.server import WebRequest
@@ -44,6 +49,26 @@ if TYPE_CHECKING:
     from scistag.vislog.visual_log import VisualLog
     from scistag.vislog.common.page_update_context import PageUpdateContext
     from scistag.vislog import LogBuilder, Cell
+    from scistag.vislog.sessions.page_render_thread import PageRenderThread
+
+
+class _WritingTarget:
+    """
+    Defines the element a thread is currently writing to and the stack of the
+    elements it was writing to previously.
+    """
+
+    __slots__ = ("cur_element", "element_stack")
+
+    def __init__(self, element: LogElement):
+        """
+        :param element: The initial target element
+        """
+        self.cur_element: LogElement = element
+        "The current target element"
+        self.element_stack: list[LogElement] = []
+        "Stack of the previous target elements"
+
 
 session_id_counter_set = set()
 """Set storing the already used session IDs"""
@@ -107,9 +132,9 @@ class PageSession:
         """
         Defines the single log elements
         """
-        self._log_backup: LogElement | None = None
+        self._log_backup: LogElementSnapshot | None = None
         """
-        Defines a copy of the current data
+        Defines a snapshot of the data at the beginning of the current update block
         """
         self.target_dir = options.output.target_dir
         """
@@ -119,10 +144,13 @@ class PageSession:
         "Lock for multithread secure access to the latest page update"
         self._backup_lock = StagLock()
         "Lock for multithread secure access to the latest page update backup"
-        self.cur_element: LogElement = self._logs
-        """Defines the current target element"""
-        self.element_stack: list[LogElement] = []
-        """Stag of **previous** elements which were previously a target"""
+        self._name_lock = StagLock()
+        "Lock for reserving unique names from multiple threads"
+        self._target = _WritingTarget(self._logs)
+        "The current writing target within the page's element tree"
+        self._isolation = threading.local()
+        """Writing targets of threads which write into isolated elements,
+        see :meth:`isolated_target`"""
         self._html_export = HTML in self.log_formats
         "Defines if HTML gets exported"
         self.md_export = MD in self.log_formats
@@ -160,6 +188,10 @@ class PageSession:
         time"""
         self.old_client_ids: set[str] = set()
         """Previously connected client IDs"""
+        self._synced_state: tuple[LogElement, int] | None = None
+        """The root element and its modification count when the client was found
+        to be up to date the last time. Allows answering the polls of idle clients
+        without visiting the whole element tree."""
         self.next_event_time = time.time()
         """The timestamp at which we think the next event will occur"""
         self.minimum_refresh_time = 0.01
@@ -200,6 +232,52 @@ class PageSession:
         self._renderers: dict[str, "LogRenderer"] = {}
 
         "The renderers for the single supported formats"
+        self._render_thread: PageRenderThread | None = None
+        """The thread rendering the pages in the background if
+        :attr:`LogRunOptions.async_render` is enabled"""
+
+    @property
+    def cur_element(self) -> LogElement:
+        """
+        Defines the current target element
+        """
+        return getattr(self._isolation, "target", self._target).cur_element
+
+    @cur_element.setter
+    def cur_element(self, element: LogElement):
+        getattr(self._isolation, "target", self._target).cur_element = element
+
+    @property
+    def element_stack(self) -> list[LogElement]:
+        """
+        Stack of **previous** elements which were previously a target
+        """
+        return getattr(self._isolation, "target", self._target).element_stack
+
+    @property
+    def is_isolated(self) -> bool:
+        """
+        Returns if the current thread is writing into an isolated element, see
+        :meth:`isolated_target`.
+        """
+        return hasattr(self._isolation, "target")
+
+    def isolated_target(self, element: LogElement) -> "IsolatedTargetContext":
+        """
+        Redirects all writes of the current thread into an element which is not
+        part of the page's element tree, e.g. to build a cell's content in a worker
+        thread while the page is modified or rendered by other threads.
+
+        Update blocks and modification notifications of the isolated thread are
+        ignored. The element can be moved into the page afterwards via
+        :meth:`LogElement.replace_content`.
+
+        Usage: `with page_session.isolated_target(element): ...`
+
+        :param element: The element to write to
+        :return: The context, restores the previous target when being left
+        """
+        return IsolatedTargetContext(self, element)
 
     def set_builder(self, builder: LogBuilder):
         """
@@ -218,13 +296,28 @@ class PageSession:
 
     def create_log_backup(self):
         """
-        Creates a copy of the logs and stores it in the log backup
+        Creates a snapshot of the logs and stores it in the log backup.
+
+        The snapshot is created in O(1), the elements modified afterwards are copied
+        on demand. See :meth:`LogElement.snapshot`.
         """
         with self._page_lock:
-            log_copy = self._logs.clone()
+            log_copy = self._logs.snapshot()
         with self._backup_lock:
+            if self._log_backup is not None:
+                self._log_backup.release()
             self._log_backup = log_copy
 
+    def release_log_backup(self):
+        """
+        Releases the log backup so the element tree does not need to preserve the
+        backed up state any longer.
+        """
+        with self._backup_lock:
+            if self._log_backup is not None:
+                self._log_backup.release()
+            self._log_backup = None
+
     def write_data(self, out_format: str, data: bytes) -> bool:
         """
         Writes data of given format type into the associated data buffer
@@ -320,19 +413,23 @@ class PageSession:
             self.cur_element.add_data(CONSOLE, (txt_code + "\n").encode("ascii"))
         return True
 
-    def _build_body(self):
+    def _build_body(self, root: LogElement | LogElementSnapshot | None = None):
         """
         Requests to combine all logs and sub logs to a single page which
         can be logged to the disk or provided in the browser. (excluding
         html headers and footers), so just "the body" of the HTML page.
 
+        :param root: The root element to build. The page's current root element
+            by default.
         :return: The finalized page, e.g. by combining base_log w/
             sub_logs as shown in the :class:`VisualLiveLog` class.
         """
         body: dict[str, bytes] = {}
+        if root is None:
+            root = self._logs
 
         for cur_format in self.log_formats:
-            log_data = self._logs.build(cur_format)
+            log_data = root.build(cur_format)
 
             if cur_format == HTML:
                 body[cur_format] = self._renderers[HTML].build_body(log_data)
@@ -373,21 +470,25 @@ class PageSession:
                 return self._page_backups[format_type]
             return b""
 
-    def get_root_element(self, backup: bool | None = None) -> (StagLock, LogElement):
+    def get_root_element(
+        self, backup: bool | None = None
+    ) -> (StagLock, LogElement | LogElementSnapshot):
         """
         Returns the current, active root element and it's access lock
         :param backup: Defines if the backup or default element shall be used.
 
-            Will be auto-detected if None is passed.
+            Will be auto-detected if None is passed. If no backup exists the
+            current root element is returned.
         :return: The access lock to access the content, the root element
         """
         if backup is None:
             with self._backup_lock:
                 backup = self._update_context_counter >= 1
         if backup:
-            return self._backup_lock, self._log_backup
-        else:
-            return self._page_lock, self._logs
+            with self._backup_lock:
+                if self._log_backup is not None:
+                    return self._backup_lock, self._log_backup
+        return self._page_lock, self._logs
 
     def render_element(
         self,
@@ -455,6 +556,9 @@ class PageSession:
 
         The page data for each type can be received via :meth:`get_latest_page`.
 
+        If :attr:`LogRunOptions.async_render` is enabled the pages are rendered in
+        a background thread, see :meth:`wait_for_render`.
+
         :param formats: A set of the formats which shall be rendered.
 
             None = All configured formats.
@@ -462,14 +566,37 @@ class PageSession:
         """
         if formats is None:
             formats = self.log_formats
-        bodies = self._build_body()
+        if self.async_render:
+            self._request_render(render_formats=formats, write_formats=set())
+            return self
+        self.render_snapshot(self._logs, formats)
+        return self
+
+    def render_snapshot(
+        self,
+        root: LogElement | LogElementSnapshot,
+        formats: set[str],
+        custom_code: bytes | None = None,
+    ) -> PageSession:
+        """
+        Renders the pages of the given formats from the given root element or
+        snapshot of it and stores them.
+
+        :param root: The root element or a snapshot of it
+        :param formats: A set of the formats which shall be rendered.
+        :param custom_code: The custom code to embed into the html page. Will be
+            received from the builder's service if not provided.
+        :return: The VisualLog object
+        """
+        bodies = self._build_body(root)
         with self._page_lock:
             self._body_backups = bodies
         # store html
-        custom_code = self.builder.service.get_embedding_code(static=True).encode(
-            "utf-8"
-        )
         if HTML in formats:
+            if custom_code is None:
+                custom_code = self.builder.service.get_embedding_code(
+                    static=True
+                ).encode("utf-8")
             self.set_latest_page(
                 HTML,
                 self._renderers[HTML].build_page(bodies[HTML], custom_code=custom_code),
@@ -496,6 +623,9 @@ class PageSession:
         Writes the rendered pages from all (or all specified) formats to
         disk.
 
+        If :attr:`LogRunOptions.async_render` is enabled the pages are rendered and
+        written in a background thread, see :meth:`wait_for_render`.
+
         :param formats: A set of formats to write. None = all configured
 
             e.g. {"html, "txt") etc. By default all formats will be stored.
@@ -505,9 +635,25 @@ class PageSession:
         if formats is None:
             formats = self.log_formats
 
+        if self.async_render:
+            self._request_render(
+                render_formats=formats if render else set(), write_formats=formats
+            )
+            return self
+
         if render:
             self.render(formats=formats)
+        self.write_pages(formats)
+        return self
 
+    def write_pages(self, formats: set[str]) -> PageSession:
+        """
+        Writes the latest rendered pages of the given formats to disk (if writing
+        to disk is enabled).
+
+        :param formats: A set of formats to write
+        :return: The VisualLog object
+        """
         if self.options.output.log_to_disk:
             # store html
             if (
@@ -535,6 +681,68 @@ class PageSession:
                 FileStag.save(self._txt_filename, self.get_page(TXT))
         return self
 
+    @property
+    def async_render(self) -> bool:
+        """
+        Defines if the pages are rendered and written in a background thread
+        """
+        return self.options is not None and self.options.run.async_render
+
+    def _request_render(self, render_formats: set[str], write_formats: set[str]):
+        """
+        Requests the rendering and writing of the current page state in the
+        background thread.
+
+        :param render_formats: The formats to render
+        :param write_formats: The formats to write to disk after rendering
+        """
+        custom_code = b""
+        if HTML in render_formats:
+            custom_code = self.builder.service.get_embedding_code(static=True).encode(
+                "utf-8"
+            )
+        with self._page_lock:
+            snapshot = self._logs.snapshot()
+            if self._render_thread is None or not self._render_thread.is_alive():
+                from scistag.vislog.sessions.page_render_thread import (
+                    PageRenderThread,
+                )
+
+                self._render_thread = PageRenderThread(self)
+                self._render_thread.start()
+            render_thread = self._render_thread
+        render_thread.request(snapshot, render_formats, write_formats, custom_code)
+
+    def wait_for_render(self, timeout: float | None = None) -> bool:
+        """
+        Waits until all renderings requested so far were executed and written to
+        disk. Only required if :attr:`LogRunOptions.async_render` is enabled.
+
+        :param timeout: The maximum time to wait in seconds
+        :return: True if all renderings were finished
+        """
+        with self._page_lock:
+            render_thread = self._render_thread
+        if render_thread is None:
+            return True
+        return render_thread.wait(timeout)
+
+    def close(self):
+        """
+        Finishes all pending background renderings and stops the rendering thread
+        and the worker threads building the parallel cells
+        """
+        with self._page_lock:
+            render_thread = self._render_thread
+            self._render_thread = None
+        if render_thread is not None:
+            render_thread.wait()
+            render_thread.terminate()
+            render_thread.join()
+        builder = self.builder
+        if builder is not None and builder._cell is not None:
+            builder._cell.graph.shutdown()
+
     def clear(self):
         """
         Clears the whole log (excluding headers and footers)
@@ -565,8 +773,18 @@ class PageSession:
     def handle_modified(self):
         """
         Is called when a new block of content has been inserted
+
+        If :attr:`LogRunOptions.async_render` is enabled the pages are re-rendered
+        (and written to disk) in the background. Bursts of modifications are
+        coalesced into a single rendering.
         """
-        pass
+        if self.async_render and not self.is_isolated:
+            write_formats = (
+                self.log_formats if self.options.output.log_to_disk else set()
+            )
+            self._request_render(
+                render_formats=self.log_formats, write_formats=write_formats
+            )
 
     def reserve_unique_name(self, name: str, digits: int = 0):
         """
@@ -578,10 +796,12 @@ class PageSession:
             number of digits.
         :return: The effective name with which the data shall be stored
         """
-        self.name_counter[name] += 1
+        with self._name_lock:
+            self.name_counter[name] += 1
+            counter = self.name_counter[name]
         result = name
-        if self.name_counter[name] > 1 or digits > 0:
-            result += f"_{self.name_counter[name]:0{digits}d}"
+        if counter > 1 or digits > 0:
+            result += f"_{counter:0{digits}d}"
         if self.session_id != MAIN_SESSION_ID_NAME:
             result += f"_{self.session_id}"
         return result
@@ -598,26 +818,35 @@ class PageSession:
         case of the builder `with builder.begin_update()` to automatically call
         end_update once the content block is left.
         """
+        from scistag.vislog.common.page_update_context import PageUpdateContext
+
+        if self.is_isolated:  # not visible to the client, no backup needed
+            return PageUpdateContext(self)
         with self._page_lock, self._backup_lock:
             self._update_context_counter += 1
             if self._update_context_counter == 1:
                 self.create_log_backup()
-            from scistag.vislog.common.page_update_context import PageUpdateContext
-
             return PageUpdateContext(self)
 
     def end_update(self):
         """
-        Ends the update mode
+        Ends the update mode.
+
+        Releases the backup once the outermost update block was left.
         """
+        if self.is_isolated:
+            return
         with self._backup_lock:
             self._update_context_counter -= 1
+            if self._update_context_counter == 0:
+                self.release_log_backup()
 
     def reset_client(self):
         """
         Is called when the client changed, e.g. because the page was reloaded
         """
         self.element_update_times = {}
+        self._synced_state = None
 
     def update_values_js(self, client_id: str, values: dict) -> bool:
         """
@@ -683,6 +912,13 @@ class PageSession:
 
             access_lock, root_element = self.get_root_element()
             with access_lock:
+                synced_state = (
+                    (root_element, root_element.total_modifications)
+                    if isinstance(root_element, LogElement)
+                    else None
+                )
+                if synced_state is not None and synced_state == self._synced_state:
+                    return {}, None  # nothing changed since the last poll
                 element_list = root_element.list_elements_recursive()
                 # ensure all elements are at least known
                 for cur_element_ref in element_list:
@@ -704,6 +940,7 @@ class PageSession:
                         modified_element_ref = cur_element_ref
                         change_time = cur_element_ref.element.last_direct_change_time
                 if modified_element_ref is None:
+                    self._synced_state = synced_state
                     return {}, None
                 path_start = modified_element_ref.path + "."
                 for element_name in self.element_update_times.keys():
@@ -915,3 +1152,35 @@ class PageSession:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self._page_lock.release()
+
+
+class IsolatedTargetContext:
+    """
+    Redirects the writes of the current thread into an isolated element as long
+    as the context is entered. See :meth:`PageSession.isolated_target`
+    """
+
+    def __init__(self, page_session: PageSession, element: LogElement):
+        """
+        :param page_session: The page session
+        :param element: The element to write to
+        """
+        self.page_session = page_session
+        "The page session whose writes are redirected"
+        self.element = element
+        "The target element"
+        self._previous: _WritingTarget | None = None
+        "The thread's previous isolated target"
+
+    def __enter__(self) -> LogElement:
+        isolation = self.page_session._isolation
+        self._previous = getattr(isolation, "target", None)
+        isolation.target = _WritingTarget(self.element)
+        return self.element
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        isolation = self.page_session._isolation
+        if self._previous is not None:
+            isolation.target = self._previous
+        else:
+            del isolation.target
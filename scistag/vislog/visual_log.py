@@ -866,6 +866,7 @@ class VisualLog:
             shutil.rmtree(self.options.output.tmp_dir)
         if not self._ran:
             self.run()
+        self.default_page.close()
         return self
 
     def clear(self):
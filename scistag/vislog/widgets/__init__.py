@@ -10,6 +10,7 @@ from .timer import LTimer, LTimerTickEvent
 from .button import LButton, LClickEvent
 from .slider import LSlider
 from .file_upload import LFileUpload, LFileUploadEvent
+from .data_frame_view import LDataFrameView
 
 __all__ = [
     "LWidget",
@@ -25,6 +26,7 @@ __all__ = [
     "LFileUploadEvent",
     "LComparison",
     "LSelect",
+    "LDataFrameView",
 ]
 
 from .value_widget import LValueWidget
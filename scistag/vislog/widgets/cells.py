@@ -8,8 +8,10 @@ rebuilt in a given time interval or progressively extended.
 
 from __future__ import annotations
 
+import hashlib
 import io
 import time
+from concurrent.futures import Executor, Future
 from contextlib import redirect_stdout
 from fnmatch import fnmatch
 from inspect import signature
@@ -18,6 +20,7 @@ from typing import Union, Callable
 from pydantic import BaseModel
 
 from scistag.vislog import LogBuilder
+from scistag.vislog.common.log_element import LogElement
 from scistag.vislog.widgets import LWidget, LEvent
 
 CELL_TYPE_SIMPLE = "simple"
@@ -83,6 +86,9 @@ class CellStats(BaseModel):
     """The average time required to build the cell in seconds"""
     build_time_s: float = 0.0
     """The last amount of time required to build the cell in seconds"""
+    skipped_updates: int = 0
+    """The count of builds which did not change the cell's content and thus did not
+    need to be sent to the client"""
 
 
 class Cell(LWidget):
@@ -110,6 +116,7 @@ class Cell(LWidget):
         page: int | str | None = None,
         capture_stdout: bool = False,
         ctype: str | None = None,
+        parallel: bool = False,
         on_build: CellOnBuildCallback = None,
         _builder_method: Union[Callable, None] = None,
     ):
@@ -146,6 +153,17 @@ class Cell(LWidget):
             displayed.
         :param capture_stdout: Defines if the stdout shall be captured and added to
             the log, e.g. print calls.
+        :param parallel: Defines if the cell may be built in a worker thread
+            concurrently to other cells.
+
+            The cell is built into an isolated element which is inserted into the
+            page once the build finished. Cells consuming keys listed in another
+            cell's ``output`` are built after the producing cell finished.
+            Progressive cells and cells capturing stdout are always built
+            sequentially.
+
+            The initial build of a parallel cell is deferred until all cells of the
+            builder were created.
         :param on_build: The callback to be called when the cell shall be build
         :param _builder_method: The object method to which this cell is attached
         """
@@ -241,8 +259,6 @@ class Cell(LWidget):
         """The time when the cell was invalidated the last time"""
         if self.interval_s is not None and self.continuous:
             self._next_tick = time.time() + self.interval_s
-        self.hashes = {}
-        """Stores the hash values for all observed elements"""
         self.statistics = CellStats()
         """
         Cell specific stats like updates, updates per second etc.
@@ -257,11 +273,24 @@ class Cell(LWidget):
         """Accumulated time for builds since the last reset"""
         self.capture_stdout = capture_stdout
         """Defines if elements logged via print() shall be logged into the cell"""
+        self.parallel = parallel
+        """Defines if the cell may be built in a worker thread concurrently to other
+        cells"""
         self.could_build = False
         """Defines if the cell could be build the last time"""
         self._data_dependencies: dict[str, int] = {}
         """Defines which dependencies this element used and which hash they had"""
-        self.build()
+        self._content_hash: str | None = None
+        """The hash of the cell's html content after its last build. None if unknown,
+        e.g. because the cell was cleared since then."""
+        self._graph = builder.cell.graph
+        """The dependency graph which triggers rebuilds of this cell when ever one of
+        its dependencies was modified"""
+        self._graph.register(self)
+        if self.supports_parallel_build and self._graph.defers_builds:
+            self._graph.schedule_build(self)
+        else:
+            self.build()
         self.leave()
         if not static:
             self.page_session.write_html(f"</div><!-- {self.cell_name} -->\n")
@@ -303,6 +332,7 @@ class Cell(LWidget):
         """
         self.sub_element.clear()
         self.sub_element.flags["widget"] = self
+        self._content_hash = None
         return self
 
     def build(self):
@@ -312,46 +342,148 @@ class Cell(LWidget):
         opened = self._closed
         if opened:
             self.enter()
+        old_mod = self.sub_element.last_direct_change_time
+        previous_hash = self._content_hash
         if not self.progressive:
             self.clear()
         if self.can_build:
             self.clear_dependencies()
             self.could_build = True
-            start_time = time.time()
-            old_mod = self.sub_element.last_direct_change_time
-            if not self.progressive and not self.static:
-                self.sub_element.add_data("html", b"<div>\n")
-            if not self.progressive:
-                self.render_header()
-            event = LCellBuildEvent(
-                name=self.identifier, widget=self, builder=self.builder
-            )
-            std_out = io.StringIO()
-            if self.capture_stdout:
-                with redirect_stdout(std_out):
-                    self.raise_event(event)
-            else:
-                self.raise_event(event)
-            buffer = std_out.getvalue()
-            if len(buffer) > 0:
-                self.handle_stdout(buffer)
-            if not self.progressive:
-                self.render_footer()
-            if not self.progressive and not self.static:
-                self.sub_element.add_data("html", b"</div>\n")
+            self._build_content(self.sub_element)
             if self.ctype in [CELL_TYPE_DATA, CELL_TYPE_ONCE, CELL_TYPE_STREAM]:
                 # prevent visual updates through a data cell
                 self.clear()
                 self.sub_element.last_direct_change_time = old_mod
-            time_required = time.time() - start_time
-            self.statistics.build_time_s = time_required
-            self._build_time_acc += time_required
-            self.statistics.builds += 1
         else:
             self.could_build = False
+        if not self.progressive:
+            self._content_hash = self._get_content_hash(self.sub_element)
+            if self._content_hash is not None and self._content_hash == previous_hash:
+                # the client is up to date already, skip the update
+                self._restore_change_time(self.sub_element, old_mod)
+                self.statistics.skipped_updates += 1
         if opened:
             self.leave()
-        self.update_hashes()
+        self._graph.handle_cell_built(self)
+
+    @staticmethod
+    def _get_content_hash(element: LogElement) -> str | None:
+        """
+        Returns the hash of an element's html content
+
+        :param element: The element
+        :return: The hash, None if the log does not create html output
+        """
+        if "html" not in element.data:
+            return None
+        return hashlib.md5(element.build("html")).hexdigest()
+
+    @staticmethod
+    def _restore_change_time(element: LogElement, change_time: float):
+        """
+        Flags an element and all of its sub elements as unchanged since given time
+
+        :param element: The element which was rebuilt with unchanged content
+        :param change_time: The element's change time before it was rebuilt
+        """
+        element.last_direct_change_time = change_time
+        for sub_element in element.sub_elements.values():
+            Cell._restore_change_time(sub_element, change_time)
+
+    def _build_content(self, target: LogElement):
+        """
+        Writes the cell's content to the current writing target
+
+        :param target: The element the page session is currently writing to
+        """
+        start_time = time.time()
+        if not self.progressive and not self.static:
+            target.add_data("html", b"<div>\n")
+        if not self.progressive:
+            self.render_header()
+        event = LCellBuildEvent(name=self.identifier, widget=self, builder=self.builder)
+        std_out = io.StringIO()
+        if self.capture_stdout:
+            with redirect_stdout(std_out):
+                self.raise_event(event)
+        else:
+            self.raise_event(event)
+        buffer = std_out.getvalue()
+        if len(buffer) > 0:
+            self.handle_stdout(buffer)
+        if not self.progressive:
+            self.render_footer()
+        if not self.progressive and not self.static:
+            target.add_data("html", b"</div>\n")
+        time_required = time.time() - start_time
+        self.statistics.build_time_s = time_required
+        self._build_time_acc += time_required
+        self.statistics.builds += 1
+
+    @property
+    def supports_parallel_build(self) -> bool:
+        """
+        Returns if the cell may be built in a worker thread, see :meth:`start_build`
+        """
+        return self.parallel and not self.progressive and not self.capture_stdout
+
+    def start_build(self, executor: Executor) -> Future | None:
+        """
+        Starts building the cell's content in a worker thread.
+
+        The content is written into an isolated element which is not part of the
+        page. Call :meth:`finish_build` from the builder's thread to insert it.
+
+        :param executor: The executor running the build
+        :return: The future providing the element containing the cell's content.
+            None if the cell's requirements are not fulfilled, in this case the
+            cell was cleared already.
+        """
+        if not self.can_build:
+            self.build()
+            return None
+        self.clear_dependencies()
+        self.could_build = True
+        element = LogElement(
+            self.sub_element.name, output_formats=list(self.sub_element.data.keys())
+        )
+        element.flags["widget"] = self
+        return executor.submit(self._build_isolated, element)
+
+    def _build_isolated(self, element: LogElement) -> LogElement:
+        """
+        Builds the cell's content into an isolated element
+
+        :param element: The element to write to
+        :return: The element
+        """
+        with self.page_session.isolated_target(element), self.builder:
+            self._build_content(element)
+        return element
+
+    def finish_build(self, future: Future):
+        """
+        Inserts the content built in a worker thread into the page.
+
+        Re-raises the exceptions raised while the cell was built.
+
+        :param future: The future returned by :meth:`start_build`
+        """
+        element: LogElement = future.result()
+        if self.ctype not in [CELL_TYPE_DATA, CELL_TYPE_ONCE, CELL_TYPE_STREAM]:
+            old_mod = self.sub_element.last_direct_change_time
+            content_hash = self._get_content_hash(element)
+            self.sub_element.replace_content(element)
+            if content_hash is not None and content_hash == self._content_hash:
+                # the client is up to date already, skip the update
+                self._restore_change_time(self.sub_element, old_mod)
+                self.statistics.skipped_updates += 1
+            else:
+                self._content_hash = content_hash
+                self.page_session.handle_modified()
+        if not self.continuous:
+            self._next_tick = None
+        self._graph.handle_cell_built(self)
 
     def render_header(self):
         """
@@ -412,15 +544,6 @@ class Cell(LWidget):
                     return False
         return True
 
-    def update_hashes(self):
-        """
-        Updates the hashes of the last modification
-        """
-        element_set = self.uses.union(self.requires)
-        for key in element_set:
-            key = self._clean_key_name(key)
-            self.hashes[key] = self.builder.cache.get_revision(key)
-
     def handle_build(self):
         """
         Is called when ever the cell shall be (re)build.
@@ -468,10 +591,6 @@ class Cell(LWidget):
             )
             self._build_time_acc = 0.0
 
-        if self.detect_changes():
-            self._next_tick = cur_time
-        if self.could_build != self.can_build:  # check if the visibility changed
-            self._next_tick = cur_time
         if self._next_tick is None:
             return None
         if cur_time >= self._next_tick:
@@ -485,23 +604,42 @@ class Cell(LWidget):
             self._next_tick = None
         return self._next_tick
 
-    def detect_changes(self):
+    def detect_changes(self) -> bool:
         """
-        Is called in intervals to detect changes in used cache variables or tracked
-        data sources.
+        Returns if any of the cell's cache or data dependencies was modified since
+        its last build.
+
+        Modifications are not polled but reported to the builder's
+        :class:`CellDependencyGraph` which rebuilds the cell in the next loop turn.
+        """
+        return self._graph.is_modified(self)
+
+    def requires_build(self, visibility_only: bool = False) -> bool:
+        """
+        Returns if the cell needs to be rebuilt after its dependencies or the
+        builder's visibility settings were modified.
+
+        :param visibility_only: If set only the visibility settings changed and the
+            cell only needs to be rebuilt if it can be built now but couldn't before
+            or vice versa.
+        :return: True if the cell shall be rebuilt
         """
-        element_set = self.uses.union(self.requires)
-        for key in element_set:
-            key = self._clean_key_name(key)
-            hash_val = self.builder.cache.get_revision(key)
-            if hash_val != self.hashes.get(key, 0):
-                return True
-        for element in self._data_dependencies:
-            cur_hash = self._data_dependencies[element]
-            new_hash = self.builder.data_loader.get_hash(element)
-            if new_hash is None or cur_hash != new_hash:
-                return True
-        return False
+        return not visibility_only or self.could_build != self.can_build
+
+    def handle_dependencies_modified(self, visibility_only: bool = False) -> bool:
+        """
+        Is called by the dependency graph when a dependency of the cell or the
+        builder's visibility settings were modified.
+
+        :param visibility_only: See :meth:`requires_build`
+        :return: True if the cell was rebuilt
+        """
+        if not self.requires_build(visibility_only):
+            return False
+        self.build()
+        if not self.continuous:
+            self._next_tick = None
+        return True
 
     def handle_stdout(self, buffer: str):
         """
@@ -554,6 +692,7 @@ class Cell(LWidget):
         Clears all current dependencies
         """
         self._data_dependencies = {}
+        self._graph.clear_source_dependencies(self)
         self.builder.data_loader.handle_cell_modified(self)
 
     def add_data_dependency(self, source: str):
@@ -568,3 +707,4 @@ class Cell(LWidget):
         self.builder.data_loader.add_source(source, self)
         if source not in self._data_dependencies:
             self._data_dependencies[source] = self.builder.data_loader.get_hash(source)
+            self._graph.add_source_dependency(self, source)
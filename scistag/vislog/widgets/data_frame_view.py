@@ -0,0 +1,250 @@
+"""
+Implements the class :class:`LDataFrameView` which shows a Pandas DataFrame of
+arbitrary size as virtual, scrollable table. The DataFrame is kept on the server
+and the client only requests the window of rows which is currently visible.
+"""
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from scistag.common import StagLock
+from scistag.vislog.common.html_table import (
+    data_frame_header_html,
+    data_frame_rows_html,
+)
+from scistag.vislog.widgets.log_widget import LWidget
+from scistag.webstag.server import WebRequest, WebResponse
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from scistag.vislog.log_builder import LogBuilder
+
+INDEX_COLUMN = -1
+"Column number used to sort a data frame view by the DataFrame's index"
+
+MAX_WINDOW_SIZE = 1000
+"The maximum count of rows a client may request at once"
+
+
+class LDataFrameView(LWidget):
+    """
+    Shows a Pandas DataFrame as virtual table.
+
+    Only a window of rows is embedded into the page. When the user scrolls, sorts
+    or filters the table the client requests the matching window from the log's
+    service via the ``vl_data_frame_view`` endpoint, so also DataFrames with
+    millions of rows can be browsed with a constant page size.
+
+    In static logs, e.g. HTML files written to disk, the first window of rows is
+    shown.
+    """
+
+    def __init__(
+        self,
+        builder: "LogBuilder",
+        df: "pd.DataFrame",
+        name: str = "dataFrameView",
+        index: bool = True,
+        page_size: int = 100,
+        height: int = 400,
+        insert: bool = True,
+    ):
+        """
+        :param builder: The log builder to which the view shall be added
+        :param df: The data frame to be shown
+        :param name: The widget's name
+        :param index: Defines if the index shall be shown
+        :param page_size: The count of rows which are transferred at once
+        :param height: The view's height in pixels
+        :param insert: Defines if the element shall be inserted into the log
+        """
+        super().__init__(name=name, builder=builder)
+        self.data_frame: "pd.DataFrame" = df
+        "The data frame being shown"
+        self.index = index
+        "Defines if the index shall be shown"
+        self.page_size = max(1, min(page_size, MAX_WINDOW_SIZE))
+        "The count of rows transferred at once"
+        self.height = height
+        "The view's height in pixels"
+        self._view_lock = StagLock()
+        "Protects the cached view when requested from multiple threads"
+        self._view_key: tuple | None = None
+        "The sort and filter settings of the cached view"
+        self._view_rows: np.ndarray | None = None
+        "The positions of the rows visible in the current view"
+        self._search_texts: dict[int, "pd.Series"] = {}
+        "Lower case text representations of each column used for filtering"
+        if insert:
+            self.insert_into_page()
+
+    @property
+    def total_rows(self) -> int:
+        """
+        Returns the total count of rows of the data frame
+        """
+        return self.data_frame.shape[0]
+
+    def get_view_rows(
+        self,
+        sort: int | None = None,
+        ascending: bool = True,
+        filter_text: str = "",
+    ) -> np.ndarray:
+        """
+        Returns the positions of the rows which are visible with given sort and
+        filter settings.
+
+        The result of the last call is cached so scrolling through a sorted or
+        filtered view does not require sorting the data again.
+
+        :param sort: The column number by which the rows shall be sorted.
+            :const:`INDEX_COLUMN` to sort by the index, None to keep the original
+            order.
+        :param ascending: Defines if the values shall be sorted in ascending order
+        :param filter_text: If defined only rows which contain this text (case
+            insensitive) in any of their columns are shown.
+        :return: The positions of the visible rows
+        """
+        if sort is not None and not INDEX_COLUMN <= sort < self.data_frame.shape[1]:
+            sort = None
+        filter_text = filter_text.lower()
+        key = (sort, ascending, filter_text)
+        with self._view_lock:
+            if self._view_key == key and self._view_rows is not None:
+                return self._view_rows
+            rows = self._sorted_rows(sort, ascending)
+            if len(filter_text):
+                rows = rows[self._filter_mask(filter_text)[rows]]
+            self._view_key = key
+            self._view_rows = rows
+            return rows
+
+    def _sorted_rows(self, sort: int | None, ascending: bool) -> np.ndarray:
+        """
+        Returns the row positions sorted by given column
+
+        :param sort: The column number, :const:`INDEX_COLUMN` or None
+        :param ascending: Defines if the values shall be sorted in ascending order
+        :return: The row positions
+        """
+        import pandas as pd
+
+        df = self.data_frame
+        if sort is None:
+            return np.arange(df.shape[0])
+        values = df.index if sort == INDEX_COLUMN else df.iloc[:, sort]
+        values = pd.Series(np.asarray(values))
+        try:
+            sorted_values = values.sort_values(
+                ascending=ascending, kind="stable", na_position="last"
+            )
+        except TypeError:  # mixed types, compare their text representation
+            sorted_values = values.astype(str).sort_values(
+                ascending=ascending, kind="stable"
+            )
+        return sorted_values.index.to_numpy()
+
+    def _filter_mask(self, filter_text: str) -> np.ndarray:
+        """
+        Returns a mask of all rows containing given text in any column
+
+        :param filter_text: The lower case text to search for
+        :return: The boolean mask
+        """
+        import pandas as pd
+
+        df = self.data_frame
+        mask = np.zeros(df.shape[0], dtype=bool)
+        columns = list(range(df.shape[1]))
+        if self.index:
+            columns.append(INDEX_COLUMN)
+        for column in columns:
+            texts = self._search_texts.get(column, None)
+            if texts is None:
+                values = df.index if column == INDEX_COLUMN else df.iloc[:, column]
+                texts = pd.Series(np.asarray(values)).astype(str).str.lower()
+                self._search_texts[column] = texts
+            mask |= texts.str.contains(filter_text, regex=False).to_numpy(dtype=bool)
+        return mask
+
+    def get_window(
+        self,
+        start: int,
+        count: int,
+        sort: int | None = None,
+        ascending: bool = True,
+        filter_text: str = "",
+    ) -> tuple[int, int, str]:
+        """
+        Returns a window of rows as HTML
+
+        :param start: The first row of the (sorted and filtered) view
+        :param count: The maximum count of rows
+        :param sort: The column number by which the rows shall be sorted, see
+            :meth:`get_view_rows`.
+        :param ascending: Defines if the values shall be sorted in ascending order
+        :param filter_text: Text to filter the rows by
+        :return: The total count of rows in the view, the effective start row and
+            the rows' HTML code.
+        """
+        rows = self.get_view_rows(sort, ascending, filter_text)
+        total = len(rows)
+        count = max(0, min(count, MAX_WINDOW_SIZE))
+        start = max(0, min(start, total - count))
+        window = self.data_frame.iloc[rows[start : start + count]]
+        return total, start, data_frame_rows_html(window, index=self.index)
+
+    def handle_window_request(self, request: WebRequest) -> WebResponse:
+        """
+        Handles a client's request for a window of rows
+
+        Supported parameters: start, count, sort (column number), ascending
+        (0 or 1) and filter.
+
+        :param request: The web request
+        :return: A JSON response containing the total count of rows in the view,
+            the effective start row and the rows' HTML code.
+        """
+        params = dict(request.parameters)
+        params.update(request.form)
+        try:
+            start = int(params.get("start", 0))
+            count = int(params.get("count", self.page_size))
+            sort = params.get("sort", "")
+            sort = int(sort) if sort not in ("", None) else None
+            ascending = str(params.get("ascending", "1")) != "0"
+        except ValueError:
+            return WebResponse(status=400, body=b"Error - invalid parameters")
+        filter_text = str(params.get("filter", ""))
+        total, start, rows = self.get_window(
+            start, count, sort=sort, ascending=ascending, filter_text=filter_text
+        )
+        body = json.dumps({"total": total, "start": start, "rows": rows})
+        return WebResponse(body=body.encode("utf-8"), mimetype="application/json")
+
+    def write(self):
+        columns = self.data_frame.shape[1]
+        sort_columns = ([INDEX_COLUMN] if self.index else []) + list(range(columns))
+        header = data_frame_header_html(
+            self.data_frame,
+            index=self.index,
+            cell_attributes=[
+                f' data-column="{column}" onclick="vlDfViewSort(this)"'
+                for column in sort_columns
+            ],
+        )
+        total, _, rows = self.get_window(0, self.page_size)
+        html = self.render(
+            "{{TEMPLATES}}/extensions/dataframe/vl_data_frame_view.html",
+            HEADER=header,
+            ROWS=rows,
+            TOTAL_ROWS=total,
+            PAGE_SIZE=self.page_size,
+            COLUMN_COUNT=len(sort_columns),
+            HEIGHT=self.height,
+        )
+        self.page_session.write_html(html)
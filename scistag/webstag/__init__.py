@@ -1,3 +1,3 @@
-from .web_fetch import web_fetch, WebCache
+from .web_fetch import web_fetch, web_fetch_many, WebCache
 
-__all__ = ["web_fetch", "WebCache"]
+__all__ = ["web_fetch", "web_fetch_many", "WebCache"]
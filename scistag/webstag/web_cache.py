@@ -0,0 +1,423 @@
+"""
+Implements the :class:`WebCache` class which stores files downloaded via
+:func:`web_fetch` in the temp directory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from threading import RLock
+
+INDEX_FILE_NAME = "index.sqlite"
+"Name of the cache's index database within the cache directory"
+
+TEMP_FILE_EXTENSION = ".tmp"
+"Extension of files which are still being written to the cache"
+
+ETAG = "ETag"
+"The response header containing an entity tag used for revalidation"
+LAST_MODIFIED = "Last-Modified"
+"The response header containing the modification date used for revalidation"
+
+
+class WebCache:
+    """
+    The WebCache class allows the temporary storage of downloaded files in
+    the temp directory. How long the file is rated as "valid" can be passed via
+    (for example) the wbe_fetch function's cache duration parameter.
+
+    All entries are registered in an SQLite index within the cache directory
+    which stores each file's size, storage and last access time and validators.
+    Lookups hence do not need to touch the file system and once the cache's
+    total size exceeds :attr:`max_cache_size` the least recently used files are
+    removed. Files are written to a temporary file first and then renamed so
+    multiple processes can share the same cache directory.
+    """
+
+    lock = RLock()
+    "Access lock"
+    cache_dir = tempfile.gettempdir() + "/scistag/"
+    "The cache directory"
+    app_name = "scistag"
+    "The application's name"
+    max_general_age = 60 * 60 * 7
+    "The maximum age of any file loaded via the cache"
+    max_cache_size = 200000000
+    "The maximum total size of all files in the cache in bytes"
+    total_size = 0
+    "Total cache size in bytes as of the last modification of the cache"
+    files_stored = 0
+    "Files stored in this session"
+    cleaned = False
+    "Defines if the cache was cleaned yet"
+    _index: sqlite3.Connection | None = None
+    "Connection to the index database"
+    _index_dir: str | None = None
+    "The cache directory the index connection belongs to"
+
+    @classmethod
+    def set_app_name(cls, name: str):
+        """
+        Modifies the application's name (and thus the cache path)
+
+        :param name: The application's name
+        """
+        with cls.lock:
+            cls._close_index()
+            cls.app_name = name
+            cls.cache_dir = tempfile.tempdir + f"/scistag/{name}/"
+            os.makedirs(cls.cache_dir, exist_ok=True)
+            cls.cleanup()
+
+    @classmethod
+    def _get_index(cls) -> sqlite3.Connection:
+        """
+        Returns the connection to the current cache directory's index and
+        creates the index if necessary.
+
+        :return: The connection. Only to be used while holding :attr:`lock`.
+        """
+        if cls._index is not None and cls._index_dir == cls.cache_dir:
+            return cls._index
+        cls._close_index()
+        os.makedirs(cls.cache_dir, exist_ok=True)
+        index = sqlite3.connect(
+            cls.cache_dir + INDEX_FILE_NAME,
+            timeout=30.0,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        index.execute("PRAGMA journal_mode=WAL")
+        index.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "name TEXT PRIMARY KEY, size INTEGER NOT NULL, stored REAL NOT NULL, "
+            "accessed REAL NOT NULL, etag TEXT, last_modified TEXT)"
+        )
+        index.execute(
+            "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)"
+        )
+        cls._index = index
+        cls._index_dir = cls.cache_dir
+        return index
+
+    @classmethod
+    def _close_index(cls):
+        """
+        Closes the connection to the index
+        """
+        if cls._index is not None:
+            cls._index.close()
+        cls._index = None
+        cls._index_dir = None
+
+    @classmethod
+    def fetch(cls, url: str, max_age: float) -> bytes | None:
+        """
+        Tries to fetch a file from the cache
+
+        Outdated files are removed unless they can be revalidated, see
+        :meth:`get_validators`.
+
+        :param url: The original url
+        :param max_age: The maximum age in seconds
+        :return: On success the file's content
+        """
+        full_name = cls.fetch_file(url, max_age=max_age)
+        if full_name is None:
+            return None
+        try:
+            with open(full_name, "rb") as file:
+                return file.read()
+        except FileNotFoundError:  # evicted by another process
+            return None
+
+    @classmethod
+    def fetch_file(cls, url: str, max_age: float) -> str | None:
+        """
+        Tries to find a file in the cache which is not older than given age
+
+        Outdated files are removed unless they can be revalidated, see
+        :meth:`get_validators`.
+
+        :param url: The original url
+        :param max_age: The maximum age in seconds
+        :return: On success the file's name in the cache
+        """
+        encoded_name = cls.encoded_name(url)
+        with cls.lock:
+            index = cls._get_index()
+            entry = index.execute(
+                "SELECT stored, etag, last_modified FROM entries WHERE name=?",
+                (encoded_name,),
+            ).fetchone()
+            if entry is None:
+                return None
+            cur_time = time.time()
+            if cur_time - entry[0] > max_age:
+                if not entry[1] and not entry[2]:
+                    cls.remove_outdated_file(cls.cache_dir + encoded_name)
+                return None
+            index.execute(
+                "UPDATE entries SET accessed=? WHERE name=?", (cur_time, encoded_name)
+            )
+            return cls.cache_dir + encoded_name
+
+    @classmethod
+    def get_validators(cls, url: str) -> dict[str, str]:
+        """
+        Returns the validators (ETag and Last-Modified headers) the server
+        provided when a cached file was stored.
+
+        :param url: The original url
+        :return: The request headers to revalidate the file via a conditional
+            request. An empty dictionary if the file can not be revalidated.
+        """
+        with cls.lock:
+            entry = (
+                cls._get_index()
+                .execute(
+                    "SELECT etag, last_modified FROM entries WHERE name=?",
+                    (cls.encoded_name(url),),
+                )
+                .fetchone()
+            )
+        headers = {}
+        if entry is None:
+            return headers
+        if entry[0]:
+            headers["If-None-Match"] = entry[0]
+        if entry[1]:
+            headers["If-Modified-Since"] = entry[1]
+        return headers
+
+    @classmethod
+    def revalidate(cls, url: str) -> str | None:
+        """
+        Marks a cached file as up to date after the server confirmed it did not
+        change
+
+        :param url: The original url
+        :return: The file's name in the cache, None if it does not exist anymore
+        """
+        encoded_name = cls.encoded_name(url)
+        with cls.lock:
+            cur_time = time.time()
+            updated = (
+                cls._get_index()
+                .execute(
+                    "UPDATE entries SET stored=?, accessed=? WHERE name=?",
+                    (cur_time, cur_time, encoded_name),
+                )
+                .rowcount
+            )
+            if updated == 0:
+                return None
+            return cls.cache_dir + encoded_name
+
+    @classmethod
+    def remove_outdated_file(cls, full_name):
+        """
+        Removes an outdated file from the cache
+
+        :param full_name: The file's name
+        """
+        with cls.lock:
+            index = cls._get_index()
+            name = os.path.basename(full_name)
+            entry = index.execute(
+                "SELECT size FROM entries WHERE name=?", (name,)
+            ).fetchone()
+            if entry is not None:
+                index.execute("DELETE FROM entries WHERE name=?", (name,))
+                cls.total_size -= entry[0]
+            try:
+                os.remove(full_name)
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def encoded_name(name: str) -> str:
+        """
+        Encodes a filename
+
+        :param name: The filename
+        :return: The encoded filename
+        """
+        return hashlib.md5(name.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def find(cls, url: str) -> str | None:
+        """
+        Searches for a file in the cache and returns it's disk path
+
+        :param url: The http url of the file to search for
+        :return: The file name if the file could be found
+        """
+        encoded_name = cls.encoded_name(url)
+        with cls.lock:
+            entry = (
+                cls._get_index()
+                .execute("SELECT 1 FROM entries WHERE name=?", (encoded_name,))
+                .fetchone()
+            )
+        return cls.cache_dir + encoded_name if entry is not None else None
+
+    @classmethod
+    def store(
+        cls,
+        url: str,
+        data: bytes | None,
+        validators: dict[str, str] | None = None,
+        source_file: str | None = None,
+    ):
+        """
+        Caches the new web element on disk.
+
+        If the cache's size exceeds :attr:`max_cache_size` afterwards the least
+        recently used files are removed.
+
+        :param url: The url of the file being stored
+        :param data: The data of the file being stored as bytes string
+        :param validators: The ETag and Last-Modified headers of the response. If
+            provided the file can be revalidated when it's outdated.
+        :param source_file: If provided the data is copied from this file instead
+        """
+        if not cls.cleaned:
+            WebCache.cleanup()
+        validators = validators if validators is not None else {}
+        encoded_name = cls.encoded_name(url)
+        full_name = cls.cache_dir + encoded_name
+        with cls.lock:
+            cls.files_stored += 1
+            index = cls._get_index()
+        handle, temp_name = tempfile.mkstemp(
+            suffix=TEMP_FILE_EXTENSION, prefix=encoded_name, dir=cls.cache_dir
+        )
+        try:
+            with os.fdopen(handle, "wb") as file:
+                if source_file is not None:
+                    with open(source_file, "rb") as source:
+                        shutil.copyfileobj(source, file)
+                else:
+                    file.write(data)
+                size = file.tell()
+            with cls.lock:
+                index.execute("BEGIN IMMEDIATE")
+                try:
+                    cur_time = time.time()
+                    index.execute(
+                        "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            encoded_name,
+                            size,
+                            cur_time,
+                            cur_time,
+                            validators.get(ETAG, None),
+                            validators.get(LAST_MODIFIED, None),
+                        ),
+                    )
+                    cls._evict(index)
+                    # the file is only moved into place once its entry was written
+                    # and not evicted right away, so a failure can not leave a
+                    # file behind which the index does not know about
+                    if (
+                        index.execute(
+                            "SELECT 1 FROM entries WHERE name=?", (encoded_name,)
+                        ).fetchone()
+                        is not None
+                    ):
+                        os.replace(temp_name, full_name)
+                except BaseException:
+                    index.execute("ROLLBACK")
+                    raise
+                index.execute("COMMIT")
+        finally:
+            if os.path.exists(temp_name):
+                os.remove(temp_name)
+
+    @classmethod
+    def _evict(cls, index: sqlite3.Connection):
+        """
+        Removes the least recently used files until the cache's total size
+        is below :attr:`max_cache_size` and updates :attr:`total_size`.
+
+        :param index: The index connection, within a transaction
+        """
+        total_size = index.execute("SELECT TOTAL(size) FROM entries").fetchone()[0]
+        if total_size > cls.max_cache_size:
+            entries = index.execute(
+                "SELECT name, size FROM entries ORDER BY accessed"
+            ).fetchall()
+            for name, size in entries:
+                if total_size <= cls.max_cache_size:
+                    break
+                index.execute("DELETE FROM entries WHERE name=?", (name,))
+                try:
+                    os.remove(cls.cache_dir + name)
+                except FileNotFoundError:
+                    pass
+                total_size -= size
+        cls.total_size = int(total_size)
+
+    @classmethod
+    def cleanup(cls):
+        """
+        Cleans up the cache and removes old files
+
+        Removes all files older than :attr:`max_general_age`, files the index
+        does not know about (e.g. left behind by a crashed process) and reduces
+        the cache to :attr:`max_cache_size`.
+        """
+        with cls.lock:
+            cls.cleaned = True
+            index = cls._get_index()
+            cur_time = time.time()
+            index.execute("BEGIN IMMEDIATE")
+            try:
+                entries = {
+                    name
+                    for (name,) in index.execute("SELECT name FROM entries").fetchall()
+                }
+                with os.scandir(cls.cache_dir) as files:
+                    for cur_file in files:
+                        if (
+                            cur_file.name in entries
+                            or cur_file.name.startswith(INDEX_FILE_NAME)
+                            or not cur_file.is_file()
+                        ):
+                            entries.discard(cur_file.name)
+                            continue
+                        if cur_time - cur_file.stat().st_mtime > cls.max_general_age:
+                            os.remove(cur_file.path)
+                for name in entries:  # files removed from outside
+                    index.execute("DELETE FROM entries WHERE name=?", (name,))
+                outdated = index.execute(
+                    "SELECT name FROM entries WHERE stored<?",
+                    (cur_time - cls.max_general_age,),
+                ).fetchall()
+                for (name,) in outdated:
+                    cls.remove_outdated_file(cls.cache_dir + name)
+                cls._evict(index)
+            except BaseException:
+                index.execute("ROLLBACK")
+                raise
+            index.execute("COMMIT")
+
+    @classmethod
+    def flush(cls):
+        """
+        Clean the cache completely
+        """
+        with cls.lock:
+            cls._close_index()
+            cls.total_size = 0
+            try:
+                shutil.rmtree(cls.cache_dir)
+            except FileNotFoundError:
+                pass
+            os.makedirs(cls.cache_dir, exist_ok=True)
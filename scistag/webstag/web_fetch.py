@@ -1,20 +1,28 @@
 """
 The web_fetch module grants easy access to data in the web via it's web_fetch
 function, a one-liner to receive a file via http within a given timeout.
+
+Connections are kept alive and shared between all requests to the same host.
 """
 
 from __future__ import annotations
 
-import hashlib
-from threading import RLock
+from concurrent.futures import ThreadPoolExecutor
+from threading import RLock, BoundedSemaphore
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
 
 import time
 import os
-import tempfile
 import shutil
 
 import scistag
 
+from .web_cache import WebCache, ETAG, LAST_MODIFIED
+
+if TYPE_CHECKING:
+    import requests
+
 FROM_CACHE = "fromCache"
 "Defines if the file was loaded from the local disk cache"
 HEADERS = "headers"
@@ -23,6 +31,15 @@ STATUS_CODE = "statusCode"
 "The response http status code, e.g. 200"
 STORED_IN_CACHE = "storedInCache"
 "Defines if the file was added to the local disk cache"
+REVALIDATED = "revalidated"
+"""Defines if an outdated file in the cache was confirmed to be up to date by the
+server (http status 304)"""
+
+STREAM_CHUNK_SIZE = 2**20
+"The size of the chunks in which streamed downloads are written to disk"
+
+MAX_CONNECTIONS_PER_HOST = 10
+"The maximum count of connections kept alive for each host"
 
 
 def file_age_in_seconds(pathname: str) -> float:
@@ -36,158 +53,72 @@ def file_age_in_seconds(pathname: str) -> float:
     return time.time() - stat.st_mtime
 
 
-class WebCache:
+_sessions: dict[str, "requests.Session"] = {}
+"The session of each host, see :func:`get_session`"
+_sessions_lock = RLock()
+"Access lock to the sessions"
+
+
+def get_session(url: str) -> "requests.Session":
+    """
+    Returns the session used for all requests to the host of given url.
+
+    The session keeps the connections to the host alive, so subsequent requests
+    do not need to establish a new TCP connection and TLS handshake.
+
+    :param url: The url
+    :return: The session
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    parts = urlsplit(url)
+    host = f"{parts.scheme}://{parts.netloc}"
+    with _sessions_lock:
+        session = _sessions.get(host, None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1, pool_maxsize=MAX_CONNECTIONS_PER_HOST
+            )
+            session.mount(host, adapter)
+            session.headers["User-Agent"] = (
+                f"SciStag/{scistag.common.__version__} "
+                f"(https://github.com/scistag/scistag/)"
+            )
+            _sessions[host] = session
+        return session
+
+
+def close_sessions():
     """
-    The WebCache class allows the temporary storage of downloaded files in
-    the temp directory. How long the file is rated as "valid" can be passed via
-    (for example) the wbe_fetch function's cache duration parameter.
+    Closes the sessions and connections of all hosts
     """
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
 
-    lock = RLock()
-    "Access lock"
-    cache_dir = tempfile.gettempdir() + "/scistag/"
-    "The cache directory"
-    app_name = "scistag"
-    "The application's name"
-    max_general_age = 60 * 60 * 7
-    "The maximum age of any file loaded via the cache"
-    max_cache_size = 200000000
-    "The maximum file size in the cache"
-    total_size = 0
-    "Total cache size"
-    files_stored = 0
-    "Files stored in this session"
-    cleaned = False
-    "Defines if the cache was cleaned yet"
-
-    @classmethod
-    def set_app_name(cls, name: str):
-        """
-        Modifies the application's name (and thus the cache path)
-
-        :param name: The application's name
-        """
-        with cls.lock:
-            cls.app_name = name
-            cls.cache_dir = tempfile.tempdir + f"/scistag/{name}/"
-            os.makedirs(cls.cache_dir, exist_ok=True)
-            cls.cleanup()
-
-    @classmethod
-    def fetch(cls, url: str, max_age: float) -> bytes | None:
-        """
-        Tries to fetch a file from the cache
-
-        :param url: The original url
-        :param max_age: The maximum age in seconds
-        :return: On success the file's content
-        """
-        encoded_name = cls.encoded_name(url)
-        full_name = cls.cache_dir + encoded_name
-        try:
-            with cls.lock:
-                if os.path.exists(full_name):
-                    if file_age_in_seconds(full_name) <= max_age:
-                        return open(full_name, "rb").read()
-                    cls.remove_outdated_file(full_name)
-                return None
-        except FileNotFoundError:
-            return None
 
-    @classmethod
-    def remove_outdated_file(cls, full_name):
-        """
-        Removes an outdated file from the cache
-
-        :param full_name: The file's name
-        """
-        cls.total_size -= os.stat(full_name).st_size
-        os.remove(full_name)
-
-    @staticmethod
-    def encoded_name(name: str) -> str:
-        """
-        Encodes a filename
-
-        :param name: The filename
-        :return: The encoded filename
-        """
-        return hashlib.md5(name.encode("utf-8")).hexdigest()
-
-    @classmethod
-    def find(cls, url: str) -> str | None:
-        """
-        Searches for a file in the cache and returns it's disk path
-
-        :param url: The http url of the file to search for
-        :return: The file name if the file could be found
-        """
-        encoded_name = cls.encoded_name(url)
-        full_name = cls.cache_dir + encoded_name
-        if os.path.exists(full_name):
-            return full_name
-        return None
+def _stream_to_file(response: "requests.Response", filename: str):
+    """
+    Writes a response's content to a file in chunks.
 
-    @classmethod
-    def store(cls, url: str, data: bytes):
-        """
-        Caches the new web element on disk.
-
-        :param url: The url of the file being stored
-        :param data: The data of the file being stored as bytes string
-        """
-        if not cls.cleaned:
-            WebCache.cleanup()
-        with cls.lock:
-            cls.files_stored += 1
-            if cls.files_stored == 1:
-                os.makedirs(cls.cache_dir, exist_ok=True)
-            if cls.total_size >= cls.max_cache_size:
-                cls.flush()
-            encoded_name = cls.encoded_name(url)
-            full_name = cls.cache_dir + encoded_name
-            with open(full_name, "wb") as file:
-                file.write(data)
-            cls.total_size += len(data)
-
-    @classmethod
-    def cleanup(cls):
-        """
-        Cleans up the cache and removes old files
-        """
-        with cls.lock:
-            cls.cleaned = True
-            try:
-                files = os.listdir(cls.cache_dir)
-            except FileNotFoundError:
-                files = []
-            cur_time = time.time()
-            cls.total_size = 0
-            for cur_file in files:
-                full_name = cls.cache_dir + cur_file
-                stat = os.stat(full_name)
-                if os.path.isdir(full_name):
-                    continue
-                if cur_time - stat.st_mtime > cls.max_general_age:
-                    os.remove(full_name)
-                else:
-                    cls.total_size += stat.st_size
-            if cls.total_size >= cls.max_cache_size:
-                # still very unelegant way, should delete files sorted by age
-                cls.flush()
-
-    @classmethod
-    def flush(cls):
-        """
-        Clean the cache completely
-        """
-        with cls.lock:
-            cls.total_size = 0
-            try:
-                shutil.rmtree(cls.cache_dir)
-            except FileNotFoundError:
-                pass
-            os.makedirs(cls.cache_dir, exist_ok=True)
+    The data is written to a temporary file first which replaces the target
+    file once the download completed.
+
+    :param response: The response opened with stream=True
+    :param filename: The target filename
+    """
+    temp_name = f"{filename}.{os.getpid()}.part"
+    try:
+        with open(temp_name, "wb") as file:
+            for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                file.write(chunk)
+        os.replace(temp_name, filename)
+    finally:
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
 
 
 def web_fetch(
@@ -198,11 +129,17 @@ def web_fetch(
     filename: str | None = None,
     out_response_details: dict | None = None,
     all_codes=False,
+    stream: bool = False,
     **_,
 ) -> bytes | None:
     """
     Fetches a file from the web via HTTP GET
 
+    Files stored in the cache which are outdated are revalidated via a
+    conditional request if the server provided an ETag or Last-Modified header.
+    If the server confirms the file did not change (http status 304) it is not
+    downloaded again.
+
     :param url: The URL
     :param timeout_s: The timeout in seconds
     :param max_cache_age: The maximum cache age in seconds. Note that the
@@ -216,56 +153,186 @@ def web_fetch(
         * statusCode - The request's http status code
         * fromCache - Defines if the files was loaded from cache
         * storedInCache - Defines if the file was added to the cache
+        * revalidated - Defines if the cached file was confirmed by the server
     :param all_codes: Defines if all http return codes shall be accepted.
         Pass a dictionary to response_details for the details.
+    :param stream: If set and a filename is provided the data is written to the
+        file in chunks as it arrives and not held in memory. An empty bytes
+        string is returned on success in this case.
     :return: The file's content if available and not timed out, otherwise None
     """
-    from_cache = False
+    stream = stream and filename is not None
     if cache is not None and cache:
         max_cache_age = 24 * 60 * 60 * 7
+    validators = {}
     if max_cache_age != 0:
-        data = WebCache.fetch(url, max_age=max_cache_age)
+        if stream:
+            data = _copy_from_cache(url, max_cache_age, filename)
+        else:
+            data = WebCache.fetch(url, max_age=max_cache_age)
         if data is not None:
             if out_response_details is not None:
                 out_response_details[FROM_CACHE] = True
-            if filename is not None:
+            if filename is not None and not stream:
                 with open(filename, "wb") as file:
                     file.write(data)
             return data
         else:
             if out_response_details is not None:
                 out_response_details[FROM_CACHE] = False
+        validators = WebCache.get_validators(url)
     import requests
 
-    headers = {
-        "User-Agent": f"SciStag/{scistag.common.__version__} (https://github.com/scistag/scistag/)"
-    }
-
     try:
-        response = requests.get(url=url, timeout=timeout_s, headers=headers)
+        response = get_session(url).get(
+            url=url, timeout=timeout_s, headers=validators, stream=stream
+        )
     except requests.exceptions.RequestException:
         return None
-    if all_codes or response.status_code != 200:
-        return None
-    if max_cache_age != 0 and response.status_code == 200 and not from_cache:
-        WebCache.store(url, response.content)
+    with response:
+        if out_response_details is not None:
+            out_response_details[STATUS_CODE] = response.status_code
+            out_response_details[HEADERS] = response.headers
+        if response.status_code == 304 and len(validators):
+            return _handle_revalidated(url, filename, stream, out_response_details)
+        if all_codes or response.status_code != 200:
+            return None
+        response_validators = {
+            key: response.headers[key]
+            for key in (ETAG, LAST_MODIFIED)
+            if key in response.headers
+        }
+        try:
+            if stream:
+                _stream_to_file(response, filename)
+                content = b""
+            else:
+                content = response.content
+        except requests.exceptions.RequestException:
+            return None
+    if max_cache_age != 0:
+        if stream:
+            WebCache.store(url, None, response_validators, source_file=filename)
+        else:
+            WebCache.store(url, content, response_validators)
         if out_response_details is not None:
             out_response_details[STORED_IN_CACHE] = True
-    if filename is not None:
+    if filename is not None and not stream:
         with open(filename, "wb") as file:
-            file.write(response.content)
+            file.write(content)
+    return content
+
+
+def _copy_from_cache(url: str, max_cache_age: float, filename: str) -> bytes | None:
+    """
+    Copies a file from the cache to the target file without loading it
+
+    :param url: The url
+    :param max_cache_age: The maximum age in seconds
+    :param filename: The target filename
+    :return: An empty bytes string on success, None if the file is not cached
+        or outdated.
+    """
+    cached_name = WebCache.fetch_file(url, max_age=max_cache_age)
+    if cached_name is None:
+        return None
+    try:
+        shutil.copyfile(cached_name, filename)
+    except FileNotFoundError:
+        return None
+    return b""
+
+
+def _handle_revalidated(
+    url: str,
+    filename: str | None,
+    stream: bool,
+    out_response_details: dict | None,
+) -> bytes | None:
+    """
+    Provides the cached version of a file after the server confirmed it is up to
+    date
+
+    :param url: The url
+    :param filename: The target filename (if any)
+    :param stream: Defines if the file shall be copied rather than being returned
+    :param out_response_details: The response details dictionary (if any)
+    :return: The file's content, an empty bytes string when streaming. None if the
+        file was removed from the cache in the meantime.
+    """
+    cached_name = WebCache.revalidate(url)
+    if cached_name is None:
+        return None
     if out_response_details is not None:
-        out_response_details[STATUS_CODE] = response.status_code
-        out_response_details[HEADERS] = response.headers
-    return response.content
+        out_response_details[FROM_CACHE] = True
+        out_response_details[REVALIDATED] = True
+    if stream:
+        shutil.copyfile(cached_name, filename)
+        return b""
+    with open(cached_name, "rb") as file:
+        data = file.read()
+    if filename is not None:
+        with open(filename, "wb") as file:
+            file.write(data)
+    return data
+
+
+def web_fetch_many(
+    urls: list[str],
+    max_workers: int = 8,
+    max_per_host: int = 4,
+    filenames: list[str | None] | None = None,
+    **params,
+) -> list[bytes | None]:
+    """
+    Fetches multiple files from the web concurrently
+
+    :param urls: The URLs
+    :param max_workers: The maximum count of concurrent downloads
+    :param max_per_host: The maximum count of concurrent downloads from a single
+        host
+    :param filenames: If provided the filename to store the data of each url in
+    :param params: Additional parameters passed to :func:`web_fetch`, e.g.
+        timeout_s or max_cache_age
+    :return: The data of each url (see :func:`web_fetch`) in the order of the
+        urls provided
+    """
+    if filenames is not None and len(filenames) != len(urls):
+        raise ValueError("The count of filenames has to match the count of urls")
+    if len(urls) == 0:
+        return []
+    host_limits: dict[str, BoundedSemaphore] = {}
+    for url in urls:
+        host = urlsplit(url).netloc
+        if host not in host_limits:
+            host_limits[host] = BoundedSemaphore(max(max_per_host, 1))
+
+    def fetch(index: int) -> bytes | None:
+        url = urls[index]
+        with host_limits[urlsplit(url).netloc]:
+            return web_fetch(
+                url,
+                filename=filenames[index] if filenames is not None else None,
+                **params,
+            )
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(urls))),
+        thread_name_prefix="web_fetch",
+    ) as executor:
+        return list(executor.map(fetch, range(len(urls))))
 
 
 __all__ = [
     "web_fetch",
+    "web_fetch_many",
+    "get_session",
+    "close_sessions",
     "WebCache",
     "FROM_CACHE",
     "STATUS_CODE",
     "HEADERS",
     "STORED_IN_CACHE",
+    "REVALIDATED",
 ]
 "Exported symbols"